@@ -0,0 +1,137 @@
+"""
+Per-request latency of a fresh client per request versus `with_options()` clones.
+
+Starts a local HTTPS stub (self-signed certificate generated with the ``openssl`` CLI)
+that answers chat completions, then sends the same request repeatedly:
+
+- ``new client``: a brand-new ``ZaiClient`` (and so a new ``httpx.Client``, SSL context
+  and TLS handshake) for every request, as a multi-tenant server without client reuse does
+- ``with_options``: one long-lived base client, and ``base.with_options(api_key=...)`` per
+  request, reusing the pooled keep-alive connection
+
+Usage:
+	python benchmarks/bench_client_reuse.py [--requests 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import ssl
+import statistics
+import subprocess
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, List
+
+import httpx
+
+from zai import ZaiClient
+
+COMPLETION = json.dumps(
+	{
+		'id': 'cmpl-1',
+		'model': 'glm-4',
+		'created': 1715329207,
+		'choices': [{'index': 0, 'finish_reason': 'stop', 'message': {'role': 'assistant', 'content': 'hi'}}],
+		'usage': {'prompt_tokens': 1, 'completion_tokens': 1, 'total_tokens': 2},
+	}
+).encode()
+
+
+class _Handler(BaseHTTPRequestHandler):
+	protocol_version = 'HTTP/1.1'
+	# headers and body are written separately; without this, delayed ACKs add ~40 ms per response
+	disable_nagle_algorithm = True
+
+	def do_POST(self) -> None:
+		self.rfile.read(int(self.headers.get('Content-Length', 0)))
+		self.send_response(200)
+		self.send_header('Content-Type', 'application/json')
+		self.send_header('Content-Length', str(len(COMPLETION)))
+		self.end_headers()
+		self.wfile.write(COMPLETION)
+
+	def log_message(self, format: str, *args: object) -> None:
+		pass
+
+
+def make_certificate(directory: str) -> tuple[str, str]:
+	cert, key = os.path.join(directory, 'cert.pem'), os.path.join(directory, 'key.pem')
+	subprocess.run(
+		[
+			'openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1',
+			'-subj', '/CN=localhost', '-addext', 'subjectAltName=DNS:localhost,IP:127.0.0.1',
+			'-keyout', key, '-out', cert,
+		],
+		check=True,
+		capture_output=True,
+	)  # fmt: skip
+	return cert, key
+
+
+def start_server(cert: str, key: str) -> ThreadingHTTPServer:
+	server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+	context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+	context.load_cert_chain(cert, key)
+	server.socket = context.wrap_socket(server.socket, server_side=True)
+	threading.Thread(target=server.serve_forever, daemon=True).start()
+	return server
+
+
+def measure(name: str, requests: int, send: Callable[[int], None]) -> None:
+	send(-1)  # warm-up
+	latencies: List[float] = []
+	for i in range(requests):
+		start = time.perf_counter()
+		send(i)
+		latencies.append(time.perf_counter() - start)
+	latencies.sort()
+	print(
+		f'{name:<14} mean {statistics.mean(latencies) * 1e3:7.2f} ms   '
+		f'p50 {latencies[len(latencies) // 2] * 1e3:7.2f} ms   '
+		f'p99 {latencies[int(len(latencies) * 0.99) - 1] * 1e3:7.2f} ms'
+	)
+
+
+def main() -> None:
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument('--requests', type=int, default=200)
+	args = parser.parse_args()
+
+	with tempfile.TemporaryDirectory() as directory:
+		cert, key = make_certificate(directory)
+		server = start_server(cert, key)
+		base_url = f'https://localhost:{server.server_address[1]}/v4'
+		messages = [{'role': 'user', 'content': 'hello'}]
+
+		def new_client(i: int) -> None:
+			http_client = httpx.Client(verify=ssl.create_default_context(cafile=cert))
+			client = ZaiClient(api_key=f'tenant-{i}', base_url=base_url, http_client=http_client)
+			try:
+				client.chat.completions.create(model='glm-4', messages=messages)
+			finally:
+				http_client.close()
+
+		base = ZaiClient(
+			api_key='base',
+			base_url=base_url,
+			http_client=httpx.Client(verify=ssl.create_default_context(cafile=cert)),
+		)
+
+		def derived_client(i: int) -> None:
+			base.with_options(api_key=f'tenant-{i}').chat.completions.create(model='glm-4', messages=messages)
+
+		print(f'{args.requests} sequential requests against a local TLS stub')
+		measure('new client', args.requests, new_client)
+		measure('with_options', args.requests, derived_client)
+
+		base.close()
+		server.shutdown()
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,120 @@
+"""
+Micro-benchmark for decoding a synthetic `ChatCompletionChunk` SSE stream.
+
+Compares the previous line-based decoder (``iter_lines`` + ``SSELineParser`` with the
+payload parsed twice) against the byte-level ``StreamResponse`` path, with both the
+standard library and, when installed, the orjson JSON backend. Each variant is timed
+twice: decoding to plain dicts (``cast_type=object``), which isolates the SSE layer,
+building ``ChatCompletionChunk`` models as the SDK does by default, and building the
+``chunk_mode='lazy'`` views.
+
+Usage:
+	python benchmarks/bench_sse_stream.py [--chunks 100000] [--chunk-size 4096]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from typing import Iterator, Mapping, Type
+
+import httpx
+
+from zai.core import HttpClient, StreamResponse, lazy_model_type
+from zai.core._json_encoder import get_json_loads, orjson
+from zai.core._streaming import SSELineParser
+from zai.types.chat.chat_completion_chunk import ChatCompletionChunk
+
+
+class _Client:
+	_strict_response_validation = False
+	_process_response_data = HttpClient._process_response_data
+
+
+def make_body(chunks: int) -> bytes:
+	lines = []
+	for i in range(chunks):
+		chunk = {
+			'id': '8635243129834723621',
+			'created': 1715329207,
+			'model': 'glm-4.5',
+			'choices': [{'index': 0, 'delta': {'role': 'assistant', 'content': f'token {i} '}}],
+		}
+		lines.append(b'data: ' + json.dumps(chunk, separators=(',', ':')).encode() + b'\n\n')
+	lines.append(b'data: [DONE]\n\n')
+	return b''.join(lines)
+
+
+def network_chunks(body: bytes, size: int) -> Iterator[bytes]:
+	for i in range(0, len(body), size):
+		yield body[i : i + size]
+
+
+def make_response(body: bytes, size: int) -> httpx.Response:
+	return httpx.Response(200, content=network_chunks(body, size))
+
+
+def legacy_stream(response: httpx.Response, cast_type: Type[object]) -> Iterator[object]:
+	"""The decoding loop `StreamResponse.__stream__` used before the byte-level decoder."""
+	client = _Client()
+	for sse in SSELineParser().iter_lines(response.iter_lines()):
+		if sse.data.startswith('[DONE]'):
+			break
+		if sse.event is None:
+			data = sse.json_data()
+			if isinstance(data, Mapping) and data.get('agent_id'):
+				yield client._process_response_data(data=data, cast_type=cast_type, response=response)
+				continue
+		if sse.event is None:
+			data = sse.json_data()
+			yield client._process_response_data(data=data, cast_type=cast_type, response=response)
+
+
+def current_stream(response: httpx.Response, cast_type: Type[object], backend: str) -> Iterator[object]:
+	return StreamResponse(
+		cast_type=cast_type,
+		response=response,
+		client=_Client(),
+		json_loads=get_json_loads(backend),
+	)
+
+
+def run(name: str, stream: Iterator[object], chunks: int) -> float:
+	start = time.perf_counter()
+	count = sum(1 for _ in stream)
+	elapsed = time.perf_counter() - start
+	assert count == chunks, (name, count)
+	rate = count / elapsed
+	print(f'  {name:<26} {elapsed:8.3f}s {rate:12,.0f} chunks/s')
+	return rate
+
+
+def main() -> None:
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+	parser.add_argument('--chunks', type=int, default=100_000)
+	parser.add_argument('--chunk-size', type=int, default=4096, help='bytes per network read')
+	args = parser.parse_args()
+
+	body = make_body(args.chunks)
+	print(f'{args.chunks:,} chunks, {len(body):,} bytes, {args.chunk_size} bytes per read')
+
+	backends = ['json'] if orjson is None else ['json', 'orjson']
+	cast_types = (
+		('SSE decode only', object),
+		('decode + ChatCompletionChunk', ChatCompletionChunk),
+		('decode + lazy chunk view', lazy_model_type(ChatCompletionChunk)),
+	)
+	for label, cast_type in cast_types:
+		print(label)
+		before = run(
+			'before (lines, json x2)', legacy_stream(make_response(body, args.chunk_size), cast_type), args.chunks
+		)
+		for backend in backends:
+			stream = current_stream(make_response(body, args.chunk_size), cast_type, backend)
+			after = run(f'after (bytes, {backend})', stream, args.chunks)
+			print(f'  {"speed-up":<26} {after / before:8.2f}x')
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,81 @@
+"""
+Peak memory of `files.create` uploads of growing files, buffered versus streamed from disk.
+
+Writes a temporary file of each size and uploads it through a transport that drains the
+multipart body in chunks, as a socket would, measuring the peak of Python allocations with
+``tracemalloc``:
+
+- ``buffered``: the file read into bytes first, which is what a path upload used to do
+- ``streamed``: the path passed as is, read in 64 KiB chunks while the body is sent
+
+Usage:
+	python benchmarks/bench_streaming_upload.py [--sizes 16 64 256]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import pathlib
+import tempfile
+import time
+import tracemalloc
+
+import httpx
+
+from zai import ZaiClient
+
+MB = 1024 * 1024
+
+
+class DrainingTransport(httpx.BaseTransport):
+	"""Consumes the request body chunk by chunk and discards it."""
+
+	def handle_request(self, request: httpx.Request) -> httpx.Response:
+		for _ in request.stream:
+			pass
+		return httpx.Response(200, json={'id': 'file-1', 'object': 'file'})
+
+
+def make_file(directory: str, size: int) -> pathlib.Path:
+	path = pathlib.Path(directory) / f'upload-{size}.bin'
+	block = os.urandom(MB)
+	with path.open('wb') as file:
+		for _ in range(size // MB):
+			file.write(block)
+	return path
+
+
+def measure(client: ZaiClient, path: pathlib.Path, streamed: bool) -> tuple:
+	tracemalloc.start()
+	start = time.perf_counter()
+	file = path if streamed else (path.name, path.read_bytes())
+	client.files.create(file=file, purpose='retrieval')
+	elapsed = time.perf_counter() - start
+	_, peak = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+	return peak, elapsed
+
+
+def main() -> None:
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument('--sizes', type=int, nargs='+', default=[16, 64, 256], help='file sizes in MB')
+	args = parser.parse_args()
+
+	client = ZaiClient(
+		api_key='bench-api-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.Client(transport=DrainingTransport()),
+	)
+	print(f'{"file MB":>8} {"mode":<10} {"peak MB":>9} {"MB/s":>9}')
+	with tempfile.TemporaryDirectory() as directory:
+		for size in args.sizes:
+			path = make_file(directory, size * MB)
+			for name, streamed in (('buffered', False), ('streamed', True)):
+				peak, elapsed = measure(client, path, streamed)
+				print(f'{size:>8} {name:<10} {peak / MB:>9.2f} {size / elapsed:>9.0f}')
+			path.unlink()
+
+
+if __name__ == '__main__':
+	main()
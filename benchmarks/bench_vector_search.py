@@ -0,0 +1,80 @@
+"""
+Queries per second of `zai.vector.VectorStore` versus corpus size.
+
+Builds stores of random clustered float32 vectors (embeddings are clustered, uniform noise
+is the worst case for an IVF index) and measures batched top-k search with:
+
+- ``exact``: brute-force scoring of every vector
+- ``ivf``: an IVF index with the default ``nlist = sqrt(n)`` lists, probing ``--nprobe`` of them
+- ``ivf+int8``: the same index ranking candidates on int8 codes, rescoring the best
+
+Recall@k of the indexed searches is measured against the exact results.
+
+Usage:
+	python benchmarks/bench_vector_search.py [--sizes 10000 100000 1000000] [--dimensions 256]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Callable, List
+
+import numpy as np
+
+from zai.vector import VectorStore
+
+
+def make_corpus(count: int, dimensions: int, rng: np.random.Generator) -> np.ndarray:
+	centers = rng.standard_normal((max(16, count // 1000), dimensions)).astype(np.float32)
+	labels = rng.integers(0, len(centers), count)
+	return centers[labels] + 0.5 * rng.standard_normal((count, dimensions)).astype(np.float32)
+
+
+def measure(search: Callable[[], List[List[object]]], queries: int, repeat: int = 3) -> tuple:
+	search()  # warm-up
+	best = float('inf')
+	for _ in range(repeat):
+		start = time.perf_counter()
+		results = search()
+		best = min(best, time.perf_counter() - start)
+	return queries / best, results
+
+
+def recall(found: List[list], expected: List[list]) -> float:
+	hits = [len({hit.id for hit in a} & {hit.id for hit in b}) / len(b) for a, b in zip(found, expected)]
+	return sum(hits) / len(hits)
+
+
+def main() -> None:
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+	parser.add_argument('--dimensions', type=int, default=256)
+	parser.add_argument('--queries', type=int, default=256)
+	parser.add_argument('--k', type=int, default=10)
+	parser.add_argument('--nprobe', type=int, default=16)
+	args = parser.parse_args()
+
+	rng = np.random.default_rng(0)
+	print(f'{args.queries} queries per batch, k={args.k}, {args.dimensions} dimensions, nprobe={args.nprobe}')
+	print(f'{"vectors":>10} {"mode":<10} {"queries/s":>12} {"recall":>8} {"build s":>8}')
+	for size in args.sizes:
+		corpus = make_corpus(size, args.dimensions, rng)
+		queries = corpus[rng.choice(size, args.queries, replace=False)] + 0.1
+		store = VectorStore()
+		store.add(corpus)
+		del corpus
+
+		qps, expected = measure(lambda: store.search(queries, k=args.k, exact=True), args.queries)
+		print(f'{size:>10} {"exact":<10} {qps:>12,.0f} {1.0:>8.3f} {0.0:>8.1f}')
+
+		for name, quantize in (('ivf', False), ('ivf+int8', True)):
+			start = time.perf_counter()
+			store.build_index(nprobe=args.nprobe, quantize=quantize)
+			build = time.perf_counter() - start
+			qps, found = measure(lambda: store.search(queries, k=args.k), args.queries)
+			print(f'{size:>10} {name:<10} {qps:>12,.0f} {recall(found, expected):>8.3f} {build:>8.1f}')
+
+
+if __name__ == '__main__':
+	main()
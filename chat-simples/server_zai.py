@@ -41,6 +41,14 @@ HARDCODED_API_KEY = "a9cb3f9acbeb44a8aaab6f745628b579.pFM2lTNLjs4afUKB"
 # Cliente ZAI (será criado sob demanda)
 client = None
 
+
+def get_base_client() -> ZaiClient:
+    """Cliente base compartilhado; cada mensagem usa um clone leve via with_options()"""
+    global client
+    if client is None:
+        client = ZaiClient(api_key=HARDCODED_API_KEY or os.getenv('ZAI_API_KEY'))
+    return client
+
 # Armazena conversações ativas
 active_conversations: Dict[str, List[Dict]] = {}
 
@@ -183,21 +191,16 @@ class ChatHandler:
                     raise Exception("Nenhuma chave API configurada. Configure no código ou no .env")
                 logger.info(f"🔑 Usando API key do .env: {api_key_to_use[:20]}...")
 
-            # Cria cliente com a chave
-            temp_client = ZaiClient(api_key=api_key_to_use)
+            # Deriva um cliente com a chave, reaproveitando o pool de conexões do cliente base
+            temp_client = get_base_client().with_options(api_key=api_key_to_use)
             stream = temp_client.chat.completions.create(**api_params)
 
             # Processa stream
-            for chunk in stream:
-                if chunk.choices and len(chunk.choices) > 0:
-                    delta = chunk.choices[0].delta
-
-                    if hasattr(delta, 'content') and delta.content:
-                        content = delta.content
-                        full_response += content
+            for content in stream.iter_text():
+                full_response += content
 
-                        # Envia delta para o cliente
-                        await self.send_text_delta(content)
+                # Envia delta para o cliente
+                await self.send_text_delta(content)
 
             # Calcula tempo de resposta
             end_time = datetime.now()
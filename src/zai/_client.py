@@ -2,33 +2,44 @@ from __future__ import annotations
 
 import os
 from functools import cached_property
-from typing import TYPE_CHECKING, Mapping, Union
+from typing import TYPE_CHECKING, Callable, Iterable, Literal, Mapping, Sequence, Union
 
 import httpx
 from httpx import Timeout
-from typing_extensions import override
+from typing_extensions import Self, override
 
 if TYPE_CHECKING:
-    from zai.api_resource.agents import Agents
-    from zai.api_resource.assistant import Assistant
-    from zai.api_resource.audio import Audio
-    from zai.api_resource.batch import Batches
-    from zai.api_resource.chat import Chat
-    from zai.api_resource.embeddings import Embeddings
-    from zai.api_resource.files import Files
-    from zai.api_resource.images import Images
-    from zai.api_resource.moderations import Moderations
-    from zai.api_resource.tools import Tools
-    from zai.api_resource.videos import Videos
-    from zai.api_resource.voice import Voice
-    from zai.api_resource.web_search import WebSearchApi
-    from zai.api_resource.file_parser import FileParser
+    from zai.api_resource.agents import Agents, AsyncAgents
+    from zai.api_resource.assistant import Assistant, AsyncAssistant
+    from zai.api_resource.audio import Audio, AsyncAudio
+    from zai.api_resource.batch import AsyncBatches, Batches
+    from zai.api_resource.chat import AsyncChat, Chat
+    from zai.api_resource.embeddings import AsyncEmbeddings, Embeddings
+    from zai.api_resource.files import AsyncFiles, Files
+    from zai.api_resource.images import AsyncImages, Images
+    from zai.api_resource.moderations import AsyncModerations, Moderations
+    from zai.api_resource.tools import AsyncTools, Tools
+    from zai.api_resource.videos import AsyncVideos, Videos
+    from zai.api_resource.voice import AsyncVoice, Voice
+    from zai.api_resource.web_search import AsyncWebSearchApi, WebSearchApi
+    from zai.api_resource.file_parser import AsyncFileParser, FileParser
 
 from .core import (
     NOT_GIVEN,
     ZAI_DEFAULT_MAX_RETRIES,
+    ApiKeyPool,
+    AsyncHttpClient,
+    AsyncRequestCoalescer,
+    AsyncRequestLimiter,
+    EmbeddingCache,
     HttpClient,
+    ModelLimit,
     NotGiven,
+    RequestAttempt,
+    RequestCoalescer,
+    RequestLimiter,
+    ResponseCache,
+    RetryPolicy,
     ZaiError,
     _jwt_token,
 )
@@ -63,6 +74,15 @@ class BaseClient(HttpClient):
             disable_token_cache: bool = True,
             _strict_response_validation: bool = False,
             source_channel: str | None = None,
+            concurrency_limits: Mapping[str, int | ModelLimit] | None = None,
+            limiter: RequestLimiter | None = None,
+            retry_policy: RetryPolicy | None = None,
+            attempt_hooks: Iterable[Callable[[RequestAttempt], None]] | None = None,
+            api_keys: Sequence[str] | Mapping[str, float] | None = None,
+            key_strategy: Literal['least_in_flight', 'round_robin'] = 'least_in_flight',
+            coalesce_requests: bool | Iterable[str] = False,
+            response_cache: ResponseCache | None = None,
+            embedding_cache: EmbeddingCache | None = None,
     ) -> None:
         """
         Initialize the ZAI client
@@ -79,7 +99,27 @@ class BaseClient(HttpClient):
             disable_token_cache (bool): Whether to disable JWT token caching
             _strict_response_validation (bool): Whether to enable strict response validation
             source_channel (str | None): Source channel identifier
+            concurrency_limits (Mapping[str, int | ModelLimit] | None): Client-side limits per model name
+                                    (case-insensitive, '*' for any other model); an int caps concurrent requests
+            limiter (RequestLimiter | None): Custom limiter, takes precedence over `concurrency_limits`
+            retry_policy (RetryPolicy | None): Retry classification, backoff and budgets;
+                                    a default `RetryPolicy` is created per client when omitted
+            attempt_hooks (Iterable[Callable[[RequestAttempt], None]] | None): Callbacks invoked after every
+                                    attempt (including retries) with its timing and outcome
+            api_keys (Sequence[str] | Mapping[str, float] | None): Several API keys, optionally mapped to
+                                    weights, to spread requests over; keys answering 401/429 are quarantined
+            key_strategy (str): How a key is picked from `api_keys`, 'least_in_flight' or 'round_robin'
+            coalesce_requests (bool | Iterable[str]): Let concurrent identical requests share one response;
+                                    True covers GET requests and POSTs to /embeddings, /moderations and
+                                    /web_search, or pass the POST paths to coalesce. Streams are never coalesced
+            response_cache (ResponseCache | None): Cache for deterministic calls, see `ResponseCache`;
+                                    individual calls can opt in or out with `cache=`
+            embedding_cache (EmbeddingCache | None): Persistent cache of embedding vectors; `embeddings.create()`
+                                    only sends the texts it does not hold, unless called with `cache=False`
         """
+        key_pool = ApiKeyPool(api_keys, strategy=key_strategy) if api_keys is not None else None
+        if api_key is None and key_pool is not None:
+            api_key = key_pool.api_keys[0]
         if api_key is None:
             api_key = os.environ.get('ZAI_API_KEY')
         if api_key is None:
@@ -87,6 +127,8 @@ class BaseClient(HttpClient):
         self.api_key = api_key
         self.source_channel = source_channel
         self.disable_token_cache = disable_token_cache
+        self._token_managers = _jwt_token.TokenManagers()
+        self.embedding_cache = embedding_cache
 
         if base_url is None:
             base_url = os.environ.get('ZAI_BASE_URL')
@@ -104,6 +146,12 @@ class BaseClient(HttpClient):
             custom_httpx_client=http_client,
             custom_headers=custom_headers,
             _strict_response_validation=_strict_response_validation,
+            limiter=limiter or (RequestLimiter(concurrency_limits) if concurrency_limits else None),
+            retry_policy=retry_policy,
+            attempt_hooks=attempt_hooks,
+            key_pool=key_pool,
+            coalescer=RequestCoalescer(coalesce_requests) if coalesce_requests else None,
+            response_cache=response_cache,
         )
 
     @property
@@ -205,10 +253,53 @@ class BaseClient(HttpClient):
             }
         else:
             return {
-                'Authorization': f'Bearer {_jwt_token.generate_token(api_key)}',
+                'Authorization': f'Bearer {self._get_token(api_key)}',
                 'x-source-channel': source_channel,
             }
 
+    def _get_token(self, api_key: str) -> str:
+        return self._token_managers.get_token(api_key)
+
+    @override
+    def _auth_headers_key(self) -> object:
+        token = None if self.disable_token_cache else self._get_token(self.api_key)
+        return (self.api_key, self.source_channel, self.disable_token_cache, token)
+
+    @override
+    def _authorization_for_key(self, api_key: str) -> str:
+        return f'Bearer {api_key if self.disable_token_cache else self._get_token(api_key)}'
+
+    @override
+    def _cache_namespace(self) -> str:
+        return self.api_key
+
+    def with_options(
+            self,
+            *,
+            api_key: str | None = None,
+            timeout: Union[float, Timeout, None, NotGiven] = NOT_GIVEN,
+            max_retries: int | NotGiven = NOT_GIVEN,
+            custom_headers: Mapping[str, str] | None = None,
+    ) -> Self:
+        """
+        Return a lightweight client derived from this one, e.g. for one tenant's API key
+
+        The clone shares this client's connection pool (and so its open TLS connections),
+        limiter, retry policy and token cache; closing or garbage-collecting the clone
+        leaves the pool open. It stops working once this client is closed.
+
+        Arguments:
+            api_key (str | None): API key of the clone; replaces `api_keys` if this client has a key pool
+            timeout (Union[float, Timeout, None, NotGiven]): Request timeout of the clone
+            max_retries (int | NotGiven): Maximum number of retries of the clone
+            custom_headers (Mapping[str, str] | None): Headers added to this client's custom headers
+        """
+        clone = self._derive(timeout=timeout, max_retries=max_retries, custom_headers=custom_headers)
+        if api_key is not None:
+            clone.api_key = api_key
+            clone._key_pool = None
+        return clone
+
     def __del__(self) -> None:
         if not hasattr(self, '_has_custom_http_client') or not hasattr(self, 'close') or not hasattr(self, '_client'):
             # if the '__init__' method raised an error, self would not have client attr
@@ -243,3 +334,281 @@ class ZhipuAiClient(BaseClient):
     @property
     def default_base_url(self):
         return 'https://open.bigmodel.cn/api/paas/v4'
+
+
+class AsyncBaseClient(AsyncHttpClient):
+    """
+    asyncio client for interacting with the ZAI API
+
+    Exposes the same resources as `BaseClient`, but every API method is a coroutine
+    and requests are sent through a shared `httpx.AsyncClient`.
+
+    Attributes:
+        chat (AsyncChat): Chat completions API resource
+        api_key (str): API key for authentication
+        disable_token_cache (bool): Whether to disable token caching
+        source_channel (str): Source channel identifier
+    """
+
+    chat: AsyncChat
+    api_key: str
+    base_url: str
+    disable_token_cache: bool = True
+    source_channel: str
+
+    def __init__(
+            self,
+            *,
+            api_key: str | None = None,
+            base_url: str | httpx.URL | None = None,
+            timeout: Union[float, Timeout, None, NotGiven] = NOT_GIVEN,
+            max_retries: int = ZAI_DEFAULT_MAX_RETRIES,
+            http_client: httpx.AsyncClient | None = None,
+            custom_headers: Mapping[str, str] | None = None,
+            disable_token_cache: bool = True,
+            _strict_response_validation: bool = False,
+            source_channel: str | None = None,
+            concurrency_limits: Mapping[str, int | ModelLimit] | None = None,
+            limiter: AsyncRequestLimiter | None = None,
+            retry_policy: RetryPolicy | None = None,
+            attempt_hooks: Iterable[Callable[[RequestAttempt], None]] | None = None,
+            api_keys: Sequence[str] | Mapping[str, float] | None = None,
+            key_strategy: Literal['least_in_flight', 'round_robin'] = 'least_in_flight',
+            coalesce_requests: bool | Iterable[str] = False,
+            response_cache: ResponseCache | None = None,
+            embedding_cache: EmbeddingCache | None = None,
+    ) -> None:
+        """
+        Initialize the async ZAI client
+
+        Arguments:
+            api_key (str | None): API key for authentication.
+                                    If None, will try to get from ZAI_API_KEY environment variable.
+            base_url (str | httpx.URL | None): Base URL for the API.
+                                    If None, will try to get from ZAI_BASE_URL environment variable
+            timeout (Union[float, Timeout, None, NotGiven]): Request timeout configuration
+            max_retries (int): Maximum number of retries for failed requests
+            http_client (httpx.AsyncClient | None): Custom async HTTP client to use
+            custom_headers (Mapping[str, str] | None): Additional headers to include in requests
+            disable_token_cache (bool): Whether to disable JWT token caching
+            _strict_response_validation (bool): Whether to enable strict response validation
+            source_channel (str | None): Source channel identifier
+            concurrency_limits (Mapping[str, int | ModelLimit] | None): Client-side limits per model name
+                                    (case-insensitive, '*' for any other model); an int caps concurrent requests
+            limiter (AsyncRequestLimiter | None): Custom limiter, takes precedence over `concurrency_limits`
+            retry_policy (RetryPolicy | None): Retry classification, backoff and budgets;
+                                    a default `RetryPolicy` is created per client when omitted
+            attempt_hooks (Iterable[Callable[[RequestAttempt], None]] | None): Callbacks invoked after every
+                                    attempt (including retries) with its timing and outcome
+            api_keys (Sequence[str] | Mapping[str, float] | None): Several API keys, optionally mapped to
+                                    weights, to spread requests over; keys answering 401/429 are quarantined
+            key_strategy (str): How a key is picked from `api_keys`, 'least_in_flight' or 'round_robin'
+            coalesce_requests (bool | Iterable[str]): Let concurrent identical requests share one response;
+                                    True covers GET requests and POSTs to /embeddings, /moderations and
+                                    /web_search, or pass the POST paths to coalesce. Streams are never coalesced
+            response_cache (ResponseCache | None): Cache for deterministic calls, see `ResponseCache`;
+                                    individual calls can opt in or out with `cache=`
+            embedding_cache (EmbeddingCache | None): Persistent cache of embedding vectors; `embeddings.create()`
+                                    only sends the texts it does not hold, unless called with `cache=False`
+        """
+        key_pool = ApiKeyPool(api_keys, strategy=key_strategy) if api_keys is not None else None
+        if api_key is None and key_pool is not None:
+            api_key = key_pool.api_keys[0]
+        if api_key is None:
+            api_key = os.environ.get('ZAI_API_KEY')
+        if api_key is None:
+            raise ZaiError('api_key not provided, please provide it through parameters or environment variables')
+        self.api_key = api_key
+        self.source_channel = source_channel
+        self.disable_token_cache = disable_token_cache
+        self._token_managers = _jwt_token.TokenManagers()
+        self.embedding_cache = embedding_cache
+
+        if base_url is None:
+            base_url = os.environ.get('ZAI_BASE_URL')
+        if base_url is None:
+            base_url = self.default_base_url
+        self.base_url = base_url
+
+        from ._version import __version__
+
+        super().__init__(
+            version=__version__,
+            base_url=base_url,
+            max_retries=max_retries,
+            timeout=timeout,
+            custom_httpx_client=http_client,
+            custom_headers=custom_headers,
+            _strict_response_validation=_strict_response_validation,
+            limiter=limiter or (AsyncRequestLimiter(concurrency_limits) if concurrency_limits else None),
+            retry_policy=retry_policy,
+            attempt_hooks=attempt_hooks,
+            key_pool=key_pool,
+            coalescer=AsyncRequestCoalescer(coalesce_requests) if coalesce_requests else None,
+            response_cache=response_cache,
+        )
+
+    @property
+    def default_base_url(self):
+        raise NotImplementedError('Subclasses must define default_base_url')
+
+    @cached_property
+    def chat(self) -> AsyncChat:
+        from zai.api_resource.chat import AsyncChat
+
+        return AsyncChat(self)
+
+    @cached_property
+    def assistant(self) -> AsyncAssistant:
+        from zai.api_resource.assistant import AsyncAssistant
+
+        return AsyncAssistant(self)
+
+    @cached_property
+    def agents(self) -> AsyncAgents:
+        from zai.api_resource.agents import AsyncAgents
+
+        return AsyncAgents(self)
+
+    @cached_property
+    def embeddings(self) -> AsyncEmbeddings:
+        from zai.api_resource.embeddings import AsyncEmbeddings
+
+        return AsyncEmbeddings(self)
+
+    @cached_property
+    def batches(self) -> AsyncBatches:
+        from zai.api_resource.batch import AsyncBatches
+
+        return AsyncBatches(self)
+
+    @cached_property
+    def tools(self) -> AsyncTools:
+        from zai.api_resource.tools import AsyncTools
+
+        return AsyncTools(self)
+
+    @cached_property
+    def web_search(self) -> AsyncWebSearchApi:
+        from zai.api_resource.web_search import AsyncWebSearchApi
+
+        return AsyncWebSearchApi(self)
+
+    @cached_property
+    def files(self) -> AsyncFiles:
+        from zai.api_resource.files import AsyncFiles
+
+        return AsyncFiles(self)
+
+    @cached_property
+    def images(self) -> AsyncImages:
+        from zai.api_resource.images import AsyncImages
+
+        return AsyncImages(self)
+
+    @cached_property
+    def audio(self) -> AsyncAudio:
+        from zai.api_resource.audio import AsyncAudio
+
+        return AsyncAudio(self)
+
+    @cached_property
+    def videos(self) -> AsyncVideos:
+        from zai.api_resource.videos import AsyncVideos
+
+        return AsyncVideos(self)
+
+    @cached_property
+    def moderations(self) -> AsyncModerations:
+        from zai.api_resource.moderations import AsyncModerations
+
+        return AsyncModerations(self)
+
+    @cached_property
+    def voice(self) -> AsyncVoice:
+        from zai.api_resource.voice import AsyncVoice
+
+        return AsyncVoice(self)
+
+    @cached_property
+    def file_parser(self) -> AsyncFileParser:
+        from zai.api_resource.file_parser import AsyncFileParser
+        return AsyncFileParser(self)
+
+    @property
+    @override
+    def auth_headers(self) -> dict[str, str]:
+        api_key = self.api_key
+        source_channel = self.source_channel or 'python-sdk'
+        if self.disable_token_cache:
+            return {
+                'Authorization': f'Bearer {api_key}',
+                'x-source-channel': source_channel,
+            }
+        else:
+            return {
+                'Authorization': f'Bearer {self._get_token(api_key)}',
+                'x-source-channel': source_channel,
+            }
+
+    def _get_token(self, api_key: str) -> str:
+        return self._token_managers.get_token(api_key)
+
+    @override
+    def _auth_headers_key(self) -> object:
+        token = None if self.disable_token_cache else self._get_token(self.api_key)
+        return (self.api_key, self.source_channel, self.disable_token_cache, token)
+
+    @override
+    def _authorization_for_key(self, api_key: str) -> str:
+        return f'Bearer {api_key if self.disable_token_cache else self._get_token(api_key)}'
+
+    @override
+    def _cache_namespace(self) -> str:
+        return self.api_key
+
+    def with_options(
+            self,
+            *,
+            api_key: str | None = None,
+            timeout: Union[float, Timeout, None, NotGiven] = NOT_GIVEN,
+            max_retries: int | NotGiven = NOT_GIVEN,
+            custom_headers: Mapping[str, str] | None = None,
+    ) -> Self:
+        """
+        Return a lightweight client derived from this one, e.g. for one tenant's API key
+
+        The clone shares this client's connection pool (and so its open TLS connections),
+        limiter, retry policy and token cache; closing or garbage-collecting the clone
+        leaves the pool open. It stops working once this client is closed.
+
+        Arguments:
+            api_key (str | None): API key of the clone; replaces `api_keys` if this client has a key pool
+            timeout (Union[float, Timeout, None, NotGiven]): Request timeout of the clone
+            max_retries (int | NotGiven): Maximum number of retries of the clone
+            custom_headers (Mapping[str, str] | None): Headers added to this client's custom headers
+        """
+        clone = self._derive(timeout=timeout, max_retries=max_retries, custom_headers=custom_headers)
+        if api_key is not None:
+            clone.api_key = api_key
+            clone._key_pool = None
+        return clone
+
+
+class AsyncZaiClient(AsyncBaseClient):
+    @property
+    def default_base_url(self):
+        return 'https://api.z.ai/api/paas/v4'
+
+    @property
+    @override
+    def auth_headers(self) -> dict[str, str]:
+        headers = super().auth_headers
+        headers['Accept-Language'] = 'en-US,en'
+        return headers
+
+
+class AsyncZhipuAiClient(AsyncBaseClient):
+    @property
+    def default_base_url(self):
+        return 'https://open.bigmodel.cn/api/paas/v4'
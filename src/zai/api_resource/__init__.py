@@ -1,24 +1,34 @@
-from .agents import Agents
+from .agents import Agents, AsyncAgents
 from .assistant import (
 	Assistant,
+	AsyncAssistant,
 )
-from .audio import Audio
-from .batch import Batches
+from .audio import AsyncAudio, Audio
+from .batch import AsyncBatches, Batches
 from .chat import (
+	AsyncChat,
+	AsyncChatAsyncCompletions,
+	AsyncChatCompletions,
+	AsyncChatCompletionStream,
 	AsyncCompletions,
 	Chat,
+	ChatCompletionStream,
+	ChatCompletionStreamAccumulator,
 	Completions,
 )
-from .embeddings import Embeddings
-from .files import Files, FilesWithRawResponse
-from .images import Images
-from .moderations import Moderations
-from .tools import Tools
+from .embeddings import AsyncEmbeddings, Embeddings
+from .files import AsyncFiles, Files, FilesWithRawResponse
+from .images import AsyncImages, Images
+from .moderations import AsyncModerations, Moderations
+from .tasks import AsyncTaskPoller, TaskPoller
+from .tools import AsyncTools, Tools
 from .videos import (
+	AsyncVideos,
 	Videos,
 )
-from .web_search import WebSearchApi
-from .file_parser import FileParser
+from .voice import AsyncVoice, Voice
+from .web_search import AsyncWebSearchApi, WebSearchApi
+from .file_parser import AsyncFileParser, FileParser
 
 
 __all__ = [
@@ -38,4 +48,26 @@ __all__ = [
 	'WebSearchApi',
 	'Agents',
 	'FileParser',
+	'Voice',
+	'TaskPoller',
+	'AsyncVideos',
+	'AsyncChat',
+	'AsyncChatCompletions',
+	'AsyncChatAsyncCompletions',
+	'ChatCompletionStream',
+	'AsyncChatCompletionStream',
+	'ChatCompletionStreamAccumulator',
+	'AsyncImages',
+	'AsyncEmbeddings',
+	'AsyncFiles',
+	'AsyncBatches',
+	'AsyncTools',
+	'AsyncAssistant',
+	'AsyncAudio',
+	'AsyncModerations',
+	'AsyncWebSearchApi',
+	'AsyncAgents',
+	'AsyncFileParser',
+	'AsyncVoice',
+	'AsyncTaskPoller',
 ]
@@ -1,3 +1,3 @@
-from zai.api_resource.agents.agents import Agents
+from zai.api_resource.agents.agents import Agents, AsyncAgents
 
-__all__ = ['Agents']
+__all__ = ['Agents', 'AsyncAgents']
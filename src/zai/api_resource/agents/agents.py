@@ -8,6 +8,8 @@ from typing_extensions import Literal
 
 from zai.core import (
 	NOT_GIVEN,
+	AsyncBaseAPI,
+	AsyncStreamResponse,
 	BaseAPI,
 	Body,
 	Headers,
@@ -23,7 +25,7 @@ from zai.types.sensitive_word_check import SensitiveWordCheckRequest
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
-	from zai._client import ZaiClient
+	from zai._client import AsyncZaiClient, ZaiClient
 
 
 class Agents(BaseAPI):
@@ -88,3 +90,67 @@ class Agents(BaseAPI):
 			options=make_request_options(extra_headers=extra_headers, extra_body=extra_body, timeout=timeout),
 			cast_type=AgentsCompletion,
 		)
+
+
+class AsyncAgents(AsyncBaseAPI):
+	def __init__(self, client: 'AsyncZaiClient') -> None:
+		super().__init__(client)
+
+	async def invoke(
+		self,
+		agent_id: Optional[str] | NotGiven = NOT_GIVEN,
+		request_id: Optional[str] | NotGiven = NOT_GIVEN,
+		stream: Optional[Literal[False]] | Literal[True] | NotGiven = NOT_GIVEN,
+		messages: Union[str, List[str], List[int], object, None] | NotGiven = NOT_GIVEN,
+		user_id: Optional[str] | NotGiven = NOT_GIVEN,
+		custom_variables: object = NOT_GIVEN,
+		sensitive_word_check: Optional[SensitiveWordCheckRequest] | NotGiven = NOT_GIVEN,
+		extra_headers: Headers | None = None,
+		extra_body: Body | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+	) -> AgentsCompletion | AsyncStreamResponse[AgentsCompletionChunk]:
+		body = deepcopy_minimal(
+			{
+				'agent_id': agent_id,
+				'request_id': request_id,
+				'user_id': user_id,
+				'messages': messages,
+				'sensitive_word_check': sensitive_word_check,
+				'stream': stream,
+				'custom_variables': custom_variables,
+			}
+		)
+
+		return await self._post(
+			'/v1/agents',
+			body=body,
+			options=make_request_options(extra_headers=extra_headers, extra_body=extra_body, timeout=timeout),
+			cast_type=AgentsCompletion,
+			stream=stream or False,
+			stream_cls=AsyncStreamResponse[AgentsCompletionChunk],
+		)
+
+	async def async_result(
+		self,
+		agent_id: Optional[str] | NotGiven = NOT_GIVEN,
+		async_id: Optional[str] | NotGiven = NOT_GIVEN,
+		conversation_id: Optional[str] | NotGiven = NOT_GIVEN,
+		custom_variables: object = NOT_GIVEN,
+		extra_headers: Headers | None = None,
+		extra_body: Body | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+	) -> AgentsCompletion:
+		body = deepcopy_minimal(
+			{
+				'agent_id': agent_id,
+				'async_id': async_id,
+				'conversation_id': conversation_id,
+				'custom_variables': custom_variables,
+			}
+		)
+		return await self._post(
+			'/v1/agents/async-result',
+			body=body,
+			options=make_request_options(extra_headers=extra_headers, extra_body=extra_body, timeout=timeout),
+			cast_type=AgentsCompletion,
+		)
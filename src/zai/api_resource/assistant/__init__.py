@@ -1,3 +1,3 @@
-from zai.api_resource.assistant.assistant import Assistant
+from zai.api_resource.assistant.assistant import Assistant, AsyncAssistant
 
-__all__ = ['Assistant']
+__all__ = ['Assistant', 'AsyncAssistant']
@@ -7,11 +7,14 @@ from typing_extensions import Literal
 
 from zai.core import (
 	NOT_GIVEN,
+	AsyncBaseAPI,
+	AsyncStreamResponse,
 	BaseAPI,
 	Body,
 	Headers,
 	NotGiven,
 	StreamResponse,
+	async_maybe_transform,
 	deepcopy_minimal,
 	make_request_options,
 	maybe_transform,
@@ -23,11 +26,11 @@ from zai.types.assistant.assistant_conversation_resp import (
 from zai.types.assistant.assistant_support_resp import AssistantSupportResp
 
 if TYPE_CHECKING:
-	from zai._client import ZaiClient
+	from zai._client import AsyncZaiClient, ZaiClient
 
 from zai.types.assistant import assistant_conversation_params, assistant_create_params
 
-__all__ = ['Assistant']
+__all__ = ['Assistant', 'AsyncAssistant']
 
 
 class Assistant(BaseAPI):
@@ -124,3 +127,99 @@ class Assistant(BaseAPI):
 			options=make_request_options(extra_headers=extra_headers, extra_body=extra_body, timeout=timeout),
 			cast_type=ConversationUsageListResp,
 		)
+
+
+class AsyncAssistant(AsyncBaseAPI):
+	def __init__(self, client: 'AsyncZaiClient') -> None:
+		super().__init__(client)
+
+	async def conversation(
+		self,
+		assistant_id: str,
+		messages: List[assistant_create_params.ConversationMessage],
+		model: str = None,
+		*,
+		stream: Optional[Literal[False]] | Literal[True] | NotGiven = NOT_GIVEN,
+		conversation_id: Optional[str] = None,
+		attachments: Optional[List[assistant_create_params.AssistantAttachments]] = None,
+		metadata: dict | None = None,
+		request_id: str = None,
+		user_id: str = None,
+		extra_parameters: Optional[assistant_create_params.ExtraParameters] = None,
+		extra_headers: Headers | None = None,
+		extra_body: Body | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+	) -> AssistantCompletion | AsyncStreamResponse[AssistantCompletion]:
+		body = deepcopy_minimal(
+			{
+				'assistant_id': assistant_id,
+				'messages': messages,
+				'stream': stream,
+				'conversation_id': conversation_id,
+				'attachments': attachments,
+				'metadata': metadata,
+				'request_id': request_id,
+				'user_id': user_id,
+				'extra_parameters': extra_parameters,
+			}
+		)
+		return await self._post(
+			'/assistant',
+			body=await async_maybe_transform(body, assistant_create_params.AssistantParameters),
+			options=make_request_options(extra_headers=extra_headers, extra_body=extra_body, timeout=timeout),
+			cast_type=AssistantCompletion,
+			stream=stream or False,
+			stream_cls=AsyncStreamResponse[AssistantCompletion],
+		)
+
+	async def query_support(
+		self,
+		*,
+		assistant_id_list: List[str] = None,
+		request_id: str = None,
+		user_id: str = None,
+		extra_headers: Headers | None = None,
+		extra_body: Body | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+	) -> AssistantSupportResp:
+		body = deepcopy_minimal(
+			{
+				'assistant_id_list': assistant_id_list,
+				'request_id': request_id,
+				'user_id': user_id,
+			}
+		)
+		return await self._post(
+			'/assistant/list',
+			body=body,
+			options=make_request_options(extra_headers=extra_headers, extra_body=extra_body, timeout=timeout),
+			cast_type=AssistantSupportResp,
+		)
+
+	async def query_conversation_usage(
+		self,
+		assistant_id: str,
+		page: int = 1,
+		page_size: int = 10,
+		*,
+		request_id: str = None,
+		user_id: str = None,
+		extra_headers: Headers | None = None,
+		extra_body: Body | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+	) -> ConversationUsageListResp:
+		body = deepcopy_minimal(
+			{
+				'assistant_id': assistant_id,
+				'page': page,
+				'page_size': page_size,
+				'request_id': request_id,
+				'user_id': user_id,
+			}
+		)
+		return await self._post(
+			'/assistant/conversation/list',
+			body=await async_maybe_transform(body, assistant_conversation_params.ConversationParameters),
+			options=make_request_options(extra_headers=extra_headers, extra_body=extra_body, timeout=timeout),
+			cast_type=ConversationUsageListResp,
+		)
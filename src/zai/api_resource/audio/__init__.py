@@ -1,4 +1,4 @@
-from .audio import Audio
-from .transcriptions import Transcriptions
+from .audio import AsyncAudio, Audio
+from .transcriptions import AsyncTranscriptions, Transcriptions
 
-__all__ = ['Audio', 'Transcriptions']
+__all__ = ['Audio', 'Transcriptions', 'AsyncAudio', 'AsyncTranscriptions']
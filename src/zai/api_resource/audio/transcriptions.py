@@ -1,22 +1,27 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Mapping, Optional, cast
+from typing import TYPE_CHECKING, Any, Callable, Mapping, Optional, cast
 
 import httpx
 from typing_extensions import Literal
 
 from zai.core import (
 	NOT_GIVEN,
+	AsyncBaseAPI,
+	AsyncStreamResponse,
 	BaseAPI,
 	Body,
 	FileTypes,
 	Headers,
 	NotGiven,
 	StreamResponse,
+	UploadProgress,
+	async_maybe_transform,
 	deepcopy_minimal,
 	make_request_options,
 	maybe_transform,
+	with_upload_progress,
 )
 from zai.core._utils import extract_files
 from zai.types.audio import transcriptions_create_param
@@ -27,7 +32,7 @@ from zai.types.sensitive_word_check import SensitiveWordCheckRequest
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
-	from zai._client import ZaiClient
+	from zai._client import AsyncZaiClient, ZaiClient
 
 
 class Transcriptions(BaseAPI):
@@ -48,6 +53,7 @@ class Transcriptions(BaseAPI):
 		stream: Optional[Literal[False]] | Literal[True] | NotGiven = NOT_GIVEN,
 		temperature: Optional[float] | NotGiven = NOT_GIVEN,
 		sensitive_word_check: Optional[SensitiveWordCheckRequest] | NotGiven = NOT_GIVEN,
+		on_progress: Optional[Callable[[UploadProgress], Any]] = None,
 		extra_headers: Headers | None = None,
 		extra_body: Body | None = None,
 		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
@@ -63,6 +69,7 @@ class Transcriptions(BaseAPI):
 			stream (Optional[Literal[False]] | Literal[True]): Whether to stream the response
 			temperature (Optional[float]): Sampling temperature for transcription
 			sensitive_word_check (Optional[SensitiveWordCheckRequest]): Sensitive word check configuration
+			on_progress (Callable[[UploadProgress], Any]): Called with an `UploadProgress` as the file is sent
 			extra_headers (Headers): Additional headers to send
 			extra_body (Body): Additional body parameters
 			timeout (float | httpx.Timeout): Request timeout
@@ -76,7 +83,7 @@ class Transcriptions(BaseAPI):
 		body = deepcopy_minimal(
 			{
 				'model': model,
-				'file': file,
+				'file': with_upload_progress(file, on_progress),
 				'request_id': request_id,
 				'user_id': user_id,
 				'temperature': temperature,
@@ -99,3 +106,76 @@ class Transcriptions(BaseAPI):
 			stream=stream or False,
 			stream_cls=StreamResponse[ChatCompletionChunk],
 		)
+
+
+class AsyncTranscriptions(AsyncBaseAPI):
+	"""
+	API resource for audio transcription operations
+	"""
+
+	def __init__(self, client: 'AsyncZaiClient') -> None:
+		super().__init__(client)
+
+	async def create(
+		self,
+		*,
+		file: FileTypes,
+		model: str,
+		request_id: Optional[str] | NotGiven = NOT_GIVEN,
+		user_id: Optional[str] | NotGiven = NOT_GIVEN,
+		stream: Optional[Literal[False]] | Literal[True] | NotGiven = NOT_GIVEN,
+		temperature: Optional[float] | NotGiven = NOT_GIVEN,
+		sensitive_word_check: Optional[SensitiveWordCheckRequest] | NotGiven = NOT_GIVEN,
+		on_progress: Optional[Callable[[UploadProgress], Any]] = None,
+		extra_headers: Headers | None = None,
+		extra_body: Body | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+	) -> Completion | AsyncStreamResponse[ChatCompletionChunk]:
+		"""
+		Transcribe audio files to text
+
+		Arguments:
+			file (FileTypes): Audio file to transcribe
+			model (str): The model to use for transcription
+			request_id (Optional[str]): Unique identifier for the request
+			user_id (Optional[str]): User identifier
+			stream (Optional[Literal[False]] | Literal[True]): Whether to stream the response
+			temperature (Optional[float]): Sampling temperature for transcription
+			sensitive_word_check (Optional[SensitiveWordCheckRequest]): Sensitive word check configuration
+			on_progress (Callable[[UploadProgress], Any]): Called with an `UploadProgress` as the file is sent
+			extra_headers (Headers): Additional headers to send
+			extra_body (Body): Additional body parameters
+			timeout (float | httpx.Timeout): Request timeout
+		"""
+		if temperature is not None and temperature != NOT_GIVEN:
+			if temperature <= 0:
+				temperature = 0.01
+			if temperature >= 1:
+				temperature = 0.99
+
+		body = deepcopy_minimal(
+			{
+				'model': model,
+				'file': with_upload_progress(file, on_progress),
+				'request_id': request_id,
+				'user_id': user_id,
+				'temperature': temperature,
+				'sensitive_word_check': sensitive_word_check,
+				'stream': stream,
+			}
+		)
+		files = extract_files(cast(Mapping[str, object], body), paths=[['file']])
+		if files:
+			extra_headers = {
+				'Content-Type': 'multipart/form-data',
+				**(extra_headers or {}),
+			}
+		return await self._post(
+			'/audio/transcriptions',
+			body=await async_maybe_transform(body, transcriptions_create_param.TranscriptionsParam),
+			files=files,
+			options=make_request_options(extra_headers=extra_headers, extra_body=extra_body, timeout=timeout),
+			cast_type=Completion,
+			stream=stream or False,
+			stream_cls=AsyncStreamResponse[ChatCompletionChunk],
+		)
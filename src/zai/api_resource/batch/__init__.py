@@ -1,3 +1,4 @@
-from .batches import Batches
+from .batches import AsyncBatches, Batches
+from .runner import AsyncBatchRun, BatchRun, BatchRunError
 
-__all__ = ['Batches']
+__all__ = ['Batches', 'AsyncBatches', 'BatchRun', 'AsyncBatchRun', 'BatchRunError']
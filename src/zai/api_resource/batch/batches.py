@@ -1,23 +1,37 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Dict, Literal, Optional
+import pathlib
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Literal, Mapping, Optional
 
 import httpx
 
 from zai.core import (
 	NOT_GIVEN,
+	AsyncBaseAPI,
 	BaseAPI,
 	Body,
 	Headers,
 	NotGiven,
+	async_maybe_transform,
 	make_request_options,
 	maybe_transform,
 )
-from zai.core.pagination import SyncCursorPage
+from zai.core.pagination import AsyncCursorPage, SyncCursorPage
 from zai.types.batch import Batch, BatchCreateParams, BatchListParams
 
+from .runner import (
+	BATCH_MAX_BYTES,
+	BATCH_MAX_REQUESTS,
+	AsyncBatchRun,
+	BatchRun,
+	async_submit_shards,
+	batch_lines,
+	submit_shards,
+	write_shards,
+)
+
 if TYPE_CHECKING:
-	from zai._client import ZaiClient
+	from zai._client import AsyncZaiClient, ZaiClient
 
 
 class Batches(BaseAPI):
@@ -151,3 +165,270 @@ class Batches(BaseAPI):
 			options=make_request_options(extra_headers=extra_headers, extra_body=extra_body, timeout=timeout),
 			cast_type=Batch,
 		)
+
+	def run(
+		self,
+		requests: Iterable[Mapping[str, Any]],
+		*,
+		endpoint: Literal['/v1/chat/completions', '/v1/embeddings'] = '/v1/chat/completions',
+		completion_window: str | None = None,
+		metadata: Optional[Dict[str, str]] | NotGiven = NOT_GIVEN,
+		max_requests_per_batch: int = BATCH_MAX_REQUESTS,
+		max_bytes_per_batch: int = BATCH_MAX_BYTES,
+		upload_concurrency: int = 4,
+		poll_interval: float = 10.0,
+		extra_headers: Headers | None = None,
+		extra_body: Body | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+	) -> BatchRun:
+		"""
+		Run any number of requests through the Batch API.
+
+		The requests are streamed into temporary JSONL files, split whenever a file would
+		exceed `max_requests_per_batch` lines or `max_bytes_per_batch` bytes, and every file is
+		uploaded and turned into a batch while the next one is written. Iterate the returned
+		run (or call its `results()`) to get `(custom_id, result)` pairs as the batches end.
+
+		Args:
+		  requests: Request bodies, or batch lines with `body` and optionally `custom_id`,
+		      `method` and `url`; bodies without a `custom_id` get `request-<position>`
+
+		  endpoint: The endpoint the requests are sent to
+
+		  completion_window: The time frame within which each batch should be processed
+
+		  metadata: Metadata attached to every batch
+
+		  max_requests_per_batch: Largest number of requests in one batch
+
+		  max_bytes_per_batch: Largest size of one batch input file in bytes
+
+		  upload_concurrency: Number of files uploaded at once
+
+		  poll_interval: Seconds between two polls of the unfinished batches
+
+		  extra_headers: Send extra headers
+
+		  extra_body: Add additional JSON properties to the request
+
+		  timeout: Override the client-level default timeout for each request, in seconds
+		"""
+		files = self._client.files
+
+		def submit(path: pathlib.Path) -> Batch:
+			file = files.create(
+				file=path, purpose='batch', extra_headers=extra_headers, extra_body=extra_body, timeout=timeout
+			)
+			return self.create(
+				completion_window=completion_window,
+				endpoint=endpoint,
+				input_file_id=file.id,
+				metadata=metadata,
+				extra_headers=extra_headers,
+				extra_body=extra_body,
+				timeout=timeout,
+			)
+
+		shards = write_shards(batch_lines(requests, endpoint), max_requests_per_batch, max_bytes_per_batch)
+		created = submit_shards(shards, submit, self.cancel, upload_concurrency)
+		return BatchRun(self, created, poll_interval)
+
+
+class AsyncBatches(AsyncBaseAPI):
+	def __init__(self, client: 'AsyncZaiClient') -> None:
+		super().__init__(client)
+
+	async def create(
+		self,
+		*,
+		completion_window: str | None = None,
+		endpoint: Literal['/v1/chat/completions', '/v1/embeddings'],
+		input_file_id: str,
+		metadata: Optional[Dict[str, str]] | NotGiven = NOT_GIVEN,
+		auto_delete_input_file: bool = True,
+		extra_headers: Headers | None = None,
+		extra_body: Body | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+	) -> Batch:
+		return await self._post(
+			'/batches',
+			body=await async_maybe_transform(
+				{
+					'completion_window': completion_window,
+					'endpoint': endpoint,
+					'input_file_id': input_file_id,
+					'metadata': metadata,
+					'auto_delete_input_file': auto_delete_input_file,
+				},
+				BatchCreateParams,
+			),
+			options=make_request_options(extra_headers=extra_headers, extra_body=extra_body, timeout=timeout),
+			cast_type=Batch,
+		)
+
+	async def retrieve(
+		self,
+		batch_id: str,
+		*,
+		extra_headers: Headers | None = None,
+		extra_body: Body | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+	) -> Batch:
+		"""
+		Retrieves a batch.
+
+		Args:
+		  extra_headers: Send extra headers
+
+		  extra_body: Add additional JSON properties to the request
+
+		  timeout: Override the client-level default timeout for this request, in seconds
+		"""
+		if not batch_id:
+			raise ValueError(f'Expected a non-empty value for `batch_id` but received {batch_id!r}')
+		return await self._get(
+			f'/batches/{batch_id}',
+			options=make_request_options(extra_headers=extra_headers, extra_body=extra_body, timeout=timeout),
+			cast_type=Batch,
+		)
+
+	async def list(
+		self,
+		*,
+		after: str | NotGiven = NOT_GIVEN,
+		limit: int | NotGiven = NOT_GIVEN,
+		extra_headers: Headers | None = None,
+		extra_body: Body | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+	) -> AsyncCursorPage[Batch]:
+		"""List your organization's batches.
+
+		Args:
+		  after: A cursor for use in pagination.
+
+		    `after` is an object ID that defines your place
+		      in the list. For instance, if you make a list request and receive 100 objects,
+		      ending with obj_foo, your subsequent call can include after=obj_foo in order to
+		      fetch the next page of the list.
+
+		  limit: A limit on the number of objects to be returned. Limit can range between 1 and
+		      100, and the default is 20.
+
+		  extra_headers: Send extra headers
+
+		  extra_body: Add additional JSON properties to the request
+
+		  timeout: Override the client-level default timeout for this request, in seconds
+		"""
+		return await self._get_api_list(
+			'/batches',
+			page=AsyncCursorPage[Batch],
+			options=make_request_options(
+				extra_headers=extra_headers,
+				extra_body=extra_body,
+				timeout=timeout,
+				query=await async_maybe_transform(
+					{
+						'after': after,
+						'limit': limit,
+					},
+					BatchListParams,
+				),
+			),
+			model=Batch,
+		)
+
+	async def cancel(
+		self,
+		batch_id: str,
+		*,
+		extra_headers: Headers | None = None,
+		extra_body: Body | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+	) -> Batch:
+		"""
+		Cancels an in-progress batch.
+
+		Args:
+		  batch_id: The ID of the batch to cancel.
+		  extra_headers: Send extra headers
+
+		  extra_body: Add additional JSON properties to the request
+
+		  timeout: Override the client-level default timeout for this request, in seconds
+
+		"""
+		if not batch_id:
+			raise ValueError(f'Expected a non-empty value for `batch_id` but received {batch_id!r}')
+		return await self._post(
+			f'/batches/{batch_id}/cancel',
+			options=make_request_options(extra_headers=extra_headers, extra_body=extra_body, timeout=timeout),
+			cast_type=Batch,
+		)
+
+	async def run(
+		self,
+		requests: Iterable[Mapping[str, Any]],
+		*,
+		endpoint: Literal['/v1/chat/completions', '/v1/embeddings'] = '/v1/chat/completions',
+		completion_window: str | None = None,
+		metadata: Optional[Dict[str, str]] | NotGiven = NOT_GIVEN,
+		max_requests_per_batch: int = BATCH_MAX_REQUESTS,
+		max_bytes_per_batch: int = BATCH_MAX_BYTES,
+		upload_concurrency: int = 4,
+		poll_interval: float = 10.0,
+		extra_headers: Headers | None = None,
+		extra_body: Body | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+	) -> AsyncBatchRun:
+		"""
+		Run any number of requests through the Batch API.
+
+		The requests are streamed into temporary JSONL files, split whenever a file would
+		exceed `max_requests_per_batch` lines or `max_bytes_per_batch` bytes, and every file is
+		uploaded and turned into a batch while the next one is written. Iterate the returned
+		run (or call its `results()`) to get `(custom_id, result)` pairs as the batches end.
+
+		Args:
+		  requests: Request bodies, or batch lines with `body` and optionally `custom_id`,
+		      `method` and `url`; bodies without a `custom_id` get `request-<position>`
+
+		  endpoint: The endpoint the requests are sent to
+
+		  completion_window: The time frame within which each batch should be processed
+
+		  metadata: Metadata attached to every batch
+
+		  max_requests_per_batch: Largest number of requests in one batch
+
+		  max_bytes_per_batch: Largest size of one batch input file in bytes
+
+		  upload_concurrency: Number of files uploaded at once
+
+		  poll_interval: Seconds between two polls of the unfinished batches
+
+		  extra_headers: Send extra headers
+
+		  extra_body: Add additional JSON properties to the request
+
+		  timeout: Override the client-level default timeout for each request, in seconds
+		"""
+		files = self._client.files
+
+		async def submit(path: pathlib.Path) -> Batch:
+			file = await files.create(
+				file=path, purpose='batch', extra_headers=extra_headers, extra_body=extra_body, timeout=timeout
+			)
+			return await self.create(
+				completion_window=completion_window,
+				endpoint=endpoint,
+				input_file_id=file.id,
+				metadata=metadata,
+				extra_headers=extra_headers,
+				extra_body=extra_body,
+				timeout=timeout,
+			)
+
+		shards = write_shards(batch_lines(requests, endpoint), max_requests_per_batch, max_bytes_per_batch)
+		created = await async_submit_shards(shards, submit, self.cancel, upload_concurrency)
+		return AsyncBatchRun(self, created, poll_interval)
@@ -0,0 +1,371 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import pathlib
+import tempfile
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+	TYPE_CHECKING,
+	Any,
+	AsyncIterator,
+	Awaitable,
+	Callable,
+	Iterable,
+	Iterator,
+	List,
+	Mapping,
+	Optional,
+	Sequence,
+	Tuple,
+)
+
+from zai.core import ZaiError
+from zai.core._json_encoder import encode_json_body
+from zai.types.batch import Batch, BatchResult
+
+if TYPE_CHECKING:
+	from .batches import AsyncBatches, Batches
+
+# limits of one batch input file
+BATCH_MAX_REQUESTS = 50_000
+BATCH_MAX_BYTES = 100 * 1024 * 1024
+
+TERMINAL_STATUSES = frozenset({'completed', 'failed', 'expired', 'cancelled'})
+
+# `url` of a batch line for each batch endpoint
+_ENDPOINT_URLS = {'/v1/chat/completions': '/v4/chat/completions', '/v1/embeddings': '/v4/embeddings'}
+
+
+class BatchRunError(ZaiError):
+	"""
+	Raised after the results of a batch run were read if some of its batches failed.
+
+	Attributes:
+		batches: The failed batches; their `errors` describe why
+	"""
+
+	def __init__(self, message: str, *, batches: List[Batch]) -> None:
+		super().__init__(message)
+		self.batches = batches
+
+
+def batch_lines(requests: Iterable[Mapping[str, Any]], endpoint: str) -> Iterator[bytes]:
+	"""
+	Encode requests as lines of a batch input file.
+
+	A request is either a complete line (a mapping with `body`, and optionally `custom_id`,
+	`method` and `url`) or just the request body. Requests without a `custom_id` get
+	`request-<position>`.
+	"""
+	url = _ENDPOINT_URLS.get(endpoint, endpoint)
+	for position, request in enumerate(requests):
+		if 'body' in request:
+			line = {
+				'custom_id': str(request.get('custom_id', f'request-{position}')),
+				'method': request.get('method', 'POST'),
+				'url': request.get('url', url),
+				'body': request['body'],
+			}
+		else:
+			line = {'custom_id': f'request-{position}', 'method': 'POST', 'url': url, 'body': request}
+		yield encode_json_body(line) + b'\n'
+
+
+def write_shards(lines: Iterable[bytes], max_requests: int, max_bytes: int) -> Iterator[Tuple[str, int]]:
+	"""
+	Write lines to temporary JSONL files of at most `max_requests` lines and `max_bytes` bytes.
+
+	Yields the path and line count of each file once it is complete, so it can be uploaded
+	while the next one is written; the caller removes the files.
+	"""
+	if max_requests < 1 or max_bytes < 1:
+		raise ValueError('`max_requests_per_batch` and `max_bytes_per_batch` must be positive')
+	file = None
+	count = size = 0
+	try:
+		for line in lines:
+			if len(line) > max_bytes:
+				raise ValueError(f'A batch request of {len(line)} bytes exceeds `max_bytes_per_batch` ({max_bytes})')
+			if file is not None and (count == max_requests or size + len(line) > max_bytes):
+				file.close()
+				yield file.name, count
+				file = None
+			if file is None:
+				file = tempfile.NamedTemporaryFile('wb', prefix='zai-batch-', suffix='.jsonl', delete=False)
+				count = size = 0
+			file.write(line)
+			count += 1
+			size += len(line)
+		if file is not None:
+			file.close()
+			yield file.name, count
+			file = None
+	finally:
+		if file is not None:
+			file.close()
+			_remove(file.name)
+
+
+def _remove(path: str) -> None:
+	try:
+		os.remove(path)
+	except OSError:
+		pass
+
+
+def _failed_error(batches: List[Batch]) -> Optional[BatchRunError]:
+	failed = [batch for batch in batches if batch.status == 'failed']
+	if not failed:
+		return None
+	return BatchRunError(f'{len(failed)} of {len(batches)} batches failed', batches=failed)
+
+
+class BatchRun:
+	"""
+	Batches created by `client.batches.run()` from one stream of requests.
+
+	All batches are polled by one loop; `results()` yields the results of each batch as soon
+	as it ends, so early shards can be processed while later ones still run.
+	"""
+
+	def __init__(self, batches: Batches, created: List[Batch], poll_interval: float) -> None:
+		self._resource = batches
+		self._batches = list(created)
+		self.poll_interval = poll_interval
+
+	@property
+	def batches(self) -> List[Batch]:
+		"""The batches, as of their last poll."""
+		return list(self._batches)
+
+	def _poll(self) -> Iterator[Batch]:
+		pending = [index for index, batch in enumerate(self._batches) if batch.status not in TERMINAL_STATUSES]
+		for batch in self._batches:
+			if batch.status in TERMINAL_STATUSES:
+				yield batch
+		while pending:
+			for index in list(pending):
+				batch = self._batches[index] = self._resource.retrieve(self._batches[index].id)
+				if batch.status in TERMINAL_STATUSES:
+					pending.remove(index)
+					yield batch
+			if pending:
+				time.sleep(self.poll_interval)
+
+	def wait(self) -> List[Batch]:
+		"""Poll until every batch has ended and return them."""
+		for _ in self._poll():
+			pass
+		return self.batches
+
+	def results(self) -> Iterator[Tuple[str, BatchResult]]:
+		"""
+		Yield `(custom_id, result)` for every request, batch by batch as they end.
+
+		Requests that could not be executed are read from the error files, with `error` or a
+		non-200 `response.status_code` set. Raises `BatchRunError` at the end if batches failed.
+		"""
+		files = self._resource._client.files
+		for batch in self._poll():
+			for file_id in (batch.output_file_id, batch.error_file_id):
+				if file_id:
+					for result in files.iter_jsonl(file_id):
+						yield result.custom_id, result
+		error = _failed_error(self._batches)
+		if error is not None:
+			raise error
+
+	def __iter__(self) -> Iterator[Tuple[str, BatchResult]]:
+		return self.results()
+
+	def cancel(self) -> None:
+		"""Cancel the batches that have not ended yet."""
+		for index, batch in enumerate(self._batches):
+			if batch.status not in TERMINAL_STATUSES:
+				self._batches[index] = self._resource.cancel(batch.id)
+
+
+class AsyncBatchRun:
+	"""
+	Batches created by `client.batches.run()` from one stream of requests; the `asyncio`
+	counterpart of `BatchRun`.
+	"""
+
+	def __init__(self, batches: AsyncBatches, created: List[Batch], poll_interval: float) -> None:
+		self._resource = batches
+		self._batches = list(created)
+		self.poll_interval = poll_interval
+
+	@property
+	def batches(self) -> List[Batch]:
+		"""The batches, as of their last poll."""
+		return list(self._batches)
+
+	async def _poll(self) -> AsyncIterator[Batch]:
+		pending = [index for index, batch in enumerate(self._batches) if batch.status not in TERMINAL_STATUSES]
+		for batch in self._batches:
+			if batch.status in TERMINAL_STATUSES:
+				yield batch
+		while pending:
+			polled = await asyncio.gather(*(self._resource.retrieve(self._batches[index].id) for index in pending))
+			for index, batch in zip(list(pending), polled):
+				self._batches[index] = batch
+				if batch.status in TERMINAL_STATUSES:
+					pending.remove(index)
+					yield batch
+			if pending:
+				await asyncio.sleep(self.poll_interval)
+
+	async def wait(self) -> List[Batch]:
+		"""Poll until every batch has ended and return them."""
+		async for _ in self._poll():
+			pass
+		return self.batches
+
+	async def results(self) -> AsyncIterator[Tuple[str, BatchResult]]:
+		"""Yield `(custom_id, result)` for every request, batch by batch as they end; see `BatchRun.results()`."""
+		files = self._resource._client.files
+		async for batch in self._poll():
+			for file_id in (batch.output_file_id, batch.error_file_id):
+				if file_id:
+					async for result in files.iter_jsonl(file_id):
+						yield result.custom_id, result
+		error = _failed_error(self._batches)
+		if error is not None:
+			raise error
+
+	def __aiter__(self) -> AsyncIterator[Tuple[str, BatchResult]]:
+		return self.results()
+
+	async def cancel(self) -> None:
+		"""Cancel the batches that have not ended yet."""
+		for index, batch in enumerate(self._batches):
+			if batch.status not in TERMINAL_STATUSES:
+				self._batches[index] = await self._resource.cancel(batch.id)
+
+
+def submit_shards(
+	shards: Iterator[Tuple[str, int]],
+	submit: Callable[[pathlib.Path], Batch],
+	cancel: Callable[[str], Any],
+	concurrency: int,
+) -> List[Batch]:
+	"""
+	Upload every shard and create its batch, with up to `concurrency` shards in flight.
+
+	Each shard file is removed once it is uploaded. On error the shards not started yet
+	are dropped and the batches already created are cancelled.
+	"""
+
+	def upload(path: str) -> Batch:
+		try:
+			return submit(pathlib.Path(path))
+		finally:
+			_remove(path)
+
+	futures: List[Future[Batch]] = []
+	with ThreadPoolExecutor(concurrency, thread_name_prefix='zai-batch-upload') as pool:
+		try:
+			for path, _ in shards:
+				try:
+					# bound the finished shard files waiting for an upload
+					while sum(not future.done() for future in futures) >= concurrency:
+						wait(futures, return_when=FIRST_COMPLETED)
+					_raise_failed(futures)
+				except BaseException:
+					_remove(path)
+					raise
+				futures.append(pool.submit(upload, path))
+			wait(futures)
+			_raise_failed(futures)
+		except BaseException:
+			shards.close()  # type: ignore[attr-defined]
+			for future in futures:
+				future.cancel()
+			wait(futures)
+			# do not leave batches running whose results nobody will read
+			for future in futures:
+				if not future.cancelled() and future.exception() is None:
+					_cancel_quietly(cancel, future.result().id)
+			raise
+	return [future.result() for future in futures]
+
+
+async def async_submit_shards(
+	shards: Iterator[Tuple[str, int]],
+	submit: Callable[[pathlib.Path], Awaitable[Batch]],
+	cancel: Callable[[str], Awaitable[Any]],
+	concurrency: int,
+) -> List[Batch]:
+	"""
+	The `asyncio` counterpart of `submit_shards()`.
+
+	Shard files are written by `shards` in a worker thread, so large inputs do not block
+	the event loop while they are split.
+	"""
+	semaphore = asyncio.Semaphore(concurrency)
+	writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='zai-batch-shards')
+	writing: Optional[Future[Optional[Tuple[str, int]]]] = None
+
+	async def upload(path: str) -> Batch:
+		try:
+			return await submit(pathlib.Path(path))
+		finally:
+			semaphore.release()
+			_remove(path)
+
+	tasks: List[asyncio.Task[Batch]] = []
+	try:
+		while True:
+			writing = writer.submit(next, shards, None)
+			shard = await asyncio.wrap_future(writing)
+			writing = None
+			if shard is None:
+				break
+			path, _ = shard
+			try:
+				# bound the finished shard files waiting for an upload
+				await semaphore.acquire()
+				_raise_failed(tasks)
+			except BaseException:
+				_remove(path)
+				raise
+			tasks.append(asyncio.ensure_future(upload(path)))
+		return list(await asyncio.gather(*tasks))
+	except BaseException:
+		if writing is not None:
+			# a shard being written cannot be interrupted: let it finish, then drop it
+			try:
+				shard = await asyncio.wrap_future(writing)
+			except BaseException:
+				shard = None
+			if shard is not None:
+				_remove(shard[0])
+		shards.close()  # type: ignore[attr-defined]
+		for task in tasks:
+			task.cancel()
+		await asyncio.gather(*tasks, return_exceptions=True)
+		for task in tasks:
+			if not task.cancelled() and task.exception() is None:
+				try:
+					await cancel(task.result().id)
+				except Exception:
+					pass
+		raise
+	finally:
+		writer.shutdown(wait=False)
+
+
+def _raise_failed(futures: Sequence[Any]) -> None:
+	for future in futures:
+		if future.done() and not future.cancelled() and future.exception() is not None:
+			raise future.exception()
+
+
+def _cancel_quietly(cancel: Callable[[str], Any], batch_id: str) -> None:
+	try:
+		cancel(batch_id)
+	except Exception:
+		pass
@@ -1,9 +1,16 @@
-from .async_completions import AsyncCompletions
-from .chat import Chat
-from .completions import Completions
+from .async_completions import AsyncChatAsyncCompletions, AsyncCompletions
+from .chat import AsyncChat, Chat
+from .completions import AsyncChatCompletions, Completions
+from .stream_accumulator import AsyncChatCompletionStream, ChatCompletionStream, ChatCompletionStreamAccumulator
 
 __all__ = [
 	'AsyncCompletions',
 	'Chat',
 	'Completions',
+	'AsyncChat',
+	'AsyncChatCompletions',
+	'AsyncChatAsyncCompletions',
+	'ChatCompletionStream',
+	'AsyncChatCompletionStream',
+	'ChatCompletionStreamAccumulator',
 ]
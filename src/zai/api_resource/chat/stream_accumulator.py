@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+
+import pydantic
+
+from zai.core import AsyncStreamResponse, LazyModel, StreamResponse, construct_type
+from zai.core._base_compat import model_dump
+from zai.core._base_type import ResponseT
+from zai.types.chat.chat_completion import Completion
+
+
+class _ToolCallBuffer:
+	__slots__ = ('id', 'type', 'name', 'arguments')
+
+	def __init__(self) -> None:
+		self.id: Optional[str] = None
+		self.type: Optional[str] = None
+		self.name: Optional[str] = None
+		self.arguments: List[str] = []
+
+
+class _ChoiceBuffer:
+	__slots__ = ('role', 'finish_reason', 'content', 'reasoning_content', 'tool_calls')
+
+	def __init__(self) -> None:
+		self.role: Optional[str] = None
+		self.finish_reason: Optional[str] = None
+		self.content: List[str] = []
+		self.reasoning_content: List[str] = []
+		self.tool_calls: Dict[int, _ToolCallBuffer] = {}
+
+
+class ChatCompletionStreamAccumulator:
+	"""
+	Merges streamed chat completion chunks into a single `Completion`.
+
+	Text, reasoning and tool-call argument fragments are collected in per-choice and
+	per-tool-call lists and joined once at the end, so accumulation stays linear in the
+	length of the output.
+	"""
+
+	def __init__(self) -> None:
+		self._choices: Dict[int, _ChoiceBuffer] = {}
+		self._chunk: Dict[str, Any] = {}
+		self._usage: Any = None
+
+	def add(self, chunk: object) -> None:
+		"""
+		Merge one chunk into the accumulated state.
+
+		Arguments:
+			chunk (object): A `ChatCompletionChunk`, a lazy chunk view or the decoded chunk JSON
+		"""
+		if isinstance(chunk, LazyModel):
+			chunk = chunk.to_dict()
+		elif isinstance(chunk, pydantic.BaseModel):
+			chunk = model_dump(chunk, exclude_unset=True)
+		if not isinstance(chunk, dict):
+			return
+
+		for key in ('id', 'model', 'created', 'request_id'):
+			value = chunk.get(key)
+			if value is not None:
+				self._chunk[key] = value
+		usage = chunk.get('usage')
+		if usage:
+			self._usage = usage
+
+		for choice in chunk.get('choices') or ():
+			index = choice.get('index') or 0
+			buffer = self._choices.get(index)
+			if buffer is None:
+				buffer = self._choices[index] = _ChoiceBuffer()
+			if choice.get('finish_reason'):
+				buffer.finish_reason = choice['finish_reason']
+
+			delta = choice.get('delta')
+			if not delta:
+				continue
+			if delta.get('role'):
+				buffer.role = delta['role']
+			if delta.get('content'):
+				buffer.content.append(delta['content'])
+			if delta.get('reasoning_content'):
+				buffer.reasoning_content.append(delta['reasoning_content'])
+			for tool_call in delta.get('tool_calls') or ():
+				self._add_tool_call(buffer, tool_call)
+
+	@staticmethod
+	def _add_tool_call(buffer: _ChoiceBuffer, tool_call: Dict[str, Any]) -> None:
+		index = tool_call.get('index') or 0
+		call = buffer.tool_calls.get(index)
+		if call is None:
+			call = buffer.tool_calls[index] = _ToolCallBuffer()
+		if tool_call.get('id'):
+			call.id = tool_call['id']
+		if tool_call.get('type'):
+			call.type = tool_call['type']
+		function = tool_call.get('function')
+		if function:
+			if function.get('name'):
+				call.name = function['name']
+			if function.get('arguments'):
+				call.arguments.append(function['arguments'])
+
+	def get_final_completion(self) -> Completion:
+		"""Build the `Completion` the accumulated chunks add up to."""
+		choices = []
+		for index in sorted(self._choices):
+			buffer = self._choices[index]
+			message: Dict[str, Any] = {
+				'role': buffer.role or 'assistant',
+				'content': ''.join(buffer.content),
+			}
+			if buffer.reasoning_content:
+				message['reasoning_content'] = ''.join(buffer.reasoning_content)
+			if buffer.tool_calls:
+				message['tool_calls'] = [
+					{
+						'id': call.id,
+						'type': call.type or 'function',
+						'function': {'name': call.name, 'arguments': ''.join(call.arguments)},
+					}
+					for _, call in sorted(buffer.tool_calls.items())
+				]
+			choices.append({'index': index, 'finish_reason': buffer.finish_reason, 'message': message})
+
+		data = {**self._chunk, 'choices': choices, 'usage': self._usage}
+		return construct_type(type_=Completion, value=data)
+
+
+class ChatCompletionStream(StreamResponse[ResponseT]):
+	"""
+	Chat completion stream that also accumulates the chunks it yields.
+
+	`get_final_completion()` drains whatever has not been consumed yet, without
+	building chunk models for it, and returns the merged `Completion`. Both iterating
+	the stream and `iter_text()` feed the accumulator, so it can be called after either.
+
+	Every text, reasoning and tool-call fragment is kept until the stream is discarded,
+	whether or not `get_final_completion()` is called: memory grows with the length of
+	the generated output, about as much as the joined text itself.
+	"""
+
+	def __init__(self, **kwargs: Any) -> None:
+		self._accumulator = ChatCompletionStreamAccumulator()
+		super().__init__(**kwargs)
+		self._chunks_json = self._iter_accumulated_json()
+
+	def __stream__(self) -> Iterator[ResponseT]:
+		response = self.response
+		cast_type = self._cast_type
+		process = self._data_process_func
+		for data in self._chunks_json:
+			yield process(data=data, cast_type=cast_type, response=response)
+
+	def _iter_accumulated_json(self) -> Iterator[object]:
+		accumulator = self._accumulator
+		for data in self._iter_json():
+			accumulator.add(data)
+			yield data
+
+	def iter_text(self) -> Iterator[str]:
+		"""Yield the text deltas of the stream, as `StreamResponse.iter_text()`, accumulating them too."""
+		return self._text_deltas(self._chunks_json)
+
+	def get_final_completion(self) -> Completion:
+		"""Consume the rest of the stream and return the accumulated `Completion`."""
+		for _ in self._chunks_json:
+			pass
+		return self._accumulator.get_final_completion()
+
+
+class AsyncChatCompletionStream(AsyncStreamResponse[ResponseT]):
+	"""
+	Async chat completion stream that also accumulates the chunks it yields.
+
+	The `async for` counterpart of `ChatCompletionStream`, with the same memory cost.
+	"""
+
+	def __init__(self, **kwargs: Any) -> None:
+		self._accumulator = ChatCompletionStreamAccumulator()
+		super().__init__(**kwargs)
+		self._chunks_json = self._iter_accumulated_json()
+
+	async def __stream__(self) -> AsyncIterator[ResponseT]:
+		response = self.response
+		cast_type = self._cast_type
+		process = self._data_process_func
+		async for data in self._chunks_json:
+			yield process(data=data, cast_type=cast_type, response=response)
+
+	async def _iter_accumulated_json(self) -> AsyncIterator[object]:
+		accumulator = self._accumulator
+		async for data in self._iter_json():
+			accumulator.add(data)
+			yield data
+
+	def iter_text(self) -> AsyncIterator[str]:
+		"""Yield the text deltas of the stream, as `AsyncStreamResponse.iter_text()`, accumulating them too."""
+		return self._text_deltas(self._chunks_json)
+
+	async def get_final_completion(self) -> Completion:
+		"""Consume the rest of the stream and return the accumulated `Completion`."""
+		async for _ in self._chunks_json:
+			pass
+		return self._accumulator.get_final_completion()
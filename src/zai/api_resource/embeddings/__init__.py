@@ -1,3 +1,4 @@
-from .embeddings import Embeddings
+from .batcher import AsyncEmbeddingBatcher, EmbeddingBatcher, EmbeddingBatcherStats
+from .embeddings import AsyncEmbeddings, Embeddings
 
-__all__ = ['Embeddings']
+__all__ = ['Embeddings', 'AsyncEmbeddings', 'EmbeddingBatcher', 'AsyncEmbeddingBatcher', 'EmbeddingBatcherStats']
@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+	from .embeddings import AsyncEmbeddings, Embeddings
+
+
+class EmbeddingBatcherStats:
+	"""
+	Counters of an embedding batcher.
+
+	Attributes:
+		calls: Texts submitted.
+		requests: Embedding requests sent for them.
+	"""
+
+	def __init__(self) -> None:
+		self.calls = 0
+		self.requests = 0
+
+	@property
+	def batch_factor(self) -> float:
+		"""Average number of texts per request."""
+		return self.calls / self.requests if self.requests else 0.0
+
+	def __repr__(self) -> str:
+		return f'EmbeddingBatcherStats(calls={self.calls}, requests={self.requests})'
+
+
+class _BaseEmbeddingBatcher:
+	def __init__(self, model: str, max_batch_size: int, max_wait: float, concurrency: int, **params: Any) -> None:
+		if max_batch_size < 1:
+			raise ValueError(f'`max_batch_size` must be at least 1, got {max_batch_size}')
+		if concurrency < 1:
+			raise ValueError(f'`concurrency` must be at least 1, got {concurrency}')
+		self.model = model
+		self.max_batch_size = max_batch_size
+		self.max_wait = max_wait
+		self.concurrency = concurrency
+		self._params: Dict[str, Any] = params
+		self._stats = EmbeddingBatcherStats()
+		self._closed = False
+
+	def stats(self) -> EmbeddingBatcherStats:
+		stats = EmbeddingBatcherStats()
+		stats.__dict__.update(self._stats.__dict__)
+		return stats
+
+	@staticmethod
+	def _vectors(response: Any, count: int) -> List[List[float]]:
+		if len(response.data) != count:
+			raise ValueError(f'Expected {count} embeddings, got {len(response.data)}')
+		vectors: List[List[float]] = [[] for _ in range(count)]
+		for position, item in enumerate(response.data):
+			vectors[item.index if item.index is not None else position] = item.embedding
+		return vectors
+
+
+class EmbeddingBatcher(_BaseEmbeddingBatcher):
+	"""
+	Aggregates concurrent single-text embedding calls into batched requests.
+
+	Texts passed to `embed()` or `submit()` from any thread are collected by a background
+	thread: a batch is sent as soon as it holds `max_batch_size` texts, or `max_wait` seconds
+	after its first text arrived, and every caller receives its own vector. Up to
+	`concurrency` batches are in flight at once.
+
+	Create it with `client.embeddings.batcher()` and `close()` it (or use it as a context
+	manager) to send the pending texts and stop the thread.
+	"""
+
+	def __init__(
+		self,
+		embeddings: Embeddings,
+		*,
+		model: str,
+		max_batch_size: int,
+		max_wait: float,
+		concurrency: int,
+		**params: Any,
+	) -> None:
+		super().__init__(model, max_batch_size, max_wait, concurrency, **params)
+		self._embeddings = embeddings
+		# text, its future and when it was submitted
+		self._pending: List[Tuple[str, Future[List[float]], float]] = []
+		self._condition = threading.Condition()
+		self._thread: Optional[threading.Thread] = None
+		self._executor = ThreadPoolExecutor(concurrency, thread_name_prefix='zai-embedding-batch')
+
+	def submit(self, text: str) -> Future[List[float]]:
+		"""Queue one text and return a future resolved with its embedding."""
+		future: Future[List[float]] = Future()
+		with self._condition:
+			if self._closed:
+				raise RuntimeError('Cannot submit to a closed embedding batcher')
+			self._pending.append((text, future, time.monotonic()))
+			self._stats.calls += 1
+			if self._thread is None:
+				self._thread = threading.Thread(target=self._run, name='zai-embedding-batcher', daemon=True)
+				self._thread.start()
+			self._condition.notify()
+		return future
+
+	def embed(self, text: str, timeout: Optional[float] = None) -> List[float]:
+		"""Embed one text as part of the next batch."""
+		return self.submit(text).result(timeout)
+
+	def _run(self) -> None:
+		while True:
+			with self._condition:
+				while not self._pending and not self._closed:
+					self._condition.wait()
+				if not self._pending:
+					return
+				while len(self._pending) < self.max_batch_size and not self._closed:
+					remaining = self._pending[0][2] + self.max_wait - time.monotonic()
+					if remaining <= 0:
+						break
+					self._condition.wait(remaining)
+				batch = [(text, future) for text, future, _ in self._pending[: self.max_batch_size]]
+				del self._pending[: self.max_batch_size]
+				self._stats.requests += 1
+			self._executor.submit(self._send, batch)
+
+	def _send(self, batch: List[Tuple[str, Future[List[float]]]]) -> None:
+		batch = [(text, future) for text, future in batch if future.set_running_or_notify_cancel()]
+		if not batch:
+			return
+		try:
+			response = self._embeddings.create(input=[text for text, _ in batch], model=self.model, **self._params)
+			vectors = self._vectors(response, len(batch))
+		except BaseException as err:
+			for _, future in batch:
+				future.set_exception(err)
+			return
+		for (_, future), vector in zip(batch, vectors):
+			future.set_result(vector)
+
+	def close(self) -> None:
+		"""Send the pending texts, wait for all batches and stop the background thread."""
+		with self._condition:
+			self._closed = True
+			self._condition.notify()
+			thread = self._thread
+		if thread is not None:
+			thread.join()
+		self._executor.shutdown(wait=True)
+
+	def __enter__(self) -> EmbeddingBatcher:
+		return self
+
+	def __exit__(self, *args: object) -> None:
+		self.close()
+
+
+class AsyncEmbeddingBatcher(_BaseEmbeddingBatcher):
+	"""
+	Aggregates concurrent single-text embedding calls into batched requests; the
+	`asyncio` counterpart of `EmbeddingBatcher`, sending each batch from its own task.
+	"""
+
+	def __init__(
+		self,
+		embeddings: AsyncEmbeddings,
+		*,
+		model: str,
+		max_batch_size: int,
+		max_wait: float,
+		concurrency: int,
+		**params: Any,
+	) -> None:
+		super().__init__(model, max_batch_size, max_wait, concurrency, **params)
+		self._embeddings = embeddings
+		self._pending: List[Tuple[str, asyncio.Future[List[float]]]] = []
+		self._timer: Optional[asyncio.TimerHandle] = None
+		self._tasks: Set[asyncio.Task[None]] = set()
+		self._semaphore: Optional[asyncio.Semaphore] = None
+
+	def submit(self, text: str) -> asyncio.Future[List[float]]:
+		"""Queue one text and return a future resolved with its embedding."""
+		if self._closed:
+			raise RuntimeError('Cannot submit to a closed embedding batcher')
+		loop = asyncio.get_running_loop()
+		future: asyncio.Future[List[float]] = loop.create_future()
+		self._pending.append((text, future))
+		self._stats.calls += 1
+		if len(self._pending) >= self.max_batch_size:
+			self._flush()
+		elif self._timer is None:
+			self._timer = loop.call_later(self.max_wait, self._flush)
+		return future
+
+	async def embed(self, text: str) -> List[float]:
+		"""Embed one text as part of the next batch."""
+		return await self.submit(text)
+
+	def _flush(self) -> None:
+		if self._timer is not None:
+			self._timer.cancel()
+			self._timer = None
+		while self._pending:
+			batch = self._pending[: self.max_batch_size]
+			del self._pending[: self.max_batch_size]
+			self._stats.requests += 1
+			task = asyncio.ensure_future(self._send(batch))
+			self._tasks.add(task)
+			task.add_done_callback(self._tasks.discard)
+
+	async def _send(self, batch: List[Tuple[str, asyncio.Future[List[float]]]]) -> None:
+		if self._semaphore is None:
+			self._semaphore = asyncio.Semaphore(self.concurrency)
+		try:
+			async with self._semaphore:
+				batch = [(text, future) for text, future in batch if not future.done()]
+				if not batch:
+					return
+				try:
+					response = await self._embeddings.create(
+						input=[text for text, _ in batch], model=self.model, **self._params
+					)
+					vectors = self._vectors(response, len(batch))
+				except Exception as err:
+					for _, future in batch:
+						if not future.done():
+							future.set_exception(err)
+					return
+		except BaseException:
+			# cancelled, e.g. at loop shutdown: the `embed()` callers must not wait forever
+			for _, future in batch:
+				if not future.done():
+					future.cancel()
+			raise
+		for (_, future), vector in zip(batch, vectors):
+			if not future.done():
+				future.set_result(vector)
+
+	async def aclose(self) -> None:
+		"""Send the pending texts and wait for all batches."""
+		self._closed = True
+		self._flush()
+		if self._tasks:
+			await asyncio.gather(*self._tasks, return_exceptions=True)
+
+	async def __aenter__(self) -> AsyncEmbeddingBatcher:
+		return self
+
+	async def __aexit__(self, *args: object) -> None:
+		await self.aclose()
@@ -1,14 +1,35 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional, Union
+import asyncio
+import binascii
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, List, Literal, Optional, Sequence, Union, cast
 
 import httpx
 
-from zai.core import NOT_GIVEN, BaseAPI, Body, Headers, NotGiven, make_request_options
-from zai.types.embeddings import EmbeddingsResponded
+from zai.core import (
+	NOT_GIVEN,
+	AsyncBaseAPI,
+	BaseAPI,
+	Body,
+	EmbeddingCache,
+	EmbeddingLookup,
+	Headers,
+	NotGiven,
+	is_given,
+	make_request_options,
+)
+from zai.types.chat.chat_completion import CompletionUsage
+from zai.types.embeddings import Embedding, EmbeddingMatrix, EmbeddingsResponded
+from zai.types.embeddings.embedding_matrix import sum_usage
+
+from .batcher import AsyncEmbeddingBatcher, EmbeddingBatcher
 
 if TYPE_CHECKING:
-	from zai._client import ZaiClient
+	from zai._client import AsyncZaiClient, ZaiClient
+
+# largest number of inputs the server accepts in one embeddings request
+EMBEDDING_BATCH_SIZE = 64
 
 
 class Embeddings(BaseAPI):
@@ -36,7 +57,9 @@ class Embeddings(BaseAPI):
 		extra_body: Body | None = None,
 		disable_strict_validation: Optional[bool] | None = None,
 		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
-	) -> EmbeddingsResponded:
+		cache: bool | NotGiven = NOT_GIVEN,
+		vector_format: Literal['list', 'array', 'numpy'] = 'list',
+	) -> EmbeddingsResponded | EmbeddingMatrix:
 		"""
 		Create embeddings for the given input
 
@@ -52,22 +75,453 @@ class Embeddings(BaseAPI):
 			extra_body (Body): Additional request body parameters
 			disable_strict_validation (Optional[bool]): Whether to disable strict validation
 			timeout (float | httpx.Timeout): Request timeout
+			cache (bool): Force (`True`) or skip (`False`) the client's response cache for this call;
+				`False` also bypasses the client's `embedding_cache`
+			vector_format (Literal['list', 'array', 'numpy']): 'array' or 'numpy' return an `EmbeddingMatrix`
+				holding all vectors in one float32 `array('f')` or NumPy matrix instead of lists of floats
 		"""
 		_cast_type = EmbeddingsResponded
 		if disable_strict_validation:
 			_cast_type = object
-		return self._post(
-			'/embeddings',
-			body={
-				'input': input,
-				'model': model,
-				'dimensions': dimensions,
-				'encoding_format': encoding_format,
-				'user': user,
-				'request_id': request_id,
-				'sensitive_word_check': sensitive_word_check,
-			},
-			options=make_request_options(extra_headers=extra_headers, extra_body=extra_body, timeout=timeout),
-			cast_type=_cast_type,
-			stream=False,
+		if vector_format != 'list':
+			# the raw body is decoded straight into a float32 buffer, skipping model construction
+			EmbeddingMatrix.check_format(vector_format)
+			_cast_type = httpx.Response
+		body = {
+			'input': input,
+			'model': model,
+			'dimensions': dimensions,
+			'encoding_format': encoding_format,
+			'user': user,
+			'request_id': request_id,
+			'sensitive_word_check': sensitive_word_check,
+		}
+		options = make_request_options(extra_headers=extra_headers, extra_body=extra_body, timeout=timeout, cache=cache)
+
+		lookup = _cache_lookup(self._client.embedding_cache, input, model, dimensions, cache, _cast_type)
+		if lookup is not None:
+			fetched = None
+			if lookup.missing:
+				missing = self._post(
+					'/embeddings',
+					body={**body, 'input': lookup.missing},
+					options=options,
+					cast_type=httpx.Response,
+					stream=False,
+				)
+				fetched = EmbeddingMatrix.from_json(missing.content)
+			return _cached_result(lookup, fetched, model, vector_format, encoding_format)
+
+		response = self._post('/embeddings', body=body, options=options, cast_type=_cast_type, stream=False)
+		if vector_format != 'list':
+			return EmbeddingMatrix.from_json(response.content, vector_format)
+		return response
+
+	def create_many(
+		self,
+		texts: Sequence[str],
+		*,
+		model: str,
+		batch_size: int = EMBEDDING_BATCH_SIZE,
+		concurrency: int = 4,
+		dimensions: Union[int] | NotGiven = NOT_GIVEN,
+		encoding_format: str | NotGiven = NOT_GIVEN,
+		user: str | NotGiven = NOT_GIVEN,
+		extra_headers: Headers | None = None,
+		extra_body: Body | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+		cache: bool | NotGiven = NOT_GIVEN,
+		vector_format: Literal['list', 'array', 'numpy'] = 'list',
+	) -> EmbeddingsResponded | EmbeddingMatrix:
+		"""
+		Embed any number of texts, split into batches that are sent in parallel
+
+		Each batch is a separate request, so a failed batch is retried on its own by the
+		client's retry policy. The embeddings are returned in input order, with `index`
+		being the position in `texts` and `usage` summed over all batches.
+
+		Arguments:
+			texts (Sequence[str]): Texts to embed
+			model (str): Model name to use for embedding generation
+			batch_size (int): Number of texts per request, at most the server limit
+			concurrency (int): Number of batches in flight at once
+			dimensions (Union[int]): Number of dimensions for the embedding vectors
+			encoding_format (str): Format for encoding the embeddings
+			user (str): User identifier
+			extra_headers (Headers): Additional HTTP headers
+			extra_body (Body): Additional request body parameters
+			timeout (float | httpx.Timeout): Request timeout of each batch
+			cache (bool): Force (`True`) or skip (`False`) the client's response cache for each batch
+			vector_format (Literal['list', 'array', 'numpy']): 'array' or 'numpy' return one `EmbeddingMatrix`
+				for all texts, see `create()`
+		"""
+		batches = _split_batches(texts, batch_size, concurrency, vector_format)
+
+		def embed(batch: Sequence[str]) -> EmbeddingsResponded | EmbeddingMatrix:
+			return self.create(
+				input=list(batch),
+				model=model,
+				dimensions=dimensions,
+				encoding_format=encoding_format,
+				user=user,
+				extra_headers=extra_headers,
+				extra_body=extra_body,
+				timeout=timeout,
+				cache=cache,
+				vector_format=vector_format,
+			)
+
+		if concurrency == 1 or len(batches) <= 1:
+			return _merge_batches(model, vector_format, batches, [embed(batch) for batch in batches])
+		with ThreadPoolExecutor(min(concurrency, len(batches)), thread_name_prefix='zai-embeddings') as pool:
+			futures = [pool.submit(embed, batch) for batch in batches]
+			try:
+				responses = [future.result() for future in futures]
+			except BaseException:
+				# batches that have not started yet are dropped
+				for future in futures:
+					future.cancel()
+				raise
+		return _merge_batches(model, vector_format, batches, responses)
+
+	def batcher(
+		self,
+		*,
+		model: str,
+		max_batch_size: int = EMBEDDING_BATCH_SIZE,
+		max_wait: float = 0.005,
+		concurrency: int = 4,
+		dimensions: Union[int] | NotGiven = NOT_GIVEN,
+		encoding_format: str | NotGiven = NOT_GIVEN,
+		user: str | NotGiven = NOT_GIVEN,
+		extra_headers: Headers | None = None,
+		extra_body: Body | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+		cache: bool | NotGiven = NOT_GIVEN,
+	) -> EmbeddingBatcher:
+		"""
+		Create a micro-batcher that merges concurrent single-text embedding calls into batched requests
+
+		Each `embed(text)` call waits at most `max_wait` seconds for other texts to share its
+		request, so many small concurrent calls cost a fraction of the round trips.
+		Call `close()` (or use it as a context manager) to send the pending texts.
+
+		Arguments:
+			model (str): Model name to use for embedding generation
+			max_batch_size (int): Number of texts after which a batch is sent at once
+			max_wait (float): Seconds a text waits for others before its batch is sent
+			concurrency (int): Number of batches in flight at once
+			dimensions (Union[int]): Number of dimensions for the embedding vectors
+			encoding_format (str): Format for encoding the embeddings
+			user (str): User identifier
+			extra_headers (Headers): Additional HTTP headers
+			extra_body (Body): Additional request body parameters
+			timeout (float | httpx.Timeout): Request timeout of each batch
+			cache (bool): Force (`True`) or skip (`False`) the client's response cache for each batch
+		"""
+		return EmbeddingBatcher(
+			self,
+			model=model,
+			max_batch_size=max_batch_size,
+			max_wait=max_wait,
+			concurrency=concurrency,
+			dimensions=dimensions,
+			encoding_format=encoding_format,
+			user=user,
+			extra_headers=extra_headers,
+			extra_body=extra_body,
+			timeout=timeout,
+			cache=cache,
 		)
+
+
+class AsyncEmbeddings(AsyncBaseAPI):
+	"""
+	Embeddings API resource
+
+	Attributes:
+		client (ZaiClient): The ZAI client instance
+	"""
+
+	def __init__(self, client: 'AsyncZaiClient') -> None:
+		super().__init__(client)
+
+	async def create(
+		self,
+		*,
+		input: Union[str, List[str], List[int], List[List[int]]],
+		model: Union[str],
+		dimensions: Union[int] | NotGiven = NOT_GIVEN,
+		encoding_format: str | NotGiven = NOT_GIVEN,
+		user: str | NotGiven = NOT_GIVEN,
+		request_id: Optional[str] | NotGiven = NOT_GIVEN,
+		sensitive_word_check: Optional[object] | NotGiven = NOT_GIVEN,
+		extra_headers: Headers | None = None,
+		extra_body: Body | None = None,
+		disable_strict_validation: Optional[bool] | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+		cache: bool | NotGiven = NOT_GIVEN,
+		vector_format: Literal['list', 'array', 'numpy'] = 'list',
+	) -> EmbeddingsResponded | EmbeddingMatrix:
+		"""
+		Create embeddings for the given input
+
+		Arguments:
+			input (Union[str, List[str], List[int], List[List[int]]]): Input text or tokens to embed
+			model (str): Model name to use for embedding generation
+			dimensions (Union[int]): Number of dimensions for the embedding vectors
+			encoding_format (str): Format for encoding the embeddings
+			user (str): User identifier
+			request_id (Optional[str]): Request identifier
+			sensitive_word_check (Optional[object]): Sensitive word checking configuration
+			extra_headers (Headers): Additional HTTP headers
+			extra_body (Body): Additional request body parameters
+			disable_strict_validation (Optional[bool]): Whether to disable strict validation
+			timeout (float | httpx.Timeout): Request timeout
+			cache (bool): Force (`True`) or skip (`False`) the client's response cache for this call;
+				`False` also bypasses the client's `embedding_cache`
+			vector_format (Literal['list', 'array', 'numpy']): 'array' or 'numpy' return an `EmbeddingMatrix`
+				holding all vectors in one float32 `array('f')` or NumPy matrix instead of lists of floats
+		"""
+		_cast_type = EmbeddingsResponded
+		if disable_strict_validation:
+			_cast_type = object
+		if vector_format != 'list':
+			# the raw body is decoded straight into a float32 buffer, skipping model construction
+			EmbeddingMatrix.check_format(vector_format)
+			_cast_type = httpx.Response
+		body = {
+			'input': input,
+			'model': model,
+			'dimensions': dimensions,
+			'encoding_format': encoding_format,
+			'user': user,
+			'request_id': request_id,
+			'sensitive_word_check': sensitive_word_check,
+		}
+		options = make_request_options(extra_headers=extra_headers, extra_body=extra_body, timeout=timeout, cache=cache)
+
+		lookup = _cache_lookup(self._client.embedding_cache, input, model, dimensions, cache, _cast_type)
+		if lookup is not None:
+			fetched = None
+			if lookup.missing:
+				missing = await self._post(
+					'/embeddings',
+					body={**body, 'input': lookup.missing},
+					options=options,
+					cast_type=httpx.Response,
+					stream=False,
+				)
+				fetched = EmbeddingMatrix.from_json(missing.content)
+			return _cached_result(lookup, fetched, model, vector_format, encoding_format)
+
+		response = await self._post('/embeddings', body=body, options=options, cast_type=_cast_type, stream=False)
+		if vector_format != 'list':
+			return EmbeddingMatrix.from_json(response.content, vector_format)
+		return response
+
+	async def create_many(
+		self,
+		texts: Sequence[str],
+		*,
+		model: str,
+		batch_size: int = EMBEDDING_BATCH_SIZE,
+		concurrency: int = 4,
+		dimensions: Union[int] | NotGiven = NOT_GIVEN,
+		encoding_format: str | NotGiven = NOT_GIVEN,
+		user: str | NotGiven = NOT_GIVEN,
+		extra_headers: Headers | None = None,
+		extra_body: Body | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+		cache: bool | NotGiven = NOT_GIVEN,
+		vector_format: Literal['list', 'array', 'numpy'] = 'list',
+	) -> EmbeddingsResponded | EmbeddingMatrix:
+		"""
+		Embed any number of texts, split into batches that are sent in parallel
+
+		Each batch is a separate request, so a failed batch is retried on its own by the
+		client's retry policy. The embeddings are returned in input order, with `index`
+		being the position in `texts` and `usage` summed over all batches.
+
+		Arguments:
+			texts (Sequence[str]): Texts to embed
+			model (str): Model name to use for embedding generation
+			batch_size (int): Number of texts per request, at most the server limit
+			concurrency (int): Number of batches in flight at once
+			dimensions (Union[int]): Number of dimensions for the embedding vectors
+			encoding_format (str): Format for encoding the embeddings
+			user (str): User identifier
+			extra_headers (Headers): Additional HTTP headers
+			extra_body (Body): Additional request body parameters
+			timeout (float | httpx.Timeout): Request timeout of each batch
+			cache (bool): Force (`True`) or skip (`False`) the client's response cache for each batch
+			vector_format (Literal['list', 'array', 'numpy']): 'array' or 'numpy' return one `EmbeddingMatrix`
+				for all texts, see `create()`
+		"""
+		batches = _split_batches(texts, batch_size, concurrency, vector_format)
+
+		semaphore = asyncio.Semaphore(concurrency)
+
+		async def embed(batch: Sequence[str]) -> EmbeddingsResponded | EmbeddingMatrix:
+			async with semaphore:
+				return await self.create(
+					input=list(batch),
+					model=model,
+					dimensions=dimensions,
+					encoding_format=encoding_format,
+					user=user,
+					extra_headers=extra_headers,
+					extra_body=extra_body,
+					timeout=timeout,
+					cache=cache,
+					vector_format=vector_format,
+				)
+
+		tasks = [asyncio.ensure_future(embed(batch)) for batch in batches]
+		try:
+			responses = await asyncio.gather(*tasks)
+		except BaseException:
+			for task in tasks:
+				task.cancel()
+			raise
+		return _merge_batches(model, vector_format, batches, responses)
+
+	def batcher(
+		self,
+		*,
+		model: str,
+		max_batch_size: int = EMBEDDING_BATCH_SIZE,
+		max_wait: float = 0.005,
+		concurrency: int = 4,
+		dimensions: Union[int] | NotGiven = NOT_GIVEN,
+		encoding_format: str | NotGiven = NOT_GIVEN,
+		user: str | NotGiven = NOT_GIVEN,
+		extra_headers: Headers | None = None,
+		extra_body: Body | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+		cache: bool | NotGiven = NOT_GIVEN,
+	) -> AsyncEmbeddingBatcher:
+		"""
+		Create a micro-batcher that merges concurrent single-text embedding calls into batched requests
+
+		Each `embed(text)` call waits at most `max_wait` seconds for other texts to share its
+		request, so many small concurrent calls cost a fraction of the round trips.
+		Call `aclose()` (or use it as an async context manager) to send the pending texts.
+
+		Arguments:
+			model (str): Model name to use for embedding generation
+			max_batch_size (int): Number of texts after which a batch is sent at once
+			max_wait (float): Seconds a text waits for others before its batch is sent
+			concurrency (int): Number of batches in flight at once
+			dimensions (Union[int]): Number of dimensions for the embedding vectors
+			encoding_format (str): Format for encoding the embeddings
+			user (str): User identifier
+			extra_headers (Headers): Additional HTTP headers
+			extra_body (Body): Additional request body parameters
+			timeout (float | httpx.Timeout): Request timeout of each batch
+			cache (bool): Force (`True`) or skip (`False`) the client's response cache for each batch
+		"""
+		return AsyncEmbeddingBatcher(
+			self,
+			model=model,
+			max_batch_size=max_batch_size,
+			max_wait=max_wait,
+			concurrency=concurrency,
+			dimensions=dimensions,
+			encoding_format=encoding_format,
+			user=user,
+			extra_headers=extra_headers,
+			extra_body=extra_body,
+			timeout=timeout,
+			cache=cache,
+		)
+
+
+def _cache_lookup(
+	embedding_cache: Optional[EmbeddingCache],
+	input: object,
+	model: str,
+	dimensions: Union[int, NotGiven],
+	cache: Union[bool, NotGiven],
+	cast_type: object,
+) -> Optional[EmbeddingLookup]:
+	"""Look the texts up in the client's embedding cache, or return `None` if the call bypasses it."""
+	if embedding_cache is None or cache is False or cast_type is object:
+		return None
+	texts = [input] if isinstance(input, str) else input
+	if not isinstance(texts, list) or not texts or not all(isinstance(text, str) for text in texts):
+		# token inputs are not cached
+		return None
+	return embedding_cache.lookup(model, dimensions if is_given(dimensions) else None, texts)
+
+
+def _cached_result(
+	lookup: EmbeddingLookup,
+	fetched: Optional[EmbeddingMatrix],
+	model: str,
+	vector_format: str,
+	encoding_format: str | NotGiven = NOT_GIVEN,
+) -> EmbeddingsResponded | EmbeddingMatrix:
+	rows = lookup.fill([fetched.row_bytes(index) for index in range(len(fetched))] if fetched is not None else [])
+	if fetched is not None:
+		model, usage = fetched.model or model, fetched.usage
+	else:
+		usage = CompletionUsage.construct(prompt_tokens=0, completion_tokens=0, total_tokens=0)
+	if vector_format == 'list' and encoding_format == 'base64':
+		# the cached rows are the little-endian float32 bytes the server base64-encodes
+		vectors: List[object] = [binascii.b2a_base64(row, newline=False).decode('ascii') for row in rows]
+	else:
+		matrix = EmbeddingMatrix.from_rows(rows, model, usage, 'array' if vector_format == 'list' else vector_format)
+		if vector_format != 'list':
+			return matrix
+		vectors = matrix.tolist()
+	data = [
+		Embedding.construct(object='embedding', index=index, embedding=vector) for index, vector in enumerate(vectors)
+	]
+	return EmbeddingsResponded.construct(object='list', data=data, model=model, usage=usage)
+
+
+def _split_batches(texts: Sequence[str], batch_size: int, concurrency: int, vector_format: str) -> List[Sequence[str]]:
+	if isinstance(texts, str):
+		raise TypeError('Expected a sequence of texts, not a single string; use `create()` instead')
+	if batch_size < 1:
+		raise ValueError(f'`batch_size` must be at least 1, got {batch_size}')
+	if concurrency < 1:
+		raise ValueError(f'`concurrency` must be at least 1, got {concurrency}')
+	if vector_format != 'list':
+		EmbeddingMatrix.check_format(vector_format)
+	return [texts[start : start + batch_size] for start in range(0, len(texts), batch_size)]
+
+
+def _merge_batches(
+	model: str,
+	vector_format: str,
+	batches: List[Sequence[str]],
+	responses: Sequence[Union[EmbeddingsResponded, EmbeddingMatrix]],
+) -> EmbeddingsResponded | EmbeddingMatrix:
+	if vector_format != 'list':
+		for batch, matrix in zip(batches, responses):
+			if len(matrix) != len(batch):
+				raise ValueError(f'Expected {len(batch)} embeddings for a batch, got {len(matrix)}')
+		return EmbeddingMatrix.concatenate(cast(Sequence[EmbeddingMatrix], responses), model, vector_format)
+
+	data: List[Embedding] = []
+	offset = 0
+	for batch, response in zip(batches, responses):
+		if len(response.data) != len(batch):
+			raise ValueError(f'Expected {len(batch)} embeddings for a batch, got {len(response.data)}')
+		# `index` is the position within the batch; fall back to the response order without it.
+		# The response may be shared through the coalescer, so it is copied rather than renumbered
+		for position, item in enumerate(response.data):
+			index = offset + (item.index if item.index is not None else position)
+			data.append(Embedding.construct(object=item.object, index=index, embedding=item.embedding))
+		offset += len(batch)
+	data.sort(key=lambda item: item.index)
+
+	return EmbeddingsResponded.construct(
+		object='list',
+		data=data,
+		model=responses[0].model if responses else model,
+		# usage is optional in practice, so a response without it counts as zero tokens
+		usage=sum_usage(getattr(response, 'usage', None) for response in responses),
+	)
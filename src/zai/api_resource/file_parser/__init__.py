@@ -1,3 +1,3 @@
-from .file_parser import FileParser
+from .file_parser import AsyncFileParser, FileParser
 
-__all__ = ['FileParser']
\ No newline at end of file
+__all__ = ['FileParser', 'AsyncFileParser']
\ No newline at end of file
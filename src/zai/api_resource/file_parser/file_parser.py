@@ -2,33 +2,37 @@ from __future__ import annotations
 
 import json
 
-from typing import TYPE_CHECKING, Mapping, cast
+from typing import TYPE_CHECKING, Any, Callable, Mapping, Optional, cast
 
 import httpx
 from typing_extensions import Literal
 
 from zai.core import (
+    AsyncBaseAPI,
     BaseAPI,
+    async_maybe_transform,
     maybe_transform,
     NOT_GIVEN,
     Body,
     Headers,
     NotGiven,
     FileTypes,
+    UploadProgress,
     _legacy_binary_response,
     _legacy_response,
     deepcopy_minimal,
     extract_files,
-    make_request_options
+    make_request_options,
+    with_upload_progress,
 )
 
 from zai.types.file_parser.file_parser_create_params import FileParserCreateParams
 from zai.types.file_parser.file_parser_resp import FileParserTaskCreateResp
 
 if TYPE_CHECKING:
-    from zai._client import ZaiClient
+    from zai._client import AsyncZaiClient, ZaiClient
 
-__all__ = ["FileParser"]
+__all__ = ["FileParser", "AsyncFileParser"]
 
 
 class FileParser(BaseAPI):
@@ -42,16 +46,22 @@ class FileParser(BaseAPI):
             file: FileTypes = None,
             file_type: str = None,
             tool_type: Literal["lite", "expert", "prime"],
+            on_progress: Optional[Callable[[UploadProgress], Any]] = None,
             extra_headers: Headers | None = None,
             extra_body: Body | None = None,
             timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
     ) -> FileParserTaskCreateResp:
+        """
+        Create a parsing task for a file, which is streamed from disk rather than read into memory.
 
+        Args:
+          on_progress: Called with an `UploadProgress` as the file content is sent
+        """
         if not file:
             raise ValueError("At least one `file` must be provided.")
         body = deepcopy_minimal(
             {
-                "file": file,
+                "file": with_upload_progress(file, on_progress),
                 "file_type": file_type,
                 "tool_type": tool_type,
             }
@@ -81,6 +91,7 @@ class FileParser(BaseAPI):
             extra_headers: Headers | None = None,
             extra_body: Body | None = None,
             timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+            cache: bool | NotGiven = NOT_GIVEN,
     ) -> httpx.Response:
         """
         Returns the contents of the specified file.
@@ -91,15 +102,100 @@ class FileParser(BaseAPI):
           extra_body: Add additional JSON properties to the request
 
           timeout: Override the client-level default timeout for this request, in seconds
+
+          cache: Force (`True`) or skip (`False`) the client's response cache for this request
         """
         if not task_id:
             raise ValueError(f"Expected a non-empty value for `task_id` but received {task_id!r}")
         extra_headers = {"Accept": "application/binary", **(extra_headers or {})}
         httpxBinaryResponseContent = self._get(
             f"/files/parser/result/{task_id}/{format_type}",
+            options=make_request_options(
+                extra_headers=extra_headers, extra_body=extra_body, timeout=timeout, cache=cache
+            ),
+            cast_type=_legacy_binary_response.HttpxBinaryResponseContent,
+        )
+        return httpxBinaryResponseContent.response
+
+
+class AsyncFileParser(AsyncBaseAPI):
+
+    def __init__(self, client: "AsyncZaiClient") -> None:
+        super().__init__(client)
+
+    async def create(
+            self,
+            *,
+            file: FileTypes = None,
+            file_type: str = None,
+            tool_type: Literal["lite", "expert", "prime"],
+            on_progress: Optional[Callable[[UploadProgress], Any]] = None,
+            extra_headers: Headers | None = None,
+            extra_body: Body | None = None,
+            timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+    ) -> FileParserTaskCreateResp:
+        """
+        Create a parsing task for a file, which is streamed from disk rather than read into memory.
+
+        Args:
+          on_progress: Called with an `UploadProgress` as the file content is sent
+        """
+        if not file:
+            raise ValueError("At least one `file` must be provided.")
+        body = deepcopy_minimal(
+            {
+                "file": with_upload_progress(file, on_progress),
+                "file_type": file_type,
+                "tool_type": tool_type,
+            }
+        )
+
+        files = extract_files(cast(Mapping[str, object], body), paths=[["file"]])
+        if files:
+            # It should be noted that the actual Content-Type header that will be
+            # sent to the server will contain a `boundary` parameter, e.g.
+            # multipart/form-data; boundary=---abc--
+            extra_headers = {"Content-Type": "multipart/form-data", **(extra_headers or {})}
+        return await self._post(
+            "/files/parser/create",
+            body=await async_maybe_transform(body, FileParserCreateParams),
+            files=files,
             options=make_request_options(
                 extra_headers=extra_headers, extra_body=extra_body, timeout=timeout
             ),
+            cast_type=FileParserTaskCreateResp,
+        )
+
+    async def content(
+            self,
+            task_id: str,
+            *,
+            format_type: Literal["text", "download_link"],
+            extra_headers: Headers | None = None,
+            extra_body: Body | None = None,
+            timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+            cache: bool | NotGiven = NOT_GIVEN,
+    ) -> httpx.Response:
+        """
+        Returns the contents of the specified file.
+
+        Args:
+          extra_headers: Send extra headers
+
+          extra_body: Add additional JSON properties to the request
+
+          timeout: Override the client-level default timeout for this request, in seconds
+
+          cache: Force (`True`) or skip (`False`) the client's response cache for this request
+        """
+        if not task_id:
+            raise ValueError(f"Expected a non-empty value for `task_id` but received {task_id!r}")
+        extra_headers = {"Accept": "application/binary", **(extra_headers or {})}
+        httpxBinaryResponseContent = await self._get(
+            f"/files/parser/result/{task_id}/{format_type}",
+            options=make_request_options(
+                extra_headers=extra_headers, extra_body=extra_body, timeout=timeout, cache=cache
+            ),
             cast_type=_legacy_binary_response.HttpxBinaryResponseContent,
         )
         return httpxBinaryResponseContent.response
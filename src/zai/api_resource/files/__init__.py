@@ -1,3 +1,3 @@
-from .files import Files, FilesWithRawResponse
+from .files import AsyncFiles, Files, FilesWithRawResponse
 
-__all__ = ['Files', 'FilesWithRawResponse']
+__all__ = ['Files', 'FilesWithRawResponse', 'AsyncFiles']
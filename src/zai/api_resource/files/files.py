@@ -1,24 +1,32 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Mapping, cast
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Iterator, List, Mapping, Optional, Type, cast
 
 import httpx
 from typing_extensions import Literal
 
 from zai.core import (
 	NOT_GIVEN,
+	AsyncBaseAPI,
 	BaseAPI,
+	BaseModel,
 	Body,
 	FileTypes,
 	Headers,
+	JsonlDecoder,
+	JsonlLineError,
 	NotGiven,
+	UploadProgress,
 	_legacy_binary_response,
 	_legacy_response,
+	async_maybe_transform,
 	deepcopy_minimal,
 	extract_files,
 	make_request_options,
 	maybe_transform,
+	with_upload_progress,
 )
+from zai.types.batch import BatchResult
 from zai.types.files import (
 	FileDeleted,
 	FileObject,
@@ -28,7 +36,7 @@ from zai.types.files import (
 )
 
 if TYPE_CHECKING:
-	from zai._client import ZaiClient
+	from zai._client import AsyncZaiClient, ZaiClient
 
 
 class Files(BaseAPI):
@@ -43,15 +51,24 @@ class Files(BaseAPI):
 		purpose: Literal['fine-tune', 'retrieval', 'batch', 'voice-clone-input'],
 		knowledge_id: str = None,
 		sentence_size: int = None,
+		on_progress: Optional[Callable[[UploadProgress], Any]] = None,
 		extra_headers: Headers | None = None,
 		extra_body: Body | None = None,
 		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
 	) -> FileObject:
+		"""
+		Upload a file, or register `upload_detail` entries with a knowledge base.
+
+		Paths and file objects are streamed from disk in chunks rather than read into memory.
+
+		Args:
+		  on_progress: Called with an `UploadProgress` as the file content is sent
+		"""
 		if not file and not upload_detail:
 			raise ValueError('At least one of `file` and `upload_detail` must be provided.')
 		body = deepcopy_minimal(
 			{
-				'file': file,
+				'file': with_upload_progress(file, on_progress),
 				'upload_detail': upload_detail,
 				'purpose': purpose,
 				'knowledge_id': knowledge_id,
@@ -185,6 +202,267 @@ class Files(BaseAPI):
 			cast_type=_legacy_binary_response.HttpxBinaryResponseContent,
 		)
 
+	def iter_jsonl(
+		self,
+		file_id: str,
+		*,
+		model: Optional[Type[BaseModel]] = BatchResult,
+		on_error: Optional[Callable[[JsonlLineError], Any]] = None,
+		max_resumes: int = 3,
+		chunk_size: Optional[int] = None,
+		extra_headers: Headers | None = None,
+		extra_body: Body | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+	) -> Iterator[Any]:
+		"""
+		Iterate the lines of a JSONL file, such as a batch output, as they are downloaded.
+
+		Only the line being read is held in memory. Malformed lines are skipped and reported to
+		`on_error` (logged by default) with their byte offset. After a dropped connection the
+		download resumes where it broke off with an HTTP `Range` request, up to `max_resumes` times.
+
+		Args:
+		  file_id: The ID of the file to read
+
+		  model: Model each line is parsed into, or `None` for plain dicts; batch results by default
+
+		  on_error: Called with a `JsonlLineError` for every line that cannot be parsed
+
+		  max_resumes: How often a broken download is resumed; 0 disables resuming
+
+		  chunk_size: Size of the chunks the response is read in, in bytes; by default as they arrive
+
+		  extra_headers: Send extra headers
+
+		  extra_body: Add additional JSON properties to the request
+
+		  timeout: Override the client-level default timeout for this request, in seconds
+		"""
+		if not file_id:
+			raise ValueError(f'Expected a non-empty value for `file_id` but received {file_id!r}')
+		decoder = JsonlDecoder(model, on_error)
+		resumes = 0
+		while True:
+			headers = {'Accept': 'application/binary', **decoder.range_headers(), **(extra_headers or {})}
+			response = self._get(
+				f'/files/{file_id}/content',
+				options=make_request_options(extra_headers=headers, extra_body=extra_body, timeout=timeout),
+				cast_type=httpx.Response,
+				stream=True,
+			)
+			try:
+				decoder.resume(response)
+				for chunk in response.iter_bytes(chunk_size):
+					for item in decoder.feed(chunk):
+						yield item
+				for item in decoder.flush():
+					yield item
+				return
+			except httpx.TransportError:
+				if resumes >= max_resumes:
+					raise
+				resumes += 1
+			finally:
+				response.close()
+
+
+class AsyncFiles(AsyncBaseAPI):
+	def __init__(self, client: 'AsyncZaiClient') -> None:
+		super().__init__(client)
+
+	async def create(
+		self,
+		*,
+		file: FileTypes = None,
+		upload_detail: List[UploadDetail] = None,
+		purpose: Literal['fine-tune', 'retrieval', 'batch', 'voice-clone-input'],
+		knowledge_id: str = None,
+		sentence_size: int = None,
+		on_progress: Optional[Callable[[UploadProgress], Any]] = None,
+		extra_headers: Headers | None = None,
+		extra_body: Body | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+	) -> FileObject:
+		"""
+		Upload a file, or register `upload_detail` entries with a knowledge base.
+
+		Paths and file objects are streamed from disk in chunks rather than read into memory.
+
+		Args:
+		  on_progress: Called with an `UploadProgress` as the file content is sent
+		"""
+		if not file and not upload_detail:
+			raise ValueError('At least one of `file` and `upload_detail` must be provided.')
+		body = deepcopy_minimal(
+			{
+				'file': with_upload_progress(file, on_progress),
+				'upload_detail': upload_detail,
+				'purpose': purpose,
+				'knowledge_id': knowledge_id,
+				'sentence_size': sentence_size,
+			}
+		)
+		files = extract_files(cast(Mapping[str, object], body), paths=[['file']])
+		if files:
+			# It should be noted that the actual Content-Type header that will be
+			# sent to the server will contain a `boundary` parameter, e.g.
+			# multipart/form-data; boundary=---abc--
+			extra_headers = {
+				'Content-Type': 'multipart/form-data',
+				**(extra_headers or {}),
+			}
+		return await self._post(
+			'/files',
+			body=await async_maybe_transform(body, file_create_params.FileCreateParams),
+			files=files,
+			options=make_request_options(extra_headers=extra_headers, extra_body=extra_body, timeout=timeout),
+			cast_type=FileObject,
+		)
+
+	async def list(
+		self,
+		*,
+		purpose: str | NotGiven = NOT_GIVEN,
+		limit: int | NotGiven = NOT_GIVEN,
+		after: str | NotGiven = NOT_GIVEN,
+		order: str | NotGiven = NOT_GIVEN,
+		extra_headers: Headers | None = None,
+		extra_body: Body | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+	) -> ListOfFileObject:
+		return await self._get(
+			'/files',
+			cast_type=ListOfFileObject,
+			options=make_request_options(
+				extra_headers=extra_headers,
+				extra_body=extra_body,
+				timeout=timeout,
+				query={
+					'purpose': purpose,
+					'limit': limit,
+					'after': after,
+					'order': order,
+				},
+			),
+		)
+
+	async def delete(
+		self,
+		file_id: str,
+		*,
+		extra_headers: Headers | None = None,
+		extra_body: Body | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+	) -> FileDeleted:
+		"""
+		Delete a file.
+
+		Args:
+		  file_id: The ID of the file to delete
+		  extra_headers: Send extra headers
+
+		  extra_body: Add additional JSON properties to the request
+
+		  timeout: Override the client-level default timeout for this request, in seconds
+		"""
+		if not file_id:
+			raise ValueError(f'Expected a non-empty value for `file_id` but received {file_id!r}')
+		return await self._delete(
+			f'/files/{file_id}',
+			options=make_request_options(extra_headers=extra_headers, extra_body=extra_body, timeout=timeout),
+			cast_type=FileDeleted,
+		)
+
+	async def content(
+		self,
+		file_id: str,
+		*,
+		extra_headers: Headers | None = None,
+		extra_body: Body | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+	) -> _legacy_response.HttpxBinaryResponseContent:
+		"""
+		Returns the contents of the specified file.
+
+		Args:
+		  extra_headers: Send extra headers
+
+		  extra_body: Add additional JSON properties to the request
+
+		  timeout: Override the client-level default timeout for this request, in seconds
+		"""
+		if not file_id:
+			raise ValueError(f'Expected a non-empty value for `file_id` but received {file_id!r}')
+		extra_headers = {'Accept': 'application/binary', **(extra_headers or {})}
+		return await self._get(
+			f'/files/{file_id}/content',
+			options=make_request_options(extra_headers=extra_headers, extra_body=extra_body, timeout=timeout),
+			cast_type=_legacy_binary_response.HttpxBinaryResponseContent,
+		)
+
+	async def iter_jsonl(
+		self,
+		file_id: str,
+		*,
+		model: Optional[Type[BaseModel]] = BatchResult,
+		on_error: Optional[Callable[[JsonlLineError], Any]] = None,
+		max_resumes: int = 3,
+		chunk_size: Optional[int] = None,
+		extra_headers: Headers | None = None,
+		extra_body: Body | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+	) -> AsyncIterator[Any]:
+		"""
+		Iterate the lines of a JSONL file, such as a batch output, as they are downloaded.
+
+		Only the line being read is held in memory. Malformed lines are skipped and reported to
+		`on_error` (logged by default) with their byte offset. After a dropped connection the
+		download resumes where it broke off with an HTTP `Range` request, up to `max_resumes` times.
+
+		Args:
+		  file_id: The ID of the file to read
+
+		  model: Model each line is parsed into, or `None` for plain dicts; batch results by default
+
+		  on_error: Called with a `JsonlLineError` for every line that cannot be parsed
+
+		  max_resumes: How often a broken download is resumed; 0 disables resuming
+
+		  chunk_size: Size of the chunks the response is read in, in bytes; by default as they arrive
+
+		  extra_headers: Send extra headers
+
+		  extra_body: Add additional JSON properties to the request
+
+		  timeout: Override the client-level default timeout for this request, in seconds
+		"""
+		if not file_id:
+			raise ValueError(f'Expected a non-empty value for `file_id` but received {file_id!r}')
+		decoder = JsonlDecoder(model, on_error)
+		resumes = 0
+		while True:
+			headers = {'Accept': 'application/binary', **decoder.range_headers(), **(extra_headers or {})}
+			response = await self._get(
+				f'/files/{file_id}/content',
+				options=make_request_options(extra_headers=headers, extra_body=extra_body, timeout=timeout),
+				cast_type=httpx.Response,
+				stream=True,
+			)
+			try:
+				decoder.resume(response)
+				async for chunk in response.aiter_bytes(chunk_size):
+					for item in decoder.feed(chunk):
+						yield item
+				for item in decoder.flush():
+					yield item
+				return
+			except httpx.TransportError:
+				if resumes >= max_resumes:
+					raise
+				resumes += 1
+			finally:
+				await response.aclose()
+
 
 class FilesWithRawResponse:
 	def __init__(self, files: Files) -> None:
@@ -3,13 +3,13 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Dict, List, Union
 
-from zai.core import BaseAPI, deepcopy_minimal
+from zai.core import NOT_GIVEN, AsyncBaseAPI, BaseAPI, NotGiven, deepcopy_minimal, make_request_options
 from zai.types.moderation.moderation_completion import Completion
 
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
-	from zai._client import ZaiClient
+	from zai._client import AsyncZaiClient, ZaiClient
 
 
 class Moderations(BaseAPI):
@@ -25,6 +25,7 @@ class Moderations(BaseAPI):
 		*,
 		model: str,
 		input: Union[str, List[str], Dict],
+		cache: bool | NotGiven = NOT_GIVEN,
 	) -> Completion:
 		"""
 		Moderate content for safety and compliance
@@ -32,6 +33,36 @@ class Moderations(BaseAPI):
 		Arguments:
 			model (str): The moderation model to use
 			input (Union[str, List[str], Dict]): Content to moderate
+			cache (bool): Force (`True`) or skip (`False`) the client's response cache for this call
 		"""
 		body = deepcopy_minimal({'model': model, 'input': input})
-		return self._post('/moderations', body=body, cast_type=Completion)
+		return self._post('/moderations', body=body, options=make_request_options(cache=cache), cast_type=Completion)
+
+
+class AsyncModerations(AsyncBaseAPI):
+	"""
+	API resource for content moderation operations
+	"""
+
+	def __init__(self, client: AsyncZaiClient) -> None:
+		super().__init__(client)
+
+	async def create(
+		self,
+		*,
+		model: str,
+		input: Union[str, List[str], Dict],
+		cache: bool | NotGiven = NOT_GIVEN,
+	) -> Completion:
+		"""
+		Moderate content for safety and compliance
+
+		Arguments:
+			model (str): The moderation model to use
+			input (Union[str, List[str], Dict]): Content to moderate
+			cache (bool): Force (`True`) or skip (`False`) the client's response cache for this call
+		"""
+		body = deepcopy_minimal({'model': model, 'input': input})
+		return await self._post(
+			'/moderations', body=body, options=make_request_options(cache=cache), cast_type=Completion
+		)
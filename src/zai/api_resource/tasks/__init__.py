@@ -0,0 +1,3 @@
+from .task_poller import AsyncTaskPoller, TaskFailedError, TaskPoller, TaskPollerStats
+
+__all__ = ['TaskPoller', 'AsyncTaskPoller', 'TaskPollerStats', 'TaskFailedError']
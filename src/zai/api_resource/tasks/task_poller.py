@@ -0,0 +1,600 @@
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+	TYPE_CHECKING,
+	Any,
+	Awaitable,
+	Callable,
+	Dict,
+	Iterable,
+	Iterator,
+	List,
+	Mapping,
+	Optional,
+	Set,
+	Tuple,
+	Type,
+)
+
+import httpx
+
+from zai.core import ZaiError
+from zai.core._json_encoder import get_json_loads
+
+if TYPE_CHECKING:
+	from zai._client import AsyncZaiClient, ZaiClient
+
+PENDING = 'pending'
+SUCCEEDED = 'succeeded'
+FAILED = 'failed'
+
+# seconds a task of each kind usually takes, until its model has been observed
+DEFAULT_EXPECTED_DURATIONS: Dict[str, float] = {
+	'chat': 10.0,
+	'video': 60.0,
+	'agent': 30.0,
+	'file_parser': 10.0,
+}
+
+# weight of the latest observed duration in a model's expected duration
+_DURATION_WEIGHT = 0.3
+
+_json_loads = get_json_loads()
+
+
+class TaskFailedError(ZaiError):
+	"""
+	Raised by the future of a task that ended in a failed state.
+
+	Attributes:
+		result: The last polled result, describing the failure
+	"""
+
+	def __init__(self, message: str, *, result: Any) -> None:
+		super().__init__(message)
+		self.result = result
+
+
+class TaskPollerStats:
+	"""
+	Counters of a task poller.
+
+	Attributes:
+		tracked: Tasks tracked so far
+		polls: Status requests sent for them
+		succeeded: Tasks that succeeded
+		failed: Tasks that failed, timed out or whose polling raised
+	"""
+
+	def __init__(self) -> None:
+		self.tracked = 0
+		self.polls = 0
+		self.succeeded = 0
+		self.failed = 0
+
+	@property
+	def polls_per_task(self) -> float:
+		"""Average number of polls of the finished tasks."""
+		finished = self.succeeded + self.failed
+		return self.polls / finished if finished else 0.0
+
+	def __repr__(self) -> str:
+		return (
+			f'TaskPollerStats(tracked={self.tracked}, polls={self.polls}, '
+			f'succeeded={self.succeeded}, failed={self.failed})'
+		)
+
+
+def async_task_status(result: Any) -> str:
+	status = (getattr(result, 'task_status', None) or '').upper()
+	if status == 'SUCCESS':
+		return SUCCEEDED
+	if status in ('FAIL', 'FAILED'):
+		return FAILED
+	return PENDING
+
+
+def agent_status(result: Any) -> str:
+	status = (result.status or '').lower()
+	if status in ('success', 'succeeded', 'completed'):
+		return SUCCEEDED
+	if status in ('fail', 'failed', 'error'):
+		return FAILED
+	if not status and result.choices:
+		return SUCCEEDED
+	return PENDING
+
+
+def file_parser_status(response: httpx.Response) -> str:
+	try:
+		status = _json_loads(response.content).get('status')
+	except Exception:
+		# a plain text result
+		return SUCCEEDED
+	if status in ('processing', 'pending'):
+		return PENDING
+	if status == 'failed':
+		return FAILED
+	return SUCCEEDED
+
+
+class _Task:
+	__slots__ = ('poll', 'status', 'future', 'key', 'started', 'deadline', 'interval')
+
+	def __init__(
+		self,
+		poll: Callable[[], Any],
+		status: Callable[[Any], str],
+		future: Any,
+		key: str,
+		deadline: Optional[float],
+		interval: float,
+	) -> None:
+		self.poll = poll
+		self.status = status
+		self.future = future
+		self.key = key
+		self.started = time.monotonic()
+		self.deadline = deadline
+		self.interval = interval
+
+
+class _BaseTaskPoller:
+	_timeout_error: Type[Exception] = concurrent.futures.TimeoutError
+
+	def __init__(
+		self,
+		*,
+		max_polls_per_second: float,
+		concurrency: int,
+		min_interval: float,
+		max_interval: float,
+		backoff: float,
+		expected_durations: Optional[Mapping[str, float]],
+		timeout: Optional[float],
+	) -> None:
+		if max_polls_per_second <= 0:
+			raise ValueError(f'`max_polls_per_second` must be positive, got {max_polls_per_second}')
+		if concurrency < 1:
+			raise ValueError(f'`concurrency` must be at least 1, got {concurrency}')
+		self.max_polls_per_second = max_polls_per_second
+		self.concurrency = concurrency
+		self.min_interval = min_interval
+		self.max_interval = max_interval
+		self.backoff = backoff
+		self.timeout = timeout
+		self._durations: Dict[str, float] = {**DEFAULT_EXPECTED_DURATIONS, **(expected_durations or {})}
+		# (due time, sequence, task) of the tasks waiting for their next poll
+		self._heap: List[Tuple[float, int, _Task]] = []
+		self._sequence = itertools.count()
+		self._last_poll = 0.0
+		self._closed = False
+		self._stats = TaskPollerStats()
+
+	def stats(self) -> TaskPollerStats:
+		stats = TaskPollerStats()
+		stats.__dict__.update(self._stats.__dict__)
+		return stats
+
+	def expected_duration(self, key: str) -> float:
+		"""Seconds a task of `key` (a model, or a task kind) is expected to take."""
+		return self._durations[key]
+
+	def _new_task(
+		self,
+		poll: Callable[[], Any],
+		status: Callable[[Any], str],
+		future: Any,
+		kind: str,
+		model: Optional[str],
+		timeout: Optional[float],
+	) -> Tuple[_Task, float]:
+		key = model or kind
+		if key not in self._durations:
+			self._durations[key] = self._durations.get(kind, self.min_interval)
+		expected = self._durations[key]
+		timeout = self.timeout if timeout is None else timeout
+		deadline = None if timeout is None else time.monotonic() + timeout
+		interval = min(max(self.min_interval, expected / 10), self.max_interval)
+		self._stats.tracked += 1
+		# no task finishes much faster than usual, so the first poll waits for half of it
+		return _Task(poll, status, future, key, deadline, interval), max(self.min_interval, expected / 2)
+
+	def _push(self, task: _Task, delay: float) -> None:
+		due = time.monotonic() + delay
+		if task.deadline is not None:
+			due = min(due, task.deadline)
+		heapq.heappush(self._heap, (due, next(self._sequence), task))
+
+	def _next_delay(self) -> Optional[float]:
+		"""Seconds until the next poll may be sent, or `None` when no task waits."""
+		if not self._heap:
+			return None
+		now = time.monotonic()
+		return max(self._heap[0][0] - now, self._last_poll + 1 / self.max_polls_per_second - now, 0.0)
+
+	def _pop(self) -> _Task:
+		self._last_poll = time.monotonic()
+		return heapq.heappop(self._heap)[2]
+
+	def _outcome(self, task: _Task, result: Any) -> Tuple[str, Any]:
+		"""Classify a polled result; returns the state and, when pending, the delay of the next poll."""
+		self._stats.polls += 1
+		state = task.status(result)
+		if state == SUCCEEDED:
+			self._stats.succeeded += 1
+			elapsed = time.monotonic() - task.started
+			expected = self._durations[task.key]
+			self._durations[task.key] = (1 - _DURATION_WEIGHT) * expected + _DURATION_WEIGHT * elapsed
+			return state, result
+		if state == FAILED:
+			self._stats.failed += 1
+			return state, TaskFailedError('Task failed', result=result)
+		if task.deadline is not None and time.monotonic() >= task.deadline:
+			self._stats.failed += 1
+			return FAILED, self._timeout_error('Task did not finish before its timeout')
+		delay = task.interval
+		task.interval = min(task.interval * self.backoff, self.max_interval)
+		return state, delay
+
+
+class TaskPoller(_BaseTaskPoller):
+	"""
+	Waits for many asynchronous tasks with a single scheduler thread.
+
+	Each tracked task gets a `concurrent.futures.Future` resolved with its final result. A
+	task is first polled after half of its expected duration, then at intervals growing by
+	`backoff` from a tenth of it up to `max_interval`. The expected duration of each model is
+	learned from the tasks that finished. All polls share one rate cap of
+	`max_polls_per_second`.
+
+	Use `track_chat_completion()`, `track_video()`, `track_agent()` or `track_file_parser()`
+	(or `track()` for any poll function), and `as_completed()` to process results as they
+	arrive. `close()` it, or use it as a context manager, to stop polling.
+	"""
+
+	def __init__(
+		self,
+		client: ZaiClient,
+		*,
+		max_polls_per_second: float = 10.0,
+		concurrency: int = 4,
+		min_interval: float = 0.5,
+		max_interval: float = 30.0,
+		backoff: float = 1.5,
+		expected_durations: Optional[Mapping[str, float]] = None,
+		timeout: Optional[float] = None,
+	) -> None:
+		super().__init__(
+			max_polls_per_second=max_polls_per_second,
+			concurrency=concurrency,
+			min_interval=min_interval,
+			max_interval=max_interval,
+			backoff=backoff,
+			expected_durations=expected_durations,
+			timeout=timeout,
+		)
+		self._client = client
+		self._condition = threading.Condition()
+		self._thread: Optional[threading.Thread] = None
+		self._executor = ThreadPoolExecutor(concurrency, thread_name_prefix='zai-task-poll')
+		self._outstanding: Set[Future[Any]] = set()
+
+	def track(
+		self,
+		poll: Callable[[], Any],
+		status: Callable[[Any], str],
+		*,
+		kind: str,
+		model: Optional[str] = None,
+		timeout: Optional[float] = None,
+	) -> Future[Any]:
+		"""
+		Track a task polled by calling `poll()`.
+
+		Arguments:
+			poll (Callable): Fetches the current state of the task
+			status (Callable): Maps a polled result to 'pending', 'succeeded' or 'failed'
+			kind (str): Kind of task, the fallback for its expected duration
+			model (str): Model running the task, whose duration is learned
+			timeout (float): Seconds after which the future fails with a `TimeoutError`
+		"""
+		future: Future[Any] = Future()
+		with self._condition:
+			if self._closed:
+				raise RuntimeError('Cannot track tasks with a closed task poller')
+			task, delay = self._new_task(poll, status, future, kind, model, timeout)
+			self._outstanding.add(future)
+			future.add_done_callback(self._outstanding.discard)
+			self._push(task, delay)
+			if self._thread is None:
+				self._thread = threading.Thread(target=self._run, name='zai-task-poller', daemon=True)
+				self._thread.start()
+			self._condition.notify()
+		return future
+
+	def track_chat_completion(
+		self, task_id: str, *, model: Optional[str] = None, timeout: Optional[float] = None
+	) -> Future[Any]:
+		"""Track a task of `chat.asyncCompletions.create()`; resolves to its `AsyncCompletion`."""
+		completions = self._client.chat.asyncCompletions
+		return self.track(
+			lambda: completions.retrieve_completion_result(task_id),
+			async_task_status,
+			kind='chat',
+			model=model,
+			timeout=timeout,
+		)
+
+	def track_video(self, task_id: str, *, model: Optional[str] = None, timeout: Optional[float] = None) -> Future[Any]:
+		"""Track a task of `videos.generations()`; resolves to its `VideoObject`."""
+		videos = self._client.videos
+		return self.track(
+			lambda: videos.retrieve_videos_result(task_id),
+			async_task_status,
+			kind='video',
+			model=model,
+			timeout=timeout,
+		)
+
+	def track_agent(self, async_id: str, *, agent_id: str, timeout: Optional[float] = None) -> Future[Any]:
+		"""Track an asynchronous agent invocation; resolves to its `AgentsCompletion`."""
+		agents = self._client.agents
+		return self.track(
+			lambda: agents.async_result(agent_id=agent_id, async_id=async_id),
+			agent_status,
+			kind='agent',
+			model=agent_id,
+			timeout=timeout,
+		)
+
+	def track_file_parser(
+		self, task_id: str, *, format_type: str = 'text', timeout: Optional[float] = None
+	) -> Future[Any]:
+		"""Track a task of `file_parser.create()`; resolves to the `httpx.Response` of its content."""
+		file_parser = self._client.file_parser
+		return self.track(
+			lambda: file_parser.content(task_id, format_type=format_type),
+			file_parser_status,
+			kind='file_parser',
+			timeout=timeout,
+		)
+
+	def as_completed(
+		self, futures: Optional[Iterable[Future[Any]]] = None, timeout: Optional[float] = None
+	) -> Iterator[Future[Any]]:
+		"""Yield `futures`, by default all unfinished tracked tasks, as they finish."""
+		with self._condition:
+			futures = list(self._outstanding if futures is None else futures)
+		return concurrent.futures.as_completed(futures, timeout)
+
+	def _run(self) -> None:
+		while True:
+			with self._condition:
+				while not self._closed:
+					delay = self._next_delay()
+					if delay is not None and delay <= 0:
+						break
+					self._condition.wait(delay)
+				if self._closed:
+					return
+				task = self._pop()
+			if not task.future.cancelled():
+				self._executor.submit(self._poll, task)
+
+	def _poll(self, task: _Task) -> None:
+		try:
+			result = task.poll()
+			with self._condition:
+				state, value = self._outcome(task, result)
+				if state == PENDING:
+					self._push(task, value)
+					self._condition.notify()
+					return
+		except BaseException as err:
+			with self._condition:
+				self._stats.polls += 1
+				self._stats.failed += 1
+			state, value = FAILED, err
+		if task.future.set_running_or_notify_cancel():
+			if state == SUCCEEDED:
+				task.future.set_result(value)
+			else:
+				task.future.set_exception(value)
+
+	def close(self) -> None:
+		"""Stop polling and cancel the futures of the unfinished tasks."""
+		with self._condition:
+			self._closed = True
+			self._condition.notify()
+			thread = self._thread
+			pending = list(self._outstanding)
+		if thread is not None:
+			thread.join()
+		for future in pending:
+			future.cancel()
+		self._executor.shutdown(wait=True)
+
+	def __enter__(self) -> TaskPoller:
+		return self
+
+	def __exit__(self, *args: object) -> None:
+		self.close()
+
+
+class AsyncTaskPoller(_BaseTaskPoller):
+	"""
+	Waits for many asynchronous tasks with a single scheduler task; the `asyncio`
+	counterpart of `TaskPoller`, resolving `asyncio.Future`s.
+	"""
+
+	_timeout_error = asyncio.TimeoutError
+
+	def __init__(
+		self,
+		client: AsyncZaiClient,
+		*,
+		max_polls_per_second: float = 10.0,
+		concurrency: int = 4,
+		min_interval: float = 0.5,
+		max_interval: float = 30.0,
+		backoff: float = 1.5,
+		expected_durations: Optional[Mapping[str, float]] = None,
+		timeout: Optional[float] = None,
+	) -> None:
+		super().__init__(
+			max_polls_per_second=max_polls_per_second,
+			concurrency=concurrency,
+			min_interval=min_interval,
+			max_interval=max_interval,
+			backoff=backoff,
+			expected_durations=expected_durations,
+			timeout=timeout,
+		)
+		self._client = client
+		self._scheduler: Optional[asyncio.Task[None]] = None
+		self._wakeup: Optional[asyncio.Event] = None
+		self._semaphore: Optional[asyncio.Semaphore] = None
+		self._polls: Set[asyncio.Task[None]] = set()
+		self._outstanding: Set[asyncio.Future[Any]] = set()
+
+	def track(
+		self,
+		poll: Callable[[], Awaitable[Any]],
+		status: Callable[[Any], str],
+		*,
+		kind: str,
+		model: Optional[str] = None,
+		timeout: Optional[float] = None,
+	) -> asyncio.Future[Any]:
+		"""Track a task polled by awaiting `poll()`; see `TaskPoller.track()`."""
+		if self._closed:
+			raise RuntimeError('Cannot track tasks with a closed task poller')
+		future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+		task, delay = self._new_task(poll, status, future, kind, model, timeout)
+		self._outstanding.add(future)
+		future.add_done_callback(self._outstanding.discard)
+		self._push(task, delay)
+		if self._scheduler is None:
+			self._wakeup = asyncio.Event()
+			self._semaphore = asyncio.Semaphore(self.concurrency)
+			self._scheduler = asyncio.ensure_future(self._run())
+		self._wakeup.set()  # type: ignore[union-attr]
+		return future
+
+	def track_chat_completion(
+		self, task_id: str, *, model: Optional[str] = None, timeout: Optional[float] = None
+	) -> asyncio.Future[Any]:
+		"""Track a task of `chat.asyncCompletions.create()`; resolves to its `AsyncCompletion`."""
+		completions = self._client.chat.asyncCompletions
+		return self.track(
+			lambda: completions.retrieve_completion_result(task_id),
+			async_task_status,
+			kind='chat',
+			model=model,
+			timeout=timeout,
+		)
+
+	def track_video(
+		self, task_id: str, *, model: Optional[str] = None, timeout: Optional[float] = None
+	) -> asyncio.Future[Any]:
+		"""Track a task of `videos.generations()`; resolves to its `VideoObject`."""
+		videos = self._client.videos
+		return self.track(
+			lambda: videos.retrieve_videos_result(task_id),
+			async_task_status,
+			kind='video',
+			model=model,
+			timeout=timeout,
+		)
+
+	def track_agent(self, async_id: str, *, agent_id: str, timeout: Optional[float] = None) -> asyncio.Future[Any]:
+		"""Track an asynchronous agent invocation; resolves to its `AgentsCompletion`."""
+		agents = self._client.agents
+		return self.track(
+			lambda: agents.async_result(agent_id=agent_id, async_id=async_id),
+			agent_status,
+			kind='agent',
+			model=agent_id,
+			timeout=timeout,
+		)
+
+	def track_file_parser(
+		self, task_id: str, *, format_type: str = 'text', timeout: Optional[float] = None
+	) -> asyncio.Future[Any]:
+		"""Track a task of `file_parser.create()`; resolves to the `httpx.Response` of its content."""
+		file_parser = self._client.file_parser
+		return self.track(
+			lambda: file_parser.content(task_id, format_type=format_type),
+			file_parser_status,
+			kind='file_parser',
+			timeout=timeout,
+		)
+
+	def as_completed(
+		self, futures: Optional[Iterable[asyncio.Future[Any]]] = None, timeout: Optional[float] = None
+	) -> Iterator[Awaitable[Any]]:
+		"""Yield awaitables of `futures`, by default all unfinished tracked tasks, in completion order."""
+		return asyncio.as_completed(list(self._outstanding if futures is None else futures), timeout=timeout)
+
+	async def _run(self) -> None:
+		wakeup = self._wakeup
+		assert wakeup is not None
+		while True:
+			delay = self._next_delay()
+			if delay is None or delay > 0:
+				wakeup.clear()
+				try:
+					await asyncio.wait_for(wakeup.wait(), delay)
+				except asyncio.TimeoutError:
+					pass
+				continue
+			task = self._pop()
+			if not task.future.done():
+				poll = asyncio.ensure_future(self._poll(task))
+				self._polls.add(poll)
+				poll.add_done_callback(self._polls.discard)
+
+	async def _poll(self, task: _Task) -> None:
+		try:
+			async with self._semaphore:  # type: ignore[union-attr]
+				result = await task.poll()
+			state, value = self._outcome(task, result)
+		except asyncio.CancelledError:
+			raise
+		except Exception as err:
+			self._stats.polls += 1
+			self._stats.failed += 1
+			state, value = FAILED, err
+		if state == PENDING:
+			self._push(task, value)
+			self._wakeup.set()  # type: ignore[union-attr]
+			return
+		if not task.future.done():
+			if state == SUCCEEDED:
+				task.future.set_result(value)
+			else:
+				task.future.set_exception(value)
+
+	async def aclose(self) -> None:
+		"""Stop polling and cancel the futures of the unfinished tasks."""
+		self._closed = True
+		tasks = [*self._polls, *([self._scheduler] if self._scheduler is not None else [])]
+		for task in tasks:
+			task.cancel()
+		await asyncio.gather(*tasks, return_exceptions=True)
+		for future in list(self._outstanding):
+			future.cancel()
+
+	async def __aenter__(self) -> AsyncTaskPoller:
+		return self
+
+	async def __aexit__(self, *args: object) -> None:
+		await self.aclose()
@@ -1,3 +1,3 @@
-from .voice import Voice
+from .voice import AsyncVoice, Voice
 
-__all__ = ['Voice']
\ No newline at end of file
+__all__ = ['Voice', 'AsyncVoice']
\ No newline at end of file
@@ -1,4 +1,4 @@
-from ._base_api import BaseAPI
+from ._base_api import AsyncBaseAPI, BaseAPI
 from ._base_compat import (
 	PYDANTIC_V2,
 	ConfigDict,
@@ -24,11 +24,13 @@ from ._base_type import (
 	NotGiven,
 	Query,
 )
+from ._coalesce import AsyncRequestCoalescer, CoalescerStats, RequestCoalescer
 from ._constants import (
 	ZAI_DEFAULT_LIMITS,
 	ZAI_DEFAULT_MAX_RETRIES,
 	ZAI_DEFAULT_TIMEOUT,
 )
+from ._embedding_cache import EmbeddingCache, EmbeddingCacheStats, EmbeddingLookup
 from ._errors import (
 	APIAuthenticationError,
 	APIInternalError,
@@ -41,10 +43,24 @@ from ._errors import (
 	APITimeoutError,
 	ZaiError,
 )
-from ._files import is_file_content
-from ._http_client import HttpClient, make_request_options
-from ._streaming import StreamResponse
+from ._files import UploadFile, UploadProgress, is_file_content, with_upload_progress
+from ._http_client import AsyncHttpClient, HttpClient, make_request_options
+from ._jsonl import JsonlDecoder, JsonlLineError
+from ._key_pool import ApiKeyPool, KeyStats
+from ._lazy_model import LazyModel, lazy_model_type
+from ._limiter import AsyncRequestLimiter, LimiterStats, ModelLimit, RequestLimiter
+from ._response_cache import (
+	CachedResponse,
+	CacheStats,
+	CacheStore,
+	DirectoryCacheStore,
+	ResponseCache,
+	SQLiteCacheStore,
+)
+from ._retry import RequestAttempt, RetryBudget, RetryPolicy, parse_retry_after
+from ._streaming import AsyncStreamResponse, StreamResponse, set_json_backend
 from ._utils import (
+	async_maybe_transform,
 	deepcopy_minimal,
 	drop_prefix_image_data,
 	extract_files,
@@ -60,6 +76,7 @@ __all__ = [
 	'BaseModel',
 	'construct_type',
 	'BaseAPI',
+	'AsyncBaseAPI',
 	'NOT_GIVEN',
 	'Headers',
 	'NotGiven',
@@ -81,6 +98,7 @@ __all__ = [
 	'get_model_fields',
 	'field_get_default',
 	'is_file_content',
+	'with_upload_progress',
 	'ZaiError',
 	'APIStatusError',
 	'APIRequestFailedError',
@@ -93,6 +111,35 @@ __all__ = [
 	'APITimeoutError',
 	'make_request_options',
 	'HttpClient',
+	'AsyncHttpClient',
+	'LazyModel',
+	'lazy_model_type',
+	'ModelLimit',
+	'LimiterStats',
+	'RequestLimiter',
+	'AsyncRequestLimiter',
+	'ApiKeyPool',
+	'KeyStats',
+	'RequestCoalescer',
+	'AsyncRequestCoalescer',
+	'CoalescerStats',
+	'EmbeddingCache',
+	'EmbeddingCacheStats',
+	'EmbeddingLookup',
+	'JsonlDecoder',
+	'JsonlLineError',
+	'UploadFile',
+	'UploadProgress',
+	'ResponseCache',
+	'CachedResponse',
+	'CacheStats',
+	'CacheStore',
+	'SQLiteCacheStore',
+	'DirectoryCacheStore',
+	'RetryPolicy',
+	'RequestAttempt',
+	'RetryBudget',
+	'parse_retry_after',
 	'ZAI_DEFAULT_TIMEOUT',
 	'ZAI_DEFAULT_MAX_RETRIES',
 	'ZAI_DEFAULT_LIMITS',
@@ -102,8 +149,11 @@ __all__ = [
 	'parse_datetime',
 	'is_given',
 	'maybe_transform',
+	'async_maybe_transform',
 	'deepcopy_minimal',
 	'drop_prefix_image_data',
 	'extract_files',
 	'StreamResponse',
+	'AsyncStreamResponse',
+	'set_json_backend',
 ]
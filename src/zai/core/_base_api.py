@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-	from .._client import ZaiClient
+	from .._client import AsyncZaiClient, ZaiClient
 
 
 class BaseAPI:
@@ -33,3 +33,32 @@ class BaseAPI:
 		self._put = client.put
 		self._patch = client.patch
 		self._get_api_list = client.get_api_list
+
+
+class AsyncBaseAPI:
+	"""
+	Base class for all asyncio API resource classes.
+
+	Mirrors `BaseAPI`, but binds the coroutine HTTP method shortcuts of an
+	`AsyncZaiClient`, so every resource method is awaitable.
+
+	Attributes:
+		_client (AsyncZaiClient): The async client instance for making API requests
+	"""
+
+	_client: AsyncZaiClient
+
+	def __init__(self, client: AsyncZaiClient) -> None:
+		"""
+		Initialize the API resource with an async client instance.
+
+		Args:
+			client (AsyncZaiClient): The async client instance for making API requests
+		"""
+		self._client = client
+		self._delete = client.delete
+		self._get = client.get
+		self._post = client.post
+		self._put = client.put
+		self._patch = client.patch
+		self._get_api_list = client.get_api_list
@@ -3,6 +3,7 @@ from __future__ import annotations
 import inspect
 import os
 from datetime import date, datetime
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Callable, Generic, Type, TypeVar, cast
 
 import pydantic
@@ -714,8 +715,12 @@ else:
 if PYDANTIC_V2:
 	from pydantic import TypeAdapter
 
+	# building a TypeAdapter generates a core schema, which is far more expensive than
+	# validating with it; stream chunks hit this for every union field of every chunk
+	_CachedTypeAdapter = cast('TypeAdapter[object]', lru_cache(maxsize=None)(TypeAdapter))
+
 	def _validate_non_model_type(*, type_: type[_T], value: object) -> _T:
-		return TypeAdapter(type_).validate_python(value)
+		return _CachedTypeAdapter(type_).validate_python(value)
 
 elif not TYPE_CHECKING:
 
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import threading
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Hashable, Iterable, Optional, Tuple, TypeVar, Union
+
+import httpx
+
+from ._json_encoder import encode_json_body
+from ._request_opt import FinalRequestOptions
+
+_T = TypeVar('_T')
+
+# POST endpoints whose result only depends on the request, so identical concurrent calls can share one response
+DEFAULT_COALESCE_PATHS: FrozenSet[str] = frozenset({'/embeddings', '/moderations', '/web_search'})
+
+CoalesceConfig = Union[bool, Iterable[str]]
+
+
+class CoalescerStats:
+	"""
+	Counters of a request coalescer.
+
+	Attributes:
+		requests: Calls that were sent to the server.
+		coalesced: Calls that were attached to an identical call already in flight.
+	"""
+
+	def __init__(self) -> None:
+		self.requests = 0
+		self.coalesced = 0
+
+	def __repr__(self) -> str:
+		return f'CoalescerStats(requests={self.requests}, coalesced={self.coalesced})'
+
+
+class _BaseCoalescer:
+	def __init__(self, paths: CoalesceConfig = True) -> None:
+		self.paths = DEFAULT_COALESCE_PATHS if paths is True else frozenset(_normalize_path(path) for path in paths)
+		self._stats = CoalescerStats()
+
+	def key(self, options: FinalRequestOptions, headers: httpx.Headers, cast_type: object) -> Optional[Hashable]:
+		"""
+		Return the key identical calls share, or `None` if the call must not be coalesced:
+		only GET requests and POSTs to the configured idempotent paths qualify, never uploads.
+		"""
+		if options.files is not None:
+			return None
+		method = options.method.lower()
+		if method != 'get' and not (method == 'post' and _normalize_path(options.url) in self.paths):
+			return None
+
+		digest = hashlib.sha256()
+		if options.json_data is not None or options.extra_json is not None:
+			digest.update(encode_json_body([options.json_data, options.extra_json], sort_keys=True))
+		# the headers carry the credentials, so different tenants never share a response
+		for name, value in sorted(headers.multi_items()):
+			digest.update(f'\n{name}:{value}'.encode())
+		params = sorted((str(name), str(value)) for name, value in (options.params or {}).items())
+		return (method, options.url, repr(params), id(cast_type), digest.digest())
+
+	def stats(self) -> CoalescerStats:
+		stats = CoalescerStats()
+		stats.__dict__.update(self._stats.__dict__)
+		return stats
+
+
+class _Call:
+	__slots__ = ('done', 'result', 'error')
+
+	def __init__(self) -> None:
+		self.done = threading.Event()
+		self.result: Any = None
+		self.error: Optional[BaseException] = None
+
+
+class RequestCoalescer(_BaseCoalescer):
+	"""
+	Thread-safe singleflight for `HttpClient`: concurrent identical calls wait for the one
+	in flight and all receive its parsed result (or its exception), so the result object is
+	shared between the callers.
+	"""
+
+	def __init__(self, paths: CoalesceConfig = True) -> None:
+		super().__init__(paths)
+		self._calls: Dict[Hashable, _Call] = {}
+		self._lock = threading.Lock()
+
+	def do(self, key: Hashable, func: Callable[[], _T]) -> _T:
+		with self._lock:
+			call = self._calls.get(key)
+			leader = call is None
+			if call is None:
+				call = self._calls[key] = _Call()
+				self._stats.requests += 1
+			else:
+				self._stats.coalesced += 1
+
+		if not leader:
+			call.done.wait()
+			if call.error is not None:
+				raise call.error
+			return call.result
+
+		try:
+			call.result = func()
+			return call.result
+		except BaseException as err:
+			call.error = err
+			raise
+		finally:
+			with self._lock:
+				del self._calls[key]
+			call.done.set()
+
+
+class AsyncRequestCoalescer(_BaseCoalescer):
+	"""
+	Singleflight for `AsyncHttpClient`; the `asyncio` counterpart of `RequestCoalescer`.
+
+	The shared request runs in its own task, so cancelling one caller does not cancel it
+	for the others.
+	"""
+
+	def __init__(self, paths: CoalesceConfig = True) -> None:
+		super().__init__(paths)
+		self._calls: Dict[Tuple[int, Hashable], asyncio.Future[Any]] = {}
+
+	async def do(self, key: Hashable, func: Callable[[], Awaitable[_T]]) -> _T:
+		loop_key = (id(asyncio.get_running_loop()), key)
+		task = self._calls.get(loop_key)
+		if task is not None:
+			self._stats.coalesced += 1
+		else:
+			task = self._calls[loop_key] = asyncio.ensure_future(func())
+			self._stats.requests += 1
+			task.add_done_callback(lambda _: self._calls.pop(loop_key, None))
+		return await asyncio.shield(task)
+
+
+def _normalize_path(path: str) -> str:
+	return '/' + path.strip('/')
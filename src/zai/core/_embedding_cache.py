@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+# SQLite builds may limit a statement to 999 parameters
+_SQL_CHUNK = 500
+
+
+def normalize_text(text: str) -> str:
+	"""Default text normalization of `EmbeddingCache`: Unicode NFC and surrounding whitespace removed."""
+	return unicodedata.normalize('NFC', text).strip()
+
+
+class EmbeddingCacheStats:
+	"""
+	Counters of an `EmbeddingCache`.
+
+	Attributes:
+		hits: Texts answered from the cache.
+		misses: Texts that had to be embedded by the server.
+		deduplicated: Repeated texts of a request that were embedded only once.
+		stores: Embeddings added to the cache.
+		evictions: Embeddings removed for age or size.
+		entries: Embeddings currently stored.
+		bytes: Size of the stored vectors.
+		bytes_saved: Size of the vectors served from the cache instead of the server.
+	"""
+
+	def __init__(self) -> None:
+		self.hits = 0
+		self.misses = 0
+		self.deduplicated = 0
+		self.stores = 0
+		self.evictions = 0
+		self.entries = 0
+		self.bytes = 0
+		self.bytes_saved = 0
+
+	@property
+	def hit_rate(self) -> float:
+		lookups = self.hits + self.misses
+		return self.hits / lookups if lookups else 0.0
+
+	def __repr__(self) -> str:
+		return (
+			f'EmbeddingCacheStats(hits={self.hits}, misses={self.misses}, deduplicated={self.deduplicated}, '
+			f'stores={self.stores}, evictions={self.evictions}, entries={self.entries}, bytes={self.bytes}, '
+			f'bytes_saved={self.bytes_saved})'
+		)
+
+
+class EmbeddingLookup:
+	"""
+	Result of `EmbeddingCache.lookup()` for the texts of one request.
+
+	Attributes:
+		missing (List[str]): Distinct texts that are not cached, in first-seen order; only these are sent
+		rows (List[Optional[bytes]]): Little-endian float32 vector per input text, `None` for misses
+	"""
+
+	def __init__(self, cache: EmbeddingCache, keys: List[bytes], rows: List[Optional[bytes]], missing: List[str]):
+		self.missing = missing
+		self.rows = rows
+		self._cache = cache
+		self._keys = keys
+
+	def fill(self, vectors: Sequence[bytes]) -> List[bytes]:
+		"""Store the server's vectors for `missing` and return the vectors of all inputs in order."""
+		if len(vectors) != len(self.missing):
+			raise ValueError(f'Expected {len(self.missing)} embeddings, got {len(vectors)}')
+		fetched: Dict[bytes, bytes] = {}
+		for key, row in zip(self._keys, self.rows):
+			if row is None and key not in fetched:
+				fetched[key] = vectors[len(fetched)]
+		self._cache.put_many(fetched.items())
+		return [row if row is not None else fetched[key] for key, row in zip(self._keys, self.rows)]
+
+
+class EmbeddingCache:
+	"""
+	Persistent, content-addressed cache of embedding vectors used by `embeddings.create()`.
+
+	Vectors are keyed by a 128-bit hash of model, dimensions and normalized text and kept as
+	float32 blobs in one SQLite table, so the same chunk is embedded once across processes
+	and reindexing runs. Within a request only the distinct missing texts are sent.
+
+	Arguments:
+		path (str | os.PathLike): SQLite database file; `':memory:'` keeps the cache in the process
+		max_bytes (int | None): Size of the stored vectors above which the least recently used are evicted
+		max_age (float | None): Seconds after which an embedding is re-fetched and eventually evicted
+		normalize (Callable[[str], str]): Text normalization applied before hashing
+	"""
+
+	def __init__(
+		self,
+		path: Union[str, os.PathLike[str]] = ':memory:',
+		*,
+		max_bytes: Optional[int] = None,
+		max_age: Optional[float] = None,
+		normalize: Callable[[str], str] = normalize_text,
+	) -> None:
+		self.path = os.fspath(path)
+		self.max_bytes = max_bytes
+		self.max_age = max_age
+		self.normalize = normalize
+		self._stats = EmbeddingCacheStats()
+		self._lock = threading.Lock()
+		self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+		self._db.execute('PRAGMA journal_mode=WAL')
+		self._db.execute(
+			'CREATE TABLE IF NOT EXISTS embeddings '
+			'(key BLOB PRIMARY KEY, vector BLOB NOT NULL, stored_at REAL NOT NULL, used_at REAL NOT NULL) '
+			'WITHOUT ROWID'
+		)
+		self._db.execute('CREATE INDEX IF NOT EXISTS embeddings_used_at ON embeddings (used_at)')
+		self._refresh_size()
+
+	def key(self, model: str, dimensions: Optional[int], text: str) -> bytes:
+		digest = hashlib.blake2b(digest_size=16)
+		digest.update(f'{model}\0{dimensions or ""}\0'.encode())
+		digest.update(self.normalize(text).encode())
+		return digest.digest()
+
+	def lookup(self, model: str, dimensions: Optional[int], texts: Sequence[str]) -> EmbeddingLookup:
+		"""Look up the texts of one request; see `EmbeddingLookup`."""
+		keys = [self.key(model, dimensions, text) for text in texts]
+		found = self.get_many(keys)
+		rows: List[Optional[bytes]] = [found.get(key) for key in keys]
+		missing: Dict[bytes, str] = {}
+		for key, text, row in zip(keys, texts, rows):
+			if row is None:
+				missing.setdefault(key, text)
+		with self._lock:
+			hits = len(keys) - rows.count(None)
+			self._stats.hits += hits
+			self._stats.misses += len(missing)
+			self._stats.deduplicated += len(keys) - hits - len(missing)
+			self._stats.bytes_saved += sum(len(row) for row in rows if row is not None)
+		return EmbeddingLookup(self, keys, rows, list(missing.values()))
+
+	def get_many(self, keys: Sequence[bytes]) -> Dict[bytes, bytes]:
+		"""Return the cached vectors of the given keys that are present and not older than `max_age`."""
+		now = time.time()
+		oldest = now - self.max_age if self.max_age is not None else 0.0
+		distinct = list(dict.fromkeys(keys))
+		found: Dict[bytes, bytes] = {}
+		with self._lock:
+			for start in range(0, len(distinct), _SQL_CHUNK):
+				chunk = distinct[start : start + _SQL_CHUNK]
+				marks = ','.join('?' * len(chunk))
+				rows = self._db.execute(
+					f'SELECT key, vector FROM embeddings WHERE stored_at >= ? AND key IN ({marks})', (oldest, *chunk)
+				)
+				found.update((bytes(key), bytes(vector)) for key, vector in rows)
+			if found:
+				# one transaction for all the updates, rather than a commit per row
+				self._db.execute('BEGIN')
+				try:
+					self._db.executemany(
+						'UPDATE embeddings SET used_at = ? WHERE key = ?', [(now, key) for key in found]
+					)
+					self._db.execute('COMMIT')
+				except BaseException:
+					self._db.execute('ROLLBACK')
+					raise
+		return found
+
+	def put_many(self, items: Iterable[Tuple[bytes, bytes]]) -> None:
+		"""Store `(key, little-endian float32 vector)` pairs, then evict down to `max_bytes`."""
+		now = time.time()
+		rows = [(key, vector, now, now) for key, vector in items]
+		if not rows:
+			return
+		with self._lock:
+			self._db.execute('BEGIN')
+			try:
+				# replaced rows are only expired ones, so a full recount is rarely needed
+				replaced = self._db.executemany(
+					'DELETE FROM embeddings WHERE key = ?', [row[:1] for row in rows]
+				).rowcount
+				self._db.executemany('INSERT INTO embeddings VALUES (?, ?, ?, ?)', rows)
+				self._db.execute('COMMIT')
+			except BaseException:
+				self._db.execute('ROLLBACK')
+				raise
+			self._stats.stores += len(rows)
+			if replaced:
+				self._refresh_size()
+			else:
+				self._stats.entries += len(rows)
+				self._stats.bytes += sum(len(row[1]) for row in rows)
+			over = self.max_bytes is not None and self._stats.bytes > self.max_bytes
+		if over:
+			self.evict(max_bytes=self.max_bytes)
+
+	def evict(self, *, max_age: Optional[float] = None, max_bytes: Optional[int] = None) -> int:
+		"""
+		Delete embeddings stored more than `max_age` seconds ago, then the least recently
+		used ones until the stored vectors fit in `max_bytes`. Returns how many were removed.
+		"""
+		removed = 0
+		with self._lock:
+			if max_age is not None:
+				removed += self._db.execute(
+					'DELETE FROM embeddings WHERE stored_at < ?', (time.time() - max_age,)
+				).rowcount
+				self._refresh_size()
+			if max_bytes is not None and self._stats.bytes > max_bytes:
+				excess = self._stats.bytes - max_bytes
+				victims = []
+				for key, size in self._db.execute('SELECT key, LENGTH(vector) FROM embeddings ORDER BY used_at'):
+					victims.append((key,))
+					excess -= size
+					if excess <= 0:
+						break
+				self._db.executemany('DELETE FROM embeddings WHERE key = ?', victims)
+				removed += len(victims)
+				self._stats.entries -= len(victims)
+				self._stats.bytes = max_bytes + excess
+			self._stats.evictions += removed
+		return removed
+
+	def _refresh_size(self) -> None:
+		entries, size = self._db.execute('SELECT COUNT(*), COALESCE(SUM(LENGTH(vector)), 0) FROM embeddings').fetchone()
+		self._stats.entries = entries
+		self._stats.bytes = size
+
+	def clear(self) -> None:
+		with self._lock:
+			self._db.execute('DELETE FROM embeddings')
+			self._refresh_size()
+
+	def stats(self) -> EmbeddingCacheStats:
+		"""Return a snapshot of the counters."""
+		with self._lock:
+			stats = EmbeddingCacheStats()
+			stats.__dict__.update(self._stats.__dict__)
+			return stats
+
+	def close(self) -> None:
+		with self._lock:
+			self._db.close()
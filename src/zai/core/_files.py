@@ -3,7 +3,8 @@ from __future__ import annotations
 import io
 import os
 import pathlib
-from typing import overload
+import time
+from typing import Any, Callable, Optional, overload
 
 from typing_extensions import TypeGuard
 
@@ -58,7 +59,7 @@ def _transform_file(file: FileTypes) -> HttpxFileTypes:
 	if is_file_content(file):
 		if isinstance(file, os.PathLike):
 			path = pathlib.Path(file)
-			return (path.name, path.read_bytes())
+			return (path.name, UploadFile(path))
 
 		return file
 
@@ -70,5 +71,144 @@ def _transform_file(file: FileTypes) -> HttpxFileTypes:
 
 def _read_file_content(file: FileContent) -> HttpxFileContent:
 	if isinstance(file, os.PathLike):
-		return pathlib.Path(file).read_bytes()
+		return UploadFile(file)
 	return file
+
+
+def with_upload_progress(file: FileTypes, on_progress: Optional[Callable[['UploadProgress'], Any]] = None) -> FileTypes:
+	"""Wrap the content of `file` in an `UploadFile` reporting to `on_progress` as it is sent."""
+	if on_progress is None or not file:
+		return file
+	if is_tuple_t(file):
+		return (file[0], UploadFile(file[1], on_progress=on_progress), *file[2:])
+	return UploadFile(file, on_progress=on_progress)
+
+
+class UploadProgress:
+	"""
+	Progress of a file upload, passed to an `on_progress` callback.
+
+	Attributes:
+		bytes_sent: Bytes of the file read into the request body so far
+		total_bytes: Size of the file, or `None` when it cannot be known without reading it
+		elapsed: Seconds since the file started being read
+	"""
+
+	__slots__ = ('bytes_sent', 'total_bytes', 'elapsed')
+
+	def __init__(self, bytes_sent: int, total_bytes: Optional[int], elapsed: float) -> None:
+		self.bytes_sent = bytes_sent
+		self.total_bytes = total_bytes
+		self.elapsed = elapsed
+
+	@property
+	def bytes_per_second(self) -> float:
+		"""Average upload throughput so far."""
+		return self.bytes_sent / self.elapsed if self.elapsed > 0 else 0.0
+
+	def __repr__(self) -> str:
+		return f'UploadProgress(bytes_sent={self.bytes_sent}, total_bytes={self.total_bytes}, elapsed={self.elapsed})'
+
+
+class UploadFile(io.RawIOBase):
+	"""
+	File content that is read in chunks while the multipart request body is sent.
+
+	A path is opened when the body is first read and closed once it has been read to the
+	end, so an upload only holds one chunk in memory whatever the size of the file. httpx
+	rewinds file content before each attempt, which restarts the read, so a retried upload
+	sends the whole file again and its progress starts over. File objects are read from and
+	rewound the same way but are left open for the caller to close.
+
+	Args:
+		file: A path, a binary file object or bytes
+		on_progress: Called with an `UploadProgress` after every chunk read
+	"""
+
+	def __init__(self, file: FileContent, *, on_progress: Optional[Callable[[UploadProgress], Any]] = None) -> None:
+		super().__init__()
+		self._path: Optional[pathlib.Path] = None
+		self._file: Any = None
+		if isinstance(file, os.PathLike):
+			self._path = pathlib.Path(file)
+			self.name = self._path.name
+		elif isinstance(file, bytes):
+			self._file = io.BytesIO(file)
+		else:
+			self._file = file
+			name = getattr(file, 'name', None)
+			if isinstance(name, str):
+				self.name = pathlib.Path(name).name
+		self._on_progress = on_progress
+		self._position = 0
+		self._started: Optional[float] = None
+		self._size: Optional[int] = None
+
+	def readable(self) -> bool:
+		return True
+
+	def seekable(self) -> bool:
+		return self._path is not None or self._file.seekable()
+
+	@property
+	def size(self) -> Optional[int]:
+		"""Size of the file, or `None` when it cannot be known without reading it."""
+		if self._size is None:
+			if self._path is not None:
+				self._size = self._path.stat().st_size
+			else:
+				try:
+					offset = self._file.tell()
+					self._size = self._file.seek(0, os.SEEK_END)
+					self._file.seek(offset)
+				except (AttributeError, OSError):
+					return None
+		return self._size
+
+	def read(self, size: int = -1) -> bytes:
+		if self.closed:
+			raise ValueError('I/O operation on closed file.')
+		if self._file is None:
+			self._file = self._path.open('rb')
+			self._file.seek(self._position)
+		if self._started is None:
+			self._started = time.monotonic()
+		data = self._file.read(size)
+		self._position += len(data)
+		if not data and self._path is not None:
+			# read to the end: release the handle, a rewind opens it again
+			self._release()
+		# every chunk is reported, and the end of an empty file once
+		if self._on_progress is not None and (data or self._position == 0):
+			self._on_progress(UploadProgress(self._position, self.size, time.monotonic() - self._started))
+		return data
+
+	def readinto(self, buffer: Any) -> int:
+		data = self.read(len(buffer))
+		buffer[: len(data)] = data
+		return len(data)
+
+	def tell(self) -> int:
+		return self._position
+
+	def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+		if self._path is not None and self._file is None:
+			if whence == os.SEEK_CUR:
+				offset += self._position
+			elif whence == os.SEEK_END:
+				offset += self.size
+			self._position = offset
+		else:
+			self._position = self._file.seek(offset, whence)
+		if self._position == 0:
+			self._started = None
+		return self._position
+
+	def _release(self) -> None:
+		file, self._file = self._file, None
+		file.close()
+
+	def close(self) -> None:
+		if self._path is not None and self._file is not None:
+			self._release()
+		super().close()
@@ -1,16 +1,21 @@
 # -*- coding:utf-8 -*-
 from __future__ import annotations
 
+import asyncio
+import copy
 import inspect
 import logging
 import time
 import warnings
-from random import random
+from functools import cached_property
 from typing import (
 	TYPE_CHECKING,
 	Any,
+	AsyncIterator,
+	Callable,
 	Dict,
 	Generic,
+	Hashable,
 	Iterable,
 	Iterator,
 	Literal,
@@ -29,6 +34,7 @@ from httpx import URL, Timeout
 
 from . import _errors, get_origin
 from ._base_compat import model_copy
+from ._coalesce import AsyncRequestCoalescer, RequestCoalescer
 from ._base_models import GenericModel, construct_type, validate_type
 from ._base_type import (
 	NOT_GIVEN,
@@ -46,8 +52,6 @@ from ._base_type import (
 	ResponseT,
 )
 from ._constants import (
-	INITIAL_RETRY_DELAY,
-	MAX_RETRY_DELAY,
 	RAW_RESPONSE_HEADER,
 	ZAI_DEFAULT_LIMITS,
 	ZAI_DEFAULT_MAX_RETRIES,
@@ -60,21 +64,27 @@ from ._errors import (
 	APITimeoutError,
 )
 from ._files import to_httpx_files
+from ._key_pool import ApiKeyPool, KeyLease
 from ._legacy_response import LegacyAPIResponse
+from ._limiter import AsyncReleasingByteStream, AsyncRequestLimiter, ReleasingByteStream, RequestLimiter
+from ._prefetch import async_prefetch_pages, prefetch_pages
 from ._request_opt import FinalRequestOptions, UserRequestInput
 from ._response import APIResponse, BaseAPIResponse, extract_response_type
-from ._streaming import StreamResponse
+from ._response_cache import AsyncRecordingByteStream, CachedResponse, RecordingByteStream, ResponseCache
+from ._retry import RequestAttempt, RetryPolicy, RetryState
+from ._streaming import AsyncStreamResponse, StreamResponse
 from ._utils import flatten, is_given, is_mapping
-from ._json_encoder import json_dumps
+from ._json_encoder import encode_json_body
 
 log: logging.Logger = logging.getLogger(__name__)
 
 # TODO: make base page type vars covariant
 SyncPageT = TypeVar('SyncPageT', bound='BaseSyncPage[Any]')
-# AsyncPageT = TypeVar("AsyncPageT", bound="BaseAsyncPage[Any]")
+AsyncPageT = TypeVar('AsyncPageT', bound='BaseAsyncPage[Any]')
 
 _T = TypeVar('_T')
 _T_co = TypeVar('_T_co', covariant=True)
+_BaseClientT = TypeVar('_BaseClientT', bound='BaseHttpClient')
 
 if TYPE_CHECKING:
 	from httpx._config import DEFAULT_TIMEOUT_CONFIG as HTTPX_DEFAULT_TIMEOUT
@@ -199,7 +209,16 @@ class BaseSyncPage(BasePage[_T], Generic[_T]):
 			for item in page._get_page_items():
 				yield item
 
-	def iter_pages(self: SyncPageT) -> Iterator[SyncPageT]:
+	def iter_pages(self: SyncPageT, *, prefetch: int = 0) -> Iterator[SyncPageT]:
+		"""
+		Iterate this page and the ones after it.
+
+		With `prefetch=N` up to N next pages are fetched in a background thread while the
+		current one is processed, instead of one request at a time.
+		"""
+		if prefetch:
+			yield from prefetch_pages(self, prefetch)
+			return
 		page = self
 		while True:
 			yield page
@@ -208,6 +227,11 @@ class BaseSyncPage(BasePage[_T], Generic[_T]):
 			else:
 				return
 
+	def auto_paging_iter(self, *, prefetch: int = 1) -> Iterator[_T]:
+		"""Iterate the items of all pages, fetching up to `prefetch` pages ahead in the background."""
+		for page in self.iter_pages(prefetch=prefetch):
+			yield from page._get_page_items()
+
 	def get_next_page(self: SyncPageT) -> SyncPageT:
 		info = self.next_page_info()
 		if not info:
@@ -219,15 +243,84 @@ class BaseSyncPage(BasePage[_T], Generic[_T]):
 		return self._client._request_api_list(self._model, page=self.__class__, options=options)
 
 
-class HttpClient:
-	_client: httpx.Client
+class BaseAsyncPage(BasePage[_T], Generic[_T]):
+	_client: AsyncHttpClient = pydantic.PrivateAttr()
+
+	def _set_private_attributes(
+		self,
+		client: AsyncHttpClient,
+		model: Type[_T],
+		options: FinalRequestOptions,
+	) -> None:
+		self._model = model
+		self._client = client
+		self._options = options
+
+	async def __aiter__(self) -> AsyncIterator[_T]:
+		async for page in self.iter_pages():
+			for item in page._get_page_items():
+				yield item
+
+	async def iter_pages(self: AsyncPageT, *, prefetch: int = 0) -> AsyncIterator[AsyncPageT]:
+		"""
+		Iterate this page and the ones after it.
+
+		With `prefetch=N` up to N next pages are fetched in a background task while the
+		current one is processed; closing the iterator early cancels the fetch in flight.
+		"""
+		if prefetch:
+			pages = async_prefetch_pages(self, prefetch)
+			try:
+				async for page in pages:
+					yield page
+			finally:
+				await pages.aclose()
+			return
+		page = self
+		while True:
+			yield page
+			if page.has_next_page():
+				page = await page.get_next_page()
+			else:
+				return
+
+	async def auto_paging_iter(self, *, prefetch: int = 1) -> AsyncIterator[_T]:
+		"""Iterate the items of all pages, fetching up to `prefetch` pages ahead in the background."""
+		pages = self.iter_pages(prefetch=prefetch)
+		try:
+			async for page in pages:
+				for item in page._get_page_items():
+					yield item
+		finally:
+			await pages.aclose()
+
+	async def get_next_page(self: AsyncPageT) -> AsyncPageT:
+		info = self.next_page_info()
+		if not info:
+			raise RuntimeError(
+				'No next page expected; please check `.has_next_page()` before calling `.get_next_page()`.'
+			)
+
+		options = self._info_to_options(info)
+		return await self._client._request_api_list(self._model, page=self.__class__, options=options)
+
+
+class BaseHttpClient:
+	"""
+	Transport-agnostic base shared by `HttpClient` and `AsyncHttpClient`.
+
+	Holds the request building, header merging, retry timing and response
+	processing logic; subclasses only own the underlying httpx client and
+	the (sync or async) send/retry loop.
+	"""
+
 	_version: str
 	_base_url: URL
 	max_retries: int
 	timeout: Union[float, Timeout, None]
 	_limits: httpx.Limits
 	_has_custom_http_client: bool
-	_default_stream_cls: Type[StreamResponse[Any]] | None = None
+	_recording_stream_cls: Callable[..., Any]
 
 	_strict_response_validation: bool
 
@@ -240,8 +333,14 @@ class HttpClient:
 		max_retries: int = ZAI_DEFAULT_MAX_RETRIES,
 		timeout: Union[float, Timeout, None],
 		limits: httpx.Limits | None = None,
-		custom_httpx_client: httpx.Client | None = None,
+		custom_httpx_client: httpx.Client | httpx.AsyncClient | None = None,
 		custom_headers: Mapping[str, str] | None = None,
+		limiter: RequestLimiter | AsyncRequestLimiter | None = None,
+		retry_policy: RetryPolicy | None = None,
+		attempt_hooks: Iterable[Callable[[RequestAttempt], None]] | None = None,
+		key_pool: ApiKeyPool | None = None,
+		coalescer: RequestCoalescer | AsyncRequestCoalescer | None = None,
+		response_cache: ResponseCache | None = None,
 	) -> None:
 		if limits is not None:
 			warnings.warn(
@@ -264,18 +363,50 @@ class HttpClient:
 		self.timeout = timeout
 		self._limits = limits
 		self._has_custom_http_client = bool(custom_httpx_client)
-		self._client = custom_httpx_client or httpx.Client(
-			base_url=base_url,
-			timeout=self.timeout,
-			limits=limits,
-		)
+		# False for clones made by `_derive()`, which borrow their parent's connection pool
+		self._owns_http_client = True
 		self._version = version
 		url = URL(url=base_url)
 		if not url.raw_path.endswith(b'/'):
 			url = url.copy_with(raw_path=url.raw_path + b'/')
 		self._base_url = url
 		self._custom_headers = custom_headers or {}
+		self._default_headers_cache: tuple[tuple[Mapping[str, str], object], dict[str, str]] | None = None
 		self._strict_response_validation = _strict_response_validation
+		self._limiter = limiter
+		self._retry_policy = retry_policy or RetryPolicy()
+		self.attempt_hooks: list[Callable[[RequestAttempt], None]] = list(attempt_hooks or ())
+		self._key_pool = key_pool
+		self._coalescer = coalescer
+		self._response_cache = response_cache
+
+	def _derive(
+		self: _BaseClientT,
+		*,
+		timeout: Union[float, Timeout, None, NotGiven] = NOT_GIVEN,
+		max_retries: int | NotGiven = NOT_GIVEN,
+		custom_headers: Mapping[str, str] | None = None,
+	) -> _BaseClientT:
+		"""
+		Shallow copy of this client that shares its httpx client, limiter, retry policy and
+		key pool. Nothing is constructed besides the copy itself; resources are re-created
+		lazily on first access, and the clone never closes the shared connection pool.
+		"""
+		clone = copy.copy(self)
+		for name in list(clone.__dict__):
+			# cached API resources are bound to the parent client
+			if isinstance(getattr(type(clone), name, None), cached_property):
+				del clone.__dict__[name]
+		clone._owns_http_client = False
+		clone._default_headers_cache = None
+		clone.attempt_hooks = list(self.attempt_hooks)
+		if is_given(timeout):
+			clone.timeout = timeout
+		if is_given(max_retries):
+			clone.max_retries = max_retries
+		if custom_headers is not None:
+			clone._custom_headers = {**self._custom_headers, **custom_headers}
+		return clone
 
 	def _prepare_url(self, url: str) -> URL:
 		sub_url = URL(url)
@@ -287,7 +418,13 @@ class HttpClient:
 
 	@property
 	def _default_headers(self):
-		return {
+		# merged once and reused until the auth state or the custom headers change
+		key = (self._custom_headers, self._auth_headers_key())
+		cached = self._default_headers_cache
+		if cached is not None and key[1] is not None and cached[0][0] is key[0] and cached[0][1] == key[1]:
+			return cached[1]
+
+		headers = {
 			'Accept': 'application/json',
 			'Content-Type': 'application/json; charset=UTF-8',
 			'Zai-SDK-Ver': self._version,
@@ -296,6 +433,23 @@ class HttpClient:
 			**self.auth_headers,
 			**self._custom_headers,
 		}
+		self._default_headers_cache = (key, headers)
+		return headers
+
+	def _auth_headers_key(self) -> object:
+		"""
+		Cheap value that changes whenever `auth_headers` would; subclasses with
+		dynamic auth headers must override it. `None` disables the header cache.
+		"""
+		return ()
+
+	@property
+	def custom_headers(self) -> Mapping[str, str]:
+		return self._custom_headers
+
+	@custom_headers.setter
+	def custom_headers(self, value: Mapping[str, str] | None) -> None:
+		self._custom_headers = dict(value or {})
 
 	@property
 	def custom_auth(self) -> httpx.Auth | None:
@@ -322,26 +476,51 @@ class HttpClient:
 
 	def _calculate_retry_timeout(
 		self,
-		remaining_retries: int,
-		options: FinalRequestOptions,
+		retry_state: RetryState,
 		response_headers: Optional[httpx.Headers] = None,
 	) -> float:
-		max_retries = options.get_max_retries(self.max_retries)
+		return self._retry_policy.retry_delay(retry_state, response_headers)
 
-		# If the API asks us to wait a certain amount of time (and it's a reasonable amount), just do what it says.
-		# retry_after = self._parse_retry_after_header(response_headers)
-		# if retry_after is not None and 0 < retry_after <= 60:
-		#     return retry_after
-
-		nb_retries = max_retries - remaining_retries
+	def _retry_delay(
+		self,
+		options: FinalRequestOptions,
+		remaining_retries: int,
+		retry_state: RetryState,
+		response_headers: Optional[httpx.Headers],
+	) -> float:
+		remaining = remaining_retries - 1
+		if remaining == 1:
+			log.debug('1 retry left')
+		else:
+			log.debug('%i retries left', remaining)
 
-		# Apply exponential backoff, but not more than the max.
-		sleep_seconds = min(INITIAL_RETRY_DELAY * pow(2.0, nb_retries), MAX_RETRY_DELAY)
+		timeout = self._calculate_retry_timeout(retry_state, response_headers)
+		log.info('Retrying request to %s in %f seconds', options.url, timeout)
+		return timeout
 
-		# Apply some jitter, plus-or-minus half a second.
-		jitter = 1 - 0.25 * random()
-		timeout = sleep_seconds * jitter
-		return timeout if timeout >= 0 else 0
+	def _emit_attempt(
+		self,
+		request: httpx.Request,
+		attempt: int,
+		started: float,
+		*,
+		response: httpx.Response | None = None,
+		error: BaseException | None = None,
+		retry_delay: float | None = None,
+	) -> None:
+		if not self.attempt_hooks:
+			return
+		info = RequestAttempt(
+			request=request,
+			attempt=attempt,
+			started=started,
+			elapsed=time.monotonic() - started,
+			response=response,
+			error=error,
+			retry_delay=retry_delay,
+		)
+		for hook in self.attempt_hooks:
+			hook(info)
 
 	def _build_request(self, options: FinalRequestOptions) -> httpx.Request:
 		kwargs: dict[str, Any] = {}
@@ -356,9 +535,6 @@ class HttpClient:
 			else:
 				raise RuntimeError(f'Unexpected JSON data type, {type(json_data)}, cannot merge with `extra_body`')
 
-		# Convert BaseModel objects to dicts before passing to httpx
-		json_data = self._prepare_json_data(json_data)
-
 		content_type = headers.get('Content-Type')
 		# multipart/form-data; boundary=---abc--
 		if headers.get('Content-Type') == 'multipart/form-data':
@@ -367,8 +543,18 @@ class HttpClient:
 				# as the caller doesn't want httpx to come up with their own boundary
 				headers.pop('Content-Type')
 
+			# Convert BaseModel objects to dicts before building the form
+			json_data = self._prepare_json_data(json_data)
 			if json_data:
 				kwargs['data'] = self._make_multipartform(json_data)
+		elif json_data is not None and options.files is None:
+			# serialized exactly once, in a single pass; retries re-send the same bytes
+			kwargs['content'] = encode_json_body(json_data)
+			if 'Content-Type' not in headers:
+				headers['Content-Type'] = 'application/json'
+			json_data = None
+		else:
+			json_data = self._prepare_json_data(json_data)
 
 		return self._client.build_request(
 			headers=headers,
@@ -461,207 +647,88 @@ class HttpClient:
 		except pydantic.ValidationError as err:
 			raise APIResponseValidationError(response=response, json_data=data) from err
 
-	def _should_stream_response_body(self, request: httpx.Request) -> bool:
-		return request.headers.get(RAW_RESPONSE_HEADER) == 'stream'  # type: ignore[no-any-return]
-
-	def _should_retry(self, response: httpx.Response) -> bool:
-		# Note: this is not a standard header
-		should_retry_header = response.headers.get('x-should-retry')
-
-		# If the server explicitly says whether or not to retry, obey.
-		if should_retry_header == 'true':
-			log.debug('Retrying as header `x-should-retry` is set to `true`')
-			return True
-		if should_retry_header == 'false':
-			log.debug('Not retrying as header `x-should-retry` is set to `false`')
-			return False
-
-		# Retry on request timeouts.
-		if response.status_code == 408:
-			log.debug('Retrying due to status code %i', response.status_code)
-			return True
-
-		# Retry on lock timeouts.
-		if response.status_code == 409:
-			log.debug('Retrying due to status code %i', response.status_code)
-			return True
-
-		# Retry on rate limits.
-		if response.status_code == 429:
-			log.debug('Retrying due to status code %i', response.status_code)
-			return True
-
-		# Retry internal errors.
-		if response.status_code >= 500:
-			log.debug('Retrying due to status code %i', response.status_code)
-			return True
-
-		log.debug('Not retrying')
-		return False
-
-	def is_closed(self) -> bool:
-		return self._client.is_closed
-
-	def close(self):
-		try:
-			if hasattr(self, '_client') and self._client is not None and not self._client.is_closed:
-				self._client.close()
-		except Exception:
-			# Ignore any exceptions during cleanup to avoid masking the original error
-			pass
-
-	def __enter__(self):
-		return self
-
-	def __exit__(self, exc_type, exc_val, exc_tb):
-		self.close()
-
-	def request(
-		self,
-		cast_type: Type[ResponseT],
-		options: FinalRequestOptions,
-		remaining_retries: Optional[int] = None,
-		*,
-		stream: bool = False,
-		stream_cls: Type[StreamResponse] | None = None,
-	) -> ResponseT | StreamResponse:
-		return self._request(
-			cast_type=cast_type,
-			options=options,
-			stream=stream,
-			stream_cls=stream_cls,
-			remaining_retries=remaining_retries,
-		)
-
-	def _request(
-		self,
-		*,
-		cast_type: Type[ResponseT],
-		options: FinalRequestOptions,
-		remaining_retries: int | None,
-		stream: bool,
-		stream_cls: Type[StreamResponse] | None,
-	) -> ResponseT | StreamResponse:
-		retries = self._remaining_retries(remaining_retries, options)
-		request = self._build_request(options)
-
-		kwargs: HttpxSendArgs = {}
-		if self.custom_auth is not None:
-			kwargs['auth'] = self.custom_auth
-		try:
-			response = self._client.send(
-				request,
-				stream=stream or self._should_stream_response_body(request=request),
-				**kwargs,
-			)
-		except httpx.TimeoutException as err:
-			log.debug('Encountered httpx.TimeoutException', exc_info=True)
-
-			if retries > 0:
-				return self._retry_request(
-					options,
-					cast_type,
-					retries,
-					stream=stream,
-					stream_cls=stream_cls,
-					response_headers=None,
-				)
-
-			log.debug('Raising timeout error')
-			raise APITimeoutError(request=request) from err
-		except Exception as err:
-			log.debug('Encountered Exception', exc_info=True)
+	@property
+	def limiter(self) -> RequestLimiter | AsyncRequestLimiter | None:
+		"""The per-model request limiter, if any; its `stats()` expose the queue-wait metrics."""
+		return self._limiter
 
-			if retries > 0:
-				return self._retry_request(
-					options,
-					cast_type,
-					retries,
-					stream=stream,
-					stream_cls=stream_cls,
-					response_headers=None,
-				)
+	@property
+	def key_pool(self) -> ApiKeyPool | None:
+		"""The API key pool requests are spread over, if any; its `stats()` expose per-key counters."""
+		return self._key_pool
 
-			log.debug('Raising connection error')
-			raise APIConnectionError(request=request) from err
+	def _authorization_for_key(self, api_key: str) -> str:
+		return f'Bearer {api_key}'
 
-		log.debug(
-			'HTTP Request: %s %s "%i %s"',
-			request.method,
-			request.url,
-			response.status_code,
-			response.reason_phrase,
-		)
+	def _lease_key(self, request: httpx.Request) -> KeyLease | None:
+		if self._key_pool is None:
+			return None
+		lease = self._key_pool.acquire()
+		# picked per attempt, so a retry after a 429 moves on to another key
+		request.headers['Authorization'] = self._authorization_for_key(lease.api_key)
+		return lease
 
-		try:
-			response.raise_for_status()
-		except httpx.HTTPStatusError as err:  # thrown on 4xx and 5xx status code
-			log.debug('Encountered httpx.HTTPStatusError', exc_info=True)
+	@property
+	def coalescer(self) -> RequestCoalescer | AsyncRequestCoalescer | None:
+		"""The singleflight layer for identical in-flight requests, if enabled; see its `stats()`."""
+		return self._coalescer
 
-			if retries > 0 and self._should_retry(err.response):
-				err.response.close()
-				return self._retry_request(
-					options,
-					cast_type,
-					retries,
-					err.response.headers,
-					stream=stream,
-					stream_cls=stream_cls,
-				)
+	@property
+	def response_cache(self) -> ResponseCache | None:
+		"""The response cache, if any; its `stats()` expose hit, miss and eviction counters."""
+		return self._response_cache
 
-			# If the response is streamed then we need to explicitly read the response
-			# to completion before attempting to access the response text.
-			if not err.response.is_closed:
-				err.response.read()
-
-			log.debug('Re-raising status error')
-			raise self._make_status_error(err.response) from None
-
-		# return self._parse_response(
-		#     cast_type=cast_type,
-		#     options=options,
-		#     response=response,
-		#     stream=stream,
-		#     stream_cls=stream_cls,
-		# )
-		return self._process_response(
-			cast_type=cast_type,
-			options=options,
-			response=response,
-			stream=stream,
-			stream_cls=stream_cls,
-		)
+	def _cache_namespace(self) -> str:
+		"""Identity cached responses are scoped to, so tenants never read each other's entries."""
+		return ''
 
-	def _retry_request(
-		self,
-		options: FinalRequestOptions,
-		cast_type: Type[ResponseT],
-		remaining_retries: int,
-		response_headers: httpx.Headers | None,
-		*,
-		stream: bool,
-		stream_cls: Type[StreamResponse] | None,
-	) -> ResponseT | StreamResponse:
-		remaining = remaining_retries - 1
-		if remaining == 1:
-			log.debug('1 retry left')
-		else:
-			log.debug('%i retries left', remaining)
+	def _cache_key(self, request: httpx.Request, options: FinalRequestOptions) -> str | None:
+		cache = self._response_cache
+		if cache is None or options.cache is False or options.files is not None:
+			return None
+		if options.cache is None and not cache.is_cacheable(request.method, options.url, options.json_data):
+			return None
+		return cache.make_key(request.method, str(request.url), request.content, self._cache_namespace())
+
+	def _cache_response(self, key: str, response: httpx.Response, options: FinalRequestOptions) -> None:
+		cache = cast(ResponseCache, self._response_cache)
+		if response.status_code != 200:
+			return
+		if response.is_closed:
+			if cache.is_final(options.url, response.content):
+				cache.set(key, CachedResponse.from_response(response, response.content))
+			return
+
+		def store(content: bytes) -> None:
+			# the recorded bytes are still in their wire encoding, so the entry keeps `content-encoding`
+			encoded = 'content-encoding' in response.headers
+			if cache.is_final(options.url, None if encoded else content):
+				cache.set(key, CachedResponse.from_response(response, content, encoded=True))
+
+		# streamed: stored once the body has been consumed to the end, e.g. a full SSE stream
+		response.stream = self._recording_stream_cls(response.stream, cache.max_entry_bytes, store)
+
+	def _coalesce_key(self, cast_type: object, options: FinalRequestOptions, stream: bool) -> Hashable | None:
+		if self._coalescer is None or stream:
+			return None
+		json_data = options.json_data
+		if is_mapping(json_data) and json_data.get('stream'):
+			return None
+		return self._coalescer.key(options, self._prepare_headers(options), cast_type)
 
-		timeout = self._calculate_retry_timeout(remaining, options, response_headers)
-		log.info('Retrying request to %s in %f seconds', options.url, timeout)
+	def _limiter_key(self, options: FinalRequestOptions) -> str | None:
+		json_data = options.json_data
+		if is_mapping(json_data):
+			model = json_data.get('model')
+			if isinstance(model, str):
+				return model
+		return None
 
-		# In a synchronous context we are blocking the entire thread. Up to the library user to run the client in a
-		# different thread if necessary.
-		time.sleep(timeout)
+	def _should_stream_response_body(self, request: httpx.Request) -> bool:
+		return request.headers.get(RAW_RESPONSE_HEADER) == 'stream'  # type: ignore[no-any-return]
 
-		return self._request(
-			options=options,
-			cast_type=cast_type,
-			remaining_retries=remaining,
-			stream=stream,
-			stream_cls=stream_cls,
-		)
+	def _should_retry(self, response: httpx.Response) -> bool:
+		return self._retry_policy.classify_response(response) is not None
 
 	def _process_response(
 		self,
@@ -721,59 +788,314 @@ class HttpClient:
 
 		return api_response.parse()
 
-	def _request_api_list(
-		self,
-		model: Type[object],
-		page: Type[SyncPageT],
-		options: FinalRequestOptions,
-	) -> SyncPageT:
-		def _parser(resp: SyncPageT) -> SyncPageT:
-			resp._set_private_attributes(
-				client=self,
-				model=model,
-				options=options,
-			)
-			return resp
-
-		options.post_parser = _parser
+	def _make_status_error(self, response) -> APIStatusError:
+		response_text = response.text.strip()
+		status_code = response.status_code
+		error_msg = f'Error code: {status_code}, with error text {response_text}'
 
-		return self.request(page, options, stream=False)
+		if status_code == 400:
+			return _errors.APIRequestFailedError(message=error_msg, response=response)
+		elif status_code == 401:
+			return _errors.APIAuthenticationError(message=error_msg, response=response)
+		elif status_code == 429:
+			return _errors.APIReachLimitError(message=error_msg, response=response)
+		elif status_code == 500:
+			return _errors.APIInternalError(message=error_msg, response=response)
+		elif status_code == 503:
+			return _errors.APIServerFlowExceedError(message=error_msg, response=response)
+		return APIStatusError(message=error_msg, response=response)
 
-	@overload
-	def get(
-		self,
-		path: str,
-		*,
-		cast_type: Type[ResponseT],
-		options: UserRequestInput = {},
-		stream: Literal[False] = False,
-	) -> ResponseT: ...
 
-	@overload
-	def get(
-		self,
-		path: str,
-		*,
-		cast_type: Type[ResponseT],
-		options: UserRequestInput = {},
-		stream: Literal[True],
-		stream_cls: Type[StreamResponse],
-	) -> StreamResponse: ...
+class HttpClient(BaseHttpClient):
+	_client: httpx.Client
+	_recording_stream_cls = RecordingByteStream
+	_default_stream_cls: Type[StreamResponse[Any]] | None = None
 
-	@overload
-	def get(
+	def __init__(
 		self,
-		path: str,
 		*,
-		cast_type: Type[ResponseT],
-		options: UserRequestInput = {},
-		stream: bool,
-		stream_cls: Type[StreamResponse] | None = None,
-	) -> ResponseT | StreamResponse: ...
-
-	def get(
-		self,
-		path: str,
+		version: str,
+		base_url: URL,
+		_strict_response_validation: bool,
+		max_retries: int = ZAI_DEFAULT_MAX_RETRIES,
+		timeout: Union[float, Timeout, None],
+		limits: httpx.Limits | None = None,
+		custom_httpx_client: httpx.Client | None = None,
+		custom_headers: Mapping[str, str] | None = None,
+		limiter: RequestLimiter | None = None,
+		retry_policy: RetryPolicy | None = None,
+		attempt_hooks: Iterable[Callable[[RequestAttempt], None]] | None = None,
+		key_pool: ApiKeyPool | None = None,
+		coalescer: RequestCoalescer | None = None,
+		response_cache: ResponseCache | None = None,
+	) -> None:
+		super().__init__(
+			version=version,
+			base_url=base_url,
+			_strict_response_validation=_strict_response_validation,
+			max_retries=max_retries,
+			timeout=timeout,
+			limits=limits,
+			custom_httpx_client=custom_httpx_client,
+			custom_headers=custom_headers,
+			limiter=limiter,
+			retry_policy=retry_policy,
+			attempt_hooks=attempt_hooks,
+			key_pool=key_pool,
+			coalescer=coalescer,
+			response_cache=response_cache,
+		)
+		self._client = custom_httpx_client or httpx.Client(
+			base_url=base_url,
+			timeout=self.timeout,
+			limits=self._limits,
+		)
+
+	def is_closed(self) -> bool:
+		return self._client.is_closed
+
+	def close(self):
+		if not getattr(self, '_owns_http_client', True):
+			# clones share their parent's connection pool, which only the parent closes
+			return
+		try:
+			if hasattr(self, '_client') and self._client is not None and not self._client.is_closed:
+				self._client.close()
+		except Exception:
+			# Ignore any exceptions during cleanup to avoid masking the original error
+			pass
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_val, exc_tb):
+		self.close()
+
+	def request(
+		self,
+		cast_type: Type[ResponseT],
+		options: FinalRequestOptions,
+		remaining_retries: Optional[int] = None,
+		*,
+		stream: bool = False,
+		stream_cls: Type[StreamResponse] | None = None,
+	) -> ResponseT | StreamResponse:
+		key = self._coalesce_key(cast_type, options, stream)
+		if key is not None:
+			return self._coalescer.do(
+				key,
+				lambda: self._request(
+					cast_type=cast_type,
+					options=options,
+					stream=False,
+					stream_cls=None,
+					remaining_retries=remaining_retries,
+				),
+			)
+
+		return self._request(
+			cast_type=cast_type,
+			options=options,
+			stream=stream,
+			stream_cls=stream_cls,
+			remaining_retries=remaining_retries,
+		)
+
+	def _send(
+		self,
+		request: httpx.Request,
+		options: FinalRequestOptions,
+		*,
+		stream: bool,
+		**kwargs: Any,
+	) -> httpx.Response:
+		release = self._limiter.acquire(self._limiter_key(options)) if self._limiter is not None else None
+		lease = self._lease_key(request)
+		if lease is not None:
+			release = _chain_releases(release, lease.release)
+		if release is None:
+			return self._client.send(request, stream=stream, **kwargs)
+
+		try:
+			response = self._client.send(request, stream=stream, **kwargs)
+		except BaseException:
+			if lease is not None:
+				lease.report_error()
+			release()
+			raise
+		if lease is not None:
+			lease.report_response(response)
+		if stream and not response.is_closed:
+			# a streamed body keeps its slot until the response is closed
+			response.stream = ReleasingByteStream(response.stream, release)
+		else:
+			release()
+		return response
+
+	def _request(
+		self,
+		*,
+		cast_type: Type[ResponseT],
+		options: FinalRequestOptions,
+		remaining_retries: int | None,
+		stream: bool,
+		stream_cls: Type[StreamResponse] | None,
+	) -> ResponseT | StreamResponse:
+		retries = self._remaining_retries(remaining_retries, options)
+		retry_policy = self._retry_policy
+		retry_state = RetryState()
+		# built (and its body serialized) once; every retry re-sends this same request
+		request = self._build_request(options)
+
+		cache_key = self._cache_key(request, options)
+		if cache_key is not None:
+			cached = cast(ResponseCache, self._response_cache).get(cache_key)
+			if cached is not None:
+				return self._process_response(
+					cast_type=cast_type,
+					options=options,
+					response=cached.to_response(request),
+					stream=stream,
+					stream_cls=stream_cls,
+				)
+
+		kwargs: HttpxSendArgs = {}
+		if self.custom_auth is not None:
+			kwargs['auth'] = self.custom_auth
+
+		attempt = 0
+		while True:
+			attempt += 1
+			started = time.monotonic()
+			try:
+				response = self._send(
+					request,
+					options,
+					stream=stream or self._should_stream_response_body(request=request),
+					**kwargs,
+				)
+			except Exception as err:
+				is_timeout = isinstance(err, httpx.TimeoutException)
+				log.debug(
+					'Encountered httpx.TimeoutException' if is_timeout else 'Encountered Exception',
+					exc_info=True,
+				)
+
+				delay = None
+				if retry_policy.should_retry(retry_state, retry_policy.classify_exception(err), retries):
+					delay = self._retry_delay(options, retries, retry_state, None)
+				self._emit_attempt(request, attempt, started, error=err, retry_delay=delay)
+				if delay is not None:
+					retries -= 1
+					# In a synchronous context we are blocking the entire thread. Up to the library user
+					# to run the client in a different thread if necessary.
+					time.sleep(delay)
+					continue
+
+				if is_timeout:
+					log.debug('Raising timeout error')
+					raise APITimeoutError(request=request) from err
+				log.debug('Raising connection error')
+				raise APIConnectionError(request=request) from err
+
+			log.debug(
+				'HTTP Request: %s %s "%i %s"',
+				request.method,
+				request.url,
+				response.status_code,
+				response.reason_phrase,
+			)
+
+			try:
+				response.raise_for_status()
+			except httpx.HTTPStatusError as err:  # thrown on 4xx and 5xx status code
+				log.debug('Encountered httpx.HTTPStatusError', exc_info=True)
+
+				delay = None
+				error_class = retry_policy.classify_response(err.response)
+				if error_class is not None and retry_policy.should_retry(retry_state, error_class, retries):
+					delay = self._retry_delay(options, retries, retry_state, err.response.headers)
+				self._emit_attempt(request, attempt, started, response=err.response, retry_delay=delay)
+				if delay is not None:
+					err.response.close()
+					retries -= 1
+					time.sleep(delay)
+					continue
+
+				# If the response is streamed then we need to explicitly read the response
+				# to completion before attempting to access the response text.
+				if not err.response.is_closed:
+					err.response.read()
+
+				log.debug('Re-raising status error')
+				raise self._make_status_error(err.response) from None
+
+			self._emit_attempt(request, attempt, started, response=response)
+			retry_policy.record_success()
+			if cache_key is not None:
+				self._cache_response(cache_key, response, options)
+
+			return self._process_response(
+				cast_type=cast_type,
+				options=options,
+				response=response,
+				stream=stream,
+				stream_cls=stream_cls,
+			)
+
+	def _request_api_list(
+		self,
+		model: Type[object],
+		page: Type[SyncPageT],
+		options: FinalRequestOptions,
+	) -> SyncPageT:
+		def _parser(resp: SyncPageT) -> SyncPageT:
+			resp._set_private_attributes(
+				client=self,
+				model=model,
+				options=options,
+			)
+			return resp
+
+		options.post_parser = _parser
+
+		return self.request(page, options, stream=False)
+
+	@overload
+	def get(
+		self,
+		path: str,
+		*,
+		cast_type: Type[ResponseT],
+		options: UserRequestInput = {},
+		stream: Literal[False] = False,
+	) -> ResponseT: ...
+
+	@overload
+	def get(
+		self,
+		path: str,
+		*,
+		cast_type: Type[ResponseT],
+		options: UserRequestInput = {},
+		stream: Literal[True],
+		stream_cls: Type[StreamResponse],
+	) -> StreamResponse: ...
+
+	@overload
+	def get(
+		self,
+		path: str,
+		*,
+		cast_type: Type[ResponseT],
+		options: UserRequestInput = {},
+		stream: bool,
+		stream_cls: Type[StreamResponse] | None = None,
+	) -> ResponseT | StreamResponse: ...
+
+	def get(
+		self,
+		path: str,
 		*,
 		cast_type: Type[ResponseT],
 		options: UserRequestInput = {},
@@ -913,22 +1235,439 @@ class HttpClient:
 		opts = FinalRequestOptions.construct(method=method, url=path, json_data=body, **options)
 		return self._request_api_list(model, page, opts)
 
-	def _make_status_error(self, response) -> APIStatusError:
-		response_text = response.text.strip()
-		status_code = response.status_code
-		error_msg = f'Error code: {status_code}, with error text {response_text}'
+class AsyncHttpClient(BaseHttpClient):
+	"""
+	asyncio counterpart of `HttpClient`, backed by `httpx.AsyncClient`.
 
-		if status_code == 400:
-			return _errors.APIRequestFailedError(message=error_msg, response=response)
-		elif status_code == 401:
-			return _errors.APIAuthenticationError(message=error_msg, response=response)
-		elif status_code == 429:
-			return _errors.APIReachLimitError(message=error_msg, response=response)
-		elif status_code == 500:
-			return _errors.APIInternalError(message=error_msg, response=response)
-		elif status_code == 503:
-			return _errors.APIServerFlowExceedError(message=error_msg, response=response)
-		return APIStatusError(message=error_msg, response=response)
+	Every request method is a coroutine and retries back off with `asyncio.sleep`,
+	so many concurrent requests can share one event loop instead of one thread each.
+	"""
+
+	_client: httpx.AsyncClient
+	_recording_stream_cls = AsyncRecordingByteStream
+	_default_stream_cls: Type[AsyncStreamResponse[Any]] | None = None
+
+	def __init__(
+		self,
+		*,
+		version: str,
+		base_url: URL,
+		_strict_response_validation: bool,
+		max_retries: int = ZAI_DEFAULT_MAX_RETRIES,
+		timeout: Union[float, Timeout, None],
+		limits: httpx.Limits | None = None,
+		custom_httpx_client: httpx.AsyncClient | None = None,
+		custom_headers: Mapping[str, str] | None = None,
+		limiter: AsyncRequestLimiter | None = None,
+		retry_policy: RetryPolicy | None = None,
+		attempt_hooks: Iterable[Callable[[RequestAttempt], None]] | None = None,
+		key_pool: ApiKeyPool | None = None,
+		coalescer: AsyncRequestCoalescer | None = None,
+		response_cache: ResponseCache | None = None,
+	) -> None:
+		super().__init__(
+			version=version,
+			base_url=base_url,
+			_strict_response_validation=_strict_response_validation,
+			max_retries=max_retries,
+			timeout=timeout,
+			limits=limits,
+			custom_httpx_client=custom_httpx_client,
+			custom_headers=custom_headers,
+			limiter=limiter,
+			retry_policy=retry_policy,
+			attempt_hooks=attempt_hooks,
+			key_pool=key_pool,
+			coalescer=coalescer,
+			response_cache=response_cache,
+		)
+		self._client = custom_httpx_client or httpx.AsyncClient(
+			base_url=base_url,
+			timeout=self.timeout,
+			limits=self._limits,
+		)
+
+	def is_closed(self) -> bool:
+		return self._client.is_closed
+
+	async def close(self):
+		if not getattr(self, '_owns_http_client', True):
+			# clones share their parent's connection pool, which only the parent closes
+			return
+		try:
+			if hasattr(self, '_client') and self._client is not None and not self._client.is_closed:
+				await self._client.aclose()
+		except Exception:
+			# Ignore any exceptions during cleanup to avoid masking the original error
+			pass
+
+	async def __aenter__(self):
+		return self
+
+	async def __aexit__(self, exc_type, exc_val, exc_tb):
+		await self.close()
+
+	async def request(
+		self,
+		cast_type: Type[ResponseT],
+		options: FinalRequestOptions,
+		remaining_retries: Optional[int] = None,
+		*,
+		stream: bool = False,
+		stream_cls: Type[AsyncStreamResponse] | None = None,
+	) -> ResponseT | AsyncStreamResponse:
+		key = self._coalesce_key(cast_type, options, stream)
+		if key is not None:
+			return await self._coalescer.do(
+				key,
+				lambda: self._request(
+					cast_type=cast_type,
+					options=options,
+					stream=False,
+					stream_cls=None,
+					remaining_retries=remaining_retries,
+				),
+			)
+
+		return await self._request(
+			cast_type=cast_type,
+			options=options,
+			stream=stream,
+			stream_cls=stream_cls,
+			remaining_retries=remaining_retries,
+		)
+
+	async def _send(
+		self,
+		request: httpx.Request,
+		options: FinalRequestOptions,
+		*,
+		stream: bool,
+		**kwargs: Any,
+	) -> httpx.Response:
+		release = await self._limiter.acquire(self._limiter_key(options)) if self._limiter is not None else None
+		lease = self._lease_key(request)
+		if lease is not None:
+			release = _chain_releases(release, lease.release)
+		if release is None:
+			return await self._client.send(request, stream=stream, **kwargs)
+
+		try:
+			response = await self._client.send(request, stream=stream, **kwargs)
+		except BaseException:
+			if lease is not None:
+				lease.report_error()
+			release()
+			raise
+		if lease is not None:
+			lease.report_response(response)
+		if stream and not response.is_closed:
+			# a streamed body keeps its slot until the response is closed
+			response.stream = AsyncReleasingByteStream(response.stream, release)
+		else:
+			release()
+		return response
+
+	async def _request(
+		self,
+		*,
+		cast_type: Type[ResponseT],
+		options: FinalRequestOptions,
+		remaining_retries: int | None,
+		stream: bool,
+		stream_cls: Type[AsyncStreamResponse] | None,
+	) -> ResponseT | AsyncStreamResponse:
+		retries = self._remaining_retries(remaining_retries, options)
+		retry_policy = self._retry_policy
+		retry_state = RetryState()
+		# built (and its body serialized) once; every retry re-sends this same request
+		request = self._build_request(options)
+
+		cache_key = self._cache_key(request, options)
+		if cache_key is not None:
+			cached = cast(ResponseCache, self._response_cache).get(cache_key)
+			if cached is not None:
+				return self._process_response(
+					cast_type=cast_type,
+					options=options,
+					response=cached.to_response(request),
+					stream=stream,
+					stream_cls=stream_cls,
+				)
+
+		kwargs: HttpxSendArgs = {}
+		if self.custom_auth is not None:
+			kwargs['auth'] = self.custom_auth
+
+		attempt = 0
+		while True:
+			attempt += 1
+			started = time.monotonic()
+			try:
+				response = await self._send(
+					request,
+					options,
+					stream=stream or self._should_stream_response_body(request=request),
+					**kwargs,
+				)
+			except Exception as err:
+				is_timeout = isinstance(err, httpx.TimeoutException)
+				log.debug(
+					'Encountered httpx.TimeoutException' if is_timeout else 'Encountered Exception',
+					exc_info=True,
+				)
+
+				delay = None
+				if retry_policy.should_retry(retry_state, retry_policy.classify_exception(err), retries):
+					delay = self._retry_delay(options, retries, retry_state, None)
+				self._emit_attempt(request, attempt, started, error=err, retry_delay=delay)
+				if delay is not None:
+					retries -= 1
+					await asyncio.sleep(delay)
+					continue
+
+				if is_timeout:
+					log.debug('Raising timeout error')
+					raise APITimeoutError(request=request) from err
+				log.debug('Raising connection error')
+				raise APIConnectionError(request=request) from err
+
+			log.debug(
+				'HTTP Request: %s %s "%i %s"',
+				request.method,
+				request.url,
+				response.status_code,
+				response.reason_phrase,
+			)
+
+			try:
+				response.raise_for_status()
+			except httpx.HTTPStatusError as err:  # thrown on 4xx and 5xx status code
+				log.debug('Encountered httpx.HTTPStatusError', exc_info=True)
+
+				delay = None
+				error_class = retry_policy.classify_response(err.response)
+				if error_class is not None and retry_policy.should_retry(retry_state, error_class, retries):
+					delay = self._retry_delay(options, retries, retry_state, err.response.headers)
+				self._emit_attempt(request, attempt, started, response=err.response, retry_delay=delay)
+				if delay is not None:
+					await err.response.aclose()
+					retries -= 1
+					await asyncio.sleep(delay)
+					continue
+
+				# If the response is streamed then we need to explicitly read the response
+				# to completion before attempting to access the response text.
+				if not err.response.is_closed:
+					await err.response.aread()
+
+				log.debug('Re-raising status error')
+				raise self._make_status_error(err.response) from None
+
+			self._emit_attempt(request, attempt, started, response=response)
+			retry_policy.record_success()
+			if cache_key is not None:
+				self._cache_response(cache_key, response, options)
+
+			return self._process_response(
+				cast_type=cast_type,
+				options=options,
+				response=response,
+				stream=stream,
+				stream_cls=stream_cls,
+			)
+
+	async def _request_api_list(
+		self,
+		model: Type[object],
+		page: Type[AsyncPageT],
+		options: FinalRequestOptions,
+	) -> AsyncPageT:
+		def _parser(resp: AsyncPageT) -> AsyncPageT:
+			resp._set_private_attributes(
+				client=self,
+				model=model,
+				options=options,
+			)
+			return resp
+
+		options.post_parser = _parser
+
+		return await self.request(page, options, stream=False)
+
+	@overload
+	async def get(
+		self,
+		path: str,
+		*,
+		cast_type: Type[ResponseT],
+		options: UserRequestInput = {},
+		stream: Literal[False] = False,
+	) -> ResponseT: ...
+
+	@overload
+	async def get(
+		self,
+		path: str,
+		*,
+		cast_type: Type[ResponseT],
+		options: UserRequestInput = {},
+		stream: Literal[True],
+		stream_cls: Type[AsyncStreamResponse],
+	) -> AsyncStreamResponse: ...
+
+	@overload
+	async def get(
+		self,
+		path: str,
+		*,
+		cast_type: Type[ResponseT],
+		options: UserRequestInput = {},
+		stream: bool,
+		stream_cls: Type[AsyncStreamResponse] | None = None,
+	) -> ResponseT | AsyncStreamResponse: ...
+
+	async def get(
+		self,
+		path: str,
+		*,
+		cast_type: Type[ResponseT],
+		options: UserRequestInput = {},
+		stream: bool = False,
+		stream_cls: Type[AsyncStreamResponse] | None = None,
+	) -> ResponseT:
+		opts = FinalRequestOptions.construct(method='get', url=path, **options)
+		return cast(
+			ResponseT,
+			await self.request(cast_type, opts, stream=stream, stream_cls=stream_cls),
+		)
+
+	@overload
+	async def post(
+		self,
+		path: str,
+		*,
+		cast_type: Type[ResponseT],
+		body: Body | None = None,
+		options: UserRequestInput = {},
+		files: RequestFiles | None = None,
+		stream: Literal[False] = False,
+	) -> ResponseT: ...
+
+	@overload
+	async def post(
+		self,
+		path: str,
+		*,
+		cast_type: Type[ResponseT],
+		body: Body | None = None,
+		options: UserRequestInput = {},
+		files: RequestFiles | None = None,
+		stream: Literal[True],
+		stream_cls: Type[AsyncStreamResponse],
+	) -> AsyncStreamResponse: ...
+
+	@overload
+	async def post(
+		self,
+		path: str,
+		*,
+		cast_type: Type[ResponseT],
+		body: Body | None = None,
+		options: UserRequestInput = {},
+		files: RequestFiles | None = None,
+		stream: bool,
+		stream_cls: Type[AsyncStreamResponse] | None = None,
+	) -> ResponseT | AsyncStreamResponse: ...
+
+	async def post(
+		self,
+		path: str,
+		*,
+		cast_type: Type[ResponseT],
+		body: Body | None = None,
+		options: UserRequestInput = {},
+		files: RequestFiles | None = None,
+		stream: bool = False,
+		stream_cls: Type[AsyncStreamResponse[Any]] | None = None,
+	) -> ResponseT | AsyncStreamResponse:
+		opts = FinalRequestOptions.construct(
+			method='post',
+			url=path,
+			json_data=body,
+			files=to_httpx_files(files),
+			**options,
+		)
+
+		return cast(
+			ResponseT,
+			await self.request(cast_type, opts, stream=stream, stream_cls=stream_cls),
+		)
+
+	async def patch(
+		self,
+		path: str,
+		*,
+		cast_type: Type[ResponseT],
+		body: Body | None = None,
+		options: UserRequestInput = {},
+	) -> ResponseT:
+		opts = FinalRequestOptions.construct(method='patch', url=path, json_data=body, **options)
+
+		return await self.request(
+			cast_type=cast_type,
+			options=opts,
+		)
+
+	async def put(
+		self,
+		path: str,
+		*,
+		cast_type: Type[ResponseT],
+		body: Body | None = None,
+		options: UserRequestInput = {},
+		files: RequestFiles | None = None,
+	) -> ResponseT | AsyncStreamResponse:
+		opts = FinalRequestOptions.construct(
+			method='put',
+			url=path,
+			json_data=body,
+			files=to_httpx_files(files),
+			**options,
+		)
+
+		return await self.request(
+			cast_type=cast_type,
+			options=opts,
+		)
+
+	async def delete(
+		self,
+		path: str,
+		*,
+		cast_type: Type[ResponseT],
+		body: Body | None = None,
+		options: UserRequestInput = {},
+	) -> ResponseT | AsyncStreamResponse:
+		opts = FinalRequestOptions.construct(method='delete', url=path, json_data=body, **options)
+
+		return await self.request(
+			cast_type=cast_type,
+			options=opts,
+		)
+
+	async def get_api_list(
+		self,
+		path: str,
+		*,
+		model: Type[object],
+		page: Type[AsyncPageT],
+		body: Body | None = None,
+		options: UserRequestInput = {},
+		method: str = 'get',
+	) -> AsyncPageT:
+		opts = FinalRequestOptions.construct(method=method, url=path, json_data=body, **options)
+		return await self._request_api_list(model, page, opts)
 
 
 def make_request_options(
@@ -939,6 +1678,7 @@ def make_request_options(
 	extra_body: Body | None = None,
 	timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
 	post_parser: PostParser | NotGiven = NOT_GIVEN,
+	cache: bool | NotGiven = NOT_GIVEN,
 ) -> UserRequestInput:
 	"""Create a dict of type RequestOptions without keys of NotGiven values."""
 	options: UserRequestInput = {}
@@ -961,9 +1701,25 @@ def make_request_options(
 		# internal
 		options['post_parser'] = post_parser  # type: ignore
 
+	if is_given(cache):
+		options['cache'] = cache
+
 	return options
 
 
+def _chain_releases(first: Callable[[], None] | None, second: Callable[[], None]) -> Callable[[], None]:
+	if first is None:
+		return second
+
+	def release() -> None:
+		try:
+			first()
+		finally:
+			second()
+
+	return release
+
+
 def _merge_mappings(
 	obj1: Mapping[_T_co, Union[_T, Omit]],
 	obj2: Mapping[_T_co, Union[_T, Omit]],
@@ -1,9 +1,18 @@
 """JSON encoding utilities for BaseModel objects."""
 
+from __future__ import annotations
+
 import json
-from typing import Any
+import math
+from typing import Any, Callable, Union
 
 from ._base_models import BaseModel
+from ._base_type import NotGiven
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speed-up
+    orjson = None
 
 
 class ZAIJSONEncoder(json.JSONEncoder):
@@ -42,3 +51,125 @@ def json_loads(s: str, **kwargs) -> Any:
         Deserialized object
     """
     return json.loads(s, **kwargs)
+
+
+class _NotGivenFound(Exception):
+    """Raised by the stdlib encoder when a nested `NotGiven` value needs stripping."""
+
+
+def _encode_default(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(by_alias=True, exclude_unset=True)
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+class _BodyEncoder(ZAIJSONEncoder):
+    def default(self, obj: Any) -> Any:
+        if isinstance(obj, NotGiven):
+            raise _NotGivenFound()
+        return super().default(obj)
+
+
+def _strip_not_given_deep(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(by_alias=True, exclude_unset=True)
+    if isinstance(obj, dict):
+        return {key: _strip_not_given_deep(value) for key, value in obj.items() if not isinstance(value, NotGiven)}
+    if isinstance(obj, (list, tuple)):
+        return [_strip_not_given_deep(item) for item in obj if not isinstance(item, NotGiven)]
+    return obj
+
+
+def _has_non_finite(obj: Any) -> bool:
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, BaseModel):
+        obj = obj.model_dump(by_alias=True, exclude_unset=True)
+    if isinstance(obj, dict):
+        return any(_has_non_finite(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(item) for item in obj)
+    return False
+
+
+def _dumps_stdlib(obj: Any, sort_keys: bool = False) -> bytes:
+    return json.dumps(
+        obj, cls=_BodyEncoder, ensure_ascii=False, separators=(',', ':'), allow_nan=False, sort_keys=sort_keys
+    ).encode('utf-8')
+
+
+def _dumps_orjson(obj: Any, sort_keys: bool = False) -> bytes | None:
+    not_given = []
+
+    def default(value: Any) -> Any:
+        if isinstance(value, NotGiven):
+            not_given.append(value)
+            return None
+        return _encode_default(value)
+
+    try:
+        data = orjson.dumps(obj, default=default, option=orjson.OPT_SORT_KEYS if sort_keys else None)
+    except orjson.JSONEncodeError:
+        # e.g. integers beyond 64 bits or non-str keys, which the standard library still handles
+        return None
+    if b'null' in data and _has_non_finite(obj):
+        # orjson writes NaN and infinities as null; the standard library rejects them instead
+        return None
+    if not_given:
+        raise _NotGivenFound()
+    return data
+
+
+def _dumps(obj: Any, sort_keys: bool) -> bytes:
+    data = _dumps_orjson(obj, sort_keys) if orjson is not None else None
+    return data if data is not None else _dumps_stdlib(obj, sort_keys)
+
+
+def encode_json_body(obj: Any, *, sort_keys: bool = False) -> bytes:
+    """
+    Serialize a request body to compact UTF-8 JSON bytes in a single pass.
+
+    `BaseModel` values are dumped with their aliases and only the fields that were set,
+    and `NotGiven` values are dropped at any depth. orjson is used when installed, the
+    standard library (`ZAIJSONEncoder`) otherwise. Either way NaN and infinite floats are
+    not valid JSON and raise `ValueError`.
+
+    Args:
+        obj: The JSON body, typically a dict
+        sort_keys: Sort object keys, giving a canonical encoding suitable for hashing
+
+    Returns:
+        The encoded body, ready to be sent as the request content
+    """
+    try:
+        return _dumps(obj, sort_keys)
+    except _NotGivenFound:
+        # top-level `NotGiven` keys are already stripped by `FinalRequestOptions`, so
+        # nested ones are rare; strip them in a second pass only when present
+        return _dumps(_strip_not_given_deep(obj), sort_keys)
+
+
+def _stdlib_loads(data: Union[str, bytes, bytearray]) -> Any:
+    return json.loads(data)
+
+
+def get_json_loads(backend: str = 'auto') -> Callable[[Union[str, bytes, bytearray]], Any]:
+    """
+    Resolve the JSON decoding function used on hot paths such as SSE streams.
+
+    Args:
+        backend: ``'orjson'``, ``'json'`` or ``'auto'`` (orjson when installed,
+            the standard library otherwise)
+
+    Returns:
+        A callable accepting ``str``, ``bytes`` or ``bytearray``
+    """
+    if backend == 'auto':
+        backend = 'json' if orjson is None else 'orjson'
+    if backend == 'orjson':
+        if orjson is None:
+            raise ImportError('The orjson JSON backend requires `pip install orjson`')
+        return orjson.loads
+    if backend == 'json':
+        return _stdlib_loads
+    raise ValueError(f'Unknown JSON backend: {backend!r}')
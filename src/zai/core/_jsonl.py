@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import logging
+import re
+from typing import Any, Callable, List, Optional, Type
+
+import httpx
+
+from ._base_models import BaseModel
+from ._json_encoder import get_json_loads
+
+log: logging.Logger = logging.getLogger(__name__)
+
+# longest excerpt of a malformed line kept in its `JsonlLineError`
+_EXCERPT_BYTES = 200
+
+_CONTENT_RANGE = re.compile(r'bytes\s+(\d+)-')
+
+
+class JsonlLineError:
+	"""
+	A line of a JSONL file that could not be decoded.
+
+	Attributes:
+		offset: Byte offset of the start of the line in the file
+		line_number: 1-based number of the line
+		line: The start of the line, at most 200 bytes
+		error: The decoding error
+	"""
+
+	__slots__ = ('offset', 'line_number', 'line', 'error')
+
+	def __init__(self, offset: int, line_number: int, line: bytes, error: Exception) -> None:
+		self.offset = offset
+		self.line_number = line_number
+		self.line = line
+		self.error = error
+
+	def __repr__(self) -> str:
+		return f'JsonlLineError(offset={self.offset}, line_number={self.line_number}, error={self.error!r})'
+
+
+def _log_line_error(error: JsonlLineError) -> None:
+	log.warning('Skipping malformed JSONL line %d at byte %d: %s', error.line_number, error.offset, error.error)
+
+
+class JsonlDecoder:
+	"""
+	Incrementally decodes JSON lines from chunks of bytes.
+
+	Only the current partial line is buffered, so memory does not grow with the file.
+	`offset` is the file position up to which lines were consumed, which is where a
+	read resumes after a dropped connection.
+	"""
+
+	def __init__(
+		self,
+		model: Optional[Type[BaseModel]] = None,
+		on_error: Optional[Callable[[JsonlLineError], Any]] = None,
+	) -> None:
+		self._loads = get_json_loads()
+		self._model = model
+		self._on_error = on_error or _log_line_error
+		self._buffer = bytearray()
+		# bytes of the next response that were already consumed
+		self._skip = 0
+		self.offset = 0
+		self.line_number = 0
+
+	def range_headers(self) -> dict:
+		"""Headers requesting the file from `offset` on."""
+		return {'Range': f'bytes={self.offset}-'} if self.offset else {}
+
+	def resume(self, response: httpx.Response) -> None:
+		"""
+		Continue with `response` after the previous one broke off.
+
+		The partial line is dropped and read again; when the server ignored the `Range`
+		header, the bytes before `offset` are skipped instead.
+		"""
+		self._buffer = bytearray()
+		if not self.offset:
+			return
+		start = 0
+		if response.status_code == 206:
+			match = _CONTENT_RANGE.match(response.headers.get('content-range', ''))
+			start = int(match.group(1)) if match else 0
+		if start > self.offset:
+			raise ValueError(f'Server resumed the file at byte {start}, after the requested byte {self.offset}')
+		self._skip = self.offset - start
+
+	def feed(self, chunk: bytes) -> List[Any]:
+		"""Decode the lines completed by `chunk`."""
+		if self._skip:
+			skipped = min(self._skip, len(chunk))
+			self._skip -= skipped
+			chunk = chunk[skipped:]
+		if b'\n' not in chunk:
+			self._buffer += chunk
+			return []
+		self._buffer += chunk
+		lines = self._buffer.split(b'\n')
+		# the last item is the start of the next line
+		self._buffer = bytearray(lines.pop())
+		items = []
+		for line in lines:
+			item = self._decode(bytes(line))
+			self.offset += len(line) + 1
+			if item is not None:
+				items.append(item)
+		return items
+
+	def flush(self) -> List[Any]:
+		"""Decode a final line without a trailing newline."""
+		if not self._buffer:
+			return []
+		line = bytes(self._buffer)
+		self._buffer = bytearray()
+		item = self._decode(line)
+		self.offset += len(line)
+		return [] if item is None else [item]
+
+	def _decode(self, line: bytes) -> Any:
+		self.line_number += 1
+		if not line.strip():
+			return None
+		try:
+			data = self._loads(line)
+			return data if self._model is None else self._model.construct(**data)
+		except Exception as err:
+			self._on_error(JsonlLineError(self.offset, self.line_number, line[:_EXCERPT_BYTES], err))
+			return None
@@ -1,7 +1,9 @@
 # -*- coding:utf-8 -*-
+import threading
 import time
+from collections import OrderedDict
+from typing import Optional
 
-import cachetools.func
 import jwt
 
 # Cache time 3 minutes
@@ -10,8 +12,10 @@ CACHE_TTL_SECONDS = 3 * 60
 # Token validity period is 30 seconds longer than cache time
 API_TOKEN_TTL_SECONDS = CACHE_TTL_SECONDS + 30
 
+# API keys whose signed tokens a client and its `with_options()` clones keep around
+MAX_TOKEN_MANAGERS = 256
+
 
-@cachetools.func.ttl_cache(maxsize=10, ttl=CACHE_TTL_SECONDS)
 def generate_token(apikey: str):
 	try:
 		api_key, secret = apikey.split('.')
@@ -30,3 +34,84 @@ def generate_token(apikey: str):
 		headers={'alg': 'HS256', 'sign_type': 'SIGN'},
 	)
 	return ret
+
+
+class TokenManager:
+	"""
+	Per-client JWT cache for one API key that refreshes tokens ahead of their expiry.
+
+	A token is reused for `CACHE_TTL_SECONDS`, after which the first caller re-signs it
+	while concurrent callers, threads or asyncio tasks alike, keep using the current token,
+	which stays valid for another `API_TOKEN_TTL_SECONDS - CACHE_TTL_SECONDS`. Nobody
+	waits on another caller's refresh unless the token has actually expired.
+
+	The refreshing caller still signs inline, so one request per `refresh_after` pays for an
+	HS256 signature (tens of microseconds). That is cheaper than handing the work to a
+	background thread, and idle keys are never re-signed.
+	"""
+
+	def __init__(self, api_key: str, *, refresh_after: float = CACHE_TTL_SECONDS) -> None:
+		self.api_key = api_key
+		self.refresh_after = refresh_after
+		self._token: Optional[str] = None
+		self._refresh_at = 0.0
+		self._expires_at = 0.0
+		self._lock = threading.Lock()
+
+	def get_token(self) -> str:
+		token = self._token
+		now = time.monotonic()
+		if token is not None and now < self._refresh_at:
+			return token
+
+		if token is not None and now < self._expires_at:
+			# refresh ahead: only one caller signs, the others go on with the still-valid token
+			if self._lock.acquire(blocking=False):
+				try:
+					return self._refresh(now)
+				finally:
+					self._lock.release()
+			return token
+
+		with self._lock:
+			if self._token is not None and time.monotonic() < self._refresh_at:
+				return self._token
+			return self._refresh(time.monotonic())
+
+	def _refresh(self, now: float) -> str:
+		token = generate_token(self.api_key)
+		# publish the deadlines before the token so lock-free readers never pair a new token with old ones
+		self._refresh_at = now + self.refresh_after
+		# leave a margin for clock skew and the request's time in flight
+		self._expires_at = now + API_TOKEN_TTL_SECONDS - 10
+		self._token = token
+		return token
+
+
+class TokenManagers:
+	"""
+	Least-recently-used map of `TokenManager`s by API key.
+
+	Shared by a client and its `with_options()` clones. It holds at most `maxsize` keys, so
+	a server deriving a clone per tenant request reuses the tokens of its active tenants
+	without growing with every key it has ever seen; an evicted key is simply re-signed.
+	"""
+
+	def __init__(self, maxsize: int = MAX_TOKEN_MANAGERS) -> None:
+		self.maxsize = maxsize
+		self._managers: OrderedDict[str, TokenManager] = OrderedDict()
+		self._lock = threading.Lock()
+
+	def get_token(self, api_key: str) -> str:
+		with self._lock:
+			manager = self._managers.get(api_key)
+			if manager is None:
+				manager = self._managers[api_key] = TokenManager(api_key)
+				if len(self._managers) > self.maxsize:
+					self._managers.popitem(last=False)
+			else:
+				self._managers.move_to_end(api_key)
+		return manager.get_token()
+
+	def __len__(self) -> int:
+		return len(self._managers)
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Dict, List, Literal, Mapping, Optional, Sequence, Union
+
+import httpx
+
+from ._retry import parse_retry_after
+
+KeyStrategy = Literal['least_in_flight', 'round_robin']
+
+# status codes that take a key out of rotation: 401 (APIAuthenticationError) and 429 (APIReachLimitError)
+_QUARANTINE_STATUS_CODES = (401, 429)
+
+
+def mask_api_key(api_key: str) -> str:
+	"""Return a loggable identifier for an API key: its id part, never the secret."""
+	key_id, sep, _ = api_key.partition('.')
+	if sep:
+		return key_id
+	return f'{api_key[:4]}...{api_key[-4:]}' if len(api_key) > 12 else '***'
+
+
+class KeyStats:
+	"""
+	Usage counters of one key of an `ApiKeyPool`.
+
+	Attributes:
+		key_id: Masked key, see `mask_api_key()`, with `#2`, `#3`, ... appended when several
+			keys of the pool mask to the same id.
+		weight: Relative share of the traffic the key should get.
+		in_flight: Requests currently using the key.
+		requests: Total number of requests sent with the key.
+		errors: Responses with a 4xx/5xx status plus transport errors.
+		quarantines: How often the key was taken out of rotation.
+		quarantined_for: Seconds until the key is used again, 0 when it is available.
+	"""
+
+	def __init__(self, key_id: str, weight: float) -> None:
+		self.key_id = key_id
+		self.weight = weight
+		self.in_flight = 0
+		self.requests = 0
+		self.errors = 0
+		self.quarantines = 0
+		self.quarantined_for = 0.0
+
+	def __repr__(self) -> str:
+		return (
+			f'KeyStats(key_id={self.key_id!r}, weight={self.weight}, in_flight={self.in_flight}, '
+			f'requests={self.requests}, errors={self.errors}, quarantines={self.quarantines}, '
+			f'quarantined_for={self.quarantined_for:.1f})'
+		)
+
+
+class _PooledKey:
+	__slots__ = ('api_key', 'stats', 'quarantined_until', 'current_weight')
+
+	def __init__(self, api_key: str, weight: float) -> None:
+		self.api_key = api_key
+		self.stats = KeyStats(mask_api_key(api_key), weight)
+		self.quarantined_until = 0.0
+		self.current_weight = 0.0
+
+
+class KeyLease:
+	"""One request's hold on a pool key; `release()` must be called once the response is done."""
+
+	__slots__ = ('api_key', '_pool', '_entry', '_released')
+
+	def __init__(self, pool: ApiKeyPool, entry: _PooledKey) -> None:
+		self.api_key = entry.api_key
+		self._pool = pool
+		self._entry = entry
+		self._released = False
+
+	def report_response(self, response: httpx.Response) -> None:
+		self._pool._report(self._entry, response.status_code, response.headers)
+
+	def report_error(self) -> None:
+		self._pool._report(self._entry, None, None)
+
+	def release(self) -> None:
+		if not self._released:
+			self._released = True
+			self._pool._release(self._entry)
+
+
+class ApiKeyPool:
+	"""
+	Spreads requests over several API keys that share one client and connection pool.
+
+	Arguments:
+		api_keys (Sequence[str] | Mapping[str, float]): The keys, or keys mapped to their weights
+		strategy (str): `'least_in_flight'` picks the key with the fewest requests in flight
+			relative to its weight; `'round_robin'` uses smooth weighted round robin
+		quarantine_seconds (float): How long a key answering 429 is skipped when the response
+			carries no `Retry-After`
+		auth_quarantine_seconds (float): How long a key answering 401 is skipped
+	"""
+
+	def __init__(
+		self,
+		api_keys: Union[Sequence[str], Mapping[str, float]],
+		*,
+		strategy: KeyStrategy = 'least_in_flight',
+		quarantine_seconds: float = 30.0,
+		auth_quarantine_seconds: float = 300.0,
+	) -> None:
+		if isinstance(api_keys, Mapping):
+			weighted = list(api_keys.items())
+		else:
+			weighted = [(api_key, 1.0) for api_key in api_keys]
+		if not weighted:
+			raise ValueError('api_keys must not be empty')
+		if any(weight <= 0 for _, weight in weighted):
+			raise ValueError('key weights must be positive')
+		if strategy not in ('least_in_flight', 'round_robin'):
+			raise ValueError(f'Unknown key strategy: {strategy!r}')
+
+		self.strategy = strategy
+		self.quarantine_seconds = quarantine_seconds
+		self.auth_quarantine_seconds = auth_quarantine_seconds
+		self._keys: List[_PooledKey] = [
+			_PooledKey(api_key, float(weight)) for api_key, weight in dict(weighted).items()
+		]
+		# masked ids collide for short keys and keys sharing an id part; number the repeats so
+		# every key keeps its own entry in `stats()`
+		seen: Dict[str, int] = {}
+		for entry in self._keys:
+			key_id = entry.stats.key_id
+			seen[key_id] = seen.get(key_id, 0) + 1
+			if seen[key_id] > 1:
+				entry.stats.key_id = f'{key_id}#{seen[key_id]}'
+		self._lock = threading.Lock()
+
+	@property
+	def api_keys(self) -> List[str]:
+		return [entry.api_key for entry in self._keys]
+
+	def acquire(self) -> KeyLease:
+		"""Pick a key for one request; never blocks, even when every key is quarantined."""
+		with self._lock:
+			now = time.monotonic()
+			available = [entry for entry in self._keys if entry.quarantined_until <= now]
+			if not available:
+				# better to try the key that recovers first than to fail the request locally
+				available = [min(self._keys, key=lambda entry: entry.quarantined_until)]
+
+			if self.strategy == 'round_robin':
+				entry = self._next_round_robin(available)
+			else:
+				entry = min(
+					available, key=lambda entry: (entry.stats.in_flight / entry.stats.weight, entry.stats.requests)
+				)
+
+			entry.stats.in_flight += 1
+			entry.stats.requests += 1
+			return KeyLease(self, entry)
+
+	@staticmethod
+	def _next_round_robin(available: List[_PooledKey]) -> _PooledKey:
+		# smooth weighted round robin, as in nginx: interleaves keys in proportion to their weights
+		total = 0.0
+		best = available[0]
+		for entry in available:
+			entry.current_weight += entry.stats.weight
+			total += entry.stats.weight
+			if entry.current_weight > best.current_weight:
+				best = entry
+		best.current_weight -= total
+		return best
+
+	def _release(self, entry: _PooledKey) -> None:
+		with self._lock:
+			entry.stats.in_flight -= 1
+
+	def _report(self, entry: _PooledKey, status_code: Optional[int], headers: Optional[httpx.Headers]) -> None:
+		if status_code is not None and status_code < 400:
+			return
+		with self._lock:
+			entry.stats.errors += 1
+			if status_code not in _QUARANTINE_STATUS_CODES:
+				return
+			if status_code == 401:
+				duration = self.auth_quarantine_seconds
+			else:
+				retry_after = parse_retry_after(headers)
+				duration = retry_after if retry_after is not None and retry_after > 0 else self.quarantine_seconds
+			entry.quarantined_until = max(entry.quarantined_until, time.monotonic() + duration)
+			entry.stats.quarantines += 1
+
+	def stats(self) -> Dict[str, KeyStats]:
+		"""Return a snapshot of the counters of every key, keyed by the masked key (`KeyStats.key_id`)."""
+		with self._lock:
+			now = time.monotonic()
+			snapshot = {}
+			for entry in self._keys:
+				stats = KeyStats(entry.stats.key_id, entry.stats.weight)
+				stats.__dict__.update(entry.stats.__dict__)
+				stats.quarantined_for = max(0.0, entry.quarantined_until - now)
+				snapshot[stats.key_id] = stats
+			return snapshot
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import inspect
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Dict, Generic, List, Tuple, Type, TypeVar, cast
+
+import pydantic
+
+from ._base_compat import field_get_default, field_outer_type, get_args, get_model_fields, get_origin, is_union
+from ._base_models import construct_type
+
+if TYPE_CHECKING:
+	from httpx import Response
+
+_ModelT = TypeVar('_ModelT', bound=pydantic.BaseModel)
+
+_MISSING = object()
+
+# attribute name -> (json key, default, converter); a `None` converter means the raw value is returned as-is
+_FieldSpec = Tuple[str, Any, 'Callable[[object], object] | None']
+
+_lazy_types: Dict[type, Type['LazyModel[Any]']] = {}
+
+
+class LazyModel(Generic[_ModelT]):
+	"""
+	Read-only, dict-backed view of a model.
+
+	Attribute access mirrors the wrapped pydantic model, but nothing is constructed up
+	front: scalar fields are read straight from the decoded JSON, while nested models
+	are wrapped in further lazy views the first time they are touched. Use
+	`lazy_model_type()` to get the view class for a given model.
+	"""
+
+	__slots__ = ('_data', '_values')
+
+	__model__: ClassVar[Type[pydantic.BaseModel]]
+	__fields__: ClassVar[Dict[str, _FieldSpec]]
+
+	_data: Dict[str, object]
+	_values: Dict[str, object] | None
+
+	def __init__(self, data: Dict[str, object]) -> None:
+		self._data = data
+		self._values = None
+
+	@classmethod
+	def build(cls, *, response: Response, data: object) -> object:
+		if not isinstance(data, dict):
+			return construct_type(type_=cls.__model__, value=data)
+		return cls(data)
+
+	def __getattr__(self, name: str) -> Any:
+		values = self._values
+		if values is not None and name in values:
+			return values[name]
+
+		spec = self.__fields__.get(name)
+		if spec is None:
+			if name in self._data:
+				return self._data[name]
+			raise AttributeError(f'{type(self).__name__!r} object has no attribute {name!r}')
+
+		key, default, convert = spec
+		value = self._data.get(key, _MISSING)
+		if value is _MISSING:
+			return default
+		if convert is None or value is None:
+			return value
+
+		value = convert(value)
+		if values is None:
+			values = self._values = {}
+		values[name] = value
+		return value
+
+	def __repr__(self) -> str:
+		return f'{type(self).__name__}({self._data!r})'
+
+	def to_dict(self) -> Dict[str, object]:
+		"""Return the decoded JSON this view reads from."""
+		return self._data
+
+	def to_model(self) -> _ModelT:
+		"""Construct the full pydantic model, including every nested model."""
+		return cast(_ModelT, construct_type(type_=self.__model__, value=self._data))
+
+
+def lazy_model_type(model: Type[_ModelT]) -> Type[LazyModel[_ModelT]]:
+	"""Return the (cached) `LazyModel` view class for the given pydantic model."""
+	lazy_type = _lazy_types.get(model)
+	if lazy_type is None:
+		lazy_type = type(
+			f'Lazy{model.__name__}',
+			(LazyModel,),
+			{'__slots__': (), '__model__': model, '__fields__': {}},
+		)
+		# registered before the fields are resolved so self-referencing models terminate
+		_lazy_types[model] = lazy_type
+		lazy_type.__fields__.update(
+			(name, (field.alias or name, field_get_default(field), _make_converter(field_outer_type(field))))
+			for name, field in get_model_fields(model).items()
+		)
+	return cast('Type[LazyModel[_ModelT]]', lazy_type)
+
+
+def _make_converter(type_: Any) -> Callable[[object], object] | None:
+	origin = get_origin(type_) or type_
+
+	if is_union(origin):
+		args = [arg for arg in get_args(type_) if arg is not type(None)]
+		if len(args) == 1:
+			return _make_converter(args[0])
+		if all(_make_converter(arg) is None for arg in args):
+			return None
+		return lambda value: construct_type(type_=type_, value=value)
+
+	if inspect.isclass(origin) and issubclass(origin, pydantic.BaseModel):
+		lazy_type = lazy_model_type(origin)
+		return lambda value: lazy_type(value) if isinstance(value, dict) else value
+
+	if origin in (list, List):
+		args = get_args(type_)
+		item_converter = _make_converter(args[0]) if args else None
+		if item_converter is None:
+			return None
+		return lambda value: [item_converter(item) for item in value] if isinstance(value, list) else value
+
+	if origin in (str, int, bool, dict, object) or type_ is Any:
+		return None
+
+	return lambda value: construct_type(type_=type_, value=value)
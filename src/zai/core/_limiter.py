@@ -0,0 +1,289 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Iterator, Mapping, Optional, Union
+
+import httpx
+
+# key of the limit applied to every model without an explicit entry
+DEFAULT_MODEL_KEY = '*'
+
+
+class ModelLimit:
+	"""
+	Client-side limits for the requests of one model.
+
+	Attributes:
+		concurrency: Maximum number of requests in flight at once; `None` for unlimited.
+		requests_per_second: Sustained request rate of the token bucket; `None` disables it.
+		burst: Token bucket capacity, i.e. how many requests may start back to back.
+	"""
+
+	def __init__(
+		self,
+		concurrency: Optional[int] = None,
+		*,
+		requests_per_second: Optional[float] = None,
+		burst: Optional[int] = None,
+	) -> None:
+		if concurrency is not None and concurrency < 1:
+			raise ValueError('concurrency must be at least 1')
+		if requests_per_second is not None and requests_per_second <= 0:
+			raise ValueError('requests_per_second must be positive')
+		self.concurrency = concurrency
+		self.requests_per_second = requests_per_second
+		self.burst = burst if burst is not None else max(1, math.ceil(requests_per_second or 1))
+
+	def __repr__(self) -> str:
+		return (
+			f'ModelLimit(concurrency={self.concurrency}, '
+			f'requests_per_second={self.requests_per_second}, burst={self.burst})'
+		)
+
+
+class LimiterStats:
+	"""
+	Queue and wait metrics of one model gate.
+
+	Attributes:
+		in_flight: Requests currently holding a slot.
+		waiting: Requests currently queued for a slot.
+		acquired: Total number of slots handed out.
+		waited: How many of those had to queue first.
+		total_wait: Seconds spent queueing, summed over all requests.
+		max_wait: Longest single queueing time in seconds.
+	"""
+
+	def __init__(self) -> None:
+		self.in_flight = 0
+		self.waiting = 0
+		self.acquired = 0
+		self.waited = 0
+		self.total_wait = 0.0
+		self.max_wait = 0.0
+
+	@property
+	def mean_wait(self) -> float:
+		return self.total_wait / self.acquired if self.acquired else 0.0
+
+	def _record(self, wait: float) -> None:
+		self.acquired += 1
+		if wait > 0:
+			self.waited += 1
+			self.total_wait += wait
+			if wait > self.max_wait:
+				self.max_wait = wait
+
+	def _copy(self) -> LimiterStats:
+		stats = LimiterStats()
+		stats.__dict__.update(self.__dict__)
+		return stats
+
+	def __repr__(self) -> str:
+		return (
+			f'LimiterStats(in_flight={self.in_flight}, waiting={self.waiting}, acquired={self.acquired}, '
+			f'waited={self.waited}, total_wait={self.total_wait:.3f}, max_wait={self.max_wait:.3f})'
+		)
+
+
+class _ModelGate:
+	"""Concurrency counter plus token bucket; callers provide the locking."""
+
+	def __init__(self, limit: ModelLimit) -> None:
+		self.limit = limit
+		self.tokens = float(limit.burst)
+		self.updated = time.monotonic()
+		self.stats = LimiterStats()
+
+	def try_acquire(self, now: float) -> float:
+		"""Take a slot and return 0, or return how long to wait (`inf` until a release)."""
+		limit = self.limit
+		if limit.concurrency is not None and self.stats.in_flight >= limit.concurrency:
+			return math.inf
+
+		rate = limit.requests_per_second
+		if rate is not None:
+			self.tokens = min(float(limit.burst), self.tokens + (now - self.updated) * rate)
+			self.updated = now
+			if self.tokens < 1:
+				return (1 - self.tokens) / rate
+			self.tokens -= 1
+
+		self.stats.in_flight += 1
+		return 0.0
+
+
+LimitsConfig = Mapping[str, Union[int, ModelLimit]]
+
+
+class _BaseLimiter:
+	def __init__(self, limits: LimitsConfig) -> None:
+		self._limits: Dict[str, ModelLimit] = {
+			key.lower(): limit if isinstance(limit, ModelLimit) else ModelLimit(limit) for key, limit in limits.items()
+		}
+		self._gates: Dict[str, _ModelGate] = {}
+
+	def _gate(self, model: Optional[str]) -> Optional[_ModelGate]:
+		if not model:
+			return None
+		key = model.lower()
+		gate = self._gates.get(key)
+		if gate is None:
+			limit = self._limits.get(key) or self._limits.get(DEFAULT_MODEL_KEY)
+			if limit is None:
+				return None
+			gate = self._gates[key] = _ModelGate(limit)
+		return gate
+
+	def stats(self) -> Dict[str, LimiterStats]:
+		"""Return a snapshot of the metrics of every model that has been requested so far."""
+		return {model: gate.stats._copy() for model, gate in self._gates.items()}
+
+
+class RequestLimiter(_BaseLimiter):
+	"""
+	Thread-safe per-model limiter used by `HttpClient` before each request is sent.
+
+	Requests over the limit wait locally instead of collecting 429 responses from the
+	server. `acquire()` returns a release callback, or `None` when the model is not limited.
+	"""
+
+	def __init__(self, limits: LimitsConfig) -> None:
+		super().__init__(limits)
+		self._condition = threading.Condition()
+
+	def acquire(self, model: Optional[str]) -> Optional[Callable[[], None]]:
+		with self._condition:
+			gate = self._gate(model)
+			if gate is None:
+				return None
+
+			start = now = time.monotonic()
+			delay = gate.try_acquire(now)
+			if delay:
+				gate.stats.waiting += 1
+				try:
+					while delay:
+						self._condition.wait(None if delay == math.inf else delay)
+						now = time.monotonic()
+						delay = gate.try_acquire(now)
+				finally:
+					gate.stats.waiting -= 1
+			gate.stats._record(now - start)
+
+		return _once(lambda: self._release(gate))
+
+	def _release(self, gate: _ModelGate) -> None:
+		with self._condition:
+			gate.stats.in_flight -= 1
+			self._condition.notify_all()
+
+
+class AsyncRequestLimiter(_BaseLimiter):
+	"""
+	Per-model limiter used by `AsyncHttpClient`; the `asyncio` counterpart of `RequestLimiter`.
+
+	Waiters queued on a full model are woken in FIFO order as slots are released.
+	"""
+
+	def __init__(self, limits: LimitsConfig) -> None:
+		super().__init__(limits)
+		self._waiters: Dict[int, Deque[asyncio.Future[None]]] = {}
+
+	async def acquire(self, model: Optional[str]) -> Optional[Callable[[], None]]:
+		gate = self._gate(model)
+		if gate is None:
+			return None
+
+		start = now = time.monotonic()
+		delay = gate.try_acquire(now)
+		if delay:
+			waiters = self._waiters.setdefault(id(gate), deque())
+			gate.stats.waiting += 1
+			try:
+				while delay:
+					if delay == math.inf:
+						waiter = asyncio.get_running_loop().create_future()
+						waiters.append(waiter)
+						try:
+							await waiter
+						except asyncio.CancelledError:
+							# woken, then cancelled before taking the slot: pass the wakeup on
+							if waiter.done() and not waiter.cancelled():
+								self._wake_next(gate)
+							raise
+						finally:
+							if waiter in waiters:
+								waiters.remove(waiter)
+					else:
+						await asyncio.sleep(delay)
+					now = time.monotonic()
+					delay = gate.try_acquire(now)
+			finally:
+				gate.stats.waiting -= 1
+		gate.stats._record(now - start)
+
+		return _once(lambda: self._release(gate))
+
+	def _release(self, gate: _ModelGate) -> None:
+		gate.stats.in_flight -= 1
+		self._wake_next(gate)
+
+	def _wake_next(self, gate: _ModelGate) -> None:
+		waiters = self._waiters.get(id(gate))
+		while waiters:
+			waiter = waiters.popleft()
+			if not waiter.done():
+				waiter.set_result(None)
+				break
+
+
+def _once(func: Callable[[], None]) -> Callable[[], None]:
+	called = False
+
+	def wrapper() -> None:
+		nonlocal called
+		if not called:
+			called = True
+			func()
+
+	return wrapper
+
+
+class ReleasingByteStream(httpx.SyncByteStream):
+	"""Response body wrapper that gives the limiter slot back once the body is closed."""
+
+	def __init__(self, stream: Any, release: Callable[[], None]) -> None:
+		self._stream = stream
+		self._release = release
+
+	def __iter__(self) -> Iterator[bytes]:
+		yield from self._stream
+
+	def close(self) -> None:
+		try:
+			self._stream.close()
+		finally:
+			self._release()
+
+
+class AsyncReleasingByteStream(httpx.AsyncByteStream):
+	"""Async response body wrapper that gives the limiter slot back once the body is closed."""
+
+	def __init__(self, stream: Any, release: Callable[[], None]) -> None:
+		self._stream = stream
+		self._release = release
+
+	async def __aiter__(self) -> AsyncIterator[bytes]:
+		async for chunk in self._stream:
+			yield chunk
+
+	async def aclose(self) -> None:
+		try:
+			await self._stream.aclose()
+		finally:
+			self._release()
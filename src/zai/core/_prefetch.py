@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import asyncio
+import queue
+import threading
+from typing import Any, AsyncIterator, Iterator, Tuple, TypeVar
+
+_PageT = TypeVar('_PageT', bound=Any)
+
+_PAGE = 'page'
+_ERROR = 'error'
+_DONE = 'done'
+
+# how often a producer blocked on a full queue checks whether the consumer left
+_STOP_CHECK_INTERVAL = 0.05
+
+
+def prefetch_pages(first: _PageT, depth: int) -> Iterator[_PageT]:
+	"""
+	Yield `first` and the pages after it, fetching up to `depth` pages ahead in a background thread.
+
+	Pages are fetched one after the other, as each cursor comes from the previous page, but
+	while the caller processes the current page. At most `depth` fetched pages wait in memory.
+	When the caller stops early no further page is requested; a request already in flight
+	finishes in the background and is dropped.
+	"""
+	if depth < 1:
+		raise ValueError(f'`prefetch` must be at least 1, got {depth}')
+	pages: queue.Queue[Tuple[str, Any]] = queue.Queue(maxsize=depth)
+	stop = threading.Event()
+
+	def put(item: Tuple[str, Any]) -> bool:
+		while not stop.is_set():
+			try:
+				pages.put(item, timeout=_STOP_CHECK_INTERVAL)
+				return True
+			except queue.Full:
+				pass
+		return False
+
+	def produce() -> None:
+		page = first
+		try:
+			while not stop.is_set() and page.has_next_page():
+				page = page.get_next_page()
+				if not put((_PAGE, page)):
+					return
+		except BaseException as err:
+			put((_ERROR, err))
+			return
+		put((_DONE, None))
+
+	thread = threading.Thread(target=produce, name='zai-page-prefetch', daemon=True)
+	thread.start()
+	try:
+		yield first
+		while True:
+			kind, value = pages.get()
+			if kind == _DONE:
+				return
+			if kind == _ERROR:
+				raise value
+			yield value
+	finally:
+		stop.set()
+
+
+async def async_prefetch_pages(first: _PageT, depth: int) -> AsyncIterator[_PageT]:
+	"""
+	Yield `first` and the pages after it, fetching up to `depth` pages ahead in a background task.
+
+	The `asyncio` counterpart of `prefetch_pages()`; closing the iterator early cancels the
+	request in flight.
+	"""
+	if depth < 1:
+		raise ValueError(f'`prefetch` must be at least 1, got {depth}')
+	pages: asyncio.Queue[Tuple[str, Any]] = asyncio.Queue(maxsize=depth)
+
+	async def produce() -> None:
+		page = first
+		try:
+			while page.has_next_page():
+				page = await page.get_next_page()
+				await pages.put((_PAGE, page))
+		except asyncio.CancelledError:
+			raise
+		except Exception as err:
+			await pages.put((_ERROR, err))
+			return
+		await pages.put((_DONE, None))
+
+	task = asyncio.ensure_future(produce())
+	try:
+		yield first
+		while True:
+			kind, value = await pages.get()
+			if kind == _DONE:
+				return
+			if kind == _ERROR:
+				raise value
+			yield value
+	finally:
+		task.cancel()
+		try:
+			await task
+		except asyncio.CancelledError:
+			pass
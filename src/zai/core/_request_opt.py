@@ -18,6 +18,7 @@ class UserRequestInput(TypedDict, total=False):
 	timeout: float | Timeout | None
 	params: Query
 	extra_json: AnyMapping
+	cache: bool
 
 
 class FinalRequestOptionsInput(TypedDict, total=False):
@@ -30,6 +31,7 @@ class FinalRequestOptionsInput(TypedDict, total=False):
 	files: HttpxRequestFiles | None
 	json_data: Body
 	extra_json: AnyMapping
+	cache: bool
 
 
 @final
@@ -43,6 +45,8 @@ class FinalRequestOptions(pydantic.BaseModel):
 	files: Union[HttpxRequestFiles, None] = None
 	idempotency_key: Union[str, None] = None
 	post_parser: Union[Callable[[Any], Any], NotGiven] = NotGiven()
+	# per-call response cache override; `None` leaves it to the cache's default policy
+	cache: Union[bool, None] = None
 
 	# It should be noted that we cannot use `json` here as that would override
 	# a BaseModel method in an incompatible fashion.
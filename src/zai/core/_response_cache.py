@@ -0,0 +1,413 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Callable, Iterator, List, Mapping, Optional, Tuple
+
+import httpx
+
+# response headers that describe the wire encoding rather than the (decoded) content we store
+_SKIPPED_HEADERS = frozenset({'content-encoding', 'content-length', 'transfer-encoding', 'connection', 'set-cookie'})
+
+# header added to responses served from the cache
+CACHE_HEADER = 'x-zai-cache'
+
+
+class CachedResponse:
+	"""
+	A stored response: status, headers and the body.
+
+	Read responses store the decoded body. Streamed responses store the bytes as received,
+	so they keep their `content-encoding` header and are decoded again when replayed.
+	"""
+
+	__slots__ = ('status_code', 'headers', 'content', 'stored_at')
+
+	def __init__(
+		self,
+		status_code: int,
+		headers: List[Tuple[str, str]],
+		content: bytes,
+		stored_at: Optional[float] = None,
+	) -> None:
+		self.status_code = status_code
+		self.headers = headers
+		self.content = content
+		self.stored_at = time.time() if stored_at is None else stored_at
+
+	@classmethod
+	def from_response(cls, response: httpx.Response, content: bytes, *, encoded: bool = False) -> CachedResponse:
+		headers = [
+			(name, value)
+			for name, value in response.headers.multi_items()
+			if name not in _SKIPPED_HEADERS or (encoded and name == 'content-encoding')
+		]
+		return cls(response.status_code, headers, content)
+
+	@property
+	def size(self) -> int:
+		return len(self.content) + sum(len(name) + len(value) for name, value in self.headers)
+
+	def to_response(self, request: httpx.Request) -> httpx.Response:
+		headers = httpx.Headers(self.headers)
+		headers[CACHE_HEADER] = 'hit'
+		return httpx.Response(self.status_code, headers=headers, content=self.content, request=request)
+
+
+class CacheStore:
+	"""
+	Second cache tier behind the in-memory LRU. Implementations must be thread-safe;
+	`ResponseCache` applies the TTL, so stores only need to keep entries around.
+	"""
+
+	def get(self, key: str) -> Optional[CachedResponse]:
+		raise NotImplementedError
+
+	def set(self, key: str, entry: CachedResponse) -> None:
+		raise NotImplementedError
+
+	def delete(self, key: str) -> None:
+		raise NotImplementedError
+
+	def clear(self) -> None:
+		raise NotImplementedError
+
+
+class SQLiteCacheStore(CacheStore):
+	"""Stores responses in one SQLite table; suitable for sharing a cache between processes."""
+
+	def __init__(self, path: str | os.PathLike[str]) -> None:
+		self.path = os.fspath(path)
+		self._lock = threading.Lock()
+		self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+		self._db.execute('PRAGMA journal_mode=WAL')
+		self._db.execute(
+			'CREATE TABLE IF NOT EXISTS responses '
+			'(key TEXT PRIMARY KEY, stored_at REAL, status_code INTEGER, headers TEXT, content BLOB)'
+		)
+
+	def get(self, key: str) -> Optional[CachedResponse]:
+		with self._lock:
+			row = self._db.execute(
+				'SELECT status_code, headers, content, stored_at FROM responses WHERE key = ?', (key,)
+			).fetchone()
+		if row is None:
+			return None
+		status_code, headers, content, stored_at = row
+		return CachedResponse(status_code, [tuple(item) for item in json.loads(headers)], bytes(content), stored_at)
+
+	def set(self, key: str, entry: CachedResponse) -> None:
+		with self._lock:
+			self._db.execute(
+				'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)',
+				(key, entry.stored_at, entry.status_code, json.dumps(entry.headers), entry.content),
+			)
+
+	def delete(self, key: str) -> None:
+		with self._lock:
+			self._db.execute('DELETE FROM responses WHERE key = ?', (key,))
+
+	def clear(self) -> None:
+		with self._lock:
+			self._db.execute('DELETE FROM responses')
+
+	def prune(self, older_than: float) -> int:
+		"""Delete entries stored before the given `time.time()` value and return how many were removed."""
+		with self._lock:
+			return self._db.execute('DELETE FROM responses WHERE stored_at < ?', (older_than,)).rowcount
+
+	def close(self) -> None:
+		with self._lock:
+			self._db.close()
+
+
+class DirectoryCacheStore(CacheStore):
+	"""Stores each response as one file in a directory, written atomically."""
+
+	def __init__(self, path: str | os.PathLike[str]) -> None:
+		self.path = os.fspath(path)
+		os.makedirs(self.path, exist_ok=True)
+
+	def _file(self, key: str) -> str:
+		return os.path.join(self.path, f'{key}.resp')
+
+	def get(self, key: str) -> Optional[CachedResponse]:
+		try:
+			with open(self._file(key), 'rb') as f:
+				meta = json.loads(f.readline())
+				content = f.read()
+		except (OSError, ValueError):
+			return None
+		return CachedResponse(
+			meta['status_code'], [tuple(item) for item in meta['headers']], content, meta['stored_at']
+		)
+
+	def set(self, key: str, entry: CachedResponse) -> None:
+		meta = {'status_code': entry.status_code, 'headers': entry.headers, 'stored_at': entry.stored_at}
+		fd, tmp = tempfile.mkstemp(dir=self.path, suffix='.tmp')
+		try:
+			with os.fdopen(fd, 'wb') as f:
+				f.write(json.dumps(meta).encode() + b'\n')
+				f.write(entry.content)
+			os.replace(tmp, self._file(key))
+		except BaseException:
+			os.unlink(tmp)
+			raise
+
+	def delete(self, key: str) -> None:
+		try:
+			os.unlink(self._file(key))
+		except FileNotFoundError:
+			pass
+
+	def clear(self) -> None:
+		for name in os.listdir(self.path):
+			if name.endswith('.resp'):
+				self.delete(name[: -len('.resp')])
+
+
+class CacheStats:
+	"""
+	Counters of a `ResponseCache`.
+
+	Attributes:
+		hits: Lookups answered from memory or from the store.
+		store_hits: The part of `hits` answered by the second tier.
+		misses: Lookups that went to the server.
+		stores: Responses added to the cache.
+		evictions: Entries dropped from memory to stay under `max_bytes`.
+		expirations: Entries found older than the TTL.
+		entries: Entries currently in memory.
+		bytes: Size of the entries currently in memory.
+	"""
+
+	def __init__(self) -> None:
+		self.hits = 0
+		self.store_hits = 0
+		self.misses = 0
+		self.stores = 0
+		self.evictions = 0
+		self.expirations = 0
+		self.entries = 0
+		self.bytes = 0
+
+	@property
+	def hit_rate(self) -> float:
+		lookups = self.hits + self.misses
+		return self.hits / lookups if lookups else 0.0
+
+	def __repr__(self) -> str:
+		return (
+			f'CacheStats(hits={self.hits}, store_hits={self.store_hits}, misses={self.misses}, stores={self.stores}, '
+			f'evictions={self.evictions}, expirations={self.expirations}, entries={self.entries}, bytes={self.bytes})'
+		)
+
+
+class ResponseCache:
+	"""
+	Response cache used by `HttpClient._request`, keyed on the serialized request.
+
+	Successful (200) responses are kept in a thread-safe in-memory LRU bounded by
+	`max_bytes`, and optionally in a persistent `store` (`SQLiteCacheStore`,
+	`DirectoryCacheStore`) that survives restarts. Streamed responses are stored once
+	fully consumed and replayed event by event on a hit.
+
+	Which calls are cached is decided by `is_cacheable()`, unless a call passes `cache=`:
+	embeddings, moderations, finished file parser results and chat completions that are
+	deterministic (`do_sample=False` or a fixed `seed`). Bodies rejected by `is_final()`
+	are never stored.
+
+	Arguments:
+		max_bytes (int): Memory budget of the LRU tier
+		ttl (float | None): Seconds an entry stays valid; `None` keeps entries until evicted
+		store (CacheStore | None): Optional second tier; note that it does blocking I/O,
+			also when used from the async client
+		max_entry_bytes (int | None): Largest response that is cached, by default a quarter of `max_bytes`
+	"""
+
+	def __init__(
+		self,
+		*,
+		max_bytes: int = 64 * 1024 * 1024,
+		ttl: Optional[float] = 3600.0,
+		store: Optional[CacheStore] = None,
+		max_entry_bytes: Optional[int] = None,
+	) -> None:
+		self.max_bytes = max_bytes
+		self.ttl = ttl
+		self.store = store
+		self.max_entry_bytes = max_entry_bytes if max_entry_bytes is not None else max_bytes // 4
+		self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+		self._stats = CacheStats()
+		self._lock = threading.Lock()
+
+	@staticmethod
+	def make_key(method: str, url: str, body: bytes, namespace: str = '') -> str:
+		digest = hashlib.sha256()
+		for part in (namespace.encode(), method.upper().encode(), url.encode()):
+			digest.update(part)
+			digest.update(b'\0')
+		digest.update(body)
+		return digest.hexdigest()
+
+	def is_cacheable(self, method: str, path: str, json_data: object) -> bool:
+		"""Default policy for calls that do not pass `cache=`."""
+		method = method.lower()
+		path = '/' + path.strip('/')
+		if method == 'get':
+			return path.startswith('/files/parser/result/')
+		if method != 'post':
+			return False
+		if path in ('/embeddings', '/moderations'):
+			return True
+		if path == '/chat/completions' and isinstance(json_data, Mapping):
+			return json_data.get('do_sample') is False or isinstance(json_data.get('seed'), int)
+		return False
+
+	@staticmethod
+	def is_final(path: str, content: Optional[bytes]) -> bool:
+		"""
+		Whether a response body may be stored: file parser results still being produced,
+		`{"status": "processing"}` or `"pending"`, are not, so later polls reach the server.
+		`content` is `None` when the body is still compressed and cannot be inspected.
+		"""
+		if not ('/' + path.strip('/')).startswith('/files/parser/result/'):
+			return True
+		if content is None:
+			return False
+		try:
+			status = json.loads(content).get('status')
+		except (ValueError, AttributeError):
+			# a plain text result
+			return True
+		return status not in ('processing', 'pending')
+
+	def _expired(self, entry: CachedResponse) -> bool:
+		return self.ttl is not None and time.time() - entry.stored_at > self.ttl
+
+	def get(self, key: str) -> Optional[CachedResponse]:
+		with self._lock:
+			entry = self._entries.get(key)
+			if entry is not None:
+				if not self._expired(entry):
+					self._entries.move_to_end(key)
+					self._stats.hits += 1
+					return entry
+				self._remove(key)
+				self._stats.expirations += 1
+
+		if self.store is not None:
+			entry = self.store.get(key)
+			if entry is not None:
+				if not self._expired(entry):
+					with self._lock:
+						self._stats.hits += 1
+						self._stats.store_hits += 1
+						self._insert(key, entry)
+					return entry
+				self.store.delete(key)
+				with self._lock:
+					self._stats.expirations += 1
+
+		with self._lock:
+			self._stats.misses += 1
+		return None
+
+	def set(self, key: str, entry: CachedResponse) -> None:
+		if entry.size > self.max_entry_bytes:
+			return
+		with self._lock:
+			self._insert(key, entry)
+			self._stats.stores += 1
+		if self.store is not None:
+			self.store.set(key, entry)
+
+	def _insert(self, key: str, entry: CachedResponse) -> None:
+		if key in self._entries:
+			self._remove(key)
+		self._entries[key] = entry
+		self._stats.entries += 1
+		self._stats.bytes += entry.size
+		while self._stats.bytes > self.max_bytes and len(self._entries) > 1:
+			oldest = next(iter(self._entries))
+			self._remove(oldest)
+			self._stats.evictions += 1
+
+	def _remove(self, key: str) -> None:
+		entry = self._entries.pop(key)
+		self._stats.entries -= 1
+		self._stats.bytes -= entry.size
+
+	def clear(self) -> None:
+		with self._lock:
+			self._entries.clear()
+			self._stats.entries = 0
+			self._stats.bytes = 0
+		if self.store is not None:
+			self.store.clear()
+
+	def stats(self) -> CacheStats:
+		"""Return a snapshot of the counters."""
+		with self._lock:
+			stats = CacheStats()
+			stats.__dict__.update(self._stats.__dict__)
+			return stats
+
+
+class RecordingByteStream(httpx.SyncByteStream):
+	"""Response body wrapper that hands the full body to `on_complete` once it was read to the end."""
+
+	def __init__(self, stream: Any, limit: int, on_complete: Callable[[bytes], None]) -> None:
+		self._stream = stream
+		self._limit = limit
+		self._on_complete = on_complete
+
+	def __iter__(self) -> Iterator[bytes]:
+		chunks: Optional[List[bytes]] = []
+		size = 0
+		for chunk in self._stream:
+			if chunks is not None:
+				size += len(chunk)
+				# too big to cache: stop recording, keep streaming
+				if size > self._limit:
+					chunks = None
+				else:
+					chunks.append(chunk)
+			yield chunk
+		if chunks is not None:
+			self._on_complete(b''.join(chunks))
+
+	def close(self) -> None:
+		self._stream.close()
+
+
+class AsyncRecordingByteStream(httpx.AsyncByteStream):
+	"""Async counterpart of `RecordingByteStream`."""
+
+	def __init__(self, stream: Any, limit: int, on_complete: Callable[[bytes], None]) -> None:
+		self._stream = stream
+		self._limit = limit
+		self._on_complete = on_complete
+
+	async def __aiter__(self) -> AsyncIterator[bytes]:
+		chunks: Optional[List[bytes]] = []
+		size = 0
+		async for chunk in self._stream:
+			if chunks is not None:
+				size += len(chunk)
+				if size > self._limit:
+					chunks = None
+				else:
+					chunks.append(chunk)
+			yield chunk
+		if chunks is not None:
+			self._on_complete(b''.join(chunks))
+
+	async def aclose(self) -> None:
+		await self._stream.aclose()
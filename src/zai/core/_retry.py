@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import email.utils
+import logging
+import math
+import threading
+import time
+from random import uniform
+from typing import Dict, Mapping, Optional
+
+import httpx
+
+from ._base_type import NOT_GIVEN, NotGiven
+from ._constants import INITIAL_RETRY_DELAY, MAX_RETRY_DELAY
+
+log: logging.Logger = logging.getLogger(__name__)
+
+# error classes a retry can be charged to
+TIMEOUT = 'timeout'
+CONNECTION = 'connection'
+RATE_LIMIT = 'rate_limit'
+CONFLICT = 'conflict'
+SERVER = 'server'
+
+
+class RetryBudget:
+	"""
+	Client-wide retry throttle shared by every request of a client (or of several clients).
+
+	Works like gRPC retry throttling: each retryable failure takes one token, each
+	success gives back `token_ratio` tokens, and retries are only allowed while more than
+	half of `max_tokens` is left. A fleet-wide outage therefore quickly stops retries
+	instead of multiplying the load, while isolated failures are retried as usual.
+	"""
+
+	def __init__(self, max_tokens: float = 100.0, token_ratio: float = 0.1) -> None:
+		if max_tokens <= 0:
+			raise ValueError('max_tokens must be positive')
+		self.max_tokens = max_tokens
+		self.token_ratio = token_ratio
+		self._tokens = max_tokens
+		self._lock = threading.Lock()
+
+	@property
+	def tokens(self) -> float:
+		return self._tokens
+
+	def record_success(self) -> None:
+		with self._lock:
+			self._tokens = min(self.max_tokens, self._tokens + self.token_ratio)
+
+	def record_failure(self) -> bool:
+		"""Charge a failure and return whether it may still be retried."""
+		with self._lock:
+			self._tokens = max(0.0, self._tokens - 1)
+			return self._tokens > self.max_tokens / 2
+
+
+class RetryState:
+	"""Retry bookkeeping of one logical request across its attempts."""
+
+	def __init__(self) -> None:
+		self.attempts: Dict[str, int] = {}
+		self.last_delay: Optional[float] = None
+
+
+class RequestAttempt:
+	"""
+	Timing of one attempt of a request, passed to the client's `attempt_hooks`.
+
+	Attributes:
+		request: The request that was sent; the same object, body included, on every attempt.
+		attempt: 1 for the first try, 2 for the first retry and so on.
+		started: `time.monotonic()` at the start of the attempt.
+		elapsed: Seconds from the start of the attempt until the response headers or the error arrived.
+		response: The response, if one was received.
+		error: The transport error, if the attempt failed without a response.
+		retry_delay: Seconds until the next attempt, or `None` if the request is not retried.
+	"""
+
+	__slots__ = ('request', 'attempt', 'started', 'elapsed', 'response', 'error', 'retry_delay')
+
+	def __init__(
+		self,
+		*,
+		request: httpx.Request,
+		attempt: int,
+		started: float,
+		elapsed: float,
+		response: Optional[httpx.Response] = None,
+		error: Optional[BaseException] = None,
+		retry_delay: Optional[float] = None,
+	) -> None:
+		self.request = request
+		self.attempt = attempt
+		self.started = started
+		self.elapsed = elapsed
+		self.response = response
+		self.error = error
+		self.retry_delay = retry_delay
+
+	@property
+	def status_code(self) -> Optional[int]:
+		return self.response.status_code if self.response is not None else None
+
+	@property
+	def will_retry(self) -> bool:
+		return self.retry_delay is not None
+
+	def __repr__(self) -> str:
+		return (
+			f'RequestAttempt(method={self.request.method!r}, url={str(self.request.url)!r}, attempt={self.attempt}, '
+			f'elapsed={self.elapsed:.3f}, status_code={self.status_code}, retry_delay={self.retry_delay})'
+		)
+
+
+class RetryPolicy:
+	"""
+	Decides whether a failed request is retried and how long to wait first.
+
+	Arguments:
+		initial_delay (float): Lower bound of the backoff delay in seconds
+		max_delay (float): Upper bound of the backoff delay in seconds
+		max_retry_after (float): Longest server-provided `Retry-After` delay that is honored
+		error_budgets (Mapping[str, int] | None): Maximum retries per error class
+			(`'timeout'`, `'connection'`, `'rate_limit'`, `'conflict'`, `'server'`); classes
+			without an entry are only limited by `max_retries`
+		budget (RetryBudget | None): Client-wide retry throttle; pass `None` to disable it
+	"""
+
+	def __init__(
+		self,
+		*,
+		initial_delay: float = INITIAL_RETRY_DELAY,
+		max_delay: float = MAX_RETRY_DELAY,
+		max_retry_after: float = 60.0,
+		error_budgets: Mapping[str, int] | None = None,
+		budget: RetryBudget | None | NotGiven = NOT_GIVEN,
+	) -> None:
+		self.initial_delay = initial_delay
+		self.max_delay = max_delay
+		self.max_retry_after = max_retry_after
+		self.error_budgets = dict(error_budgets or {})
+		self.budget = RetryBudget() if isinstance(budget, NotGiven) else budget
+
+	def classify_response(self, response: httpx.Response) -> str | None:
+		"""Return the error class of a failed response, or `None` if it must not be retried."""
+		status_code = response.status_code
+		if status_code == 408:
+			error_class = TIMEOUT
+		elif status_code == 409:
+			error_class = CONFLICT
+		elif status_code == 429:
+			error_class = RATE_LIMIT
+		elif status_code >= 500:
+			error_class = SERVER
+		else:
+			error_class = None
+
+		# Note: this is not a standard header
+		should_retry_header = response.headers.get('x-should-retry')
+
+		# If the server explicitly says whether or not to retry, obey.
+		if should_retry_header == 'true':
+			log.debug('Retrying as header `x-should-retry` is set to `true`')
+			return error_class or SERVER
+		if should_retry_header == 'false':
+			log.debug('Not retrying as header `x-should-retry` is set to `false`')
+			return None
+
+		if error_class is not None:
+			log.debug('Retrying due to status code %i', status_code)
+		else:
+			log.debug('Not retrying')
+		return error_class
+
+	def classify_exception(self, err: BaseException) -> str:
+		return TIMEOUT if isinstance(err, httpx.TimeoutException) else CONNECTION
+
+	def should_retry(self, state: RetryState, error_class: str, remaining_retries: int) -> bool:
+		if remaining_retries <= 0:
+			return False
+
+		attempts = state.attempts.get(error_class, 0)
+		if attempts >= self.error_budgets.get(error_class, math.inf):
+			log.debug('Not retrying as the %s retry budget is used up', error_class)
+			return False
+		if self.budget is not None and not self.budget.record_failure():
+			log.debug('Not retrying as the client-wide retry budget is exhausted')
+			return False
+
+		state.attempts[error_class] = attempts + 1
+		return True
+
+	def record_success(self) -> None:
+		if self.budget is not None:
+			self.budget.record_success()
+
+	def retry_delay(self, state: RetryState, response_headers: Optional[httpx.Headers] = None) -> float:
+		# If the API asks us to wait a certain amount of time (and it's a reasonable amount), just do what it says.
+		retry_after = parse_retry_after(response_headers)
+		if retry_after is not None and 0 < retry_after <= self.max_retry_after:
+			delay = retry_after
+		else:
+			# decorrelated jitter: the next delay is drawn between the base and three times the previous one
+			previous = state.last_delay or self.initial_delay
+			delay = min(self.max_delay, uniform(self.initial_delay, previous * 3))
+		state.last_delay = delay
+		return delay
+
+
+def parse_retry_after(headers: Optional[httpx.Headers]) -> float | None:
+	"""Parse `retry-after-ms` or `Retry-After` (seconds or an HTTP date) into seconds."""
+	if headers is None:
+		return None
+
+	retry_ms = headers.get('retry-after-ms')
+	if retry_ms is not None:
+		try:
+			return float(retry_ms) / 1000
+		except ValueError:
+			pass
+
+	retry_after = headers.get('retry-after')
+	if retry_after is None:
+		return None
+	try:
+		return float(retry_after)
+	except ValueError:
+		pass
+
+	retry_date = email.utils.parsedate_tz(retry_after)
+	if retry_date is None:
+		return None
+	return email.utils.mktime_tz(retry_date) - time.time()
@@ -3,20 +3,106 @@ from __future__ import annotations
 
 import inspect
 import json
-from typing import TYPE_CHECKING, Generic, Iterator, Mapping, Type, cast
+import re
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Generic, Iterator, Type, Union, cast
 
 import httpx
+import pydantic
 from typing_extensions import TypeGuard
 
 from . import get_origin
+from ._base_compat import field_outer_type, get_model_fields
+from ._base_models import construct_type
 from ._base_type import ResponseT
 from ._errors import APIResponseError
+from ._json_encoder import get_json_loads
 from ._utils import extract_type_var_from_base, is_mapping
 
 _FIELD_SEPARATOR = ':'
 
+# An SSE event ends at the first blank line, whatever the line terminator style.
+_EVENT_BOUNDARY = re.compile(rb'\r\n\r\n|\n\n|\r\r')
+# Longest boundary minus one; how far back a re-scan must start after new bytes arrive.
+_BOUNDARY_OVERLAP = 3
+
+_default_json_loads = get_json_loads()
+
 if TYPE_CHECKING:
-	from ._http_client import HttpClient
+	from ._http_client import AsyncHttpClient, HttpClient
+
+
+def set_json_backend(backend: str = 'auto') -> None:
+	"""
+	Select the JSON decoder used for stream chunks created from now on.
+
+	Args:
+		backend: ``'orjson'``, ``'json'`` or ``'auto'`` (orjson when installed)
+	"""
+	global _default_json_loads
+	_default_json_loads = get_json_loads(backend)
+
+
+def _raise_for_stream_error(data: object, response: httpx.Response, event: str | None = None) -> None:
+	# decoded JSON objects are always plain dicts, which is much cheaper to check than `Mapping`
+	if not isinstance(data, dict) or not data.get('error'):
+		return
+	if event is None and data.get('agent_id'):
+		# agent chunks carry their own `error` field; a named `error` event still raises
+		return
+
+	error = data['error']
+	message = error.get('message') if is_mapping(error) else None
+	if not message or not isinstance(message, str):
+		message = 'An error occurred during streaming'
+
+	raise APIResponseError(
+		message=message,
+		request=response.request,
+		json_data=error,
+	)
+
+
+def _usage_type(cast_type: type) -> type | None:
+	"""The declared type of the `usage` field of a chunk model (or lazy view), if any."""
+	model = getattr(cast_type, '__model__', cast_type)
+	if not (inspect.isclass(model) and issubclass(model, pydantic.BaseModel)):
+		return None
+	field = get_model_fields(model).get('usage')
+	return None if field is None else field_outer_type(field)
+
+
+class _TextCollector:
+	"""Pulls `choices[0].delta.content` out of decoded chunks and remembers the trailing metadata."""
+
+	__slots__ = ('finish_reason', 'usage')
+
+	def __init__(self) -> None:
+		self.finish_reason: str | None = None
+		self.usage: object = None
+
+	def feed(self, data: object) -> str | None:
+		if not isinstance(data, dict):
+			return None
+		usage = data.get('usage')
+		if usage:
+			self.usage = usage
+		choices = data.get('choices')
+		if not choices:
+			return None
+		choice = choices[0]
+		finish_reason = choice.get('finish_reason')
+		if finish_reason:
+			self.finish_reason = finish_reason
+		delta = choice.get('delta')
+		return delta.get('content') if delta else None
+
+	def finish(self, stream: StreamResponse[Any] | AsyncStreamResponse[Any]) -> None:
+		stream.finish_reason = self.finish_reason
+		usage_type = _usage_type(stream._cast_type)
+		if self.usage is not None and usage_type is not None:
+			stream.usage = construct_type(type_=usage_type, value=self.usage)
+		else:
+			stream.usage = self.usage
 
 
 class StreamResponse(Generic[ResponseT]):
@@ -25,10 +111,14 @@ class StreamResponse(Generic[ResponseT]):
 
 	Attributes:
 		response: The response from server.
+		finish_reason: The last `finish_reason` seen by `iter_text()`.
+		usage: The token usage reported to `iter_text()`, set once the stream is exhausted.
 		_cast_type: The type of response.
 	"""
 
 	response: httpx.Response
+	finish_reason: str | None
+	usage: object
 	_cast_type: Type[ResponseT]
 
 	def __init__(
@@ -37,10 +127,14 @@ class StreamResponse(Generic[ResponseT]):
 		cast_type: Type[ResponseT],
 		response: httpx.Response,
 		client: HttpClient,
+		json_loads: Callable[[bytes], object] | None = None,
 	) -> None:
 		self.response = response
+		self.finish_reason = None
+		self.usage = None
 		self._cast_type = cast_type
 		self._data_process_func = client._process_response_data
+		self._json_loads = json_loads or _default_json_loads
 		self._stream_chunks = self.__stream__()
 
 	def __next__(self) -> ResponseT:
@@ -51,65 +145,136 @@ class StreamResponse(Generic[ResponseT]):
 			yield item
 
 	def __stream__(self) -> Iterator[ResponseT]:
-		sse_line_parser = SSELineParser()
-		iterator = sse_line_parser.iter_lines(self.response.iter_lines())
+		response = self.response
+		cast_type = self._cast_type
+		process = self._data_process_func
+		for data in self._iter_json():
+			yield process(data=data, cast_type=cast_type, response=response)
+
+	def _iter_json(self) -> Iterator[object]:
+		response = self.response
+		json_loads = self._json_loads
+		iterator = SSEBytesDecoder().iter_data(response.iter_bytes())
+
+		for event, payload in iterator:
+			if payload.startswith(b'[DONE]'):
+				break
+			if not payload:
+				continue
+
+			data = json_loads(payload)
+			if event is None or event == 'error':
+				_raise_for_stream_error(data, response, event)
+			yield data
+
+		for _ in iterator:
+			pass
+
+	def iter_text(self) -> Iterator[str]:
+		"""
+		Yield the text deltas (`choices[0].delta.content`) of a chat completion stream.
+
+		Chunks are read straight from the decoded JSON without building response models.
+		Once the stream is exhausted `finish_reason` and `usage` hold the final metadata.
+		"""
+		yield from self._text_deltas(self._iter_json())
+
+	def _text_deltas(self, chunks: Iterator[object]) -> Iterator[str]:
+		collector = _TextCollector()
+		for data in chunks:
+			content = collector.feed(data)
+			if content:
+				yield content
+		collector.finish(self)
+
+
+class AsyncStreamResponse(Generic[ResponseT]):
+	"""
+	Async stream response class, the `async for` counterpart of `StreamResponse`.
+
+	Attributes:
+		response: The response from server.
+		finish_reason: The last `finish_reason` seen by `iter_text()`.
+		usage: The token usage reported to `iter_text()`, set once the stream is exhausted.
+		_cast_type: The type of response.
+	"""
+
+	response: httpx.Response
+	finish_reason: str | None
+	usage: object
+	_cast_type: Type[ResponseT]
 
-		for sse in iterator:
-			if sse.data.startswith('[DONE]'):
+	def __init__(
+		self,
+		*,
+		cast_type: Type[ResponseT],
+		response: httpx.Response,
+		client: AsyncHttpClient,
+		json_loads: Callable[[bytes], object] | None = None,
+	) -> None:
+		self.response = response
+		self.finish_reason = None
+		self.usage = None
+		self._cast_type = cast_type
+		self._data_process_func = client._process_response_data
+		self._json_loads = json_loads or _default_json_loads
+		self._stream_chunks = self.__stream__()
+
+	async def __anext__(self) -> ResponseT:
+		return await self._stream_chunks.__anext__()
+
+	async def __aiter__(self) -> AsyncIterator[ResponseT]:
+		async for item in self._stream_chunks:
+			yield item
+
+	async def __stream__(self) -> AsyncIterator[ResponseT]:
+		response = self.response
+		cast_type = self._cast_type
+		process = self._data_process_func
+		async for data in self._iter_json():
+			yield process(data=data, cast_type=cast_type, response=response)
+
+	async def _iter_json(self) -> AsyncIterator[object]:
+		response = self.response
+		json_loads = self._json_loads
+		iterator = SSEBytesDecoder().aiter_data(response.aiter_bytes())
+
+		async for event, payload in iterator:
+			if payload.startswith(b'[DONE]'):
 				break
-			if sse.event is None:
-				data = sse.json_data()
-				if isinstance(data, Mapping) and data.get('agent_id'):
-					yield self._data_process_func(
-						data=data,
-						cast_type=self._cast_type,
-						response=self.response,
-					)
-					continue
-				if isinstance(data, Mapping) and data.get('error'):
-					raise APIResponseError(
-						message='An error occurred during streaming',
-						request=self.response.request,
-						json_data=data['error'],
-					)
-			if sse.event is None:
-				data = sse.json_data()
-				if is_mapping(data) and data.get('error'):
-					message = None
-					error = data.get('error')
-					if is_mapping(error):
-						message = error.get('message')
-					if not message or not isinstance(message, str):
-						message = 'An error occurred during streaming'
-
-					raise APIResponseError(
-						message=message,
-						request=self.response.request,
-						json_data=data['error'],
-					)
-				yield self._data_process_func(data=data, cast_type=self._cast_type, response=self.response)
-
-			else:
-				data = sse.json_data()
-
-				if sse.event == 'error' and is_mapping(data) and data.get('error'):
-					message = None
-					error = data.get('error')
-					if is_mapping(error):
-						message = error.get('message')
-					if not message or not isinstance(message, str):
-						message = 'An error occurred during streaming'
-
-					raise APIResponseError(
-						message=message,
-						request=self.response.request,
-						json_data=data['error'],
-					)
-				yield self._data_process_func(data=data, cast_type=self._cast_type, response=self.response)
-
-		for sse in iterator:
+			if not payload:
+				continue
+
+			data = json_loads(payload)
+			if event is None or event == 'error':
+				_raise_for_stream_error(data, response, event)
+			yield data
+
+		async for _ in iterator:
 			pass
 
+	async def iter_text(self) -> AsyncIterator[str]:
+		"""
+		Yield the text deltas (`choices[0].delta.content`) of a chat completion stream.
+
+		Chunks are read straight from the decoded JSON without building response models.
+		Once the stream is exhausted `finish_reason` and `usage` hold the final metadata.
+		"""
+		async for content in self._text_deltas(self._iter_json()):
+			yield content
+
+	async def _text_deltas(self, chunks: AsyncIterator[object]) -> AsyncIterator[str]:
+		collector = _TextCollector()
+		async for data in chunks:
+			content = collector.feed(data)
+			if content:
+				yield content
+		collector.finish(self)
+
+	async def close(self) -> None:
+		"""Close the response and release the connection."""
+		await self.response.aclose()
+
 
 class Event(object):
 	def __init__(
@@ -202,10 +367,148 @@ class SSELineParser:
 		return
 
 
-def is_stream_class_type(typ: type) -> TypeGuard[type[StreamResponse[object]]]:
+class SSEBytesDecoder:
+	"""
+	Incremental server-sent events decoder working directly on the raw byte stream.
+
+	The decoder is a small state machine over a single reusable buffer: network chunks
+	are appended to it, only the not yet scanned tail is searched for event boundaries,
+	and consumed events are dropped from the front so the storage is recycled instead
+	of reallocated. Fields are split as bytes, so no per-line strings are built, and
+	the common ``data: {...}`` event skips field parsing altogether.
+	"""
+
+	_buffer: bytearray
+	_scanned: int
+
+	def __init__(self):
+		self._buffer = bytearray()
+		self._scanned = 0
+
+	def _split(self, chunk: bytes) -> Iterator[bytearray]:
+		buffer = self._buffer
+		buffer += chunk
+		start = 0
+		pos = max(self._scanned - _BOUNDARY_OVERLAP, 0)
+		search = _EVENT_BOUNDARY.search
+		while True:
+			match = search(buffer, pos)
+			if match is None:
+				break
+			yield buffer[start : match.start()]
+			start = pos = match.end()
+		if start:
+			del buffer[:start]
+		self._scanned = len(buffer)
+
+	def _rest(self) -> Iterator[bytearray]:
+		if self._buffer:
+			raw = self._buffer[:]
+			self._buffer.clear()
+			self._scanned = 0
+			yield raw
+
+	def feed(self, chunk: bytes) -> Iterator[Event]:
+		"""Append a chunk of bytes and yield every event it completes."""
+		for raw in self._split(chunk):
+			event = self.decode_event(raw)
+			if event is not None:
+				yield event
+
+	def flush(self) -> Iterator[Event]:
+		"""Yield the trailing event of a stream that ended without a blank line."""
+		for raw in self._rest():
+			event = self.decode_event(raw)
+			if event is not None:
+				yield event
+
+	def iter_bytes(self, iterator: Iterator[bytes]) -> Iterator[Event]:
+		for chunk in iterator:
+			yield from self.feed(chunk)
+		yield from self.flush()
+
+	async def aiter_bytes(self, iterator: AsyncIterator[bytes]) -> AsyncIterator[Event]:
+		async for chunk in iterator:
+			for event in self.feed(chunk):
+				yield event
+		for event in self.flush():
+			yield event
+
+	def iter_data(self, iterator: Iterator[bytes]) -> Iterator[tuple[str | None, bytearray]]:
+		"""Yield ``(event name, raw data payload)`` pairs without building `Event` objects."""
+		for chunk in iterator:
+			for raw in self._split(chunk):
+				yield self.decode_data(raw)
+		for raw in self._rest():
+			yield self.decode_data(raw)
+
+	async def aiter_data(self, iterator: AsyncIterator[bytes]) -> AsyncIterator[tuple[str | None, bytearray]]:
+		async for chunk in iterator:
+			for raw in self._split(chunk):
+				yield self.decode_data(raw)
+		for raw in self._rest():
+			yield self.decode_data(raw)
+
+	@staticmethod
+	def decode_data(raw: bytearray) -> tuple[str | None, bytearray]:
+		if raw.startswith(b'data: ') and b'\n' not in raw and b'\r' not in raw:
+			return None, raw[6:]
+
+		event: str | None = None
+		data: list[bytes] = []
+		for line in raw.splitlines():
+			if not line or line[:1] == b':':
+				continue
+			field, _p, value = line.partition(b':')
+			if value[:1] == b' ':
+				value = value[1:]
+			if field == b'data':
+				data.append(value)
+			elif field == b'event':
+				event = value.decode('utf-8')
+		return event, bytearray(b'\n').join(data)
+
+	@staticmethod
+	def decode_event(raw: bytes | bytearray) -> Event | None:
+		event: str | None = None
+		id: str | None = None
+		retry: int | None = None
+		data: list[bytes] = []
+
+		for line in raw.splitlines():
+			if not line or line[:1] == b':':
+				continue
+			field, _p, value = line.partition(b':')
+			if value[:1] == b' ':
+				value = value[1:]
+			if field == b'data':
+				data.append(value)
+			elif field == b'event':
+				event = value.decode('utf-8')
+			elif field == b'id':
+				id = value.decode('utf-8')
+			elif field == b'retry':
+				try:
+					retry = int(value)
+				except (TypeError, ValueError):
+					pass
+
+		if event is None and not data and id is None and retry is None:
+			return None
+		return Event(
+			event=event,
+			data=b'\n'.join(data).decode('utf-8'),
+			id=id,
+			retry=retry,
+		)
+
+
+def is_stream_class_type(
+	typ: type,
+) -> TypeGuard[Union[type[StreamResponse[object]], type[AsyncStreamResponse[object]]]]:
 	"""TypeGuard for determining whether or not the given type is a subclass of `Stream` / `AsyncStream`"""
 	origin = get_origin(typ) or typ
-	return inspect.isclass(origin) and issubclass(origin, StreamResponse)
+	return inspect.isclass(origin) and issubclass(origin, (StreamResponse, AsyncStreamResponse))
 
 
 def extract_stream_chunk_type(
@@ -213,7 +516,7 @@ def extract_stream_chunk_type(
 	*,
 	failure_message: str | None = None,
 ) -> type:
-	"""Given a type like `StreamResponse[T]`, returns the generic type variable `T`.
+	"""Given a type like `StreamResponse[T]` or `AsyncStreamResponse[T]`, returns the generic type variable `T`.
 
 	This also handles the case where a concrete subclass is given, e.g.
 	```py
@@ -227,6 +530,6 @@ def extract_stream_chunk_type(
 	return extract_type_var_from_base(
 		stream_cls,
 		index=0,
-		generic_bases=cast('tuple[type, ...]', (StreamResponse,)),
+		generic_bases=cast('tuple[type, ...]', (StreamResponse, AsyncStreamResponse)),
 		failure_message=failure_message,
 	)
@@ -0,0 +1,48 @@
+from typing import Any, Dict, Optional
+
+from zai.core import BaseModel
+
+
+class BatchResultResponse(BaseModel):
+	"""
+	Response of one request of a batch
+
+	Attributes:
+		status_code (Optional[int]): HTTP status code of the request
+		request_id (Optional[str]): Identifier of the request
+		body (Optional[Dict[str, Any]]): Response body, as the synchronous endpoint returns it
+	"""
+
+	status_code: Optional[int] = None
+	request_id: Optional[str] = None
+	body: Optional[Dict[str, Any]] = None
+
+
+class BatchResultError(BaseModel):
+	"""
+	Error of one request of a batch that could not be executed
+
+	Attributes:
+		code (Optional[str]): Defined business error code
+		message (Optional[str]): Description of the error
+	"""
+
+	code: Optional[str] = None
+	message: Optional[str] = None
+
+
+class BatchResult(BaseModel):
+	"""
+	One line of a batch output or error file
+
+	Attributes:
+		id (Optional[str]): Identifier of the line
+		custom_id (str): The `custom_id` of the request it answers
+		response (Optional[BatchResultResponse]): Response of the request
+		error (Optional[BatchResultError]): Error of the request
+	"""
+
+	id: Optional[str] = None
+	custom_id: str
+	response: Optional[BatchResultResponse] = None
+	error: Optional[BatchResultError] = None
@@ -1,6 +1,8 @@
+from .embedding_matrix import EmbeddingMatrix
 from .embeddings import Embedding, EmbeddingsResponded
 
 __all__ = [
 	'Embedding',
+	'EmbeddingMatrix',
 	'EmbeddingsResponded',
 ]
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import binascii
+import sys
+from array import array
+from typing import Any, Iterable, List, Optional, Sequence, Union
+
+from zai.core._json_encoder import get_json_loads
+from zai.types.chat.chat_completion import CompletionUsage
+
+_json_loads = get_json_loads()
+
+
+def _numpy() -> Any:
+	try:
+		import numpy
+	except ImportError as err:
+		raise ImportError("`vector_format='numpy'` requires `pip install numpy`") from err
+	return numpy
+
+
+def sum_usage(usages: Iterable[Optional[CompletionUsage]]) -> CompletionUsage:
+	"""Add up the token usage of several responses, counting missing usage or counts as zero."""
+	prompt_tokens = completion_tokens = total_tokens = 0
+	for usage in usages:
+		prompt_tokens += getattr(usage, 'prompt_tokens', None) or 0
+		completion_tokens += getattr(usage, 'completion_tokens', None) or 0
+		total_tokens += getattr(usage, 'total_tokens', None) or 0
+	return CompletionUsage.construct(
+		prompt_tokens=prompt_tokens, completion_tokens=completion_tokens, total_tokens=total_tokens
+	)
+
+
+class EmbeddingMatrix:
+	"""
+	Embeddings of a response in one contiguous float32 buffer, without a Python float per value
+
+	Row `i` is the embedding of input `i`. With `encoding_format='base64'` the vectors are
+	decoded straight into that buffer; NumPy matrices wrap it with `frombuffer` and are
+	read-only in that case.
+
+	Attributes:
+		vectors (array | numpy.ndarray): Row-major `array('f')` of `len(self) * dimensions`
+			values, or a `(len(self), dimensions)` NumPy `float32` matrix
+		dimensions (int): Length of each embedding
+		model (str): Model used for embedding generation
+		usage (CompletionUsage): Token usage information
+	"""
+
+	__slots__ = ('vectors', 'dimensions', 'model', 'usage', '_count')
+
+	def __init__(self, vectors: Any, count: int, dimensions: int, model: str, usage: CompletionUsage) -> None:
+		self.vectors = vectors
+		self.dimensions = dimensions
+		self.model = model
+		self.usage = usage
+		self._count = count
+
+	@staticmethod
+	def check_format(vector_format: str) -> None:
+		"""Raise if `vector_format` is unknown or needs NumPy that is not installed."""
+		if vector_format not in ('array', 'numpy'):
+			raise ValueError(f"Unknown vector format: {vector_format!r}, expected 'array' or 'numpy'")
+		if vector_format == 'numpy':
+			_numpy()
+
+	@classmethod
+	def from_json(cls, content: Union[bytes, str], vector_format: str = 'array') -> EmbeddingMatrix:
+		"""Build the matrix from the raw JSON body of an embeddings response."""
+		cls.check_format(vector_format)
+		payload = _json_loads(content)
+		items = payload['data']
+		# `index` is optional; fall back to the response order without it
+		if any(item.get('index') is not None for item in items):
+			items = sorted(items, key=lambda item: item['index'])
+		rows = [item['embedding'] for item in items]
+		if rows and isinstance(rows[0], str):
+			# base64 of little-endian float32 values
+			rows = [binascii.a2b_base64(row) for row in rows]
+		count = len(rows)
+		dimensions = len(rows[0]) if rows else 0
+		if any(len(row) != dimensions for row in rows):
+			raise ValueError('Embeddings of a response have different dimensions')
+
+		if rows and isinstance(rows[0], bytes):
+			dimensions //= 4
+			vectors = _from_buffer(b''.join(rows), count, dimensions, vector_format)
+		elif vector_format == 'numpy':
+			vectors = _numpy().array(rows, dtype='float32').reshape(count, dimensions)
+		else:
+			vectors = array('f')
+			for row in rows:
+				vectors.extend(row)
+
+		usage = CompletionUsage.construct(**payload.get('usage', {}))
+		return cls(vectors, count, dimensions, payload.get('model', ''), usage)
+
+	@classmethod
+	def from_rows(
+		cls, rows: Sequence[bytes], model: str, usage: CompletionUsage, vector_format: str = 'array'
+	) -> EmbeddingMatrix:
+		"""Build the matrix from little-endian float32 rows, such as those of an `EmbeddingCache`."""
+		cls.check_format(vector_format)
+		dimensions = len(rows[0]) if rows else 0
+		if any(len(row) != dimensions for row in rows):
+			raise ValueError('Embeddings have different dimensions')
+		count = len(rows)
+		return cls(
+			_from_buffer(b''.join(rows), count, dimensions // 4, vector_format), count, dimensions // 4, model, usage
+		)
+
+	@classmethod
+	def concatenate(cls, matrices: Sequence[EmbeddingMatrix], model: str, vector_format: str) -> EmbeddingMatrix:
+		"""Stack the matrices of consecutive batches, summing their usage."""
+		dimensions = matrices[0].dimensions if matrices else 0
+		if any(matrix.dimensions != dimensions for matrix in matrices if len(matrix)):
+			raise ValueError('Cannot concatenate embeddings of different dimensions')
+		if vector_format == 'numpy':
+			numpy = _numpy()
+			parts = [matrix.vectors for matrix in matrices]
+			vectors = numpy.concatenate(parts) if parts else numpy.empty((0, 0), dtype='float32')
+		else:
+			vectors = array('f')
+			for matrix in matrices:
+				vectors.extend(matrix.vectors)
+		usage = sum_usage(matrix.usage for matrix in matrices)
+		return cls(
+			vectors,
+			sum(len(matrix) for matrix in matrices),
+			dimensions,
+			matrices[0].model if matrices else model,
+			usage,
+		)
+
+	def __len__(self) -> int:
+		return self._count
+
+	def __getitem__(self, index: int) -> Any:
+		"""Return row `index` without copying: a `memoryview` of floats, or a NumPy row."""
+		if not isinstance(self.vectors, array):
+			return self.vectors[index]
+		if index < 0:
+			index += self._count
+		if not 0 <= index < self._count:
+			raise IndexError('embedding index out of range')
+		start = index * self.dimensions
+		return memoryview(self.vectors)[start : start + self.dimensions]
+
+	def row_bytes(self, index: int) -> bytes:
+		"""Return row `index` as little-endian float32 bytes."""
+		row = self[index]
+		if isinstance(row, memoryview):
+			if sys.byteorder == 'big':
+				swapped = array('f', row)
+				swapped.byteswap()
+				return swapped.tobytes()
+			return row.tobytes()
+		return row.astype('<f4').tobytes()
+
+	def tolist(self) -> List[List[float]]:
+		"""Return the embeddings as nested lists of Python floats."""
+		return [list(self[index]) for index in range(self._count)]
+
+	@property
+	def nbytes(self) -> int:
+		"""Size of the vector buffer in bytes."""
+		return self._count * self.dimensions * 4
+
+	def __repr__(self) -> str:
+		return f'EmbeddingMatrix(count={self._count}, dimensions={self.dimensions}, model={self.model!r})'
+
+
+def _from_buffer(buffer: bytes, count: int, dimensions: int, vector_format: str) -> Any:
+	# joining a single row returns it unchanged, so one-row responses are not copied again
+	if vector_format == 'numpy':
+		return _numpy().frombuffer(buffer, dtype='<f4').reshape(count, dimensions)
+	vectors = array('f')
+	vectors.frombytes(buffer)
+	if sys.byteorder == 'big':
+		vectors.byteswap()
+	return vectors
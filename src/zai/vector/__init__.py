@@ -0,0 +1,15 @@
+"""
+In-process vector search over embeddings results.
+
+Requires NumPy (`pip install "zai-sdk[vector]"`).
+"""
+
+try:
+	import numpy  # noqa: F401
+except ImportError as err:  # pragma: no cover - depends on the environment
+	raise ImportError('`zai.vector` requires NumPy, install it with `pip install "zai-sdk[vector]"`') from err
+
+from ._ivf import IVFIndex
+from ._store import SearchHit, VectorStore, as_matrix
+
+__all__ = ['IVFIndex', 'SearchHit', 'VectorStore', 'as_matrix']
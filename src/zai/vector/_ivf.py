@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+
+# rows scored per matrix product, bounding the temporary score matrix
+_CHUNK_ROWS = 65536
+
+
+class IVFIndex:
+	"""
+	Inverted-file index of a `VectorStore` for large corpora.
+
+	Vectors are grouped by the nearest of `nlist` k-means centroids, and a query only scores the
+	groups of its `nprobe` nearest centroids. With `quantize=True` every vector also gets an int8
+	code (a quarter of its float32 size); candidates are ranked on the codes first and only the
+	best `rerank * k` are scored on the float32 vectors.
+
+	Build it with `VectorStore.build_index()`, which keeps it up to date on `add()` and `delete()`.
+	"""
+
+	def __init__(
+		self,
+		centroids: np.ndarray,
+		*,
+		scale: Optional[np.ndarray] = None,
+		nprobe: int = 8,
+		rerank: int = 4,
+	) -> None:
+		self.centroids = np.ascontiguousarray(centroids, dtype=np.float32)
+		self.scale = None if scale is None else np.asarray(scale, dtype=np.float32)
+		self.nprobe = nprobe
+		self.rerank = rerank
+		self._centroid_norms = np.einsum('ij,ij->i', self.centroids, self.centroids)
+		self._lists = np.empty(0, dtype=np.int32)
+		self._codes: Optional[np.ndarray] = None if scale is None else np.empty((0, len(self.scale)), dtype=np.int8)
+		self._count = 0
+		# rows sorted by list, rebuilt lazily after changes
+		self._order: Optional[np.ndarray] = None
+		self._bounds: Optional[np.ndarray] = None
+
+	@classmethod
+	def train(
+		cls,
+		vectors: np.ndarray,
+		nlist: int,
+		*,
+		nprobe: int = 8,
+		quantize: bool = False,
+		rerank: int = 4,
+		sample_size: Optional[int] = None,
+		iterations: int = 10,
+		seed: int = 0,
+	) -> IVFIndex:
+		"""Train the centroids (and the quantization scale) on a sample of `vectors`."""
+		if not 0 < nlist <= len(vectors):
+			raise ValueError(f'`nlist` must be between 1 and the number of vectors ({len(vectors)}), got {nlist}')
+		rng = np.random.default_rng(seed)
+		# about 40 training vectors per list are enough for stable centroids
+		sample_size = min(len(vectors), sample_size or max(40 * nlist, 10000))
+		sample = np.asarray(vectors[np.sort(rng.choice(len(vectors), sample_size, replace=False))], dtype=np.float32)
+		centroids = _kmeans(sample, nlist, iterations, rng)
+		scale = None
+		if quantize:
+			scale = np.abs(sample).max(axis=0) / 127
+			scale[scale == 0] = 1
+		return cls(centroids, scale=scale, nprobe=nprobe, rerank=rerank)
+
+	@property
+	def nlist(self) -> int:
+		return len(self.centroids)
+
+	@property
+	def quantized(self) -> bool:
+		return self.scale is not None
+
+	def assign(self, vectors: np.ndarray) -> np.ndarray:
+		"""Return the list (nearest centroid) of each vector."""
+		return _nearest(vectors, self.centroids, self._centroid_norms)
+
+	def encode(self, vectors: np.ndarray) -> np.ndarray:
+		return np.clip(np.rint(vectors / self.scale), -127, 127).astype(np.int8)
+
+	def reserve(self, capacity: int) -> None:
+		if capacity > len(self._lists):
+			self._lists = _grow(self._lists, capacity)
+			if self._codes is not None:
+				self._codes = _grow(self._codes, capacity)
+
+	def add(self, vectors: np.ndarray, start: int) -> None:
+		end = start + len(vectors)
+		self.reserve(end)
+		self._lists[start:end] = self.assign(vectors)
+		if self._codes is not None:
+			self._codes[start:end] = self.encode(vectors)
+		self._count = max(self._count, end)
+		self._order = None
+
+	def move(self, source: int, target: int) -> None:
+		self._lists[target] = self._lists[source]
+		if self._codes is not None:
+			self._codes[target] = self._codes[source]
+		self._order = None
+
+	def truncate(self, count: int) -> None:
+		self._count = count
+		self._order = None
+
+	def search(
+		self, vectors: np.ndarray, queries: np.ndarray, k: int, nprobe: Optional[int] = None
+	) -> List[Tuple[np.ndarray, np.ndarray]]:
+		"""Return the rows and scores of the top `k` vectors per query, best first."""
+		order, bounds = self._sorted_lists()
+		nprobe = min(nprobe or self.nprobe, self.nlist)
+		probes = _nearest_k(queries, self.centroids, self._centroid_norms, nprobe)
+		keep = self.rerank * k if self._codes is not None else k
+		scaled = queries * self.scale if self._codes is not None else queries
+
+		# score list by list, each against all the queries probing it, so a list is read once per batch
+		pairs = np.argsort(probes, axis=None, kind='stable')
+		probed, starts = np.unique(probes.ravel()[pairs], return_index=True)
+		candidates: List[List[np.ndarray]] = [[] for _ in range(len(queries))]
+		candidate_scores: List[List[np.ndarray]] = [[] for _ in range(len(queries))]
+		for item, group in zip(probed, np.split(pairs // nprobe, starts[1:])):
+			rows = order[bounds[item] : bounds[item + 1]]
+			if not len(rows):
+				continue
+			if self._codes is not None:
+				scores = scaled[group] @ self._codes[rows].astype(np.float32).T
+			else:
+				scores = queries[group] @ vectors[rows].T
+			top, top_scores = _top_k(scores, keep)
+			for query, columns, values in zip(group.tolist(), top, top_scores):
+				candidates[query].append(rows[columns])
+				candidate_scores[query].append(values)
+
+		results = []
+		for query, rows_of_lists, scores_of_lists in zip(queries, candidates, candidate_scores):
+			if not rows_of_lists:
+				results.append((np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)))
+				continue
+			rows = np.concatenate(rows_of_lists)
+			scores = np.concatenate(scores_of_lists)
+			if self._codes is not None:
+				# rescore the best approximate candidates on the float32 vectors
+				rows = rows[_top_k(scores[None, :], keep)[0][0]]
+				rows.sort()
+				scores = vectors[rows] @ query
+			top, top_scores = _top_k(scores[None, :], k)
+			results.append((rows[top[0]], top_scores[0]))
+		return results
+
+	def _sorted_lists(self) -> Tuple[np.ndarray, np.ndarray]:
+		if self._order is None:
+			lists = self._lists[: self._count]
+			self._order = np.argsort(lists, kind='stable')
+			self._bounds = np.searchsorted(lists[self._order], np.arange(self.nlist + 1))
+		return self._order, self._bounds
+
+	def state(self) -> Tuple[dict, dict]:
+		"""Return the JSON settings and the arrays that `from_state()` restores the index from."""
+		arrays = {'centroids': self.centroids, 'lists': self._lists[: self._count]}
+		if self._codes is not None:
+			arrays['codes'] = self._codes[: self._count]
+			arrays['scale'] = self.scale
+		return {'nprobe': self.nprobe, 'rerank': self.rerank}, arrays
+
+	@classmethod
+	def from_state(cls, settings: dict, arrays: dict) -> IVFIndex:
+		index = cls(
+			arrays['centroids'], scale=arrays.get('scale'), nprobe=settings['nprobe'], rerank=settings['rerank']
+		)
+		index._lists = arrays['lists']
+		if index._codes is not None:
+			index._codes = arrays['codes']
+		index._count = len(index._lists)
+		return index
+
+
+def _grow(array: np.ndarray, capacity: int) -> np.ndarray:
+	grown = np.empty((max(capacity, 2 * len(array)),) + array.shape[1:], dtype=array.dtype)
+	grown[: len(array)] = array
+	return grown
+
+
+def _top_k(scores: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+	"""Column indices and values of the `k` largest scores of each row, best first."""
+	k = min(k, scores.shape[1])
+	if k < scores.shape[1]:
+		top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+	else:
+		top = np.broadcast_to(np.arange(scores.shape[1]), scores.shape)
+	values = np.take_along_axis(scores, top, axis=1)
+	order = np.argsort(-values, axis=1, kind='stable')
+	return np.take_along_axis(top, order, axis=1), np.take_along_axis(values, order, axis=1)
+
+
+def _distances(vectors: np.ndarray, centroids: np.ndarray, centroid_norms: np.ndarray) -> np.ndarray:
+	# squared L2 distance up to the per-vector constant |x|^2
+	return centroid_norms - 2 * (vectors @ centroids.T)
+
+
+def _nearest(vectors: np.ndarray, centroids: np.ndarray, centroid_norms: np.ndarray) -> np.ndarray:
+	labels = np.empty(len(vectors), dtype=np.int32)
+	for start in range(0, len(vectors), _CHUNK_ROWS):
+		chunk = np.asarray(vectors[start : start + _CHUNK_ROWS], dtype=np.float32)
+		labels[start : start + len(chunk)] = _distances(chunk, centroids, centroid_norms).argmin(axis=1)
+	return labels
+
+
+def _nearest_k(vectors: np.ndarray, centroids: np.ndarray, centroid_norms: np.ndarray, k: int) -> np.ndarray:
+	return _top_k(-_distances(vectors, centroids, centroid_norms), k)[0]
+
+
+def _kmeans(sample: np.ndarray, nlist: int, iterations: int, rng: Any) -> np.ndarray:
+	centroids = sample[rng.choice(len(sample), nlist, replace=False)].copy()
+	for _ in range(iterations):
+		labels = _nearest(sample, centroids, np.einsum('ij,ij->i', centroids, centroids))
+		order = np.argsort(labels, kind='stable')
+		counts = np.bincount(labels, minlength=nlist)
+		filled = np.flatnonzero(counts)
+		sums = np.add.reduceat(sample[order], np.concatenate(([0], np.cumsum(counts)[:-1]))[filled], axis=0)
+		centroids[filled] = sums / counts[filled, None]
+		# restart empty clusters from random sample vectors
+		empty = np.flatnonzero(counts == 0)
+		if len(empty):
+			centroids[empty] = sample[rng.choice(len(sample), len(empty), replace=False)]
+	return centroids
@@ -0,0 +1,319 @@
+from __future__ import annotations
+
+import json
+import os
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Union
+
+import numpy as np
+
+from zai.types.embeddings import EmbeddingMatrix, EmbeddingsResponded
+
+from ._ivf import _CHUNK_ROWS, IVFIndex, _grow, _top_k
+
+_FORMAT_VERSION = 1
+
+
+class SearchHit(NamedTuple):
+	"""One search result: the id of a stored vector and its similarity to the query."""
+
+	id: Any
+	score: float
+
+
+class VectorStore:
+	"""
+	In-process float32 vector store with batched top-k similarity search.
+
+	Vectors live in one contiguous `(n, dimensions)` float32 matrix and are scored against a
+	whole batch of queries with one matrix product per chunk of the corpus. With
+	`metric='cosine'` vectors and queries are L2-normalized, so the score is the cosine
+	similarity; with `'dot'` it is the raw inner product.
+
+	Results of `embeddings.create()` can be added as they are, in either result format.
+	For corpora of millions of vectors `build_index()` adds an `IVFIndex`, and `save()` /
+	`load()` keep the store in `.npy` files that are memory-mapped on load.
+
+	Arguments:
+		dimensions (int | None): Length of the vectors; taken from the first `add()` when omitted
+		metric (Literal['cosine', 'dot']): Similarity used to rank the vectors
+	"""
+
+	def __init__(self, dimensions: Optional[int] = None, *, metric: str = 'cosine') -> None:
+		if metric not in ('cosine', 'dot'):
+			raise ValueError(f"Unknown metric: {metric!r}, expected 'cosine' or 'dot'")
+		self.metric = metric
+		self.dimensions = dimensions
+		self._vectors = np.empty((0, dimensions or 0), dtype=np.float32)
+		self._count = 0
+		self._ids: List[Any] = []
+		self._rows: Dict[Any, int] = {}
+		self._next_id = 0
+		self._index: Optional[IVFIndex] = None
+
+	def __len__(self) -> int:
+		return self._count
+
+	def __contains__(self, id: object) -> bool:
+		return id in self._rows
+
+	@property
+	def ids(self) -> List[Any]:
+		"""Ids of the stored vectors, in row order."""
+		return list(self._ids)
+
+	@property
+	def vectors(self) -> np.ndarray:
+		"""The stored (normalized, for cosine) vectors; row `i` belongs to `ids[i]`."""
+		return self._vectors[: self._count]
+
+	@property
+	def index(self) -> Optional[IVFIndex]:
+		return self._index
+
+	def add(
+		self,
+		vectors: Union[EmbeddingsResponded, EmbeddingMatrix, np.ndarray, Iterable[Iterable[float]]],
+		ids: Optional[Iterable[Any]] = None,
+	) -> List[Any]:
+		"""
+		Add vectors and return their ids.
+
+		Arguments:
+			vectors: An embeddings result (list or matrix format), a 2-D array or a sequence of vectors
+			ids: One unique id per vector (str or int to be saved); consecutive integers when omitted
+		"""
+		matrix = as_matrix(vectors)
+		if self.dimensions is None:
+			self.dimensions = matrix.shape[1]
+			self._vectors = np.empty((0, self.dimensions), dtype=np.float32)
+		if matrix.shape[1] != self.dimensions:
+			raise ValueError(f'Expected vectors of {self.dimensions} dimensions, got {matrix.shape[1]}')
+		new_ids = self._new_ids(len(matrix), ids)
+		if self.metric == 'cosine':
+			matrix = _normalize(matrix)
+
+		start, end = self._count, self._count + len(matrix)
+		if end > len(self._vectors):
+			self._vectors = _grow(self._vectors, end)
+		self._vectors[start:end] = matrix
+		if self._index is not None:
+			self._index.add(matrix, start)
+		for row, id in enumerate(new_ids, start):
+			self._rows[id] = row
+		self._ids.extend(new_ids)
+		self._count = end
+		return new_ids
+
+	def _new_ids(self, count: int, ids: Optional[Iterable[Any]]) -> List[Any]:
+		if ids is None:
+			new_ids = []
+			while len(new_ids) < count:
+				if self._next_id not in self._rows:
+					new_ids.append(self._next_id)
+				self._next_id += 1
+			return new_ids
+		new_ids = list(ids)
+		if len(new_ids) != count:
+			raise ValueError(f'Expected {count} ids, got {len(new_ids)}')
+		if len(set(new_ids)) != count or any(id in self._rows for id in new_ids):
+			raise ValueError('Vector ids must be unique')
+		return new_ids
+
+	def delete(self, ids: Iterable[Any]) -> int:
+		"""Remove the vectors with the given ids and return how many were stored."""
+		removed = 0
+		for id in ids:
+			row = self._rows.pop(id, None)
+			if row is None:
+				continue
+			# keep the matrix dense by moving the last vector into the freed row
+			last = self._count - 1
+			if row != last:
+				self._vectors[row] = self._vectors[last]
+				moved = self._ids[row] = self._ids[last]
+				self._rows[moved] = row
+				if self._index is not None:
+					self._index.move(last, row)
+			self._ids.pop()
+			self._count = last
+			removed += 1
+		if removed and self._index is not None:
+			self._index.truncate(self._count)
+		return removed
+
+	def get(self, id: Any) -> np.ndarray:
+		"""Return the stored vector of `id` (normalized, for cosine)."""
+		return self._vectors[self._rows[id]]
+
+	def search(
+		self,
+		queries: Union[np.ndarray, Iterable[float], Iterable[Iterable[float]], EmbeddingsResponded, EmbeddingMatrix],
+		k: int = 10,
+		*,
+		nprobe: Optional[int] = None,
+		exact: bool = False,
+	) -> Union[List[SearchHit], List[List[SearchHit]]]:
+		"""
+		Return the `k` most similar vectors per query, best first.
+
+		Arguments:
+			queries: One vector, a batch of vectors or an embeddings result; a single vector
+				returns one list of hits, a batch one list per query
+			k (int): Number of hits per query
+			nprobe (int | None): Lists of the index scored per query, by default the index's `nprobe`
+			exact (bool): Score every vector even if an index was built
+		"""
+		single = isinstance(queries, np.ndarray) and queries.ndim == 1
+		if not isinstance(queries, (np.ndarray, EmbeddingsResponded, EmbeddingMatrix)):
+			queries = np.asarray(list(queries), dtype=np.float32)
+			single = queries.ndim == 1
+		matrix = as_matrix(queries)
+		if self.dimensions is not None and matrix.shape[1] != self.dimensions:
+			raise ValueError(f'Expected queries of {self.dimensions} dimensions, got {matrix.shape[1]}')
+		if self.metric == 'cosine':
+			matrix = _normalize(matrix)
+
+		k = min(k, self._count)
+		if k <= 0:
+			results: List[List[SearchHit]] = [[] for _ in range(len(matrix))]
+		elif self._index is not None and not exact:
+			results = [self._hits(rows, scores) for rows, scores in self._index.search(self.vectors, matrix, k, nprobe)]
+		else:
+			rows, scores = _exact_top_k(self.vectors, matrix, k)
+			results = [self._hits(row, score) for row, score in zip(rows, scores)]
+		return results[0] if single else results
+
+	def _hits(self, rows: np.ndarray, scores: np.ndarray) -> List[SearchHit]:
+		ids = self._ids
+		return [SearchHit(ids[row], score) for row, score in zip(rows.tolist(), scores.tolist())]
+
+	def build_index(
+		self,
+		nlist: Optional[int] = None,
+		*,
+		nprobe: int = 8,
+		quantize: bool = False,
+		rerank: int = 4,
+		sample_size: Optional[int] = None,
+		seed: int = 0,
+	) -> IVFIndex:
+		"""
+		Train an `IVFIndex` on the stored vectors; later searches use it unless `exact=True`.
+
+		Arguments:
+			nlist (int | None): Number of lists, by default about `sqrt(len(self))`
+			nprobe (int): Lists scored per query; higher is more accurate and slower
+			quantize (bool): Rank candidates on int8 codes before rescoring the best `rerank * k`
+			rerank (int): Candidates rescored exactly per hit, with `quantize`
+			sample_size (int | None): Vectors the centroids are trained on
+			seed (int): Seed of the training sample and initial centroids
+		"""
+		if not self._count:
+			raise ValueError('Cannot build an index over an empty store')
+		nlist = nlist or max(1, int(self._count**0.5))
+		index = IVFIndex.train(
+			self.vectors,
+			nlist,
+			nprobe=nprobe,
+			quantize=quantize,
+			rerank=rerank,
+			sample_size=sample_size,
+			seed=seed,
+		)
+		index.reserve(len(self._vectors))
+		for start in range(0, self._count, _CHUNK_ROWS):
+			index.add(self.vectors[start : start + _CHUNK_ROWS], start)
+		self._index = index
+		return index
+
+	def drop_index(self) -> None:
+		self._index = None
+
+	def save(self, path: Union[str, os.PathLike[str]]) -> None:
+		"""
+		Write the store into the directory `path`: the vectors (and index arrays) as `.npy`
+		files that `load()` memory-maps, and the ids and settings as JSON.
+		"""
+		os.makedirs(path, exist_ok=True)
+		np.save(os.path.join(path, 'vectors.npy'), self.vectors)
+		meta: Dict[str, Any] = {
+			'version': _FORMAT_VERSION,
+			'metric': self.metric,
+			'dimensions': self.dimensions,
+			'ids': self._ids,
+			'next_id': self._next_id,
+			'index': None,
+		}
+		if self._index is not None:
+			settings, arrays = self._index.state()
+			meta['index'] = {**settings, 'arrays': sorted(arrays)}
+			for name, array in arrays.items():
+				np.save(os.path.join(path, f'index_{name}.npy'), array)
+		with open(os.path.join(path, 'store.json'), 'w', encoding='utf-8') as file:
+			json.dump(meta, file)
+
+	@classmethod
+	def load(cls, path: Union[str, os.PathLike[str]], *, mmap: bool = True) -> VectorStore:
+		"""
+		Load a store written by `save()`. With `mmap=True` the arrays are memory-mapped
+		copy-on-write: pages are read on demand and changes never reach the files.
+		"""
+		with open(os.path.join(path, 'store.json'), encoding='utf-8') as file:
+			meta = json.load(file)
+		if meta.get('version') != _FORMAT_VERSION:
+			raise ValueError(f'Unsupported vector store format: {meta.get("version")!r}')
+		mmap_mode = 'c' if mmap else None
+
+		store = cls(meta['dimensions'], metric=meta['metric'])
+		store._vectors = np.load(os.path.join(path, 'vectors.npy'), mmap_mode=mmap_mode)
+		store._count = len(store._vectors)
+		store._ids = meta['ids']
+		store._rows = {id: row for row, id in enumerate(store._ids)}
+		store._next_id = meta['next_id']
+		if meta['index'] is not None:
+			arrays = {
+				name: np.load(os.path.join(path, f'index_{name}.npy'), mmap_mode=mmap_mode)
+				for name in meta['index']['arrays']
+			}
+			store._index = IVFIndex.from_state(meta['index'], arrays)
+		return store
+
+
+def as_matrix(vectors: Any) -> np.ndarray:
+	"""Return `vectors` as a 2-D float32 array, without copying when it already is one."""
+	if isinstance(vectors, EmbeddingMatrix):
+		if isinstance(vectors.vectors, np.ndarray):
+			matrix = vectors.vectors
+		else:
+			matrix = np.frombuffer(vectors.vectors, dtype=np.float32).reshape(len(vectors), vectors.dimensions)
+	elif isinstance(vectors, EmbeddingsResponded):
+		data = sorted(vectors.data, key=lambda item: item.index or 0)
+		matrix = np.array([item.embedding for item in data], dtype=np.float32)
+	else:
+		matrix = np.asarray(vectors, dtype=np.float32)
+	if matrix.ndim == 1:
+		matrix = matrix.reshape(1, -1)
+	if matrix.ndim != 2:
+		raise ValueError(f'Expected a 2-D array of vectors, got {matrix.ndim} dimensions')
+	return matrix
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+	norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+	norms[norms == 0] = 1
+	return matrix / norms
+
+
+def _exact_top_k(vectors: np.ndarray, queries: np.ndarray, k: int) -> tuple:
+	"""Batched brute-force top-k, scoring the corpus one chunk at a time."""
+	best_rows = np.empty((len(queries), 0), dtype=np.int64)
+	best_scores = np.empty((len(queries), 0), dtype=np.float32)
+	for start in range(0, len(vectors), _CHUNK_ROWS):
+		scores = queries @ vectors[start : start + _CHUNK_ROWS].T
+		rows, scores = _top_k(scores, k)
+		best_rows = np.concatenate([best_rows, rows + start], axis=1)
+		best_scores = np.concatenate([best_scores, scores], axis=1)
+		if best_rows.shape[1] > k:
+			top, best_scores = _top_k(best_scores, k)
+			best_rows = np.take_along_axis(best_rows, top, axis=1)
+	return best_rows, best_scores
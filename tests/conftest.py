@@ -2,11 +2,13 @@
 
 from importlib import util
 from pathlib import Path
-from typing import Dict, Sequence
+from typing import Callable, Dict, Sequence
 
+import httpx
 import pytest
 from pytest import Config, Function, Parser
 
+from zai import AsyncZaiClient, ZaiClient
 from zai.core.logs import (
 	get_config_dict,
 	get_log_file,
@@ -109,3 +111,37 @@ def test_file_path(request) -> Path:
 	test_file_path = Path(str(request.fspath)).parent
 	print('test_file_path:', test_file_path)
 	return test_file_path
+
+
+@pytest.fixture
+def make_client() -> Callable[..., ZaiClient]:
+	"""
+	Build `ZaiClient`s that talk to an in-process server instead of the network.
+
+	The server is an `httpx.MockTransport` handler, or a transport of its own for tests that
+	need to see the request body as it is sent. Keyword arguments are passed to the client,
+	which uses a fixed test API key unless it is given `api_key` or an `api_keys` pool.
+	"""
+
+	def make(handler, **kwargs) -> ZaiClient:
+		transport = handler if isinstance(handler, httpx.BaseTransport) else httpx.MockTransport(handler)
+		if 'api_keys' not in kwargs:
+			kwargs.setdefault('api_key', 'test-api-key')
+		kwargs.setdefault('base_url', 'https://api.test.com/v4')
+		return ZaiClient(http_client=httpx.Client(transport=transport), **kwargs)
+
+	return make
+
+
+@pytest.fixture
+def make_async_client() -> Callable[..., AsyncZaiClient]:
+	"""The `AsyncZaiClient` counterpart of `make_client`; handlers may be coroutine functions."""
+
+	def make(handler, **kwargs) -> AsyncZaiClient:
+		transport = handler if isinstance(handler, httpx.AsyncBaseTransport) else httpx.MockTransport(handler)
+		if 'api_keys' not in kwargs:
+			kwargs.setdefault('api_key', 'test-api-key')
+		kwargs.setdefault('base_url', 'https://api.test.com/v4')
+		return AsyncZaiClient(http_client=httpx.AsyncClient(transport=transport), **kwargs)
+
+	return make
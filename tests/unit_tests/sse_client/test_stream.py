@@ -1,11 +1,14 @@
 # -*- coding: utf-8 -*-
+import json
 from typing import Iterable, Type, cast
 
 import httpx
+import pytest
 
-from zai.core import HttpClient, StreamResponse, get_args
+from zai.core import APIResponseError, HttpClient, StreamResponse, get_args
 from zai.core._base_type import ResponseT
-from zai.types.chat.chat_completion_chunk import ChatCompletionChunk
+from zai.core._json_encoder import get_json_loads
+from zai.types.chat.chat_completion_chunk import ChatCompletionChunk, CompletionUsage
 
 
 class MockClient:
@@ -49,3 +52,65 @@ def test_stream_cls_chunk() -> None:
 	assert chat_completion_chunk2.choices[0].delta.role == 'assistant'
 	assert chat_completion_chunk2.choices[0].index == 0
 	assert chat_completion_chunk2.model == 'glm-4'
+
+
+def _stream(body: bytes, **kwargs) -> StreamResponse[ChatCompletionChunk]:
+	MockClient._process_response_data = HttpClient._process_response_data
+	return StreamResponse[ChatCompletionChunk](
+		cast_type=ChatCompletionChunk,
+		response=httpx.Response(
+			status_code=200, content=body, request=httpx.Request('POST', 'https://api.test.com/v4/chat/completions')
+		),
+		client=MockClient(),
+		**kwargs,
+	)
+
+
+def test_stream_parses_each_event_once() -> None:
+	calls = []
+
+	def json_loads(payload: bytes) -> object:
+		calls.append(bytes(payload))
+		return json.loads(payload)
+
+	stream = _stream(
+		b': keep-alive\n\n'
+		b'data: {"id":"1","choices":[{"index":0,"delta":{"content":"a"}}]}\n\n'
+		b'event: ping\n\n'
+		b'data: {"id":"1","choices":[{"index":0,"delta":{"content":"b"}}]}\n\n'
+		b'data: [DONE]\n\n',
+		json_loads=json_loads,
+	)
+
+	assert [chunk.choices[0].delta.content for chunk in stream] == ['a', 'b']
+	assert len(calls) == 2
+
+
+def test_stream_error_event() -> None:
+	stream = _stream(b'event: error\ndata: {"error":{"message":"quota exceeded"}}\n\n')
+
+	with pytest.raises(APIResponseError, match='quota exceeded'):
+		next(stream)
+
+
+def test_json_backends() -> None:
+	assert get_json_loads('json')(b'{"a":1}') == {'a': 1}
+	assert get_json_loads('auto')(bytearray(b'[1]')) == [1]
+	with pytest.raises(ValueError):
+		get_json_loads('simdjson')
+
+
+def test_iter_text() -> None:
+	stream = _stream(
+		b'data: {"id":"1","choices":[{"index":0,"delta":{"role":"assistant","content":"Hel"}}]}\n\n'
+		b'data: {"id":"1","choices":[{"index":0,"delta":{"reasoning_content":"hmm"}}]}\n\n'
+		b'data: {"id":"1","choices":[{"index":0,"delta":{"content":"lo"}}]}\n\n'
+		b'data: {"id":"1","choices":[{"index":0,"finish_reason":"stop","delta":{"content":""}}],'
+		b'"usage":{"prompt_tokens":3,"completion_tokens":2,"total_tokens":5}}\n\n'
+		b'data: [DONE]\n\n'
+	)
+
+	assert list(stream.iter_text()) == ['Hel', 'lo']
+	assert stream.finish_reason == 'stop'
+	assert isinstance(stream.usage, CompletionUsage)
+	assert stream.usage.total_tokens == 5
@@ -0,0 +1,158 @@
+import json
+
+import httpx
+import pytest
+
+from zai import AsyncZaiClient
+from zai.core import AsyncStreamResponse
+from zai.types.chat.chat_completion import Completion
+from zai.types.chat.chat_completion_chunk import ChatCompletionChunk
+
+COMPLETION = {
+	'id': 'cmpl-1',
+	'model': 'glm-4',
+	'created': 1715329207,
+	'choices': [{'index': 0, 'finish_reason': 'stop', 'message': {'role': 'assistant', 'content': 'hi'}}],
+	'usage': {'prompt_tokens': 1, 'completion_tokens': 1, 'total_tokens': 2},
+}
+
+
+async def test_async_chat_completion(make_async_client) -> None:
+	def handler(request: httpx.Request) -> httpx.Response:
+		assert request.url.path == '/v4/chat/completions'
+		assert request.headers['Authorization'] == 'Bearer test-api-key'
+		assert json.loads(request.content)['model'] == 'glm-4'
+		return httpx.Response(200, json=COMPLETION)
+
+	async with make_async_client(handler) as client:
+		completion = await client.chat.completions.create(
+			model='glm-4', messages=[{'role': 'user', 'content': 'hello'}]
+		)
+
+	assert isinstance(completion, Completion)
+	assert completion.choices[0].message.content == 'hi'
+	assert client.is_closed()
+
+
+async def test_async_chat_completion_stream(make_async_client) -> None:
+	def handler(request: httpx.Request) -> httpx.Response:
+		body = (
+			b'data: {"id":"1","model":"glm-4","choices":[{"index":0,"delta":{"role":"assistant","content":"1"}}]}\n\n'
+			b'data: {"id":"1","model":"glm-4","choices":[{"index":0,"delta":{"role":"assistant","content":"2"}}]}\n\n'
+			b'data: [DONE]\n\n'
+		)
+		return httpx.Response(200, content=body, headers={'content-type': 'text/event-stream'})
+
+	client = make_async_client(handler)
+	stream = await client.chat.completions.create(
+		model='glm-4', messages=[{'role': 'user', 'content': 'hello'}], stream=True
+	)
+	assert isinstance(stream, AsyncStreamResponse)
+
+	chunks = [chunk async for chunk in stream]
+	assert all(isinstance(chunk, ChatCompletionChunk) for chunk in chunks)
+	assert [chunk.choices[0].delta.content for chunk in chunks] == ['1', '2']
+	await client.close()
+
+
+async def test_async_chat_completion_stream_split_chunks(make_async_client) -> None:
+	body = (
+		b'data: {"id":"1","model":"glm-4","choices":[{"index":0,"delta":{"content":"a"}}]}\r\n\r\n'
+		b'data: {"id":"1","model":"glm-4","choices":[{"index":0,"delta":{"content":"b"}}]}\r\n\r\n'
+		b'data: [DONE]\r\n\r\n'
+	)
+
+	async def chunks():
+		for i in range(0, len(body), 7):
+			yield body[i : i + 7]
+
+	def handler(request: httpx.Request) -> httpx.Response:
+		return httpx.Response(200, content=chunks(), headers={'content-type': 'text/event-stream'})
+
+	client = make_async_client(handler)
+	stream = await client.chat.completions.create(
+		model='glm-4', messages=[{'role': 'user', 'content': 'hello'}], stream=True
+	)
+
+	assert [chunk.choices[0].delta.content async for chunk in stream] == ['a', 'b']
+	await client.close()
+
+
+async def test_async_stream_iter_text(make_async_client) -> None:
+	def handler(request: httpx.Request) -> httpx.Response:
+		body = (
+			b'data: {"id":"1","choices":[{"index":0,"delta":{"content":"a"}}]}\n\n'
+			b'data: {"id":"1","choices":[{"index":0,"delta":{"content":"b"},"finish_reason":"length"}],'
+			b'"usage":{"prompt_tokens":1,"completion_tokens":2,"total_tokens":3}}\n\n'
+			b'data: [DONE]\n\n'
+		)
+		return httpx.Response(200, content=body, headers={'content-type': 'text/event-stream'})
+
+	client = make_async_client(handler)
+	stream = await client.chat.completions.create(
+		model='glm-4', messages=[{'role': 'user', 'content': 'hello'}], stream=True
+	)
+
+	assert ''.join([text async for text in stream.iter_text()]) == 'ab'
+	assert stream.finish_reason == 'length'
+	assert stream.usage.completion_tokens == 2
+	await client.close()
+
+
+async def test_async_retry_uses_asyncio_sleep(monkeypatch, make_async_client) -> None:
+	calls = []
+	sleeps = []
+
+	def handler(request: httpx.Request) -> httpx.Response:
+		calls.append(request)
+		if len(calls) == 1:
+			return httpx.Response(500, json={'error': 'boom'})
+		return httpx.Response(200, json=COMPLETION)
+
+	async def fake_sleep(seconds: float) -> None:
+		sleeps.append(seconds)
+
+	monkeypatch.setattr('asyncio.sleep', fake_sleep)
+
+	client = make_async_client(handler, max_retries=2)
+	completion = await client.chat.completions.create(model='glm-4', messages=[{'role': 'user', 'content': 'hello'}])
+
+	assert completion.choices[0].message.content == 'hi'
+	assert len(calls) == 2
+	assert len(sleeps) == 1
+	await client.close()
+
+
+async def test_async_batches_list_pagination(make_async_client) -> None:
+	def batch(batch_id: str) -> dict:
+		return {
+			'id': batch_id,
+			'completion_window': '24h',
+			'created_at': 1,
+			'endpoint': '/v4/chat/completions',
+			'input_file_id': 'file-1',
+			'object': 'batch',
+			'status': 'completed',
+		}
+
+	def handler(request: httpx.Request) -> httpx.Response:
+		if request.url.params.get('after') is None:
+			return httpx.Response(200, json={'data': [batch('b1'), batch('b2')]})
+		if request.url.params['after'] == 'b2':
+			return httpx.Response(200, json={'data': [batch('b3')]})
+		return httpx.Response(200, json={'data': []})
+
+	client = make_async_client(handler)
+	page = await client.batches.list(limit=2)
+	ids = [item.id async for item in page]
+
+	assert ids == ['b1', 'b2', 'b3']
+	await client.close()
+
+
+async def test_async_client_requires_api_key(monkeypatch) -> None:
+	from zai.core import ZaiError
+
+	monkeypatch.delenv('ZAI_API_KEY', raising=False)
+	with pytest.raises(ZaiError):
+		AsyncZaiClient()
@@ -0,0 +1,175 @@
+import json
+import os
+import threading
+
+import httpx
+import pytest
+
+from zai.api_resource.batch import BatchRunError
+from zai.api_resource.batch.runner import async_submit_shards, write_shards
+from zai.core import APIStatusError
+from zai.types.batch import Batch
+
+
+class FakeBatchServer:
+	"""Files and batches endpoints answering every batch after `polls_until_done` polls."""
+
+	def __init__(self, polls_until_done: int = 1, fail: bool = False) -> None:
+		self.polls_until_done = polls_until_done
+		self.fail = fail
+		self.uploads = []
+		self.batches = {}
+		self.polls = 0
+		self.lock = threading.Lock()
+
+	def __call__(self, request: httpx.Request) -> httpx.Response:
+		path = request.url.path.replace('/v4', '', 1)
+		with self.lock:
+			if path == '/files':
+				content = request.read()
+				start = content.index(b'\r\n\r\n', content.index(b'filename=')) + 4
+				lines = content[start : content.index(b'\r\n--', start)].decode().splitlines()
+				file_id = f'file-{len(self.uploads)}'
+				self.uploads.append(lines)
+				return httpx.Response(200, json={'id': file_id, 'object': 'file', 'purpose': 'batch'})
+			if path == '/batches':
+				body = json.loads(request.content)
+				batch_id = f'batch-{len(self.batches)}'
+				self.batches[batch_id] = {'input': body['input_file_id'], 'polls': 0}
+				return httpx.Response(200, json=self._batch(batch_id, 'validating'))
+			if path.startswith('/batches/'):
+				batch_id = path.split('/')[2]
+				if path.endswith('/cancel'):
+					return httpx.Response(200, json=self._batch(batch_id, 'cancelling'))
+				self.polls += 1
+				state = self.batches[batch_id]
+				state['polls'] += 1
+				if state['polls'] < self.polls_until_done:
+					return httpx.Response(200, json=self._batch(batch_id, 'in_progress'))
+				if self.fail:
+					return httpx.Response(200, json=self._batch(batch_id, 'failed'))
+				return httpx.Response(200, json=self._batch(batch_id, 'completed', f'out-{state["input"]}'))
+			if path.startswith('/files/out-'):
+				lines = self.uploads[int(path.split('-')[-1].split('/')[0])]
+				output = []
+				for line in map(json.loads, lines):
+					body = {'choices': [{'message': {'content': line['body']['messages'][0]['content'].upper()}}]}
+					output.append({'custom_id': line['custom_id'], 'response': {'status_code': 200, 'body': body}})
+				return httpx.Response(200, content='\n'.join(map(json.dumps, output)).encode())
+		return httpx.Response(404)
+
+	def _batch(self, batch_id: str, status: str, output_file_id: str = None) -> dict:
+		return {
+			'id': batch_id,
+			'object': 'batch',
+			'endpoint': '/v1/chat/completions',
+			'input_file_id': self.batches[batch_id]['input'],
+			'completion_window': '24h',
+			'created_at': 0,
+			'status': status,
+			'output_file_id': output_file_id,
+		}
+
+
+def _requests(count: int):
+	for i in range(count):
+		yield {'model': 'glm-4', 'messages': [{'role': 'user', 'content': f'hello {i}'}]}
+
+
+def test_run_shards_uploads_and_collects_results(make_client) -> None:
+	server = FakeBatchServer(polls_until_done=2)
+	client = make_client(server)
+
+	run = client.batches.run(_requests(25), max_requests_per_batch=10, poll_interval=0)
+	results = dict(run)
+
+	assert sorted(len(lines) for lines in server.uploads) == [5, 10, 10]
+	assert json.loads(server.uploads[0][0])['url'] == '/v4/chat/completions'
+	assert len(results) == 25
+	assert results['request-24'].response.body['choices'][0]['message']['content'] == 'HELLO 24'
+	assert server.polls == 6
+	assert {batch.status for batch in run.batches} == {'completed'}
+
+
+def test_explicit_custom_ids_and_failed_batches(make_client) -> None:
+	server = FakeBatchServer(fail=True)
+	client = make_client(server)
+	requests = [{'custom_id': 'a', 'body': body} for body in _requests(1)]
+
+	run = client.batches.run(requests, poll_interval=0)
+	with pytest.raises(BatchRunError) as error:
+		list(run.results())
+	assert json.loads(server.uploads[0][0])['custom_id'] == 'a'
+	assert [batch.id for batch in error.value.batches] == ['batch-0']
+
+
+def test_failed_upload_cancels_created_batches(make_client) -> None:
+	server = FakeBatchServer()
+	cancelled = []
+
+	def handler(request: httpx.Request) -> httpx.Response:
+		if request.url.path.endswith('/cancel'):
+			cancelled.append(request.url.path.split('/')[-2])
+		if request.url.path.endswith('/files') and server.uploads:
+			return httpx.Response(400, json={'error': {'code': '1210', 'message': 'bad file'}})
+		return server(request)
+
+	client = make_client(handler)
+	with pytest.raises(APIStatusError):
+		client.batches.run(_requests(20), max_requests_per_batch=10, upload_concurrency=1)
+	assert cancelled == ['batch-0']
+
+
+def test_write_shards_respects_byte_limit_and_cleans_up() -> None:
+	lines = [b'x' * 9 + b'\n'] * 5
+	shards = list(write_shards(lines, max_requests=100, max_bytes=25))
+	assert [count for _, count in shards] == [2, 2, 1]
+	for path, _ in shards:
+		assert os.path.getsize(path) <= 25
+		os.remove(path)
+
+	with pytest.raises(ValueError):
+		list(write_shards([b'x' * 30], max_requests=100, max_bytes=25))
+
+
+async def test_async_shards_are_written_off_the_event_loop() -> None:
+	threads = []
+	paths = []
+
+	def lines():
+		for i in range(30):
+			threads.append(threading.current_thread())
+			yield b'{"custom_id": "request-%d"}' % i
+
+	async def submit(path):
+		paths.append(path)
+		if len(paths) == 2:
+			raise RuntimeError('upload failed')
+		return Batch.construct(id=path.name)
+
+	async def cancel(batch_id):
+		pass
+
+	shards = write_shards(lines(), max_requests=10, max_bytes=10**6)
+	with pytest.raises(RuntimeError):
+		await async_submit_shards(shards, submit, cancel, concurrency=1)
+
+	assert threads
+	assert threading.main_thread() not in threads
+	assert not any(path.exists() for path in paths)
+
+
+async def test_async_run(make_async_client) -> None:
+	server = FakeBatchServer(polls_until_done=2)
+
+	async def handler(request: httpx.Request) -> httpx.Response:
+		await request.aread()
+		return server(request)
+
+	client = make_async_client(handler)
+	run = await client.batches.run(_requests(15), max_requests_per_batch=10, poll_interval=0)
+	results = {custom_id: result async for custom_id, result in run}
+
+	assert len(server.uploads) == 2
+	assert sorted(results) == sorted(f'request-{i}' for i in range(15))
+	await client.close()
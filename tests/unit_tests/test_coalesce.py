@@ -0,0 +1,105 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from zai.core import APIStatusError
+
+EMBEDDING = {
+	'object': 'list',
+	'model': 'embedding-3',
+	'data': [{'object': 'embedding', 'index': 0, 'embedding': [0.1, 0.2]}],
+	'usage': {'prompt_tokens': 1, 'completion_tokens': 0, 'total_tokens': 1},
+}
+COMPLETION = {
+	'id': 'cmpl-1',
+	'choices': [{'index': 0, 'finish_reason': 'stop', 'message': {'role': 'assistant', 'content': 'hi'}}],
+	'usage': {'prompt_tokens': 1, 'completion_tokens': 1, 'total_tokens': 2},
+}
+
+
+def _wait_for_followers(client, count: int) -> None:
+	while client.coalescer.stats().coalesced < count:
+		threading.Event().wait(0.001)
+
+
+def test_identical_concurrent_requests_share_one_call(make_client) -> None:
+	calls = []
+
+	def handler(request: httpx.Request) -> httpx.Response:
+		calls.append(request)
+		_wait_for_followers(client, 3)
+		return httpx.Response(200, json=EMBEDDING)
+
+	client = make_client(handler, coalesce_requests=True)
+	with ThreadPoolExecutor(4) as pool:
+		results = list(pool.map(lambda _: client.embeddings.create(model='embedding-3', input='hello'), range(4)))
+
+	assert len(calls) == 1
+	assert all(result is results[0] for result in results)
+	assert results[0].data[0].embedding == [0.1, 0.2]
+	stats = client.coalescer.stats()
+	assert (stats.requests, stats.coalesced) == (1, 3)
+
+
+def test_errors_reach_every_caller(make_client) -> None:
+	calls = []
+
+	def handler(request: httpx.Request) -> httpx.Response:
+		calls.append(request)
+		_wait_for_followers(client, 1)
+		return httpx.Response(400, json={'error': {'code': '1214', 'message': 'bad input'}})
+
+	client = make_client(handler, coalesce_requests=True, max_retries=0)
+
+	def call(_):
+		with pytest.raises(APIStatusError):
+			client.moderations.create(model='moderation', input='hello')
+
+	with ThreadPoolExecutor(2) as pool:
+		list(pool.map(call, range(2)))
+	assert len(calls) == 1
+
+
+def test_non_idempotent_and_distinct_requests_are_not_coalesced(make_client) -> None:
+	client = make_client(lambda request: httpx.Response(200, json=COMPLETION), coalesce_requests=True)
+	coalescer = client.coalescer
+	headers = client._prepare_headers
+
+	from zai.core._request_opt import FinalRequestOptions
+
+	def key(url, body, method='post'):
+		options = FinalRequestOptions.construct(method=method, url=url, json_data=body)
+		return coalescer.key(options, headers(options), object)
+
+	assert key('/chat/completions', {'model': 'glm-4'}) is None
+	assert key('/files', None, method='delete') is None
+	assert key('/embeddings', {'input': 'a', 'model': 'm'}) == key('/embeddings', {'model': 'm', 'input': 'a'})
+	assert key('/embeddings', {'input': 'a'}) != key('/embeddings', {'input': 'b'})
+	assert key('/files/1', None, method='get') is not None
+
+	other_tenant = client.with_options(api_key='other-key')
+	options = FinalRequestOptions.construct(method='post', url='/embeddings', json_data={'input': 'a'})
+	assert coalescer.key(options, other_tenant._prepare_headers(options), object) != key('/embeddings', {'input': 'a'})
+
+
+async def test_async_identical_requests_share_one_call(make_async_client) -> None:
+	calls = []
+
+	async def handler(request: httpx.Request) -> httpx.Response:
+		calls.append(request)
+		await asyncio.sleep(0.01)
+		return httpx.Response(200, json=EMBEDDING)
+
+	client = make_async_client(handler, coalesce_requests=['/embeddings'])
+	results = await asyncio.gather(
+		*(client.embeddings.create(model='embedding-3', input='hello') for _ in range(5)),
+		client.embeddings.create(model='embedding-3', input='other'),
+	)
+
+	assert len(calls) == 2
+	assert all(result is results[0] for result in results[:5])
+	assert results[5] is not results[0]
+	await client.close()
@@ -0,0 +1,103 @@
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from zai.core import APIStatusError
+
+
+def _embed(request: httpx.Request) -> httpx.Response:
+	texts = json.loads(request.content)['input']
+	data = [{'object': 'embedding', 'index': index, 'embedding': [float(text[1:])]} for index, text in enumerate(texts)]
+	usage = {'prompt_tokens': len(texts), 'completion_tokens': 0, 'total_tokens': len(texts)}
+	return httpx.Response(200, json={'object': 'list', 'model': 'embedding-3', 'data': data, 'usage': usage})
+
+
+def test_concurrent_calls_share_requests(make_client) -> None:
+	sizes = []
+	lock = threading.Lock()
+
+	def handler(request: httpx.Request) -> httpx.Response:
+		with lock:
+			sizes.append(len(json.loads(request.content)['input']))
+		return _embed(request)
+
+	with make_client(handler).embeddings.batcher(model='embedding-3', max_batch_size=8, max_wait=0.05) as batcher:
+		with ThreadPoolExecutor(32) as pool:
+			vectors = list(pool.map(batcher.embed, [f't{i}' for i in range(32)]))
+
+	assert vectors == [[float(i)] for i in range(32)]
+	assert sum(sizes) == 32
+	assert len(sizes) < 32
+	assert max(sizes) <= 8
+	stats = batcher.stats()
+	assert (stats.calls, stats.requests) == (32, len(sizes))
+	assert stats.batch_factor > 1
+
+
+def test_max_wait_bounds_latency(make_client) -> None:
+	batcher = make_client(_embed).embeddings.batcher(model='embedding-3', max_wait=0.01)
+	start = time.monotonic()
+	assert batcher.embed('t7', timeout=5) == [7.0]
+	assert time.monotonic() - start < 1
+	batcher.close()
+	with pytest.raises(RuntimeError):
+		batcher.submit('t1')
+
+
+def test_errors_reach_every_caller_of_the_batch(make_client) -> None:
+	def handler(request: httpx.Request) -> httpx.Response:
+		return httpx.Response(400, json={'error': {'code': '1210', 'message': 'bad input'}})
+
+	with make_client(handler).embeddings.batcher(model='embedding-3', max_wait=0.05) as batcher:
+		futures = [batcher.submit(f't{i}') for i in range(3)]
+		for future in futures:
+			with pytest.raises(APIStatusError):
+				future.result(timeout=5)
+	assert batcher.stats().requests == 1
+
+
+def test_invalid_arguments(make_client) -> None:
+	with pytest.raises(ValueError):
+		make_client(_embed).embeddings.batcher(model='embedding-3', max_batch_size=0)
+
+
+async def test_async_batcher_merges_gathered_calls(make_async_client) -> None:
+	sizes = []
+
+	async def handler(request: httpx.Request) -> httpx.Response:
+		sizes.append(len(json.loads(request.content)['input']))
+		return _embed(request)
+
+	client = make_async_client(handler)
+	async with client.embeddings.batcher(model='embedding-3', max_batch_size=4) as batcher:
+		vectors = await asyncio.gather(*(batcher.embed(f't{i}') for i in range(10)))
+
+	assert vectors == [[float(i)] for i in range(10)]
+	assert sizes == [4, 4, 2]
+	await client.close()
+
+
+async def test_cancelled_batch_does_not_strand_its_callers(make_async_client) -> None:
+	started = asyncio.Event()
+
+	async def handler(request: httpx.Request) -> httpx.Response:
+		started.set()
+		await asyncio.Event().wait()
+
+	client = make_async_client(handler)
+	batcher = client.embeddings.batcher(model='embedding-3', max_wait=0.001)
+	futures = [batcher.submit('t1'), batcher.submit('t2')]
+	await started.wait()
+
+	# as at loop shutdown: the task sending the batch is cancelled
+	for task in list(batcher._tasks):
+		task.cancel()
+	done, _ = await asyncio.wait(futures, timeout=1)
+	assert len(done) == 2
+	assert all(future.cancelled() for future in futures)
+	await client.close()
@@ -0,0 +1,99 @@
+import base64
+import json
+import struct
+import time
+
+import httpx
+import pytest
+
+from zai.core import EmbeddingCache
+from zai.types.embeddings import EmbeddingMatrix
+
+
+def _vector(text: str) -> list:
+	return [float(len(text)), 0.5]
+
+
+def _server(sent: list):
+	def handler(request: httpx.Request) -> httpx.Response:
+		texts = json.loads(request.content)['input']
+		sent.append(texts)
+		data = [{'object': 'embedding', 'index': i, 'embedding': _vector(text)} for i, text in enumerate(texts)]
+		usage = {'prompt_tokens': len(texts), 'completion_tokens': 0, 'total_tokens': len(texts)}
+		return httpx.Response(200, json={'object': 'list', 'model': 'embedding-3', 'data': data, 'usage': usage})
+
+	return handler
+
+
+def test_only_distinct_misses_are_sent(make_client) -> None:
+	sent = []
+	client = make_client(_server(sent), embedding_cache=EmbeddingCache())
+
+	first = client.embeddings.create(input=['a', 'bb', 'a'], model='embedding-3')
+	second = client.embeddings.create(input=['ccc', ' bb', 'a'], model='embedding-3')
+
+	assert sent == [['a', 'bb'], ['ccc']]
+	assert [item.embedding for item in first.data] == [_vector('a'), _vector('bb'), _vector('a')]
+	assert [item.embedding for item in second.data] == [_vector('ccc'), _vector('bb'), _vector('a')]
+	assert [item.index for item in second.data] == [0, 1, 2]
+
+	stats = client.embedding_cache.stats()
+	assert (stats.hits, stats.misses, stats.deduplicated, stats.entries) == (2, 3, 1, 3)
+	assert stats.hit_rate == pytest.approx(2 / 5)
+	assert stats.bytes_saved == 2 * 8
+
+
+def test_keys_include_model_and_dimensions(make_client) -> None:
+	sent = []
+	client = make_client(_server(sent), embedding_cache=EmbeddingCache())
+	client.embeddings.create(input='a', model='embedding-3')
+	client.embeddings.create(input='a', model='embedding-3', dimensions=256)
+	client.embeddings.create(input='a', model='embedding-2')
+	client.embeddings.create(input='a', model='embedding-3', cache=False)
+	client.embeddings.create(input='a', model='embedding-3')
+	assert len(sent) == 4
+
+
+def test_base64_results_keep_their_format(make_client) -> None:
+	sent = []
+	client = make_client(_server(sent), embedding_cache=EmbeddingCache())
+	client.embeddings.create(input='a', model='embedding-3')
+
+	# served from the cache, still in the requested encoding
+	result = client.embeddings.create(input=['a', 'bb'], model='embedding-3', encoding_format='base64')
+	assert sent == [['a'], ['bb']]
+	assert [base64.b64decode(item.embedding) for item in result.data] == [
+		struct.pack('<2f', *_vector('a')),
+		struct.pack('<2f', *_vector('bb')),
+	]
+
+
+def test_matrix_results_and_persistence(tmp_path, make_client) -> None:
+	sent = []
+	path = tmp_path / 'embeddings.sqlite'
+	client = make_client(_server(sent), embedding_cache=EmbeddingCache(path))
+	client.embeddings.create(input=['a', 'bb'], model='embedding-3')
+
+	client = make_client(_server(sent), embedding_cache=EmbeddingCache(path))
+	matrix = client.embeddings.create(input=['bb', 'a'], model='embedding-3', vector_format='array')
+	assert len(sent) == 1
+	assert isinstance(matrix, EmbeddingMatrix)
+	assert matrix.tolist() == [_vector('bb'), _vector('a')]
+	assert matrix.usage.total_tokens == 0
+
+
+def test_eviction_by_size_and_age(monkeypatch) -> None:
+	cache = EmbeddingCache(max_bytes=16)
+	row = struct.pack('<2f', 1.0, 2.0)
+	cache.put_many([(b'a', row), (b'b', row)])
+	cache.get_many([b'a'])
+	cache.put_many([(b'c', row)])
+
+	assert set(cache.get_many([b'a', b'b', b'c'])) == {b'a', b'c'}
+	assert cache.stats().evictions == 1
+	assert cache.stats().bytes == 16
+
+	now = time.time()
+	monkeypatch.setattr(time, 'time', lambda: now + 100)
+	assert cache.evict(max_age=50) == 2
+	assert cache.stats().entries == 0
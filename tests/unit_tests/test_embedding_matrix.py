@@ -0,0 +1,73 @@
+import base64
+import json
+import struct
+from array import array
+
+import httpx
+import pytest
+
+from zai.types.embeddings import EmbeddingMatrix
+
+VECTORS = [[0.5, -1.0, 2.0], [1.5, 0.25, -0.75]]
+
+
+def _payload(encoding: str = 'float') -> dict:
+	def encode(vector):
+		return base64.b64encode(struct.pack('<3f', *vector)).decode() if encoding == 'base64' else vector
+
+	data = [{'object': 'embedding', 'index': index, 'embedding': encode(VECTORS[index])} for index in (1, 0)]
+	usage = {'prompt_tokens': 2, 'completion_tokens': 0, 'total_tokens': 2}
+	return {'object': 'list', 'model': 'embedding-3', 'data': data, 'usage': usage}
+
+
+@pytest.mark.parametrize('encoding', ['float', 'base64'])
+def test_array_format_returns_one_float32_buffer(encoding, make_client) -> None:
+	def handler(request: httpx.Request) -> httpx.Response:
+		assert json.loads(request.content)['encoding_format'] == encoding
+		return httpx.Response(200, json=_payload(encoding))
+
+	matrix = make_client(handler).embeddings.create(
+		input=['a', 'b'], model='embedding-3', encoding_format=encoding, vector_format='array'
+	)
+
+	assert isinstance(matrix, EmbeddingMatrix)
+	assert isinstance(matrix.vectors, array) and matrix.vectors.typecode == 'f'
+	assert (len(matrix), matrix.dimensions, matrix.nbytes) == (2, 3, 24)
+	assert matrix.tolist() == VECTORS
+	assert list(matrix[-1]) == VECTORS[1]
+	assert matrix.model == 'embedding-3'
+	assert matrix.usage.total_tokens == 2
+
+
+def test_create_many_concatenates_batches(make_client) -> None:
+	def handler(request: httpx.Request) -> httpx.Response:
+		texts = json.loads(request.content)['input']
+		data = [{'object': 'embedding', 'index': i, 'embedding': [float(text), 0.0]} for i, text in enumerate(texts)]
+		usage = {'prompt_tokens': len(texts), 'completion_tokens': 0, 'total_tokens': len(texts)}
+		return httpx.Response(200, json={'object': 'list', 'model': 'embedding-3', 'data': data, 'usage': usage})
+
+	texts = [str(i) for i in range(5)]
+	client = make_client(handler)
+	matrix = client.embeddings.create_many(texts, model='embedding-3', batch_size=2, vector_format='array')
+
+	assert matrix.tolist() == [[float(i), 0.0] for i in range(5)]
+	assert matrix.usage.prompt_tokens == 5
+
+
+def test_unknown_format_fails_before_sending(make_client) -> None:
+	def handler(request: httpx.Request) -> httpx.Response:
+		raise AssertionError('no request expected')
+
+	with pytest.raises(ValueError):
+		make_client(handler).embeddings.create(input='a', model='embedding-3', vector_format='matrix')
+
+
+def test_numpy_format_wraps_the_decoded_buffer() -> None:
+	numpy = pytest.importorskip('numpy')
+	content = json.dumps(_payload('base64')).encode()
+	matrix = EmbeddingMatrix.from_json(content, 'numpy')
+
+	assert matrix.vectors.dtype == numpy.float32
+	assert matrix.vectors.shape == (2, 3)
+	assert not matrix.vectors.flags.owndata
+	assert matrix.vectors.tolist() == VECTORS
@@ -0,0 +1,118 @@
+import asyncio
+import json
+import threading
+import time
+
+import httpx
+import pytest
+
+from zai.core import RetryPolicy
+
+
+def _embed(request: httpx.Request) -> httpx.Response:
+	texts = json.loads(request.content)['input']
+	# answer out of order, like a server that parallelizes internally
+	data = [
+		{'object': 'embedding', 'index': index, 'embedding': [float(text[1:])]}
+		for index, text in reversed(list(enumerate(texts)))
+	]
+	usage = {'prompt_tokens': len(texts), 'completion_tokens': 0, 'total_tokens': len(texts)}
+	return httpx.Response(200, json={'object': 'list', 'model': 'embedding-3', 'data': data, 'usage': usage})
+
+
+TEXTS = [f't{i}' for i in range(10)]
+
+
+def test_results_are_reassembled_in_input_order(make_client) -> None:
+	sizes = []
+
+	def handler(request: httpx.Request) -> httpx.Response:
+		sizes.append(len(json.loads(request.content)['input']))
+		return _embed(request)
+
+	result = make_client(handler).embeddings.create_many(TEXTS, model='embedding-3', batch_size=3, concurrency=3)
+
+	assert sorted(sizes) == [1, 3, 3, 3]
+	assert [item.index for item in result.data] == list(range(10))
+	assert [item.embedding for item in result.data] == [[float(i)] for i in range(10)]
+	assert (result.usage.prompt_tokens, result.usage.total_tokens) == (10, 10)
+
+
+def test_batches_run_in_parallel(make_client) -> None:
+	in_flight = []
+	peak = []
+	lock = threading.Lock()
+
+	def handler(request: httpx.Request) -> httpx.Response:
+		with lock:
+			in_flight.append(request)
+			peak.append(len(in_flight))
+		time.sleep(0.02)
+		with lock:
+			in_flight.remove(request)
+		return _embed(request)
+
+	make_client(handler).embeddings.create_many(TEXTS, model='embedding-3', batch_size=2, concurrency=4)
+	assert max(peak) == 4
+
+
+def test_failed_batches_are_retried_individually(make_client) -> None:
+	calls = []
+
+	def handler(request: httpx.Request) -> httpx.Response:
+		texts = json.loads(request.content)['input']
+		calls.append(texts[0])
+		if texts[0] == 't4' and calls.count('t4') == 1:
+			return httpx.Response(503, json={'error': {'code': '500', 'message': 'busy'}})
+		return _embed(request)
+
+	client = make_client(handler, retry_policy=RetryPolicy(initial_delay=0.001, max_delay=0.001))
+	result = client.embeddings.create_many(TEXTS, model='embedding-3', batch_size=4, concurrency=2)
+
+	assert sorted(calls) == ['t0', 't4', 't4', 't8']
+	assert [item.embedding for item in result.data] == [[float(i)] for i in range(10)]
+
+
+@pytest.mark.parametrize('vector_format', ['list', 'array'])
+def test_batches_without_usage_count_as_zero_tokens(vector_format, make_client) -> None:
+	def handler(request: httpx.Request) -> httpx.Response:
+		response = _embed(request)
+		body = json.loads(response.content)
+		if body['data'][0]['embedding'] != [9.0]:
+			del body['usage']
+		return httpx.Response(200, json=body)
+
+	result = make_client(handler).embeddings.create_many(
+		TEXTS, model='embedding-3', batch_size=3, vector_format=vector_format
+	)
+
+	assert len(result.data if vector_format == 'list' else result) == 10
+	assert (result.usage.prompt_tokens, result.usage.total_tokens) == (1, 1)
+
+
+def test_invalid_arguments(make_client) -> None:
+	client = make_client(_embed)
+	with pytest.raises(TypeError):
+		client.embeddings.create_many('one text', model='embedding-3')
+	with pytest.raises(ValueError):
+		client.embeddings.create_many(TEXTS, model='embedding-3', batch_size=0)
+	assert client.embeddings.create_many([], model='embedding-3').data == []
+
+
+async def test_async_create_many_limits_concurrency(make_async_client) -> None:
+	in_flight = []
+	peak = []
+
+	async def handler(request: httpx.Request) -> httpx.Response:
+		in_flight.append(request)
+		peak.append(len(in_flight))
+		await asyncio.sleep(0.01)
+		in_flight.remove(request)
+		return _embed(request)
+
+	client = make_async_client(handler)
+	result = await client.embeddings.create_many(TEXTS, model='embedding-3', batch_size=2, concurrency=2)
+
+	assert max(peak) == 2
+	assert [item.embedding for item in result.data] == [[float(i)] for i in range(10)]
+	await client.close()
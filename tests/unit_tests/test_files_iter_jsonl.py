@@ -0,0 +1,98 @@
+import json
+
+import httpx
+import pytest
+
+from zai.types.batch import BatchResult
+
+LINES = [json.dumps({'custom_id': f'request-{i}', 'response': {'status_code': 200}}).encode() for i in range(6)]
+LINES[2] = b'{"custom_id": "broken'
+CONTENT = b'\n'.join(LINES) + b'\n'
+
+
+class BrokenStream(httpx.SyncByteStream):
+	"""Yields `content` in small chunks and drops the connection after `fail_after` bytes."""
+
+	def __init__(self, content: bytes, fail_after=None) -> None:
+		self.content = content
+		self.fail_after = fail_after
+		self.closed = False
+
+	def __iter__(self):
+		for start in range(0, len(self.content), 7):
+			if self.fail_after is not None and start >= self.fail_after:
+				raise httpx.ReadError('connection dropped')
+			yield self.content[start : start + 7]
+
+	def close(self) -> None:
+		self.closed = True
+
+
+def test_lines_are_parsed_incrementally_and_errors_reported(make_client) -> None:
+	errors = []
+	client = make_client(lambda request: httpx.Response(200, stream=BrokenStream(CONTENT)))
+
+	results = list(client.files.iter_jsonl('file-1', on_error=errors.append))
+
+	assert all(isinstance(result, BatchResult) for result in results)
+	assert [result.custom_id for result in results] == ['request-0', 'request-1', 'request-3', 'request-4', 'request-5']
+	assert [(error.line_number, error.offset) for error in errors] == [(3, len(LINES[0]) + len(LINES[1]) + 2)]
+	assert errors[0].line == LINES[2]
+
+
+def test_dropped_connection_resumes_with_range(make_client) -> None:
+	ranges = []
+
+	def handler(request: httpx.Request) -> httpx.Response:
+		ranges.append(request.headers.get('range'))
+		if len(ranges) == 1:
+			return httpx.Response(200, stream=BrokenStream(CONTENT, fail_after=len(LINES[0]) + 20))
+		start = int(request.headers['range'][len('bytes=') : -1])
+		headers = {'Content-Range': f'bytes {start}-{len(CONTENT) - 1}/{len(CONTENT)}'}
+		return httpx.Response(206, headers=headers, stream=BrokenStream(CONTENT[start:]))
+
+	results = list(make_client(handler).files.iter_jsonl('file-1', model=None, on_error=lambda error: None))
+
+	assert ranges == [None, f'bytes={len(LINES[0]) + 1}-']
+	assert [result['custom_id'] for result in results] == [
+		'request-0',
+		'request-1',
+		'request-3',
+		'request-4',
+		'request-5',
+	]
+
+
+def test_resume_skips_ahead_when_range_is_ignored(make_client) -> None:
+	calls = []
+
+	def handler(request: httpx.Request) -> httpx.Response:
+		calls.append(request)
+		fail_after = 30 if len(calls) == 1 else None
+		return httpx.Response(200, stream=BrokenStream(CONTENT, fail_after=fail_after))
+
+	results = list(make_client(handler).files.iter_jsonl('file-1', on_error=lambda error: None))
+	assert len(calls) == 2
+	assert len(results) == 5
+
+	calls.clear()
+	with pytest.raises(httpx.ReadError):
+		list(make_client(handler).files.iter_jsonl('file-1', max_resumes=0))
+
+
+def test_early_exit_closes_the_response(make_client) -> None:
+	stream = BrokenStream(CONTENT)
+	results = make_client(lambda request: httpx.Response(200, stream=stream)).files.iter_jsonl('file-1')
+	assert next(results).custom_id == 'request-0'
+	results.close()
+	assert stream.closed
+
+
+async def test_async_iter_jsonl(make_async_client) -> None:
+	async def handler(request: httpx.Request) -> httpx.Response:
+		return httpx.Response(200, content=CONTENT)
+
+	client = make_async_client(handler)
+	results = [result async for result in client.files.iter_jsonl('file-1', on_error=lambda error: None)]
+	assert len(results) == 5
+	await client.close()
@@ -5,7 +5,8 @@ import pytest
 from typing import Optional, List
 
 from zai.core._base_models import BaseModel
-from zai.core._json_encoder import ZAIJSONEncoder, json_dumps
+from zai.core._base_type import NOT_GIVEN
+from zai.core._json_encoder import ZAIJSONEncoder, encode_json_body, json_dumps
 from zai.core._http_client import HttpClient
 
 
@@ -156,6 +157,66 @@ def test_completion_message_like_serialization():
 	assert result == expected
 
 
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch):
+	"""Run a test against each JSON body encoder, skipping orjson when it is not installed."""
+	if request.param == "orjson":
+		pytest.importorskip("orjson")
+	else:
+		monkeypatch.setattr("zai.core._json_encoder.orjson", None)
+	return request.param
+
+
+def test_encode_json_body(backend):
+	"""Test that request bodies are encoded to compact bytes with BaseModel and NotGiven handling."""
+
+	body = {
+		"model": "glm-4",
+		"messages": [{"role": "user", "content": "héllo"}, MessageForTest(content="hi", role="assistant")],
+		"extra": {"top_k": NOT_GIVEN, "n": 1},
+	}
+	data = encode_json_body(body)
+
+	assert isinstance(data, bytes)
+	assert b", " not in data
+	assert json.loads(data) == {
+		"model": "glm-4",
+		"messages": [{"role": "user", "content": "héllo"}, {"content": "hi", "role": "assistant"}],
+		"extra": {"n": 1},
+	}
+	assert "héllo".encode() in data
+
+
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), -float("inf")])
+def test_encode_json_body_rejects_non_finite_floats(backend, value):
+	"""Test that both encoders reject NaN and infinities instead of sending them."""
+	with pytest.raises(ValueError):
+		encode_json_body({"temperature": 0.5, "extra": {"scores": [1.0, value]}, "stop": None})
+	with pytest.raises(ValueError):
+		encode_json_body({"messages": [MessageForTest(content="hi", role="user")], "top_p": value})
+
+
+def test_encode_json_body_falls_back_for_big_ints():
+	"""Test that values orjson rejects are still encoded by the standard library."""
+	assert json.loads(encode_json_body({"n": 2**70})) == {"n": 2**70}
+
+
+def test_request_body_is_sent_as_content():
+	"""Test that HttpClient sends the pre-serialized body with a JSON content type."""
+	from zai.core._request_opt import FinalRequestOptions
+
+	client = HttpClient(base_url="https://test.com", version="v1", _strict_response_validation=True, timeout=10.0)
+	options = FinalRequestOptions.construct(
+		method="post",
+		url="/chat",
+		json_data={"messages": [MessageForTest(content="hello", role="user")], "stream": NOT_GIVEN},
+	)
+	request = client._build_request(options)
+
+	assert request.headers["Content-Type"].startswith("application/json")
+	assert json.loads(request.content) == {"messages": [{"content": "hello", "role": "user"}]}
+
+
 if __name__ == "__main__":
 	# Run basic tests
 	test_base_model_dict_conversion()
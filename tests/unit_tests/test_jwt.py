@@ -22,3 +22,48 @@ def test_token() -> None:
 	apikey = 'invalid_api_key'
 	with pytest.raises(Exception):
 		generate_token(apikey)
+
+
+def test_token_manager_reuses_and_refreshes_ahead(monkeypatch) -> None:
+	from zai.core import _jwt_token
+
+	now = [1000.0]
+	monkeypatch.setattr(_jwt_token.time, 'monotonic', lambda: now[0])
+	signed = []
+	monkeypatch.setattr(_jwt_token, 'generate_token', lambda apikey: signed.append(apikey) or f'token-{len(signed)}')
+
+	manager = _jwt_token.TokenManager('12345678.abcdefg')
+	assert manager.get_token() == 'token-1'
+	assert manager.get_token() == 'token-1'
+
+	# another caller holds the refresh: the current, still valid token is handed out without waiting
+	now[0] += _jwt_token.CACHE_TTL_SECONDS + 1
+	with manager._lock:
+		assert manager.get_token() == 'token-1'
+	assert manager.get_token() == 'token-2'
+
+	now[0] += _jwt_token.API_TOKEN_TTL_SECONDS
+	assert manager.get_token() == 'token-3'
+	assert len(signed) == 3
+
+
+def test_client_caches_default_headers(monkeypatch) -> None:
+	from zai import ZaiClient
+	from zai.core import _jwt_token
+
+	signed = []
+	monkeypatch.setattr(_jwt_token, 'generate_token', lambda apikey: signed.append(apikey) or f'jwt-{apikey}')
+
+	client = ZaiClient(api_key='12345678.abcdefg', disable_token_cache=False, custom_headers={'x-a': '1'})
+	headers = client._default_headers
+	assert headers['Authorization'] == 'Bearer jwt-12345678.abcdefg'
+	assert client._default_headers is headers
+	assert signed == ['12345678.abcdefg']
+
+	client.custom_headers = {'x-a': '2'}
+	assert client._default_headers['x-a'] == '2'
+
+	client.api_key = '87654321.gfedcba'
+	assert client._default_headers['Authorization'] == 'Bearer jwt-87654321.gfedcba'
+	assert client._default_headers['x-a'] == '2'
+	client.close()
@@ -0,0 +1,114 @@
+import httpx
+import pytest
+
+from zai.core import ApiKeyPool, APIReachLimitError
+
+COMPLETION = {
+	'id': 'cmpl-1',
+	'choices': [{'index': 0, 'finish_reason': 'stop', 'message': {'role': 'assistant', 'content': 'hi'}}],
+	'usage': {'prompt_tokens': 1, 'completion_tokens': 1, 'total_tokens': 2},
+}
+
+
+def test_least_in_flight_spreads_concurrent_requests() -> None:
+	pool = ApiKeyPool(['a.1', 'b.2', 'c.3'])
+
+	leases = [pool.acquire() for _ in range(3)]
+	assert sorted(lease.api_key for lease in leases) == ['a.1', 'b.2', 'c.3']
+
+	leases[1].release()
+	assert pool.acquire().api_key == 'b.2'
+	assert pool.stats()['b'].in_flight == 1
+	assert pool.stats()['b'].requests == 2
+
+
+def test_weighted_round_robin() -> None:
+	pool = ApiKeyPool({'a.1': 2, 'b.2': 1}, strategy='round_robin')
+
+	picked = []
+	for _ in range(6):
+		lease = pool.acquire()
+		picked.append(lease.api_key)
+		lease.release()
+
+	assert picked.count('a.1') == 4
+	assert picked.count('b.2') == 2
+	assert picked[:3] == ['a.1', 'b.2', 'a.1']
+
+
+def test_stats_keep_keys_with_colliding_masked_ids() -> None:
+	pool = ApiKeyPool(['short', 'tiny', 'team.secret-1', 'team.secret-2'])
+
+	for _ in range(4):
+		pool.acquire()
+
+	stats = pool.stats()
+	assert list(stats) == ['***', '***#2', 'team', 'team#2']
+	assert all(entry.requests == 1 for entry in stats.values())
+
+
+def test_invalid_pool_arguments() -> None:
+	with pytest.raises(ValueError):
+		ApiKeyPool([])
+	with pytest.raises(ValueError):
+		ApiKeyPool({'a.1': 0})
+	with pytest.raises(ValueError):
+		ApiKeyPool(['a.1'], strategy='random')
+
+
+def test_rate_limited_key_is_quarantined_and_retried_on_another(monkeypatch, make_client) -> None:
+	monkeypatch.setattr('time.sleep', lambda seconds: None)
+	seen = []
+
+	def handler(request: httpx.Request) -> httpx.Response:
+		seen.append(request.headers['Authorization'])
+		if request.headers['Authorization'] == 'Bearer a.1':
+			return httpx.Response(429, headers={'retry-after': '20'}, json={'error': {'code': '1302'}})
+		return httpx.Response(200, json=COMPLETION)
+
+	client = make_client(handler, api_keys=['a.1', 'b.2'])
+	for _ in range(3):
+		client.chat.completions.create(model='glm-4', messages=[])
+
+	assert seen == ['Bearer a.1', 'Bearer b.2', 'Bearer b.2', 'Bearer b.2']
+	stats = client.key_pool.stats()
+	assert stats['a'].errors == 1
+	assert stats['a'].quarantines == 1
+	assert 19 < stats['a'].quarantined_for <= 20
+	assert stats['b'].requests == 3
+	assert all(key.in_flight == 0 for key in stats.values())
+
+
+def test_fully_quarantined_pool_still_sends(monkeypatch, make_client) -> None:
+	def handler(request: httpx.Request) -> httpx.Response:
+		return httpx.Response(429, json={'error': {'code': '1302'}})
+
+	client = make_client(handler, api_keys=['a.1'], max_retries=0)
+	for _ in range(2):
+		with pytest.raises(APIReachLimitError):
+			client.chat.completions.create(model='glm-4', messages=[])
+
+	assert client.key_pool.stats()['a'].requests == 2
+
+
+async def test_async_key_pool_uses_jwt_per_key(make_async_client) -> None:
+	import jwt
+
+	key_ids = []
+
+	def handler(request: httpx.Request) -> httpx.Response:
+		token = request.headers['Authorization'].split(' ', 1)[1]
+		key_ids.append(jwt.decode(token, options={'verify_signature': False})['api_key'])
+		return httpx.Response(200, json=COMPLETION)
+
+	client = make_async_client(
+		handler,
+		api_keys=['key1.secret1', 'key2.secret2'],
+		key_strategy='round_robin',
+		disable_token_cache=False,
+	)
+	for _ in range(4):
+		await client.chat.completions.create(model='glm-4', messages=[])
+
+	assert key_ids == ['key1', 'key2', 'key1', 'key2']
+	await client.close()
@@ -0,0 +1,61 @@
+import httpx
+
+from zai.core import lazy_model_type
+from zai.types.chat.chat_completion_chunk import ChatCompletionChunk, ChoiceDelta
+
+CHUNK = {
+	'id': '1',
+	'model': 'glm-4',
+	'choices': [
+		{
+			'index': 0,
+			'delta': {
+				'content': 'hi',
+				'tool_calls': [{'index': 0, 'function': {'name': 'get_weather', 'arguments': '{"city"'}}],
+			},
+		}
+	],
+	'usage': {'prompt_tokens': 1, 'completion_tokens': 2, 'total_tokens': 3},
+}
+
+
+def test_lazy_chunk_attributes() -> None:
+	LazyChunk = lazy_model_type(ChatCompletionChunk)
+	assert lazy_model_type(ChatCompletionChunk) is LazyChunk
+
+	chunk = LazyChunk.build(response=httpx.Response(200), data=CHUNK)
+	assert chunk._values is None
+
+	delta = chunk.choices[0].delta
+	assert delta.content == 'hi'
+	assert delta.role is None
+	assert delta.tool_calls[0].function.arguments == '{"city"'
+	assert chunk.usage.total_tokens == 3
+	assert chunk.created is None
+	assert chunk.choices is chunk.choices
+
+	model = chunk.to_model()
+	assert isinstance(model, ChatCompletionChunk)
+	assert isinstance(model.choices[0].delta, ChoiceDelta)
+	assert model.choices[0].delta.tool_calls[0].function.name == 'get_weather'
+
+
+def test_lazy_chunk_mode_stream(make_client) -> None:
+	body = (
+		b'data: {"id":"1","choices":[{"index":0,"delta":{"content":"a"}}]}\n\n'
+		b'data: {"id":"1","choices":[{"index":0,"delta":{"content":"b"}}]}\n\n'
+		b'data: [DONE]\n\n'
+	)
+
+	def handler(request: httpx.Request) -> httpx.Response:
+		assert 'chunk_mode' not in request.content.decode()
+		return httpx.Response(200, content=body, headers={'content-type': 'text/event-stream'})
+
+	client = make_client(handler)
+	stream = client.chat.completions.create(
+		model='glm-4', messages=[{'role': 'user', 'content': 'hello'}], stream=True, chunk_mode='lazy'
+	)
+	chunks = list(stream)
+
+	assert [type(chunk).__name__ for chunk in chunks] == ['LazyChatCompletionChunk'] * 2
+	assert [chunk.choices[0].delta.content for chunk in chunks] == ['a', 'b']
@@ -0,0 +1,129 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from zai.core import AsyncRequestLimiter, ModelLimit, RequestLimiter
+
+COMPLETION = {
+	'id': 'cmpl-1',
+	'choices': [{'index': 0, 'finish_reason': 'stop', 'message': {'role': 'assistant', 'content': 'hi'}}],
+	'usage': {'prompt_tokens': 1, 'completion_tokens': 1, 'total_tokens': 2},
+}
+
+
+class ConcurrencyProbe:
+	def __init__(self) -> None:
+		self.lock = threading.Lock()
+		self.current = 0
+		self.peak = 0
+
+	def __enter__(self) -> None:
+		with self.lock:
+			self.current += 1
+			self.peak = max(self.peak, self.current)
+
+	def __exit__(self, *args) -> None:
+		with self.lock:
+			self.current -= 1
+
+
+def test_sync_concurrency_limit(make_client) -> None:
+	probe = ConcurrencyProbe()
+
+	def handler(request: httpx.Request) -> httpx.Response:
+		with probe:
+			time.sleep(0.02)
+		return httpx.Response(200, json=COMPLETION)
+
+	client = make_client(handler, concurrency_limits={'GLM-4.5-Flash': 2})
+
+	def call() -> None:
+		client.chat.completions.create(model='glm-4.5-flash', messages=[{'role': 'user', 'content': 'hi'}])
+
+	threads = [threading.Thread(target=call) for _ in range(6)]
+	for thread in threads:
+		thread.start()
+	for thread in threads:
+		thread.join()
+
+	assert probe.peak == 2
+	stats = client.limiter.stats()['glm-4.5-flash']
+	assert stats.acquired == 6
+	assert stats.in_flight == 0
+	assert stats.waited >= 1
+	assert stats.max_wait > 0
+
+
+def test_unlisted_model_is_not_limited() -> None:
+	limiter = RequestLimiter({'glm-4.5-flash': 1})
+	assert limiter.acquire('glm-4.6') is None
+	assert limiter.acquire(None) is None
+
+	release = limiter.acquire('glm-4.5-flash')
+	release()
+	release()
+	assert limiter.stats()['glm-4.5-flash'].in_flight == 0
+
+
+def test_token_bucket_rate() -> None:
+	limiter = RequestLimiter({'*': ModelLimit(requests_per_second=50, burst=1)})
+
+	start = time.monotonic()
+	for _ in range(3):
+		limiter.acquire('any-model')()
+	elapsed = time.monotonic() - start
+
+	assert elapsed >= 0.035
+	assert limiter.stats()['any-model'].waited == 2
+
+
+def test_invalid_limit() -> None:
+	with pytest.raises(ValueError):
+		ModelLimit(0)
+
+
+async def test_async_stream_holds_slot_until_closed(make_async_client) -> None:
+	async def body():
+		yield b'data: {"id":"1","choices":[{"index":0,"delta":{"content":"a"}}]}\n\n'
+		yield b'data: [DONE]\n\n'
+
+	def handler(request: httpx.Request) -> httpx.Response:
+		return httpx.Response(200, content=body(), headers={'content-type': 'text/event-stream'})
+
+	client = make_async_client(handler, concurrency_limits={'glm-4.5-flash': 1})
+	messages = [{'role': 'user', 'content': 'hi'}]
+
+	first = await client.chat.completions.create(model='glm-4.5-flash', messages=messages, stream=True)
+	second = asyncio.ensure_future(
+		client.chat.completions.create(model='glm-4.5-flash', messages=messages, stream=True)
+	)
+	await asyncio.sleep(0.01)
+	assert not second.done()
+	assert client.limiter.stats()['glm-4.5-flash'].waiting == 1
+
+	assert [text async for text in first.iter_text()] == ['a']
+	stream = await asyncio.wait_for(second, 1)
+	assert [text async for text in stream.iter_text()] == ['a']
+
+	stats = client.limiter.stats()['glm-4.5-flash']
+	assert stats.in_flight == 0
+	assert stats.waited == 1
+	await client.close()
+
+
+async def test_async_wakeup_survives_a_cancelled_waiter() -> None:
+	limiter = AsyncRequestLimiter({'*': ModelLimit(1)})
+	release = await limiter.acquire('glm-4')
+	b = asyncio.ensure_future(limiter.acquire('glm-4'))
+	c = asyncio.ensure_future(limiter.acquire('glm-4'))
+	await asyncio.sleep(0)
+
+	# b is woken, but cancelled before it runs and takes the free slot
+	release()
+	b.cancel()
+	release_c = await asyncio.wait_for(c, 1)
+	assert b.cancelled()
+	release_c()
@@ -0,0 +1,117 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+PAGE_SIZE = 3
+TOTAL = 12
+
+
+def _page(request: httpx.Request) -> httpx.Response:
+	after = request.url.params.get('after')
+	start = int(after.split('-')[1]) + 1 if after else 0
+	data = [
+		{
+			'id': f'batch-{i}',
+			'object': 'batch',
+			'endpoint': '/v1/chat/completions',
+			'input_file_id': 'file-1',
+			'completion_window': '24h',
+			'created_at': 0,
+			'status': 'completed',
+		}
+		for i in range(start, min(start + PAGE_SIZE, TOTAL))
+	]
+	return httpx.Response(200, json={'object': 'list', 'data': data, 'has_more': start + PAGE_SIZE < TOTAL})
+
+
+class SlowServer:
+	def __init__(self, delay: float) -> None:
+		self.delay = delay
+		self.requests = []
+		self.lock = threading.Lock()
+
+	def __call__(self, request: httpx.Request) -> httpx.Response:
+		with self.lock:
+			self.requests.append(request.url.params.get('after'))
+		time.sleep(self.delay)
+		return _page(request)
+
+
+def test_prefetch_overlaps_fetching_with_processing(make_client) -> None:
+	def consume(prefetch: int) -> float:
+		client = make_client(SlowServer(0.05))
+		start = time.monotonic()
+		ids = []
+		for page in client.batches.list(limit=PAGE_SIZE).iter_pages(prefetch=prefetch):
+			time.sleep(0.05)  # processing
+			ids.extend(batch.id for batch in page.data)
+		assert ids == [f'batch-{i}' for i in range(TOTAL)]
+		return time.monotonic() - start
+
+	serial = consume(0)
+	prefetched = consume(2)
+	assert prefetched < serial * 0.8
+
+
+def test_auto_paging_iter_and_early_exit(make_client) -> None:
+	server = SlowServer(0.01)
+	page = make_client(server).batches.list(limit=PAGE_SIZE)
+	assert [batch.id for batch in page.auto_paging_iter(prefetch=1)] == [f'batch-{i}' for i in range(TOTAL)]
+
+	server.requests.clear()
+	items = page.auto_paging_iter(prefetch=1)
+	assert next(items).id == 'batch-0'
+	items.close()
+	time.sleep(0.1)
+	# at most the page in flight and the one waiting in the queue were fetched
+	assert len(server.requests) <= 2
+
+
+def test_errors_surface_in_the_consumer(make_client) -> None:
+	def handler(request: httpx.Request) -> httpx.Response:
+		if request.url.params.get('after'):
+			return httpx.Response(400, json={'error': {'code': '1210', 'message': 'bad cursor'}})
+		return _page(request)
+
+	pages = make_client(handler).batches.list(limit=PAGE_SIZE).iter_pages(prefetch=2)
+	assert len(next(pages).data) == PAGE_SIZE
+	with pytest.raises(Exception, match='bad cursor'):
+		next(pages)
+	with pytest.raises(ValueError):
+		list(make_client(handler).batches.list(limit=PAGE_SIZE).iter_pages(prefetch=-1))
+
+
+async def test_async_prefetch_and_cancellation(make_async_client) -> None:
+	requests = []
+	completed = []
+	release = asyncio.Event()
+
+	async def handler(request: httpx.Request) -> httpx.Response:
+		requests.append(request.url.params.get('after'))
+		if len(requests) > 1:
+			await release.wait()
+		completed.append(request.url.params.get('after'))
+		return _page(request)
+
+	client = make_async_client(handler)
+	first = await client.batches.list(limit=PAGE_SIZE)
+	release.set()
+	assert [batch.id async for batch in first.auto_paging_iter(prefetch=2)] == [f'batch-{i}' for i in range(TOTAL)]
+
+	release.clear()
+	requests.clear()
+	completed.clear()
+	pages = first.iter_pages(prefetch=1)
+	await pages.__anext__()
+	await asyncio.sleep(0.05)
+	# one page waits in the queue while the fetch of the next one is blocked
+	assert (requests, completed) == (['batch-2', 'batch-5'], ['batch-2'])
+	await pages.aclose()
+	release.set()
+	await asyncio.sleep(0.05)
+	# the blocked fetch was cancelled instead of completing
+	assert completed == ['batch-2']
+	await client.close()
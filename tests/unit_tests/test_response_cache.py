@@ -0,0 +1,205 @@
+import gzip
+import time
+
+import httpx
+import pytest
+
+from zai import ZaiClient
+from zai.core import CachedResponse, DirectoryCacheStore, ResponseCache, SQLiteCacheStore
+
+EMBEDDING = {
+	'object': 'list',
+	'model': 'embedding-3',
+	'data': [{'object': 'embedding', 'index': 0, 'embedding': [0.1, 0.2]}],
+	'usage': {'prompt_tokens': 1, 'completion_tokens': 0, 'total_tokens': 1},
+}
+COMPLETION = {
+	'id': 'cmpl-1',
+	'choices': [{'index': 0, 'finish_reason': 'stop', 'message': {'role': 'assistant', 'content': 'hi'}}],
+	'usage': {'prompt_tokens': 1, 'completion_tokens': 1, 'total_tokens': 2},
+}
+SSE_EVENTS = [
+	b'data: {"id":"1","choices":[{"index":0,"delta":{"content":"a"}}]}\n\n',
+	b'data: {"id":"1","choices":[{"index":0,"delta":{"content":"b"}}]}\n\n',
+	b'data: [DONE]\n\n',
+]
+
+
+def test_cached_embeddings_skip_the_network(make_client) -> None:
+	calls = []
+
+	def handler(request: httpx.Request) -> httpx.Response:
+		calls.append(request)
+		return httpx.Response(200, json=EMBEDDING)
+
+	client = make_client(handler, response_cache=ResponseCache())
+	first = client.embeddings.create(model='embedding-3', input='hello')
+	second = client.embeddings.create(model='embedding-3', input='hello')
+	client.embeddings.create(model='embedding-3', input='other')
+	client.embeddings.create(model='embedding-3', input='hello', cache=False)
+
+	assert len(calls) == 3
+	assert second.data[0].embedding == first.data[0].embedding == [0.1, 0.2]
+	stats = client.response_cache.stats()
+	assert (stats.hits, stats.misses, stats.stores, stats.entries) == (1, 2, 2, 2)
+	assert stats.hit_rate == pytest.approx(1 / 3)
+
+
+def test_only_deterministic_chat_calls_are_cached_by_default(make_client) -> None:
+	calls = []
+
+	def handler(request: httpx.Request) -> httpx.Response:
+		calls.append(request)
+		return httpx.Response(200, json=COMPLETION)
+
+	client = make_client(handler, response_cache=ResponseCache())
+	messages = [{'role': 'user', 'content': 'hello'}]
+	for _ in range(2):
+		client.chat.completions.create(model='glm-4', messages=messages)
+	assert len(calls) == 2
+
+	for _ in range(2):
+		client.chat.completions.create(model='glm-4', messages=messages, do_sample=False)
+	for _ in range(2):
+		client.chat.completions.create(model='glm-4', messages=messages, seed=7)
+	for _ in range(2):
+		client.chat.completions.create(model='glm-4', messages=messages, temperature=0.5, cache=True)
+	assert len(calls) == 5
+
+
+def test_streamed_responses_are_replayed(make_client) -> None:
+	calls = []
+
+	def handler(request: httpx.Request) -> httpx.Response:
+		calls.append(request)
+		return httpx.Response(200, headers={'Content-Type': 'text/event-stream'}, content=iter(SSE_EVENTS))
+
+	client = make_client(handler, response_cache=ResponseCache())
+	messages = [{'role': 'user', 'content': 'hello'}]
+
+	def contents():
+		stream = client.chat.completions.create(model='glm-4', messages=messages, do_sample=False, stream=True)
+		return [chunk.choices[0].delta.content for chunk in stream]
+
+	assert contents() == ['a', 'b']
+	assert contents() == ['a', 'b']
+	assert len(calls) == 1
+	assert client.response_cache.stats().hits == 1
+
+
+def test_compressed_streams_are_replayed(tmp_path, make_client) -> None:
+	body = gzip.compress(b''.join(SSE_EVENTS))
+	calls = []
+
+	def handler(request: httpx.Request) -> httpx.Response:
+		calls.append(request)
+		chunks = iter([body[:10], body[10:]])
+		headers = {'Content-Type': 'text/event-stream', 'Content-Encoding': 'gzip'}
+		return httpx.Response(200, headers=headers, content=chunks)
+
+	def contents(client: ZaiClient):
+		stream = client.chat.completions.create(model='glm-4', messages=[], do_sample=False, stream=True)
+		return [chunk.choices[0].delta.content for chunk in stream]
+
+	store = DirectoryCacheStore(tmp_path)
+	client = make_client(handler, response_cache=ResponseCache(store=store))
+	assert contents(client) == ['a', 'b']
+	# replayed from memory, then from the persistent store by a fresh cache
+	assert contents(client) == ['a', 'b']
+	assert contents(make_client(handler, response_cache=ResponseCache(store=store))) == ['a', 'b']
+	assert len(calls) == 1
+
+
+def test_file_parser_results_are_cached_once_finished(make_client) -> None:
+	bodies = [b'{"status": "processing"}', b'{"status": "processing"}', b'parsed text']
+	calls = []
+
+	def handler(request: httpx.Request) -> httpx.Response:
+		calls.append(request)
+		return httpx.Response(200, content=bodies[min(len(calls), len(bodies)) - 1])
+
+	client = make_client(handler, response_cache=ResponseCache())
+	results = [client.file_parser.content('t1', format_type='text').content for _ in range(4)]
+
+	assert results == [bodies[0], bodies[1], b'parsed text', b'parsed text']
+	assert len(calls) == 3
+	assert client.response_cache.stats().stores == 1
+
+
+def test_partially_read_streams_are_not_stored(make_client) -> None:
+	def handler(request: httpx.Request) -> httpx.Response:
+		return httpx.Response(200, headers={'Content-Type': 'text/event-stream'}, content=iter(SSE_EVENTS))
+
+	client = make_client(handler, response_cache=ResponseCache())
+	stream = client.chat.completions.create(model='glm-4', messages=[], do_sample=False, stream=True)
+	next(iter(stream))
+	stream.response.close()
+	assert client.response_cache.stats().stores == 0
+
+
+def test_tenants_do_not_share_entries(make_client) -> None:
+	calls = []
+
+	def handler(request: httpx.Request) -> httpx.Response:
+		calls.append(request.headers['Authorization'])
+		return httpx.Response(200, json=EMBEDDING)
+
+	cache = ResponseCache()
+	client = make_client(handler, response_cache=cache, api_key='key-a')
+	client.embeddings.create(model='embedding-3', input='hello')
+	client.with_options(api_key='key-b').embeddings.create(model='embedding-3', input='hello')
+	client.embeddings.create(model='embedding-3', input='hello')
+	assert calls == ['Bearer key-a', 'Bearer key-b']
+
+
+def _entry(size: int) -> CachedResponse:
+	return CachedResponse(200, [('content-type', 'application/json')], b'x' * size)
+
+
+def test_ttl_and_lru_eviction(monkeypatch) -> None:
+	cache = ResponseCache(max_bytes=400, max_entry_bytes=200, ttl=10)
+	cache.set('a', _entry(100))
+	cache.set('b', _entry(100))
+	cache.get('a')
+	cache.set('c', _entry(150))
+	cache.set('huge', _entry(250))
+
+	assert cache.get('b') is None
+	assert cache.get('huge') is None
+	assert cache.get('a') is not None
+	stats = cache.stats()
+	assert (stats.evictions, stats.entries) == (1, 2)
+
+	now = time.time()
+	monkeypatch.setattr(time, 'time', lambda: now + 11)
+	assert cache.get('a') is None
+	assert cache.stats().expirations == 1
+
+
+@pytest.mark.parametrize('store_cls', [SQLiteCacheStore, DirectoryCacheStore])
+def test_persistent_store_survives_restarts(tmp_path, store_cls) -> None:
+	key = ResponseCache.make_key('POST', 'https://api.test.com/v4/embeddings', b'{}', 'ns')
+	ResponseCache(store=store_cls(tmp_path / 'cache')).set(key, _entry(10))
+
+	restarted = ResponseCache(store=store_cls(tmp_path / 'cache'))
+	entry = restarted.get(key)
+	assert entry is not None
+	assert entry.content == b'x' * 10
+	assert entry.headers == [('content-type', 'application/json')]
+	assert restarted.stats().store_hits == 1
+	assert restarted.get(key) is entry
+
+
+async def test_async_client_uses_the_cache(make_async_client) -> None:
+	calls = []
+
+	def handler(request: httpx.Request) -> httpx.Response:
+		calls.append(request)
+		return httpx.Response(200, json=EMBEDDING)
+
+	client = make_async_client(handler, response_cache=ResponseCache())
+	for _ in range(3):
+		result = await client.embeddings.create(model='embedding-3', input='hello')
+	assert result.data[0].embedding == [0.1, 0.2]
+	assert len(calls) == 1
+	await client.close()
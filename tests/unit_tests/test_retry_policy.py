@@ -0,0 +1,137 @@
+import email.utils
+import time
+
+import httpx
+import pytest
+
+from zai.core import APIReachLimitError, APITimeoutError, RetryBudget, RetryPolicy, parse_retry_after
+from zai.core._retry import RetryState
+
+COMPLETION = {
+	'id': 'cmpl-1',
+	'choices': [{'index': 0, 'finish_reason': 'stop', 'message': {'role': 'assistant', 'content': 'hi'}}],
+	'usage': {'prompt_tokens': 1, 'completion_tokens': 1, 'total_tokens': 2},
+}
+
+
+@pytest.fixture
+def sleeps(monkeypatch) -> list:
+	calls = []
+	monkeypatch.setattr('time.sleep', calls.append)
+	return calls
+
+
+def test_parse_retry_after() -> None:
+	assert parse_retry_after(None) is None
+	assert parse_retry_after(httpx.Headers({'retry-after-ms': '1500'})) == 1.5
+	assert parse_retry_after(httpx.Headers({'retry-after': '3'})) == 3.0
+	assert parse_retry_after(httpx.Headers({'retry-after': 'soon'})) is None
+
+	date = email.utils.formatdate(time.time() + 30, usegmt=True)
+	assert 28 < parse_retry_after(httpx.Headers({'retry-after': date})) <= 30
+
+
+def test_retry_after_header_is_honored(sleeps, make_client) -> None:
+	calls = []
+
+	def handler(request: httpx.Request) -> httpx.Response:
+		calls.append(request)
+		if len(calls) == 1:
+			return httpx.Response(429, headers={'retry-after-ms': '250'}, json={'error': {'code': '1302'}})
+		return httpx.Response(200, json=COMPLETION)
+
+	completion = make_client(handler).chat.completions.create(model='glm-4', messages=[])
+
+	assert completion.choices[0].message.content == 'hi'
+	assert sleeps == [0.25]
+
+
+def test_decorrelated_jitter_bounds() -> None:
+	policy = RetryPolicy(initial_delay=0.5, max_delay=8.0)
+	state = RetryState()
+	previous = 0.5
+	for _ in range(20):
+		delay = policy.retry_delay(state)
+		assert 0.5 <= delay <= min(8.0, previous * 3)
+		previous = delay
+
+
+def test_error_class_budget(sleeps, make_client) -> None:
+	calls = []
+
+	def handler(request: httpx.Request) -> httpx.Response:
+		calls.append(request)
+		raise httpx.ReadTimeout('timed out', request=request)
+
+	client = make_client(handler, max_retries=5, retry_policy=RetryPolicy(error_budgets={'timeout': 1}))
+	with pytest.raises(APITimeoutError):
+		client.chat.completions.create(model='glm-4', messages=[])
+
+	assert len(calls) == 2
+	assert len(sleeps) == 1
+
+
+def test_client_wide_retry_budget(sleeps, make_client) -> None:
+	calls = []
+
+	def handler(request: httpx.Request) -> httpx.Response:
+		calls.append(request)
+		return httpx.Response(429, json={'error': {'code': '1302'}})
+
+	budget = RetryBudget(max_tokens=4, token_ratio=1)
+	client = make_client(handler, max_retries=3, retry_policy=RetryPolicy(budget=budget))
+
+	with pytest.raises(APIReachLimitError):
+		client.chat.completions.create(model='glm-4', messages=[])
+	# tokens 4 -> 3 (retry) -> 2 (no longer above half): one retry only
+	assert len(calls) == 2
+
+	calls.clear()
+	with pytest.raises(APIReachLimitError):
+		client.chat.completions.create(model='glm-4', messages=[])
+	assert len(calls) == 1
+
+	budget.record_success()
+	budget.record_success()
+	assert budget.tokens == 3
+
+
+def test_retries_resend_the_same_body(sleeps, make_client) -> None:
+	requests = []
+
+	def handler(request: httpx.Request) -> httpx.Response:
+		requests.append(request)
+		if len(requests) < 3:
+			return httpx.Response(503, json={'error': 'busy'})
+		return httpx.Response(200, json=COMPLETION)
+
+	client = make_client(handler, max_retries=3)
+	client.chat.completions.create(model='glm-4', messages=[{'role': 'user', 'content': 'hi'}])
+
+	assert len(requests) == 3
+	assert all(request is requests[0] for request in requests)
+	assert requests[0].content is requests[-1].content
+
+
+def test_attempt_hooks_report_timings(sleeps, make_client) -> None:
+	attempts = []
+	calls = []
+
+	def handler(request: httpx.Request) -> httpx.Response:
+		calls.append(request)
+		if len(calls) == 1:
+			raise httpx.ConnectError('refused', request=request)
+		if len(calls) == 2:
+			return httpx.Response(429, headers={'retry-after': '1'}, json={'error': {'code': '1302'}})
+		return httpx.Response(200, json=COMPLETION)
+
+	client = make_client(handler, max_retries=3, attempt_hooks=[attempts.append])
+	client.chat.completions.create(model='glm-4', messages=[])
+
+	assert [attempt.attempt for attempt in attempts] == [1, 2, 3]
+	assert [attempt.status_code for attempt in attempts] == [None, 429, 200]
+	assert isinstance(attempts[0].error, httpx.ConnectError)
+	assert [attempt.will_retry for attempt in attempts] == [True, True, False]
+	assert attempts[1].retry_delay == 1.0
+	assert all(attempt.elapsed >= 0 for attempt in attempts)
+	assert sleeps == [attempts[0].retry_delay, 1.0]
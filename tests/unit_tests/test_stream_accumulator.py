@@ -0,0 +1,127 @@
+import httpx
+
+from zai.api_resource.chat import ChatCompletionStreamAccumulator
+from zai.core import construct_type
+from zai.types.chat.chat_completion import Completion
+from zai.types.chat.chat_completion_chunk import ChatCompletionChunk
+
+CHUNKS = [
+	{
+		'id': 'c1',
+		'model': 'glm-4.5',
+		'created': 1,
+		'choices': [{'index': 0, 'delta': {'role': 'assistant', 'reasoning_content': 'Let me '}}],
+	},
+	{'id': 'c1', 'choices': [{'index': 0, 'delta': {'reasoning_content': 'think.'}}]},
+	{'id': 'c1', 'choices': [{'index': 0, 'delta': {'content': 'Checking '}}]},
+	{'id': 'c1', 'choices': [{'index': 0, 'delta': {'content': 'the weather.'}}]},
+	{
+		'id': 'c1',
+		'choices': [
+			{
+				'index': 0,
+				'delta': {
+					'tool_calls': [
+						{
+							'index': 0,
+							'id': 'call_1',
+							'type': 'function',
+							'function': {'name': 'get_weather', 'arguments': '{"ci'},
+						}
+					]
+				},
+			}
+		],
+	},
+	{
+		'id': 'c1',
+		'choices': [{'index': 0, 'delta': {'tool_calls': [{'index': 0, 'function': {'arguments': 'ty": "Paris"}'}}]}}],
+	},
+	{
+		'id': 'c1',
+		'choices': [{'index': 0, 'finish_reason': 'tool_calls', 'delta': {}}],
+		'usage': {'prompt_tokens': 5, 'completion_tokens': 7, 'total_tokens': 12},
+	},
+]
+
+SSE_BODY = (
+	b''.join(b'data: ' + httpx.Response(200, json=chunk).content + b'\n\n' for chunk in CHUNKS) + b'data: [DONE]\n\n'
+)
+
+
+def _assert_completion(completion: Completion) -> None:
+	assert isinstance(completion, Completion)
+	assert completion.id == 'c1'
+	assert completion.model == 'glm-4.5'
+	choice = completion.choices[0]
+	assert choice.finish_reason == 'tool_calls'
+	assert choice.message.role == 'assistant'
+	assert choice.message.content == 'Checking the weather.'
+	assert choice.message.reasoning_content == 'Let me think.'
+	assert choice.message.tool_calls[0].id == 'call_1'
+	assert choice.message.tool_calls[0].function.name == 'get_weather'
+	assert choice.message.tool_calls[0].function.arguments == '{"city": "Paris"}'
+	assert completion.usage.total_tokens == 12
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+	return httpx.Response(200, content=SSE_BODY, headers={'content-type': 'text/event-stream'})
+
+
+def _network_handler(request: httpx.Request) -> httpx.Response:
+	# a generator body is read from the transport as it is consumed, not loaded up front
+	return httpx.Response(200, content=iter([SSE_BODY]), headers={'content-type': 'text/event-stream'})
+
+
+def test_accumulator_accepts_models_and_dicts() -> None:
+	accumulator = ChatCompletionStreamAccumulator()
+	for i, chunk in enumerate(CHUNKS):
+		accumulator.add(chunk if i % 2 else construct_type(type_=ChatCompletionChunk, value=chunk))
+
+	_assert_completion(accumulator.get_final_completion())
+
+
+def test_stream_get_final_completion_after_partial_iteration(make_client) -> None:
+	client = make_client(_handler)
+	stream = client.chat.completions.create(model='glm-4.5', messages=[{'role': 'user', 'content': 'hi'}], stream=True)
+
+	first = next(stream)
+	assert first.choices[0].delta.reasoning_content == 'Let me '
+	_assert_completion(stream.get_final_completion())
+	assert list(stream) == []
+
+
+async def test_async_stream_get_final_completion(make_async_client) -> None:
+	client = make_async_client(_handler)
+	stream = await client.chat.completions.create(
+		model='glm-4.5', messages=[{'role': 'user', 'content': 'hi'}], stream=True, chunk_mode='lazy'
+	)
+
+	_assert_completion(await stream.get_final_completion())
+	await client.close()
+
+
+def test_iter_text_then_get_final_completion(make_client) -> None:
+	client = make_client(_network_handler)
+	stream = client.chat.completions.create(model='glm-4.5', messages=[{'role': 'user', 'content': 'hi'}], stream=True)
+
+	assert list(stream.iter_text()) == ['Checking ', 'the weather.']
+	assert stream.finish_reason == 'tool_calls'
+	_assert_completion(stream.get_final_completion())
+
+
+async def test_async_iter_text_then_get_final_completion(make_async_client) -> None:
+	async def body():
+		yield SSE_BODY
+
+	async def handler(request: httpx.Request) -> httpx.Response:
+		return httpx.Response(200, content=body(), headers={'content-type': 'text/event-stream'})
+
+	client = make_async_client(handler)
+	stream = await client.chat.completions.create(
+		model='glm-4.5', messages=[{'role': 'user', 'content': 'hi'}], stream=True
+	)
+
+	assert [text async for text in stream.iter_text()] == ['Checking ', 'the weather.']
+	_assert_completion(await stream.get_final_completion())
+	await client.close()
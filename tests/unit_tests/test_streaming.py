@@ -1,8 +1,10 @@
-from typing import Iterator
+from typing import AsyncIterator, Iterator
 
+import httpx
 import pytest
 
-from zai.core._streaming import SSELineParser
+from zai.core import APIResponseError, HttpClient, StreamResponse
+from zai.core._streaming import SSEBytesDecoder, SSELineParser
 
 
 def test_basic() -> None:
@@ -90,3 +92,63 @@ def test_multiple_events_with_data() -> None:
 
 	with pytest.raises(StopIteration):
 		next(it)
+
+
+def test_bytes_decoder_event_split_across_chunks() -> None:
+	def body() -> Iterator[bytes]:
+		yield b'event: completion\r\nda'
+		yield b'ta: {"foo":'
+		yield b'true}\r\n\r'
+		yield b'\ndata: {"bar":false}\n'
+		yield b'\n'
+
+	events = list(SSEBytesDecoder().iter_bytes(body()))
+
+	assert [sse.event for sse in events] == ['completion', None]
+	assert [sse.json_data() for sse in events] == [{'foo': True}, {'bar': False}]
+
+
+def test_bytes_decoder_fields() -> None:
+	def body() -> Iterator[bytes]:
+		yield b': keep-alive\n\n'
+		yield b'id: 7\nretry: 100\ndata: first\ndata: second\n\n'
+		yield 'data: 你好'.encode('utf-8')
+
+	events = list(SSEBytesDecoder().iter_bytes(body()))
+
+	assert len(events) == 2
+	assert events[0].id == '7'
+	assert events[0].retry == 100
+	assert events[0].data == 'first\nsecond'
+	assert events[1].data == '你好'
+
+
+async def test_bytes_decoder_async() -> None:
+	async def body() -> AsyncIterator[bytes]:
+		for byte in b'event: ping\n\ndata: {"foo":true}\n\n':
+			yield bytes([byte])
+
+	events = [sse async for sse in SSEBytesDecoder().aiter_bytes(body())]
+
+	assert [sse.event for sse in events] == ['ping', None]
+	assert events[1].json_data() == {'foo': True}
+
+
+class _Client:
+	_strict_response_validation = False
+	_process_response_data = HttpClient._process_response_data
+
+
+def _stream(body: bytes) -> StreamResponse:
+	request = httpx.Request('POST', 'https://api.test.com/v4/v1/agents')
+	return StreamResponse(
+		cast_type=object, response=httpx.Response(200, content=body, request=request), client=_Client()
+	)
+
+
+def test_agent_chunks_with_error_are_yielded_but_error_events_raise() -> None:
+	chunk = b'data: {"agent_id": "a1", "error": {"message": "tool failed"}}\n\n'
+	assert list(_stream(chunk + b'data: [DONE]\n\n')) == [{'agent_id': 'a1', 'error': {'message': 'tool failed'}}]
+
+	with pytest.raises(APIResponseError, match='tool failed'):
+		list(_stream(b'event: error\n' + chunk))
@@ -0,0 +1,116 @@
+import io
+import os
+
+import httpx
+import pytest
+
+from zai.core import UploadFile
+
+CONTENT = os.urandom(300 * 1024 + 17)
+
+
+class Upload(httpx.BaseTransport):
+	"""
+	Reads the multipart body chunk by chunk, the way a real connection sends it.
+
+	`httpx.MockTransport` reads the whole request body up front, and keeps it for retries.
+	"""
+
+	def __init__(self, failures: int = 0) -> None:
+		self.failures = failures
+		self.bodies = []
+		self.headers = []
+
+	def handle_request(self, request: httpx.Request) -> httpx.Response:
+		self.headers.append(request.headers)
+		self.bodies.append(b''.join(request.stream))
+		if len(self.bodies) <= self.failures:
+			return httpx.Response(503, json={'error': 'busy'})
+		return httpx.Response(200, json={'id': 'file-1', 'object': 'file', 'bytes': len(CONTENT)})
+
+
+@pytest.fixture
+def upload_path(tmp_path):
+	path = tmp_path / 'knowledge.pdf'
+	path.write_bytes(CONTENT)
+	return path
+
+
+def test_path_is_streamed_in_chunks_with_progress(upload_path, make_client) -> None:
+	server = Upload()
+	progress = []
+
+	result = make_client(server).files.create(file=upload_path, purpose='retrieval', on_progress=progress.append)
+
+	assert result.id == 'file-1'
+	body = server.bodies[0]
+	assert CONTENT in body
+	assert b'filename="knowledge.pdf"' in body
+	assert int(server.headers[0]['content-length']) == len(body)
+	# one report per 64 KiB chunk, never the whole file at once
+	assert len(progress) == 5
+	assert [report.bytes_sent for report in progress][-1] == len(CONTENT)
+	assert all(report.total_bytes == len(CONTENT) for report in progress)
+	assert progress[-1].bytes_per_second > 0
+
+
+def test_retried_upload_resends_the_whole_file(upload_path, monkeypatch, make_client) -> None:
+	monkeypatch.setattr('time.sleep', lambda delay: None)
+	server = Upload(failures=1)
+	progress = []
+
+	make_client(server, max_retries=2).file_parser.create(
+		file=('report.pdf', upload_path, 'application/pdf'), tool_type='lite', on_progress=progress.append
+	)
+
+	assert len(server.bodies) == 2
+	assert server.bodies[0] == server.bodies[1]
+	assert CONTENT in server.bodies[1]
+	# progress starts over with the second attempt
+	sent = [report.bytes_sent for report in progress]
+	assert sent.count(len(CONTENT)) == 2
+	assert sent[sent.index(len(CONTENT)) + 1] < len(CONTENT)
+
+
+def test_upload_file_opens_paths_lazily(upload_path) -> None:
+	file = UploadFile(upload_path)
+	assert file.name == 'knowledge.pdf'
+	assert file.size == len(CONTENT)
+	assert file._file is None
+
+	assert file.read(10) == CONTENT[:10]
+	assert file.read() == CONTENT[10:]
+	assert file.read() == b''
+	# read to the end: the handle is released until the next rewind
+	assert file._file is None
+	assert file.seek(0) == 0
+	assert file.read(5) == CONTENT[:5]
+	file.close()
+	assert file._file is None
+	with pytest.raises(ValueError):
+		file.read()
+
+
+def test_file_objects_are_left_open() -> None:
+	source = io.BytesIO(CONTENT)
+	file = UploadFile(source)
+	assert file.size == len(CONTENT)
+	assert file.read() == CONTENT
+	file.close()
+	assert not source.closed
+
+
+async def test_async_upload(upload_path, make_async_client) -> None:
+	bodies = []
+
+	class AsyncUpload(httpx.AsyncBaseTransport):
+		async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+			bodies.append(b''.join([chunk async for chunk in request.stream]))
+			return httpx.Response(200, json={'id': 'file-1'})
+
+	client = make_async_client(AsyncUpload())
+	progress = []
+	await client.files.create(file=upload_path, purpose='retrieval', on_progress=progress.append)
+	assert CONTENT in bodies[0]
+	assert progress[-1].bytes_sent == len(CONTENT)
+	await client.close()
@@ -0,0 +1,110 @@
+import asyncio
+import concurrent.futures
+import threading
+import time
+
+import httpx
+import pytest
+
+from zai.api_resource import AsyncTaskPoller, TaskPoller
+from zai.api_resource.tasks import TaskFailedError
+
+
+class FakeTasks:
+	"""`/async-result/{id}` answering PROCESSING until a task has run for its duration."""
+
+	def __init__(self, durations) -> None:
+		self.durations = durations
+		self.started = {task_id: time.monotonic() for task_id in durations}
+		self.polls = {task_id: 0 for task_id in durations}
+		self.lock = threading.Lock()
+
+	def __call__(self, request: httpx.Request) -> httpx.Response:
+		task_id = request.url.path.rsplit('/', 1)[-1]
+		with self.lock:
+			self.polls[task_id] += 1
+		duration = self.durations[task_id]
+		if duration is None:
+			status = 'FAIL'
+		elif time.monotonic() - self.started[task_id] >= duration:
+			status = 'SUCCESS'
+		else:
+			status = 'PROCESSING'
+		return httpx.Response(200, json={'id': task_id, 'model': 'glm-4', 'task_status': status})
+
+
+def test_tasks_resolve_in_completion_order_with_few_polls(make_client) -> None:
+	server = FakeTasks({'slow': 0.4, 'fast': 0.1})
+	with TaskPoller(make_client(server), expected_durations={'chat': 0.1}, min_interval=0.01) as poller:
+		futures = {poller.track_chat_completion(task_id): task_id for task_id in ('slow', 'fast')}
+		order = [futures[future] for future in poller.as_completed(timeout=5)]
+
+	assert order == ['fast', 'slow']
+	assert all(future.result().task_status == 'SUCCESS' for future in futures)
+	# a 10 ms loop would have polled the slow task 40 times
+	assert server.polls['slow'] < 10
+	stats = poller.stats()
+	assert (stats.tracked, stats.succeeded, stats.polls) == (2, 2, sum(server.polls.values()))
+	# the model's expected duration moves towards what was observed
+	assert poller.expected_duration('chat') > 0.1
+
+
+def test_failed_and_timed_out_tasks(make_client) -> None:
+	server = FakeTasks({'broken': None, 'endless': 60})
+	with TaskPoller(make_client(server), expected_durations={'video': 0.02}, min_interval=0.01) as poller:
+		failed = poller.track_video('broken')
+		timed_out = poller.track_video('endless', timeout=0.1)
+		with pytest.raises(TaskFailedError) as error:
+			failed.result(timeout=5)
+		assert error.value.result.task_status == 'FAIL'
+		with pytest.raises(concurrent.futures.TimeoutError):
+			timed_out.result(timeout=5)
+	assert poller.stats().failed == 2
+
+
+def test_polls_share_one_rate_cap(make_client) -> None:
+	server = FakeTasks({f'task-{i}': 0.3 for i in range(20)})
+	poller = TaskPoller(
+		make_client(server),
+		max_polls_per_second=50,
+		expected_durations={'chat': 0.0},
+		min_interval=0.01,
+		max_interval=0.01,
+	)
+	start = time.monotonic()
+	futures = [poller.track_chat_completion(task_id) for task_id in server.durations]
+	concurrent.futures.wait(futures, timeout=10)
+	elapsed = time.monotonic() - start
+	poller.close()
+
+	assert all(future.result().task_status == 'SUCCESS' for future in futures)
+	assert sum(server.polls.values()) <= 50 * elapsed + 1
+
+
+def test_close_cancels_unfinished_tasks(make_client) -> None:
+	server = FakeTasks({'endless': 60})
+	poller = TaskPoller(make_client(server), expected_durations={'chat': 10})
+	future = poller.track_chat_completion('endless')
+	poller.close()
+	assert future.cancelled()
+	with pytest.raises(RuntimeError):
+		poller.track_chat_completion('endless')
+
+
+async def test_async_task_poller(make_async_client) -> None:
+	server = FakeTasks({'a': 0.05, 'b': 0.1})
+
+	async def handler(request: httpx.Request) -> httpx.Response:
+		return server(request)
+
+	client = make_async_client(handler)
+	async with AsyncTaskPoller(client, expected_durations={'chat': 0.05}, min_interval=0.01) as poller:
+		futures = [poller.track_chat_completion(task_id) for task_id in ('b', 'a')]
+		results = [(await future).id for future in poller.as_completed(futures, timeout=5)]
+		endless = poller.track_chat_completion('b', timeout=0.01)
+		server.started['b'] = time.monotonic() + 60
+		with pytest.raises(asyncio.TimeoutError):
+			await endless
+
+	assert results == ['a', 'b']
+	await client.close()
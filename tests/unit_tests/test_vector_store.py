@@ -0,0 +1,108 @@
+from array import array
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from zai.types.chat.chat_completion import CompletionUsage  # noqa: E402
+from zai.types.embeddings import Embedding, EmbeddingMatrix, EmbeddingsResponded  # noqa: E402
+from zai.vector import VectorStore  # noqa: E402
+
+
+def _corpus(count: int = 2000, dimensions: int = 32, seed: int = 1):
+	return np.random.default_rng(seed).standard_normal((count, dimensions)).astype(np.float32)
+
+
+def _brute_force(corpus, queries, k):
+	corpus = corpus / np.linalg.norm(corpus, axis=1, keepdims=True)
+	queries = queries / np.linalg.norm(queries, axis=1, keepdims=True)
+	return np.argsort(-(queries @ corpus.T), axis=1)[:, :k]
+
+
+def test_exact_search_matches_brute_force() -> None:
+	corpus, queries = _corpus(), _corpus(20, seed=2)
+	store = VectorStore()
+	store.add(corpus)
+
+	results = store.search(queries, k=5)
+	assert [[hit.id for hit in hits] for hits in results] == _brute_force(corpus, queries, 5).tolist()
+	assert all(hits[0].score >= hits[-1].score for hits in results)
+
+	single = store.search(queries[0], k=3)
+	assert [hit.id for hit in single] == [hit.id for hit in results[0][:3]]
+
+
+def test_dot_metric_and_embedding_results() -> None:
+	usage = CompletionUsage(prompt_tokens=2, completion_tokens=0, total_tokens=2)
+	listed = EmbeddingsResponded(
+		object='list',
+		model='embedding-3',
+		data=[
+			Embedding(object='embedding', index=1, embedding=[0.0, 2.0]),
+			Embedding(object='embedding', index=0, embedding=[3.0, 0.0]),
+		],
+		usage=usage,
+	)
+	matrix = EmbeddingMatrix(array('f', [1.0, 1.0]), 1, 2, 'embedding-3', usage)
+
+	store = VectorStore(metric='dot')
+	assert store.add(listed, ids=['x', 'y']) == ['x', 'y']
+	store.add(matrix, ids=['z'])
+
+	assert store.search([1.0, 0.0], k=3) == [('x', 3.0), ('z', 1.0), ('y', 0.0)]
+
+
+def test_delete_keeps_ids_consistent() -> None:
+	corpus = _corpus(100)
+	store = VectorStore()
+	store.add(corpus)
+	assert store.delete([0, 5, 99, 1000]) == 3
+	assert len(store) == 97 and 5 not in store
+
+	hits = store.search(corpus[[10, 98]], k=1)
+	assert [hits[0][0].id, hits[1][0].id] == [10, 98]
+	assert store.add(corpus[:2]) == [100, 101]
+	with pytest.raises(ValueError):
+		store.add(corpus[:1], ids=[10])
+
+
+@pytest.mark.parametrize('quantize', [False, True])
+def test_ivf_index_recall(quantize) -> None:
+	# clustered data, as real embeddings are
+	rng = np.random.default_rng(3)
+	centers = rng.standard_normal((20, 32)).astype(np.float32)
+	corpus = (centers[rng.integers(0, 20, 5000)] + 0.3 * rng.standard_normal((5000, 32))).astype(np.float32)
+	queries = corpus[rng.choice(5000, 50, replace=False)] + 0.05
+
+	store = VectorStore()
+	store.add(corpus)
+	store.build_index(nlist=20, nprobe=4, quantize=quantize)
+	expected = _brute_force(corpus, queries, 10)
+	found = [[hit.id for hit in hits] for hits in store.search(queries, k=10)]
+
+	recall = np.mean([len(set(a) & set(b)) / 10 for a, b in zip(found, expected.tolist())])
+	assert recall > 0.9
+
+	store.delete(range(0, 5000, 2))
+	store.add(corpus[:10], ids=[f'new-{i}' for i in range(10)])
+	hits = store.search(corpus[0], k=1, nprobe=20)
+	assert hits[0].id == 'new-0'
+
+
+def test_save_and_memory_mapped_load(tmp_path) -> None:
+	corpus = _corpus(500)
+	store = VectorStore()
+	store.add(corpus, ids=[f'doc-{i}' for i in range(500)])
+	store.build_index(nlist=8, quantize=True)
+	store.save(tmp_path / 'store')
+
+	loaded = VectorStore.load(tmp_path / 'store')
+	assert isinstance(loaded.vectors.base, np.memmap) or isinstance(loaded.vectors, np.memmap)
+	assert loaded.ids == store.ids
+	assert loaded.search(corpus[:3], k=4) == store.search(corpus[:3], k=4)
+	assert loaded.search(corpus[:3], k=4, exact=True) == store.search(corpus[:3], k=4, exact=True)
+
+	loaded.delete(['doc-0'])
+	loaded.add(corpus[:1], ids=['again'])
+	assert loaded.search(corpus[0], k=1, exact=True)[0].id == 'again'
+	assert VectorStore.load(tmp_path / 'store').ids[0] == 'doc-0'
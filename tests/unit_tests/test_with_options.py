@@ -0,0 +1,87 @@
+import gc
+
+import httpx
+
+from zai import ZaiClient
+
+COMPLETION = {
+	'id': 'cmpl-1',
+	'choices': [{'index': 0, 'finish_reason': 'stop', 'message': {'role': 'assistant', 'content': 'hi'}}],
+	'usage': {'prompt_tokens': 1, 'completion_tokens': 1, 'total_tokens': 2},
+}
+
+
+def test_with_options_shares_the_connection_pool(make_client) -> None:
+	seen = []
+
+	def handler(request: httpx.Request) -> httpx.Response:
+		seen.append((request.headers['Authorization'], request.headers.get('x-tenant')))
+		return httpx.Response(200, json=COMPLETION)
+
+	client = make_client(handler, api_key='parent-key')
+	client.chat.completions.create(model='glm-4', messages=[])
+
+	clone = client.with_options(api_key='tenant-key', timeout=5.0, max_retries=0, custom_headers={'x-tenant': 't1'})
+	assert type(clone) is ZaiClient
+	assert clone._client is client._client
+	assert (clone.timeout, clone.max_retries) == (5.0, 0)
+	assert clone.chat is not client.chat
+	assert clone.chat._client is clone
+
+	clone.chat.completions.create(model='glm-4', messages=[])
+	client.chat.completions.create(model='glm-4', messages=[])
+	assert seen == [
+		('Bearer parent-key', None),
+		('Bearer tenant-key', 't1'),
+		('Bearer parent-key', None),
+	]
+	assert client.api_key == 'parent-key'
+
+
+def test_per_tenant_clones_keep_a_bounded_token_cache(make_client) -> None:
+	tokens = []
+
+	def handler(request: httpx.Request) -> httpx.Response:
+		tokens.append(request.headers['Authorization'])
+		return httpx.Response(200, json=COMPLETION)
+
+	client = make_client(handler, api_key='parent.secret', disable_token_cache=False)
+	client._token_managers.maxsize = 4
+	for tenant in range(20):
+		client.with_options(api_key=f'tenant{tenant}.secret').chat.completions.create(model='glm-4', messages=[])
+	assert len(client._token_managers) == 4
+
+	# a recent tenant's clone reuses the token signed for its previous request
+	client.with_options(api_key='tenant19.secret').chat.completions.create(model='glm-4', messages=[])
+	assert tokens[-1] == tokens[-2]
+
+
+def test_closing_a_clone_keeps_the_pool_open() -> None:
+	client = ZaiClient(api_key='parent-key', base_url='https://api.test.com/v4')
+
+	clone = client.with_options(api_key='tenant-key')
+	clone.close()
+	del clone
+	gc.collect()
+	assert not client.is_closed()
+
+	with client.with_options(max_retries=1):
+		pass
+	assert not client.is_closed()
+
+	client.close()
+	assert client.is_closed()
+
+
+async def test_async_with_options(make_async_client) -> None:
+	def handler(request: httpx.Request) -> httpx.Response:
+		assert request.headers['Authorization'] == 'Bearer tenant-key'
+		return httpx.Response(200, json=COMPLETION)
+
+	client = make_async_client(handler, api_key='parent-key')
+	async with client.with_options(api_key='tenant-key') as clone:
+		completion = await clone.chat.completions.create(model='glm-4', messages=[])
+
+	assert completion.choices[0].message.content == 'hi'
+	assert not client.is_closed()
+	await client.close()